@@ -0,0 +1,77 @@
+"""Build the n-gram language profiles used by the ``ngram`` language detector.
+
+Reads langdetect's Wikipedia-trained profiles (Apache-2.0), folds case, keeps
+the most frequent 1-, 2- and 3-grams per language as log-probabilities and
+writes them, with langdetect's CJK normalisation classes, to
+``src/doc_parsing/infrastructure/triage/language_profiles.json``.
+
+    uv run python scripts/build_language_profiles.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from collections import Counter
+from pathlib import Path
+
+import langdetect
+from langdetect.utils.ngram import NGram
+
+OUTPUT = (
+    Path(__file__).resolve().parents[1]
+    / "src/doc_parsing/infrastructure/triage/language_profiles.json"
+)
+
+
+def _profile(path: Path, limits: tuple[int, int, int]) -> dict[str, object]:
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    counts: Counter[str] = Counter()
+    for gram, count in raw["freq"].items():
+        counts[gram.lower()] += count
+    ngrams: dict[str, float] = {}
+    floors: list[float] = []
+    for order, (limit, total) in enumerate(
+        zip(limits, raw["n_words"], strict=True), start=1
+    ):
+        ranked = [
+            (gram, count) for gram, count in counts.most_common() if len(gram) == order
+        ][:limit]
+        logps = {gram: round(math.log(count / total), 2) for gram, count in ranked}
+        ngrams.update(logps)
+        # Anything rarer than the last kept n-gram scores below it.
+        floors.append(round(min(logps.values(), default=math.log(1 / total)) - 1, 2))
+    return {"floors": floors, "ngrams": ngrams}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--unigrams", type=int, default=100)
+    parser.add_argument("--bigrams", type=int, default=200)
+    parser.add_argument("--trigrams", type=int, default=300)
+    parser.add_argument("--output", type=Path, default=OUTPUT)
+    args = parser.parse_args()
+
+    limits = (args.unigrams, args.bigrams, args.trigrams)
+    profiles_dir = Path(langdetect.__file__).parent / "profiles"
+    languages = {
+        path.name: _profile(path, limits) for path in sorted(profiles_dir.iterdir())
+    }
+    # One profile per line keeps regenerated files reviewable.
+    compact = {"ensure_ascii": False, "separators": (",", ":")}
+    lines = [
+        f"{json.dumps(language, **compact)}:{json.dumps(profile, **compact)}"
+        for language, profile in languages.items()
+    ]
+    args.output.write_text(
+        '{"source":"langdetect profiles, Apache-2.0",\n'
+        f'"cjk_classes":{json.dumps(list(NGram.CJK_CLASS), **compact)},\n'
+        '"languages":{\n' + ",\n".join(lines) + "\n}}\n",
+        encoding="utf-8",
+    )
+    print(f"wrote {len(languages)} profiles to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
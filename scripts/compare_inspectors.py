@@ -0,0 +1,127 @@
+"""Compare the pypdf and pdfium triage inspectors over a corpus of PDFs.
+
+Inspects every PDF with both backends (same settings, from the config's
+``inspection`` section) and reports throughput per backend and how often they
+agree on the metadata fields and, with ``--config``, on the triage decision.
+Disagreeing documents are listed with both values.
+
+    uv run python scripts/compare_inspectors.py corpus/ --config triage.yaml
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from doc_parsing.application.inputs import MappedPdfInput
+from doc_parsing.application.triage_config_resolver import TriageConfigResolver
+from doc_parsing.application.use_cases import TriagePolicyChain
+from doc_parsing.domain import TriageMetadata, TriagePolicy
+from doc_parsing.infrastructure.triage import (
+    PdfiumInspectorConfig,
+    PypdfInspectorConfig,
+    TriagePolicyRegistry,
+    create_inspector,
+)
+from doc_parsing.infrastructure.triage.inspection import InspectorConfigBase
+
+FIELDS = ("page_count", "scanned", "language", "image_only_pages")
+
+
+def _pdfs(paths: list[Path]) -> list[Path]:
+    found: list[Path] = []
+    for path in paths:
+        found.extend(sorted(path.rglob("*.pdf")) if path.is_dir() else [path])
+    return found
+
+
+def _load(config: Path | None) -> tuple[dict[str, Any], TriagePolicy | None]:
+    if config is None:
+        return {}, None
+    registry = TriagePolicyRegistry()
+    registry.load_from_entrypoints()
+    model: Any = TriageConfigResolver(registry).parse(
+        yaml.safe_load(config.read_text()) or {}
+    )
+    chain = TriagePolicyChain([registry.create(p) for p in model.triage.policies])
+    # Settings of one backend only (pypdf's decode budgets) are left at their
+    # defaults.
+    shared = set(InspectorConfigBase.model_fields)
+    return model.inspection.model_dump(include=shared), chain
+
+
+def _decision(policy: TriagePolicy | None, metadata: TriageMetadata) -> str | None:
+    decision = policy.decide(metadata) if policy is not None else None
+    if decision is None:
+        return None
+    return f"{decision.route.value}:{decision.hint or '-'}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", type=Path, nargs="+", help="PDFs or directories")
+    parser.add_argument("--config", type=Path, help="triage config for decisions")
+    parser.add_argument("--show", type=int, default=20, help="disagreements to list")
+    args = parser.parse_args()
+
+    settings, policy = _load(args.config)
+    inspectors = {
+        "pypdf": create_inspector(PypdfInspectorConfig(**settings)),
+        "pdfium": create_inspector(PdfiumInspectorConfig(**settings)),
+    }
+    pdfs = _pdfs(args.paths)
+    seconds = dict.fromkeys(inspectors, 0.0)
+    errors = dict.fromkeys(inspectors, 0)
+    agreed = dict.fromkeys((*FIELDS, "decision"), 0)
+    compared = 0
+    disagreements: list[str] = []
+    for path in pdfs:
+        results: dict[str, dict[str, Any]] = {}
+        with MappedPdfInput.open(path) as source:
+            for kind, inspector in inspectors.items():
+                started = time.perf_counter()
+                try:
+                    metadata = inspector.inspect(source)
+                except Exception:
+                    errors[kind] += 1
+                    continue
+                finally:
+                    seconds[kind] += time.perf_counter() - started
+                results[kind] = {
+                    **{name: getattr(metadata, name) for name in FIELDS},
+                    "decision": _decision(policy, metadata),
+                }
+        if len(results) < len(inspectors):
+            continue
+        compared += 1
+        pypdf, pdfium = results["pypdf"], results["pdfium"]
+        differing = [name for name in agreed if pypdf[name] != pdfium[name]]
+        for name in agreed:
+            agreed[name] += name not in differing
+        if differing:
+            disagreements.append(
+                f"{path}: "
+                + ", ".join(f"{n} {pypdf[n]!r} vs {pdfium[n]!r}" for n in differing)
+            )
+
+    print(f"documents: {len(pdfs)}, compared: {compared}")
+    for kind in inspectors:
+        rate = len(pdfs) / seconds[kind] if seconds[kind] else 0.0
+        print(
+            f"{kind}: {seconds[kind]:.2f}s, {rate:.1f} docs/s, errors: {errors[kind]}"
+        )
+    for name, count in agreed.items():
+        if name == "decision" and policy is None:
+            continue
+        share = count / compared if compared else 0.0
+        print(f"agreement {name}: {count}/{compared} ({share:.1%})")
+    for line in disagreements[: args.show]:
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
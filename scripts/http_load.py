@@ -0,0 +1,100 @@
+"""Load generator for ``doc-parse serve-http``.
+
+Uploads a PDF repeatedly from ``--concurrency`` connections, waits for each
+task's markdown, and reports throughput and latency percentiles for uploads
+and for end-to-end parses. Rejected (429) uploads are counted, not retried.
+
+    uv run python scripts/http_load.py sample.pdf --requests 200 --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+
+
+async def _request(
+    host: str, port: int, method: str, target: str, body: bytes = b""
+) -> tuple[int, bytes]:
+    reader, writer = await asyncio.open_connection(host, port)
+    head = f"{method} {target} HTTP/1.1\r\nHost: {host}\r\n"
+    if method == "POST":
+        head += "Content-Type: application/pdf\r\n"
+        head += f"Content-Length: {len(body)}\r\n"
+    writer.write(head.encode("latin-1") + b"\r\n" + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status_line, _, rest = response.partition(b"\r\n")
+    _, _, payload = rest.partition(b"\r\n\r\n")
+    return int(status_line.split()[1]), payload
+
+
+async def _one(
+    host: str, port: int, pdf: bytes, wait: float
+) -> tuple[int, float, float | None]:
+    started = time.perf_counter()
+    status, payload = await _request(host, port, "POST", "/v1/tasks", pdf)
+    accepted = time.perf_counter() - started
+    if status != 202:
+        return status, accepted, None
+    task_id = json.loads(payload)["task_id"]
+    status, _ = await _request(
+        host, port, "GET", f"/v1/tasks/{task_id}/markdown?wait={wait}"
+    )
+    return status, accepted, time.perf_counter() - started
+
+
+async def _run(args: argparse.Namespace) -> None:
+    pdf = args.pdf.read_bytes()
+    remaining = iter(range(args.requests))
+    results: list[tuple[int, float, float | None]] = []
+
+    async def client() -> None:
+        for _ in remaining:
+            results.append(await _one(args.host, args.port, pdf, args.wait))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    uploads = sorted(accepted for _, accepted, _ in results)
+    parses = sorted(total for status, _, total in results if total and status == 200)
+    rejected = sum(status == 429 for status, _, _ in results)
+    failed = len(results) - len(parses) - rejected
+    print(f"requests: {len(results)} in {elapsed:.2f}s")
+    print(f"throughput: {len(results) / elapsed:.1f} req/s, ", end="")
+    print(f"{len(parses) / elapsed:.1f} parses/s")
+    print(f"rejected (429): {rejected}, failed: {failed}")
+    print(f"upload latency: {_percentiles(uploads)}")
+    print(f"end-to-end latency: {_percentiles(parses)}")
+
+
+def _percentiles(samples: list[float]) -> str:
+    if len(samples) < 2:
+        return "n/a"
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return ", ".join(
+        f"p{point} {cuts[point - 1] * 1000:.0f}ms" for point in (50, 90, 95, 99)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("pdf", type=Path)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--wait", type=float, default=30.0, help="long-poll seconds per request"
+    )
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
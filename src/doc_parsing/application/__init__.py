@@ -1,5 +1,25 @@
+from .async_execution import AsyncExecutionConfig, AsyncExecutor
+from .batch import (
+    BatchConfig,
+    BatchItem,
+    BatchOutcome,
+    BatchReport,
+    PrefetchSpool,
+    SpooledInput,
+    run_batch,
+)
 from .config_resolver import ConfigResolver
+from .dlq import DlqReplayOutcome, replay_dlq
+from .inputs import MappedPdfInput, RemotePdfInput
 from .logging import LoggingConfig, configure_logging, get_logger
+from .routing import (
+    ParseProfile,
+    ProfileRouter,
+    ProfileSelection,
+    TriagedParse,
+    TriageRejectedError,
+)
+from .scheduler import ParseScheduler, SchedulerConfig
 from .triage_config_resolver import TriageConfigResolver
 from .use_cases import (
     ParsePdfToMarkdown,
@@ -10,18 +30,50 @@ from .use_cases import (
     TriagePdfResult,
     TriagePolicyChain,
 )
+from .worker_pool import (
+    ParseTimeoutError,
+    ParseWorkerPool,
+    ParseWorkerSpec,
+    WorkerCrashedError,
+    WorkerPoolConfig,
+)
 
 __all__ = [
+    "AsyncExecutionConfig",
+    "AsyncExecutor",
+    "BatchConfig",
+    "BatchItem",
+    "BatchOutcome",
+    "BatchReport",
     "ConfigResolver",
+    "DlqReplayOutcome",
     "LoggingConfig",
     "configure_logging",
     "get_logger",
+    "MappedPdfInput",
     "ParsePdfToMarkdown",
     "ParsePdfToMarkdownInput",
     "ParsePdfToMarkdownResult",
+    "ParseProfile",
+    "ParseScheduler",
+    "ParseTimeoutError",
+    "ParseWorkerPool",
+    "ParseWorkerSpec",
+    "PrefetchSpool",
+    "ProfileRouter",
+    "ProfileSelection",
+    "RemotePdfInput",
+    "SchedulerConfig",
+    "SpooledInput",
     "TriageConfigResolver",
+    "TriagedParse",
     "TriagePdf",
     "TriagePdfInput",
     "TriagePdfResult",
     "TriagePolicyChain",
+    "TriageRejectedError",
+    "WorkerCrashedError",
+    "WorkerPoolConfig",
+    "replay_dlq",
+    "run_batch",
 ]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+
+class AsyncExecutionConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    executor: Literal["thread", "process"] = "thread"
+    max_in_flight: int = 4
+    max_workers: int | None = None
+    start_method: Literal["spawn", "forkserver", "fork"] = "spawn"
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> AsyncExecutionConfig:
+        if self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        return self
+
+
+class AsyncExecutor:
+    """Runs blocking use-case work off the event loop, a bounded amount at once.
+
+    ``in_flight`` limits how many documents are parsed or inspected at the same
+    time across every ``execute_async`` call sharing this executor on one
+    event loop; each loop that uses the executor gets its own limit. The pool
+    is created on first use with ``max_workers`` (default ``max_in_flight``)
+    threads or processes. With ``executor="process"`` the parser factory or
+    inspector and every input must be picklable, so stream inputs are
+    rejected.
+    """
+
+    def __init__(self, config: AsyncExecutionConfig | None = None) -> None:
+        self._config = config or AsyncExecutionConfig()
+        self._in_flight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._pool: Executor | None = None
+
+    @property
+    def config(self) -> AsyncExecutionConfig:
+        return self._config
+
+    @property
+    def isolated(self) -> bool:
+        return self._config.executor == "process"
+
+    @property
+    def in_flight(self) -> asyncio.Semaphore:
+        # A semaphore belongs to the loop that first waits on it, so one is
+        # made per running loop rather than when the executor is built.
+        loop = asyncio.get_running_loop()
+        semaphore = self._in_flight.get(loop)
+        if semaphore is None:
+            semaphore = self._in_flight[loop] = asyncio.Semaphore(
+                self._config.max_in_flight
+            )
+        return semaphore
+
+    async def run[R](self, function: Callable[..., R], *args: object) -> R:
+        """Run ``function`` on the pool.
+
+        Cancelling the caller cancels work that has not started. Work already
+        running in a thread or process is waited for before the cancellation
+        propagates, since it may still be using ``args`` (an open source, for
+        instance), and its result is dropped.
+        """
+        future = self._executor().submit(function, *args)
+        result = asyncio.wrap_future(future)
+        try:
+            return await asyncio.shield(result)
+        except asyncio.CancelledError:
+            if not future.cancel():
+                await _stopped(result)
+            raise
+
+    async def as_completed[T, R](
+        self,
+        run: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+        *,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[R | Exception]:
+        """Yield ``run(item)`` results in completion order.
+
+        Items are pulled lazily, ``max_in_flight`` at a time. A failure is
+        raised (cancelling the rest) unless ``return_exceptions`` is set, in
+        which case it is yielded in place of the result. Closing the iterator
+        early cancels everything still pending.
+        """
+        remaining = iter(items)
+        pending: set[asyncio.Task[R]] = set()
+        try:
+            while True:
+                for item in remaining:
+                    pending.add(asyncio.ensure_future(run(item)))
+                    if len(pending) >= self._config.max_in_flight:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done:
+                    try:
+                        result = finished.result()
+                    except Exception as exc:
+                        if not return_exceptions:
+                            raise
+                        yield exc
+                    else:
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def close(self, *, wait: bool = True) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> AsyncExecutor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            workers = self._config.max_workers or self._config.max_in_flight
+            if self.isolated:
+                self._pool = ProcessPoolExecutor(
+                    workers,
+                    mp_context=multiprocessing.get_context(self._config.start_method),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    workers, thread_name_prefix="doc-parse-async"
+                )
+        return self._pool
+
+
+async def to_thread[R](function: Callable[..., R], *args: object) -> R:
+    """``asyncio.to_thread`` that, when cancelled, first waits for ``function``.
+
+    For blocking calls on resources the caller closes as it unwinds.
+    """
+    task = asyncio.ensure_future(asyncio.to_thread(function, *args))
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        await _stopped(task)
+        raise
+
+
+async def _stopped(future: asyncio.Future[Any]) -> None:
+    # Further cancellations are absorbed here; the caller re-raises the first.
+    while not future.done():
+        try:
+            await asyncio.wait([future])
+        except asyncio.CancelledError:
+            pass
+    if not future.cancelled():
+        # Retrieved so a failure is not reported as never retrieved.
+        future.exception()
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from doc_parsing.application.inputs import is_remote_uri
+from doc_parsing.application.logging import get_logger
+from doc_parsing.application.scheduler import SchedulerConfig
+from doc_parsing.application.worker_pool import WorkerPoolConfig
+from doc_parsing.domain import DocumentId, TaskId
+
+
+class BatchConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    prefetch_concurrency: int = 4
+    workers: int = 2
+    spool_dir: Path | None = None
+    spool_max_mb: float = 512.0
+    output_dir: Path | None = None
+    job_store: Path | None = None
+    pool: WorkerPoolConfig | None = None
+    # Orders parses by expected cost instead of input order.
+    scheduler: SchedulerConfig | None = None
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> BatchConfig:
+        if self.prefetch_concurrency < 1:
+            raise ValueError("prefetch_concurrency must be >= 1")
+        if self.workers < 1:
+            raise ValueError("workers must be >= 1")
+        if self.spool_max_mb <= 0:
+            raise ValueError("spool_max_mb must be > 0")
+        if (
+            self.pool is not None
+            and self.scheduler is not None
+            and self.scheduler.workers + self.scheduler.fast_lane_workers
+            > self.pool.workers
+        ):
+            # Otherwise the fast lane could wait behind large documents in
+            # the pool's own queue.
+            raise ValueError(
+                "scheduler workers and fast_lane_workers cannot exceed pool.workers"
+            )
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class BatchItem:
+    location: str
+    task_id: TaskId
+    document_id: DocumentId
+
+
+@dataclass(frozen=True, slots=True)
+class SpooledInput:
+    item: BatchItem
+    path: Path
+    size: int
+    spooled: bool
+
+
+@dataclass(slots=True)
+class BatchOutcome[R]:
+    item: BatchItem
+    result: R | None = None
+    error: str | None = None
+    fetch_seconds: float = 0.0
+    run_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class BatchReport[R]:
+    outcomes: list[BatchOutcome[R]] = field(default_factory=list)
+    wall_seconds: float = 0.0
+    io_busy_seconds: float = 0.0
+    cpu_busy_seconds: float = 0.0
+    overlap_seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[BatchOutcome[R]]:
+        return [outcome for outcome in self.outcomes if not outcome.ok]
+
+    @property
+    def overlap_ratio(self) -> float:
+        """Share of the shorter of I/O and CPU busy time hidden behind the other."""
+        shorter = min(self.io_busy_seconds, self.cpu_busy_seconds)
+        return self.overlap_seconds / shorter if shorter > 0 else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "documents": len(self.outcomes),
+            "failed": len(self.failed),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "io_busy_seconds": round(self.io_busy_seconds, 3),
+            "cpu_busy_seconds": round(self.cpu_busy_seconds, 3),
+            "overlap_seconds": round(self.overlap_seconds, 3),
+            "overlap_ratio": round(self.overlap_ratio, 3),
+        }
+
+
+class PrefetchSpool:
+    """Size-capped local directory that remote inputs are downloaded into.
+
+    ``fetch`` waits while the spool is full, which holds the prefetch stage
+    back until workers release documents. One fsspec filesystem is kept per
+    protocol so connections (e.g. the HTTP session) are reused across fetches.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._used_bytes = 0
+        self._capacity = asyncio.Condition()
+        self._filesystems: dict[str, Any] = {}
+
+    @property
+    def used_bytes(self) -> int:
+        return self._used_bytes
+
+    async def fetch(self, item: BatchItem) -> SpooledInput:
+        if not is_remote_uri(item.location):
+            return SpooledInput(
+                item=item, path=Path(item.location), size=0, spooled=False
+            )
+
+        from upath import UPath
+
+        location = UPath(item.location)
+        filesystem = self._filesystems.setdefault(location.protocol, location.fs)
+        size = await asyncio.to_thread(filesystem.size, location.path)
+        await self._reserve(size)
+        # Object keys need not end in .pdf; the original location travels as
+        # ``source_uri`` instead.
+        target = self._directory / f"{uuid.uuid4().hex}.pdf"
+        try:
+            await asyncio.to_thread(filesystem.get_file, location.path, str(target))
+        except BaseException:
+            await self._release(size)
+            target.unlink(missing_ok=True)
+            raise
+        return SpooledInput(item=item, path=target, size=size, spooled=True)
+
+    async def release(self, spooled: SpooledInput) -> None:
+        if not spooled.spooled:
+            return
+        spooled.path.unlink(missing_ok=True)
+        await self._release(spooled.size)
+
+    async def _reserve(self, size: int) -> None:
+        async with self._capacity:
+            # An object larger than the whole spool is admitted once it is empty.
+            await self._capacity.wait_for(
+                lambda: (
+                    self._used_bytes == 0 or self._used_bytes + size <= self._max_bytes
+                )
+            )
+            self._used_bytes += size
+
+    async def _release(self, size: int) -> None:
+        async with self._capacity:
+            self._used_bytes -= size
+            self._capacity.notify_all()
+
+
+def run_batch[R](
+    items: Sequence[BatchItem],
+    worker: Callable[[SpooledInput], R],
+    config: BatchConfig,
+) -> BatchReport[R]:
+    """Run ``worker`` over ``items`` with downloads overlapped with the work."""
+    return asyncio.run(_run_batch(items, worker, config))
+
+
+async def _run_batch[R](
+    items: Sequence[BatchItem],
+    worker: Callable[[SpooledInput], R],
+    config: BatchConfig,
+) -> BatchReport[R]:
+    logger = get_logger(__name__)
+    pending: asyncio.Queue[BatchItem | None] = asyncio.Queue()
+    ready: asyncio.Queue[tuple[SpooledInput | None, BatchOutcome[R]] | None] = (
+        asyncio.Queue(maxsize=config.workers)
+    )
+    report: BatchReport[R] = BatchReport()
+    io_intervals: list[tuple[float, float]] = []
+    cpu_intervals: list[tuple[float, float]] = []
+    for item in items:
+        pending.put_nowait(item)
+    for _ in range(config.prefetch_concurrency):
+        pending.put_nowait(None)
+
+    with (
+        _spool_directory(config.spool_dir) as spool_dir,
+        ThreadPoolExecutor(max_workers=config.workers) as executor,
+    ):
+        spool = PrefetchSpool(
+            spool_dir, max_bytes=int(config.spool_max_mb * 1024 * 1024)
+        )
+        loop = asyncio.get_running_loop()
+
+        async def prefetch() -> None:
+            while (item := await pending.get()) is not None:
+                outcome: BatchOutcome[R] = BatchOutcome(item=item)
+                started = time.perf_counter()
+                try:
+                    spooled: SpooledInput | None = await spool.fetch(item)
+                except Exception as exc:
+                    spooled = None
+                    outcome.error = f"fetch failed: {exc}"
+                finished = time.perf_counter()
+                outcome.fetch_seconds = finished - started
+                if spooled is not None and spooled.spooled:
+                    io_intervals.append((started, finished))
+                    logger.info(
+                        "batch.fetch.complete",
+                        extra={
+                            "location": item.location,
+                            "bytes": spooled.size,
+                            "seconds": round(outcome.fetch_seconds, 3),
+                            "spool_used_bytes": spool.used_bytes,
+                        },
+                    )
+                await ready.put((spooled, outcome))
+
+        async def consume() -> None:
+            while (entry := await ready.get()) is not None:
+                spooled, outcome = entry
+                if spooled is not None:
+                    started = time.perf_counter()
+                    try:
+                        outcome.result = await loop.run_in_executor(
+                            executor, worker, spooled
+                        )
+                    except Exception as exc:
+                        outcome.error = str(exc) or type(exc).__name__
+                    finally:
+                        finished = time.perf_counter()
+                        outcome.run_seconds = finished - started
+                        cpu_intervals.append((started, finished))
+                        await spool.release(spooled)
+                report.outcomes.append(outcome)
+
+        started = time.perf_counter()
+        consumers = [asyncio.create_task(consume()) for _ in range(config.workers)]
+        await asyncio.gather(*(prefetch() for _ in range(config.prefetch_concurrency)))
+        for _ in consumers:
+            await ready.put(None)
+        await asyncio.gather(*consumers)
+        report.wall_seconds = time.perf_counter() - started
+
+    # Workers finish out of order; report in input order.
+    order = {id(item): index for index, item in enumerate(items)}
+    report.outcomes.sort(key=lambda outcome: order[id(outcome.item)])
+
+    report.io_busy_seconds = _busy_seconds(io_intervals)
+    report.cpu_busy_seconds = _busy_seconds(cpu_intervals)
+    report.overlap_seconds = max(
+        report.io_busy_seconds
+        + report.cpu_busy_seconds
+        - _busy_seconds(io_intervals + cpu_intervals),
+        0.0,
+    )
+    logger.info("batch.complete", extra=report.summary())
+    return report
+
+
+def _busy_seconds(intervals: list[tuple[float, float]]) -> float:
+    total = 0.0
+    current_start: float | None = None
+    current_end = 0.0
+    for start, end in sorted(intervals):
+        if current_start is None or start > current_end:
+            if current_start is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_start is not None:
+        total += current_end - current_start
+    return total
+
+
+@contextmanager
+def _spool_directory(configured: Path | None) -> Iterator[Path]:
+    if configured is not None:
+        configured.mkdir(parents=True, exist_ok=True)
+        yield configured
+        return
+    with tempfile.TemporaryDirectory(prefix="doc-parse-spool-") as directory:
+        yield Path(directory)
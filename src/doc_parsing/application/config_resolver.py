@@ -7,7 +7,9 @@ from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
 
+from doc_parsing.application.batch import BatchConfig
 from doc_parsing.application.logging import LoggingConfig
+from doc_parsing.application.routing import ParseProfile
 from doc_parsing.infrastructure.parsers.registry import ParserRegistry
 
 
@@ -16,9 +18,13 @@ class CliConfig:
     parser: BaseModel
     task_id: str
     document_id: str
-    input_path: Path
+    input_path: str | None
+    inputs: list[str] | None
     output_path: Path | None
     logging: LoggingConfig
+    batch: BatchConfig
+    profiles: dict[str, ParseProfile]
+    triage_config: Path | None
 
 
 class ConfigResolver:
@@ -33,9 +39,13 @@ class ConfigResolver:
             parser=(adapter_union, ...),
             task_id=(str, "task-1"),
             document_id=(str, "doc-1"),
-            input_path=(Path, ...),
+            input_path=(str | None, None),
+            inputs=(list[str] | None, None),
             output_path=(Path | None, None),
             logging=(LoggingConfig, LoggingConfig()),
+            batch=(BatchConfig, BatchConfig()),
+            profiles=(dict[str, ParseProfile], {}),
+            triage_config=(Path | None, None),
         )
 
     def parse(self, raw_config: dict[str, Any]) -> BaseModel:
@@ -46,16 +56,19 @@ class ConfigResolver:
         self,
         model: BaseModel,
         *,
-        input_path: Path | None,
+        input_path: str | None,
         output_path: Path | None,
         task_id: str | None,
         document_id: str | None,
         parser_kind: str | None,
         logging_overrides: dict[str, Any] | None = None,
+        inputs: list[str] | None = None,
     ) -> BaseModel:
         raw = model.model_dump()
         if input_path is not None:
             raw["input_path"] = input_path
+        if inputs is not None:
+            raw["inputs"] = inputs
         if output_path is not None:
             raw["output_path"] = output_path
         if task_id is not None:
@@ -84,6 +97,9 @@ class ConfigResolver:
                 logging_raw = dict(raw.get("logging", {}))
                 logging_raw[key.removeprefix("logging.")] = value
                 raw["logging"] = logging_raw
+            elif key.startswith(("batch.", "profiles.")):
+                section, _, nested = key.partition(".")
+                raw[section] = _with_nested(raw.get(section) or {}, nested, value)
             else:
                 raw[key] = value
         return type(model).model_validate(raw)
@@ -113,6 +129,15 @@ def _parse_override(entry: str) -> tuple[str, Any]:
     return key, _coerce_value(raw_value)
 
 
+def _with_nested(section: dict[str, Any], key: str, value: Any) -> dict[str, Any]:
+    updated = dict(section)
+    head, _, rest = key.partition(".")
+    updated[head] = (
+        _with_nested(updated.get(head) or {}, rest, value) if rest else value
+    )
+    return updated
+
+
 def _coerce_value(raw: str) -> Any:
     lowered = raw.lower()
     if lowered in {"true", "false"}:
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from doc_parsing.application.logging import get_logger
+from doc_parsing.application.use_cases import (
+    ParsePdfToMarkdown,
+    ParsePdfToMarkdownInput,
+    ParsePdfToMarkdownResult,
+    TriagePdf,
+    TriagePdfInput,
+)
+from doc_parsing.domain import (
+    DlqRecord,
+    PdfParserConfig,
+    SourceType,
+    TriageResult,
+    TriageRoute,
+)
+
+
+@dataclass(slots=True)
+class DlqReplayOutcome:
+    record: DlqRecord
+    triage: TriageResult | None = None
+    parse: ParsePdfToMarkdownResult | None = None
+    error: str | None = None
+
+    @property
+    def recovered(self) -> bool:
+        return self.triage is not None and self.triage.decision.route == (
+            TriageRoute.PARSE
+        )
+
+
+def replay_dlq(
+    records: Iterable[DlqRecord],
+    triage: TriagePdf,
+    *,
+    parse: ParsePdfToMarkdown | None = None,
+    parser_config: PdfParserConfig | None = None,
+) -> list[DlqReplayOutcome]:
+    """Re-triage rejected documents, parsing the ones the policies now accept.
+
+    Records whose source was raw bytes (uploads, stdin) cannot be re-read and
+    come back with an error. If ``triage`` has a DLQ sink, documents that are
+    still rejected are written to it again.
+    """
+    if parse is not None and parser_config is None:
+        raise ValueError("parser_config is required to parse replayed documents")
+    logger = get_logger(__name__)
+    outcomes: list[DlqReplayOutcome] = []
+    for record in records:
+        outcome = DlqReplayOutcome(record=record)
+        outcomes.append(outcome)
+        if record.source.source_type == SourceType.RAW_BYTES:
+            outcome.error = "raw byte sources cannot be replayed"
+            continue
+        source = _source_arguments(record)
+        try:
+            outcome.triage = triage.execute(
+                TriagePdfInput(
+                    task_id=record.task_id, document_id=record.document_id, **source
+                )
+            ).result
+            if outcome.recovered and parse is not None and parser_config is not None:
+                outcome.parse = parse.execute(
+                    ParsePdfToMarkdownInput(
+                        parser_config=parser_config,
+                        task_id=record.task_id,
+                        document_id=record.document_id,
+                        **source,
+                    )
+                )
+        except Exception as exc:
+            outcome.error = str(exc) or type(exc).__name__
+    logger.info(
+        "dlq.replay.complete",
+        extra={
+            "records": len(outcomes),
+            "recovered": sum(outcome.recovered for outcome in outcomes),
+            "failed": sum(outcome.error is not None for outcome in outcomes),
+        },
+    )
+    return outcomes
+
+
+def _source_arguments(record: DlqRecord) -> dict[str, Any]:
+    if record.source.source_type == SourceType.LOCAL_FILE:
+        return {"file_path": Path(record.source.uri)}
+    return {"file_path": None, "uri": record.source.uri}
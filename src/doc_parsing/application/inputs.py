@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import io
+import mmap
+from collections import defaultdict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from doc_parsing.domain import PdfInput, SourceType
+
+
+class MappedPdfInput(PdfInput):
+    """A PDF opened once and shared by header sniffing, inspection and parsing.
+
+    Local files are memory-mapped where the platform and filesystem allow it
+    and read into memory in a single buffered read otherwise; uploads and
+    stdin are wrapped as-is. Every read is attributed to a stage so callers
+    can log bytes consumed per stage.
+    """
+
+    def __init__(
+        self,
+        buffer: bytes | mmap.mmap,
+        *,
+        uri: str,
+        name: str,
+        path: Path | None = None,
+        source_type: SourceType = SourceType.LOCAL_FILE,
+    ) -> None:
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._uri = uri
+        self._name = name
+        self._path = path
+        self._source_type = source_type
+        self._bytes_read: defaultdict[str, int] = defaultdict(int)
+
+    @classmethod
+    def open(
+        cls,
+        path: Path,
+        *,
+        uri: str | None = None,
+        source_type: SourceType = SourceType.LOCAL_FILE,
+    ) -> MappedPdfInput:
+        with path.open("rb") as handle:
+            try:
+                buffer: bytes | mmap.mmap = mmap.mmap(
+                    handle.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except (OSError, ValueError):
+                # Empty files, pipes and some network filesystems cannot be
+                # mapped; fall back to one buffered read of the whole file.
+                buffer = handle.read()
+        return cls(
+            buffer,
+            uri=uri or str(path),
+            name=path.name,
+            path=path,
+            source_type=source_type,
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes, *, name: str) -> MappedPdfInput:
+        return cls(data, uri=name, name=name, source_type=SourceType.RAW_BYTES)
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO, *, name: str) -> MappedPdfInput:
+        # Pipes and upload streams are not seekable, so take them in one read.
+        return cls.from_bytes(stream.read(), name=name)
+
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def source_type(self) -> SourceType:
+        return self._source_type
+
+    @property
+    def path(self) -> Path | None:
+        return self._path
+
+    @property
+    def size(self) -> int:
+        return len(self._view)
+
+    @property
+    def mapped(self) -> bool:
+        return isinstance(self._buffer, mmap.mmap)
+
+    def read_range(self, offset: int, length: int, *, stage: str) -> bytes:
+        chunk = self._view[offset : offset + length].tobytes()
+        self._bytes_read[stage] += len(chunk)
+        return chunk
+
+    def open_stream(self, *, stage: str) -> BinaryIO:
+        return _MemoryStream(self._view, self._bytes_read, stage)
+
+    def bytes_read(self) -> Mapping[str, int]:
+        return dict(self._bytes_read)
+
+    def close(self) -> None:
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> MappedPdfInput:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class RemotePdfInput(PdfInput):
+    """A PDF on an fsspec filesystem, read through ranged requests.
+
+    The object is opened once; reads go through fsspec's cache so inspection
+    fetches only the blocks pypdf touches (trailer, xref, page tree and the
+    pages it samples) instead of downloading the whole file.
+    """
+
+    def __init__(
+        self,
+        handle: Any,
+        *,
+        uri: str,
+        name: str,
+        size: int,
+        source_type: SourceType,
+    ) -> None:
+        self._handle = handle
+        self._uri = uri
+        self._name = name
+        self._size = size
+        self._source_type = source_type
+        self._bytes_read: defaultdict[str, int] = defaultdict(int)
+
+    @classmethod
+    def open(
+        cls,
+        uri: str,
+        *,
+        block_size: int,
+        cache_type: str,
+        storage_options: Mapping[str, Any] | None = None,
+    ) -> RemotePdfInput | MappedPdfInput:
+        from upath import UPath
+
+        location = UPath(uri, **dict(storage_options or {}))
+        source_type = remote_source_type(location.protocol)
+        handle = location.fs.open(
+            location.path, "rb", block_size=block_size, cache_type=cache_type
+        )
+        if not handle.seekable():
+            # Servers without range support only allow one sequential read.
+            with handle:
+                data = handle.read()
+            return MappedPdfInput(
+                data, uri=uri, name=location.name, source_type=source_type
+            )
+        size = getattr(handle, "size", None)
+        if size is None:
+            size = location.fs.size(location.path)
+        return cls(
+            handle, uri=uri, name=location.name, size=size, source_type=source_type
+        )
+
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def source_type(self) -> SourceType:
+        return self._source_type
+
+    @property
+    def path(self) -> Path | None:
+        return None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def fetched_bytes(self) -> int | None:
+        cache = getattr(self._handle, "cache", None)
+        return getattr(cache, "total_requested_bytes", None)
+
+    def read_range(self, offset: int, length: int, *, stage: str) -> bytes:
+        self._handle.seek(offset)
+        chunk = self._handle.read(length)
+        self._bytes_read[stage] += len(chunk)
+        return chunk
+
+    def open_stream(self, *, stage: str) -> BinaryIO:
+        return _RangeStream(self, stage)
+
+    def bytes_read(self) -> Mapping[str, int]:
+        return dict(self._bytes_read)
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> RemotePdfInput:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def is_remote_uri(value: str) -> bool:
+    return "://" in value
+
+
+def remote_source_type(protocol: str) -> SourceType:
+    if protocol in {"http", "https"}:
+        return SourceType.URL
+    return SourceType.OBJECT_STORAGE
+
+
+def source_type_for(location: str) -> SourceType:
+    if not is_remote_uri(location):
+        return SourceType.LOCAL_FILE
+    return remote_source_type(location.split("://", 1)[0])
+
+
+class _RangeStream(io.RawIOBase):
+    """Independent cursor over a shared remote handle."""
+
+    def __init__(self, source: RemotePdfInput, stage: str) -> None:
+        super().__init__()
+        self._source = source
+        self._position = 0
+        self._stage = stage
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._source.size + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("negative seek position")
+        self._position = position
+        return position
+
+    def read(self, size: int | None = -1) -> bytes:
+        remaining = max(self._source.size - self._position, 0)
+        length = remaining if size is None or size < 0 else min(size, remaining)
+        chunk = self._source.read_range(self._position, length, stage=self._stage)
+        self._position += len(chunk)
+        return chunk
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        chunk = self.read(len(buffer))
+        memoryview(buffer).cast("B")[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class _MemoryStream(io.RawIOBase):
+    """Seekable read-only stream over a buffer that never copies it whole."""
+
+    def __init__(
+        self, view: memoryview, counters: defaultdict[str, int], stage: str
+    ) -> None:
+        super().__init__()
+        self._view = view
+        self._position = 0
+        self._counters = counters
+        self._stage = stage
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("negative seek position")
+        self._position = position
+        return position
+
+    def read(self, size: int | None = -1) -> bytes:
+        start = self._position
+        end = len(self._view) if size is None or size < 0 else start + size
+        chunk = self._view[start:end].tobytes()
+        self._position = start + len(chunk)
+        self._counters[self._stage] += len(chunk)
+        return chunk
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        chunk = self._view[self._position : self._position + len(buffer)]
+        size = len(chunk)
+        # ctypes buffers (pdfium reads through one) carry a "<B" format.
+        memoryview(buffer).cast("B")[:size] = chunk
+        self._position += size
+        self._counters[self._stage] += size
+        return size
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from doc_parsing.application.logging import get_logger
+from doc_parsing.application.use_cases import (
+    ParsePdfToMarkdownInput,
+    ParsePdfToMarkdownResult,
+    TriagePdf,
+    TriagePdfInput,
+)
+from doc_parsing.domain import (
+    PageRanges,
+    ParseOptions,
+    PdfParserConfig,
+    TriageDecision,
+    TriageResult,
+    TriageRoute,
+)
+
+DEFAULT_PROFILE = "default"
+
+
+class ParseProfile(BaseModel):
+    """Parser settings for one class of document, selected by a triage hint.
+
+    ``parser`` overrides the base parser options; giving a different ``kind``
+    switches adapter and replaces the options entirely. With
+    ``page_selective_ocr`` only the pages triage found to be image-only are
+    OCRed.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    parser: dict[str, Any] = Field(default_factory=dict)
+    extract_tables: bool = True
+    extract_images: bool = True
+    extract_text: bool = True
+    language_from_triage: bool = True
+    page_selective_ocr: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileSelection:
+    profile: str
+    parser_config: PdfParserConfig
+    options: ParseOptions
+
+
+class TriageRejectedError(ValueError):
+    def __init__(self, decision: TriageDecision) -> None:
+        super().__init__(f"triage routed to dlq: {decision.reason}")
+        self.decision = decision
+
+
+@dataclass(slots=True)
+class _ProfileStats:
+    documents: int = 0
+    pages: int = 0
+    run_seconds: float = 0.0
+
+
+class ProfileRouter:
+    """Maps triage results to parse profiles and tracks throughput per profile.
+
+    A decision's ``hint`` names the profile. Documents without a hint, or with
+    one that names no profile, use the ``default`` profile if configured and
+    the base parser config otherwise.
+    """
+
+    def __init__(
+        self, base: PdfParserConfig, profiles: Mapping[str, ParseProfile]
+    ) -> None:
+        self._base = base
+        self._profiles = dict(profiles)
+        self._configs = {
+            name: _profile_parser_config(base, profile)
+            for name, profile in self._profiles.items()
+        }
+        self._stats: dict[str, _ProfileStats] = {}
+        self._lock = threading.Lock()
+        self._logger = get_logger(__name__)
+
+    def parser_configs(self) -> list[PdfParserConfig]:
+        return list(self._configs.values())
+
+    def select(self, result: TriageResult) -> ProfileSelection:
+        hint = result.decision.hint
+        if hint is not None and hint not in self._profiles:
+            self._logger.warning("parse.profile.unknown", extra={"hint": hint})
+        name = hint if hint in self._profiles else DEFAULT_PROFILE
+        profile = self._profiles.get(name)
+        if profile is None:
+            return ProfileSelection(
+                name,
+                self._base,
+                ParseOptions(
+                    language_hint=result.metadata.language,
+                    ocr_pages=_ocr_pages(result),
+                ),
+            )
+        language = result.metadata.language if profile.language_from_triage else None
+        return ProfileSelection(
+            profile=name,
+            parser_config=self._configs[name],
+            options=ParseOptions(
+                extract_tables=profile.extract_tables,
+                extract_images=profile.extract_images,
+                extract_text=profile.extract_text,
+                language_hint=language,
+                ocr_pages=_ocr_pages(result) if profile.page_selective_ocr else None,
+            ),
+        )
+
+    def record(self, profile: str, *, pages: int, run_seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(profile, _ProfileStats())
+            stats.documents += 1
+            stats.pages += pages
+            stats.run_seconds += run_seconds
+
+    def throughput(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                name: {
+                    "documents": stats.documents,
+                    "pages": stats.pages,
+                    "run_seconds": round(stats.run_seconds, 3),
+                    "pages_per_second": round(
+                        stats.pages / stats.run_seconds if stats.run_seconds else 0.0,
+                        3,
+                    ),
+                }
+                for name, stats in sorted(self._stats.items())
+            }
+
+    def log_throughput(self) -> None:
+        for name, stats in self.throughput().items():
+            self._logger.info(
+                "parse.profile.throughput", extra={"profile": name, **stats}
+            )
+
+
+class TriagedParse:
+    """Triages each document, then parses it with the profile triage picked.
+
+    Documents routed to the DLQ are not parsed; ``execute`` raises
+    ``TriageRejectedError`` for them.
+    """
+
+    def __init__(
+        self,
+        triage: TriagePdf,
+        parse: Callable[[ParsePdfToMarkdownInput], ParsePdfToMarkdownResult],
+        router: ProfileRouter,
+    ) -> None:
+        self._triage = triage
+        self._parse = parse
+        self._router = router
+
+    def execute(self, data: ParsePdfToMarkdownInput) -> ParsePdfToMarkdownResult:
+        if data.content is not None and not isinstance(data.content, bytes):
+            # Both stages read the document, so a stream is buffered once.
+            content = data.content
+            data = dataclasses.replace(
+                data,
+                content=bytes(content)
+                if isinstance(content, bytearray | memoryview)
+                else content.read(),
+            )
+        triage = self._triage.execute(
+            TriagePdfInput(
+                file_path=data.file_path,
+                task_id=data.task_id,
+                document_id=data.document_id,
+                content=data.content,
+                source_name=data.source_name,
+                uri=data.uri,
+                source_uri=data.source_uri,
+            )
+        ).result
+        if triage.decision.route == TriageRoute.DLQ:
+            raise TriageRejectedError(triage.decision)
+
+        selection = self._router.select(triage)
+        get_logger(
+            __name__,
+            task_id=data.task_id.value,
+            document_id=data.document_id.value,
+        ).info(
+            "parse.profile.selected",
+            extra={
+                "profile": selection.profile,
+                "parser_name": selection.parser_config.name,
+                "hint": triage.decision.hint,
+            },
+        )
+        result = self._parse(
+            dataclasses.replace(
+                data,
+                parser_config=selection.parser_config,
+                options=selection.options,
+            )
+        )
+        self._router.record(
+            selection.profile,
+            pages=triage.metadata.page_count,
+            run_seconds=result.task.run_seconds or 0.0,
+        )
+        return result
+
+
+def _ocr_pages(result: TriageResult) -> PageRanges | None:
+    metadata = result.metadata
+    if not metadata.inspected:
+        # Decided from the preflight alone: no page was looked at, so the
+        # empty ranges say nothing about which pages need OCR.
+        return None
+    ranges = metadata.image_only_page_ranges
+    # Inspectors that only count image-only pages leave OCR to the parser.
+    return ranges if len(ranges) == metadata.image_only_pages else None
+
+
+def _profile_parser_config(
+    base: PdfParserConfig, profile: ParseProfile
+) -> PdfParserConfig:
+    overrides = dict(profile.parser)
+    kind = overrides.pop("kind", base.name)
+    if kind != base.name:
+        return PdfParserConfig(name=kind, options=overrides)
+    return PdfParserConfig(name=kind, options={**(base.options or {}), **overrides})
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import dataclasses
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from doc_parsing.application.logging import get_logger
+from doc_parsing.application.use_cases import (
+    ParsePdfToMarkdownInput,
+    ParsePdfToMarkdownResult,
+)
+from doc_parsing.domain import TriageMetadata
+
+
+class SchedulerConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    workers: int = 2
+    fast_lane_workers: int = 1
+    fast_lane_max_pages: int = 10
+    scanned_page_cost: float = 5.0
+    aging_pages_per_second: float = 2.0
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> SchedulerConfig:
+        if self.workers < 1:
+            raise ValueError("workers must be >= 1")
+        if self.fast_lane_workers < 0:
+            raise ValueError("fast_lane_workers must be >= 0")
+        if self.fast_lane_max_pages < 1:
+            raise ValueError("fast_lane_max_pages must be >= 1")
+        if self.scanned_page_cost < 1.0:
+            raise ValueError("scanned_page_cost must be >= 1.0")
+        if self.aging_pages_per_second < 0.0:
+            raise ValueError("aging_pages_per_second must be >= 0.0")
+        return self
+
+
+@dataclass(order=True, slots=True)
+class _Job:
+    key: float
+    sequence: int
+    cost: float = field(compare=False)
+    small: bool = field(compare=False)
+    data: ParsePdfToMarkdownInput = field(compare=False)
+    future: Future[ParsePdfToMarkdownResult] = field(compare=False)
+
+
+class ParseScheduler:
+    """Orders parse work by expected cost, with a lane reserved for small PDFs.
+
+    Cost is the page count, with scanned pages weighted by
+    ``scanned_page_cost`` since they go through OCR. Jobs run
+    shortest-expected-first; waiting lowers a job's effective cost by
+    ``aging_pages_per_second`` so large documents are not starved. Because every
+    queued job ages at the same rate, ``cost + rate * enqueued_at`` orders jobs
+    exactly like ``cost - rate * waited`` and can stay fixed in a heap.
+
+    Fast-lane workers only take documents with at most ``fast_lane_max_pages``
+    pages, so a burst of large documents cannot occupy every worker.
+
+    ``execute`` runs one job on a scheduler thread: ``ParsePdfToMarkdown.execute``
+    or anything wrapping it, such as a worker-pool submission.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[ParsePdfToMarkdownInput], ParsePdfToMarkdownResult],
+        config: SchedulerConfig,
+    ) -> None:
+        self._execute = execute
+        self._config = config
+        self._small: list[_Job] = []
+        self._large: list[_Job] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._logger = get_logger(__name__)
+        self._threads = [
+            threading.Thread(
+                target=self._work, args=(lane,), name=f"parse-{lane}-{index}"
+            )
+            for lane, count in (
+                ("fast", config.fast_lane_workers),
+                ("general", config.workers),
+            )
+            for index in range(count)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def expected_cost(self, metadata: TriageMetadata) -> float:
+        scanned_pages = (
+            metadata.page_count if metadata.scanned else metadata.image_only_pages
+        )
+        text_pages = metadata.page_count - scanned_pages
+        return max(text_pages + scanned_pages * self._config.scanned_page_cost, 1.0)
+
+    def submit(
+        self, data: ParsePdfToMarkdownInput, metadata: TriageMetadata
+    ) -> Future[ParsePdfToMarkdownResult]:
+        future: Future[ParsePdfToMarkdownResult] = Future()
+        cost = self.expected_cost(metadata)
+        job = _Job(
+            key=cost + self._config.aging_pages_per_second * time.monotonic(),
+            sequence=next(self._sequence),
+            cost=cost,
+            small=metadata.page_count <= self._config.fast_lane_max_pages,
+            data=dataclasses.replace(data, queued_at=datetime.now(tz=UTC)),
+            future=future,
+        )
+        with self._condition:
+            if self._closed:
+                raise ValueError("scheduler is closed")
+            heapq.heappush(self._small if job.small else self._large, job)
+            self._condition.notify_all()
+        return future
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._small) + len(self._large)
+
+    def close(self, *, wait: bool = True) -> None:
+        """Stop accepting work; queued jobs still run before workers exit."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def __enter__(self) -> ParseScheduler:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _work(self, lane: str) -> None:
+        while (job := self._next_job(lane)) is not None:
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            self._logger.info(
+                "schedule.dispatch",
+                extra={
+                    "lane": lane,
+                    "task_id": job.data.task_id.value,
+                    "expected_cost": job.cost,
+                },
+            )
+            try:
+                job.future.set_result(self._execute(job.data))
+            except Exception as exc:
+                job.future.set_exception(exc)
+
+    def _next_job(self, lane: str) -> _Job | None:
+        with self._condition:
+            while True:
+                queue = self._eligible_queue(lane)
+                if queue is not None:
+                    return heapq.heappop(queue)
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+    def _eligible_queue(self, lane: str) -> list[_Job] | None:
+        if lane == "fast" or not self._large:
+            return self._small or None
+        if not self._small:
+            return self._large
+        return self._small if self._small[0] < self._large[0] else self._large
@@ -14,7 +14,11 @@ from pydantic import (
     model_validator,
 )
 
+from doc_parsing.application.batch import BatchConfig
 from doc_parsing.application.logging import LoggingConfig
+from doc_parsing.infrastructure.dlq import DlqSpoolConfig
+from doc_parsing.infrastructure.triage.inspection import InspectorConfigBase
+from doc_parsing.infrastructure.triage.inspectors import InspectorConfig
 from doc_parsing.infrastructure.triage.pypdf_inspector import PypdfInspectorConfig
 from doc_parsing.infrastructure.triage.registry import TriagePolicyRegistry
 
@@ -22,12 +26,15 @@ from doc_parsing.infrastructure.triage.registry import TriagePolicyRegistry
 @dataclass(frozen=True, slots=True)
 class TriageCliConfig:
     triage: BaseModel
-    inspection: PypdfInspectorConfig
+    inspection: InspectorConfig
     task_id: str
     document_id: str
-    input_path: Path
+    input_path: str | None
+    inputs: list[str] | None
     output_path: Path | None
     logging: LoggingConfig
+    batch: BatchConfig
+    dlq: DlqSpoolConfig | None
 
 
 class TriageConfigResolver:
@@ -45,12 +52,15 @@ class TriageConfigResolver:
             "TriageCliConfig",
             __base__=_TriageCliBase,
             triage=(triage_model, ...),
-            inspection=(PypdfInspectorConfig, PypdfInspectorConfig()),
+            inspection=(InspectorConfig, PypdfInspectorConfig()),
             task_id=(str, "task-1"),
             document_id=(str, "doc-1"),
-            input_path=(Path, ...),
+            input_path=(str | None, None),
+            inputs=(list[str] | None, None),
             output_path=(Path | None, None),
             logging=(LoggingConfig, LoggingConfig()),
+            batch=(BatchConfig, BatchConfig()),
+            dlq=(DlqSpoolConfig | None, None),
         )
 
     def parse(self, raw_config: dict[str, Any]) -> BaseModel:
@@ -61,15 +71,18 @@ class TriageConfigResolver:
         self,
         model: BaseModel,
         *,
-        input_path: Path | None,
+        input_path: str | None,
         output_path: Path | None,
         task_id: str | None,
         document_id: str | None,
         logging_overrides: dict[str, Any] | None = None,
+        inputs: list[str] | None = None,
     ) -> BaseModel:
         raw = model.model_dump()
         if input_path is not None:
             raw["input_path"] = input_path
+        if inputs is not None:
+            raw["inputs"] = inputs
         if output_path is not None:
             raw["output_path"] = output_path
         if task_id is not None:
@@ -94,12 +107,28 @@ class TriageConfigResolver:
                 raw["triage"] = triage_raw
             elif key.startswith("inspection."):
                 inspection_raw = dict(raw.get("inspection", {}))
-                inspection_raw[key.removeprefix("inspection.")] = value
+                field = key.removeprefix("inspection.")
+                if field == "kind" and value != inspection_raw.get("kind"):
+                    # Only the settings every inspector has carry over.
+                    inspection_raw = {
+                        name: setting
+                        for name, setting in inspection_raw.items()
+                        if name in InspectorConfigBase.model_fields
+                    }
+                inspection_raw[field] = value
                 raw["inspection"] = inspection_raw
             elif key.startswith("logging."):
                 logging_raw = dict(raw.get("logging", {}))
                 logging_raw[key.removeprefix("logging.")] = value
                 raw["logging"] = logging_raw
+            elif key.startswith("batch."):
+                raw["batch"] = _with_nested(
+                    raw.get("batch") or {}, key.removeprefix("batch."), value
+                )
+            elif key.startswith("dlq."):
+                dlq_raw = dict(raw.get("dlq") or {})
+                dlq_raw[key.removeprefix("dlq.")] = value
+                raw["dlq"] = dlq_raw
             else:
                 raw[key] = value
         return type(model).model_validate(raw)
@@ -140,6 +169,15 @@ def _parse_override(entry: str) -> tuple[str, Any]:
     return key, _coerce_value(raw_value)
 
 
+def _with_nested(section: dict[str, Any], key: str, value: Any) -> dict[str, Any]:
+    updated = dict(section)
+    head, _, rest = key.partition(".")
+    updated[head] = (
+        _with_nested(updated.get(head) or {}, rest, value) if rest else value
+    )
+    return updated
+
+
 def _coerce_value(raw: str) -> Any:
     lowered = raw.lower()
     if lowered in {"true", "false"}:
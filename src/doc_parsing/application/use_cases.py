@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import logging
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from typing import Any, BinaryIO
 
+from doc_parsing.application.async_execution import AsyncExecutor, to_thread
+from doc_parsing.application.inputs import (
+    MappedPdfInput,
+    RemotePdfInput,
+    source_type_for,
+)
 from doc_parsing.application.logging import get_logger
 from doc_parsing.domain import (
+    AsyncPdfInspector,
+    AsyncPdfParser,
+    DlqRecord,
+    DlqSink,
     Document,
     DocumentContent,
     DocumentId,
@@ -12,10 +28,15 @@ from doc_parsing.domain import (
     ParseOptions,
     ParsingRequest,
     ParsingTask,
+    ParsingTaskStore,
+    PdfInput,
     PdfInspector,
+    PdfParser,
     PdfParserConfig,
     PdfParserFactory,
-    SourceType,
+    PdfPreflight,
+    PdfPreflightReader,
+    PreflightTriagePolicy,
     TaskId,
     TriageDecision,
     TriageMetadata,
@@ -24,20 +45,34 @@ from doc_parsing.domain import (
     TriageRoute,
 )
 
+# Triage jumps between the trailer, xref and page objects, so it reads small
+# blocks through a bounded LRU block cache. Parsing consumes the whole file,
+# so it reads ahead in large sequential chunks.
+_TRIAGE_REMOTE_READ: dict[str, Any] = {
+    "block_size": 256 * 1024,
+    "cache_type": "blockcache",
+}
+_PARSE_REMOTE_READ: dict[str, Any] = {
+    "block_size": 8 * 1024 * 1024,
+    "cache_type": "readahead",
+}
+
 
 @dataclass(slots=True)
 class ParsePdfToMarkdownInput:
-    file_path: Path
+    file_path: Path | None
     parser_config: PdfParserConfig
     task_id: TaskId
     document_id: DocumentId
     options: ParseOptions = ParseOptions()
+    content: bytes | BinaryIO | None = None
+    source_name: str = "document.pdf"
+    uri: str | None = None
+    source_uri: str | None = None
+    queued_at: datetime | None = None
 
     def __post_init__(self) -> None:
-        if not self.file_path:
-            raise ValueError("file_path is required")
-        if self.file_path.suffix.lower() != ".pdf":
-            raise ValueError("file_path must point to a .pdf file")
+        _validate_source(self.file_path, self.content, self.uri, self.source_name)
 
 
 @dataclass(slots=True)
@@ -46,35 +81,122 @@ class ParsePdfToMarkdownResult:
 
 
 class ParsePdfToMarkdown:
-    def __init__(self, parser_factory: PdfParserFactory) -> None:
+    def __init__(
+        self,
+        parser_factory: PdfParserFactory,
+        *,
+        task_store: ParsingTaskStore | None = None,
+        executor: AsyncExecutor | None = None,
+    ) -> None:
         self._parser_factory = parser_factory
+        self._task_store = task_store
+        self._executor = executor or AsyncExecutor()
 
     def execute(self, data: ParsePdfToMarkdownInput) -> ParsePdfToMarkdownResult:
-        logger = get_logger(
-            __name__,
-            task_id=data.task_id.value,
-            document_id=data.document_id.value,
-            parser_name=data.parser_config.name,
-        )
+        logger = _parse_logger(data)
         parser = self._parser_factory.create(data.parser_config)
 
-        if not data.file_path.exists():
-            raise FileNotFoundError(str(data.file_path))
+        with _open_source(data, _PARSE_REMOTE_READ) as source:
+            task = self._receive(data, source, logger)
+            self._start(task)
+            try:
+                markdown = parser.parse(source, data.options)
+            except Exception as exc:
+                self._fail(task, exc)
+                raise
+            logger.info(
+                "parse.complete",
+                extra={"chars": len(markdown), **_io_extra(source)},
+            )
+        return self._complete(data, task, markdown, logger)
+
+    async def execute_async(
+        self, data: ParsePdfToMarkdownInput
+    ) -> ParsePdfToMarkdownResult:
+        """Async ``execute``, bounded by the executor's in-flight limit.
+
+        Cancelling the caller records the task as cancelled, whether it was
+        still waiting for a slot or already parsing.
+        """
+        executor = self._executor
+        logger = _parse_logger(data)
+        parser: PdfParser | None = None
+        if executor.isolated:
+            data = _picklable_input(data)
+        else:
+            parser = await asyncio.to_thread(
+                self._parser_factory.create, data.parser_config
+            )
+
+        source = await asyncio.to_thread(_open_source, data, _PARSE_REMOTE_READ)
+        with source:
+            task = self._receive(data, source, logger)
+            try:
+                async with executor.in_flight:
+                    self._start(task)
+                    if parser is None:
+                        markdown, io_extra = await executor.run(
+                            _parse_isolated, self._parser_factory, data
+                        )
+                    else:
+                        markdown = await _parse_async(
+                            parser, source, data.options, executor
+                        )
+                        io_extra = _io_extra(source)
+            except asyncio.CancelledError:
+                task.cancel("cancelled")
+                self._record(task)
+                raise
+            except Exception as exc:
+                self._fail(task, exc)
+                raise
+            logger.info("parse.complete", extra={"chars": len(markdown), **io_extra})
+        return self._complete(data, task, markdown, logger)
 
-        logger.info("parse.start", extra={"path": str(data.file_path)})
+    def execute_many_async(
+        self,
+        items: Iterable[ParsePdfToMarkdownInput],
+        *,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[ParsePdfToMarkdownResult | Exception]:
+        """Parse ``items`` concurrently, yielding results as they complete."""
+        return self._executor.as_completed(
+            self.execute_async, items, return_exceptions=return_exceptions
+        )
+
+    def _receive(
+        self,
+        data: ParsePdfToMarkdownInput,
+        source: PdfInput,
+        logger: logging.LoggerAdapter,
+    ) -> ParsingTask:
+        logger.info("parse.start", extra={"path": source.uri})
         task = ParsingTask(
             request=ParsingRequest(
                 task_id=data.task_id,
-                source=DocumentSource(
-                    uri=str(data.file_path), source_type=SourceType.LOCAL_FILE
-                ),
+                source=DocumentSource(uri=source.uri, source_type=source.source_type),
                 options=data.options,
-            )
+            ),
+            queued_at=data.queued_at,
         )
+        self._record(task)
+        return task
+
+    def _start(self, task: ParsingTask) -> None:
         task.start()
+        self._record(task)
 
-        markdown = parser.parse(data.file_path)
-        logger.info("parse.complete", extra={"chars": len(markdown)})
+    def _fail(self, task: ParsingTask, exc: Exception) -> None:
+        task.fail(str(exc) or type(exc).__name__)
+        self._record(task)
+
+    def _complete(
+        self,
+        data: ParsePdfToMarkdownInput,
+        task: ParsingTask,
+        markdown: str,
+        logger: logging.LoggerAdapter,
+    ) -> ParsePdfToMarkdownResult:
         document = Document(
             document_id=data.document_id,
             source=task.request.source,
@@ -82,20 +204,33 @@ class ParsePdfToMarkdown:
         )
 
         task.complete(document)
+        self._record(task)
+        logger.info(
+            "parse.timing",
+            extra={
+                "queue_wait_seconds": round(task.queue_wait_seconds or 0.0, 3),
+                "run_seconds": round(task.run_seconds or 0.0, 3),
+            },
+        )
         return ParsePdfToMarkdownResult(task=task)
 
+    def _record(self, task: ParsingTask) -> None:
+        if self._task_store is not None:
+            self._task_store.record(task)
+
 
 @dataclass(slots=True)
 class TriagePdfInput:
-    file_path: Path
+    file_path: Path | None
     task_id: TaskId
     document_id: DocumentId
+    content: bytes | BinaryIO | None = None
+    source_name: str = "document.pdf"
+    uri: str | None = None
+    source_uri: str | None = None
 
     def __post_init__(self) -> None:
-        if not self.file_path:
-            raise ValueError("file_path is required")
-        if self.file_path.suffix.lower() != ".pdf":
-            raise ValueError("file_path must point to a .pdf file")
+        _validate_source(self.file_path, self.content, self.uri, self.source_name)
 
 
 @dataclass(slots=True)
@@ -103,10 +238,19 @@ class TriagePdfResult:
     result: TriageResult
 
 
-class TriagePolicyChain(TriagePolicy):
+class TriagePolicyChain(PreflightTriagePolicy):
     def __init__(self, policies: list[TriagePolicy]) -> None:
         self._policies = list(policies)
 
+    def decide_preflight(self, preflight: PdfPreflight) -> TriageDecision | None:
+        # Later policies see only what earlier ones leave unmatched, which the
+        # preflight cannot tell apart from what they would match once
+        # inspected; so only the first policy decides here.
+        first = self._policies[0] if self._policies else None
+        if isinstance(first, PreflightTriagePolicy):
+            return first.decide_preflight(preflight)
+        return None
+
     def decide(self, metadata: TriageMetadata) -> TriageDecision | None:
         for policy in self._policies:
             decision = policy.decide(metadata)
@@ -116,28 +260,117 @@ class TriagePolicyChain(TriagePolicy):
 
 
 class TriagePdf:
-    def __init__(self, inspector: PdfInspector, policy: TriagePolicy) -> None:
+    def __init__(
+        self,
+        inspector: PdfInspector,
+        policy: TriagePolicy,
+        *,
+        preflight: PdfPreflightReader | None = None,
+        dlq_sink: DlqSink | None = None,
+        executor: AsyncExecutor | None = None,
+    ) -> None:
         self._inspector = inspector
         self._policy = policy
+        self._preflight = preflight
+        self._dlq_sink = dlq_sink
+        self._executor = executor or AsyncExecutor()
 
     def execute(self, data: TriagePdfInput) -> TriagePdfResult:
-        logger = get_logger(
-            __name__,
-            task_id=data.task_id.value,
-            document_id=data.document_id.value,
-        )
+        logger = _triage_logger(data)
+
+        with _open_source(data, _TRIAGE_REMOTE_READ) as source:
+            _check_header(source)
+            preflight = self._preflight.read(source) if self._preflight else None
+            logger.info("triage.start", extra={"path": source.uri})
+            decision = self._decide_preflight(preflight, logger)
+            if decision is None or preflight is None:
+                metadata = _with_preflight(self._inspector.inspect(source), preflight)
+            else:
+                metadata = _preflight_metadata(preflight)
+            logger.info("triage.io", extra=_io_extra(source))
+            document_source = DocumentSource(
+                uri=source.uri, source_type=source.source_type
+            )
+
+        return self._decide(data, document_source, metadata, logger, decision)
 
-        if not data.file_path.exists():
-            raise FileNotFoundError(str(data.file_path))
+    async def execute_async(self, data: TriagePdfInput) -> TriagePdfResult:
+        """Async ``execute``, bounded by the executor's in-flight limit."""
+        executor = self._executor
+        logger = _triage_logger(data)
+        if executor.isolated:
+            data = _picklable_input(data)
 
-        with data.file_path.open("rb") as handle:
-            header = handle.read(4)
-        if header != b"%PDF":
-            raise ValueError("file_path does not appear to be a PDF")
+        source = await asyncio.to_thread(_open_source, data, _TRIAGE_REMOTE_READ)
+        with source:
+            await to_thread(_check_header, source)
+            preflight = None
+            if self._preflight is not None:
+                preflight = await to_thread(self._preflight.read, source)
+            logger.info("triage.start", extra={"path": source.uri})
+            decision = self._decide_preflight(preflight, logger)
+            if decision is not None and preflight is not None:
+                metadata = _preflight_metadata(preflight)
+                io_extra = _io_extra(source)
+            else:
+                async with executor.in_flight:
+                    if executor.isolated:
+                        metadata, io_extra = await executor.run(
+                            _inspect_isolated, self._inspector, data
+                        )
+                    else:
+                        metadata = await _inspect_async(
+                            self._inspector, source, executor
+                        )
+                        io_extra = _io_extra(source)
+                metadata = _with_preflight(metadata, preflight)
+            logger.info("triage.io", extra=io_extra)
+            document_source = DocumentSource(
+                uri=source.uri, source_type=source.source_type
+            )
+
+        return self._decide(data, document_source, metadata, logger, decision)
+
+    def execute_many_async(
+        self,
+        items: Iterable[TriagePdfInput],
+        *,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[TriagePdfResult | Exception]:
+        """Triage ``items`` concurrently, yielding results as they complete."""
+        return self._executor.as_completed(
+            self.execute_async, items, return_exceptions=return_exceptions
+        )
+
+    def _decide_preflight(
+        self, preflight: PdfPreflight | None, logger: logging.LoggerAdapter
+    ) -> TriageDecision | None:
+        if preflight is None:
+            return None
+        logger.info(
+            "triage.preflight",
+            extra={
+                "file_size": preflight.file_size,
+                "encrypted": preflight.encrypted,
+                "linearized": preflight.linearized,
+                "truncated": preflight.truncated,
+                "page_count": preflight.page_count,
+            },
+        )
+        if not isinstance(self._policy, PreflightTriagePolicy):
+            return None
+        return self._policy.decide_preflight(preflight)
 
-        logger.info("triage.start", extra={"path": str(data.file_path)})
-        metadata = self._inspector.inspect(data.file_path)
-        decision = self._policy.decide(metadata)
+    def _decide(
+        self,
+        data: TriagePdfInput,
+        document_source: DocumentSource,
+        metadata: TriageMetadata,
+        logger: logging.LoggerAdapter,
+        decision: TriageDecision | None = None,
+    ) -> TriagePdfResult:
+        if decision is None:
+            decision = self._policy.decide(metadata)
         if decision is None:
             decision = TriageDecision(
                 route=TriageRoute.DLQ,
@@ -152,9 +385,175 @@ class TriagePdf:
                 "route": decision.route.value,
                 "policy": decision.policy,
                 "rule": decision.rule,
+                "inspected": metadata.inspected,
             },
         )
+        if decision.route == TriageRoute.DLQ and self._dlq_sink is not None:
+            self._dlq_sink.write(
+                DlqRecord(
+                    task_id=data.task_id,
+                    document_id=data.document_id,
+                    source=document_source,
+                    decision=decision,
+                    metadata=metadata,
+                )
+            )
 
         return TriagePdfResult(
             result=TriageResult(metadata=metadata, decision=decision)
         )
+
+
+def _parse_logger(data: ParsePdfToMarkdownInput) -> logging.LoggerAdapter:
+    return get_logger(
+        __name__,
+        task_id=data.task_id.value,
+        document_id=data.document_id.value,
+        parser_name=data.parser_config.name,
+    )
+
+
+def _triage_logger(data: TriagePdfInput) -> logging.LoggerAdapter:
+    return get_logger(
+        __name__, task_id=data.task_id.value, document_id=data.document_id.value
+    )
+
+
+def _preflight_metadata(preflight: PdfPreflight) -> TriageMetadata:
+    return _with_preflight(
+        TriageMetadata(
+            page_count=preflight.page_count or 0,
+            language=None,
+            scanned=False,
+            image_only_pages=0,
+            image_only_page_ratio=0.0,
+            inspected=False,
+        ),
+        preflight,
+    )
+
+
+def _check_header(source: PdfInput) -> None:
+    if source.read_range(0, 4, stage="header") != b"%PDF":
+        raise ValueError("file_path does not appear to be a PDF")
+
+
+def _with_preflight(
+    metadata: TriageMetadata, preflight: PdfPreflight | None
+) -> TriageMetadata:
+    if preflight is None:
+        return metadata
+    return dataclasses.replace(
+        metadata,
+        file_size=preflight.file_size,
+        encrypted=preflight.encrypted,
+        linearized=preflight.linearized,
+        truncated=preflight.truncated,
+    )
+
+
+async def _parse_async(
+    parser: PdfParser,
+    source: PdfInput,
+    options: ParseOptions,
+    executor: AsyncExecutor,
+) -> str:
+    if isinstance(parser, AsyncPdfParser):
+        return await parser.parse_async(source, options)
+    return await executor.run(parser.parse, source, options)
+
+
+async def _inspect_async(
+    inspector: PdfInspector, source: PdfInput, executor: AsyncExecutor
+) -> TriageMetadata:
+    if isinstance(inspector, AsyncPdfInspector):
+        return await inspector.inspect_async(source)
+    return await executor.run(inspector.inspect, source)
+
+
+def _picklable_input[D: (ParsePdfToMarkdownInput, TriagePdfInput)](data: D) -> D:
+    # Process executors reopen the source in the worker from the pickled input.
+    if data.content is None or isinstance(data.content, bytes):
+        return data
+    if isinstance(data.content, bytearray | memoryview):
+        return dataclasses.replace(data, content=bytes(data.content))
+    raise ValueError("process executors need a file_path, uri or bytes content")
+
+
+def _parse_isolated(
+    parser_factory: PdfParserFactory, data: ParsePdfToMarkdownInput
+) -> tuple[str, dict[str, object]]:
+    parser = parser_factory.create(data.parser_config)
+    with _open_source(data, _PARSE_REMOTE_READ) as source:
+        if isinstance(parser, AsyncPdfParser):
+            markdown = asyncio.run(parser.parse_async(source, data.options))
+        else:
+            markdown = parser.parse(source, data.options)
+        return markdown, _io_extra(source)
+
+
+def _inspect_isolated(
+    inspector: PdfInspector, data: TriagePdfInput
+) -> tuple[TriageMetadata, dict[str, object]]:
+    with _open_source(data, _TRIAGE_REMOTE_READ) as source:
+        if isinstance(inspector, AsyncPdfInspector):
+            metadata = asyncio.run(inspector.inspect_async(source))
+        else:
+            metadata = inspector.inspect(source)
+        return metadata, _io_extra(source)
+
+
+def _validate_source(
+    file_path: Path | None,
+    content: bytes | BinaryIO | None,
+    uri: str | None,
+    source_name: str,
+) -> None:
+    provided = sum(value is not None for value in (file_path, content, uri))
+    if provided > 1:
+        raise ValueError("provide only one of file_path, content or uri")
+    if content is not None:
+        if not source_name.strip():
+            raise ValueError("source_name cannot be empty")
+        return
+    if uri is not None:
+        if not uri.strip():
+            raise ValueError("uri cannot be empty")
+        return
+    if not file_path:
+        raise ValueError("file_path is required")
+    if file_path.suffix.lower() != ".pdf":
+        raise ValueError("file_path must point to a .pdf file")
+
+
+def _open_source(
+    data: ParsePdfToMarkdownInput | TriagePdfInput, remote_read: dict[str, Any]
+) -> MappedPdfInput | RemotePdfInput:
+    if isinstance(data.content, bytes | bytearray | memoryview):
+        return MappedPdfInput.from_bytes(bytes(data.content), name=data.source_name)
+    if data.content is not None:
+        return MappedPdfInput.from_stream(data.content, name=data.source_name)
+    if data.uri is not None:
+        return RemotePdfInput.open(data.uri, **remote_read)
+    if data.file_path is None:
+        raise ValueError("file_path is required")
+    if data.source_uri is not None:
+        # A local copy (e.g. from the prefetch spool) keeps its origin.
+        return MappedPdfInput.open(
+            data.file_path,
+            uri=data.source_uri,
+            source_type=source_type_for(data.source_uri),
+        )
+    return MappedPdfInput.open(data.file_path)
+
+
+def _io_extra(source: MappedPdfInput | RemotePdfInput) -> dict[str, object]:
+    extra: dict[str, object] = {
+        "bytes_read": dict(source.bytes_read()),
+        "size_bytes": source.size,
+    }
+    if isinstance(source, MappedPdfInput):
+        extra["mapped"] = source.mapped
+    else:
+        extra["fetched_bytes"] = source.fetched_bytes
+    return extra
@@ -0,0 +1,612 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from multiprocessing.connection import Connection, wait
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from doc_parsing.application.inputs import source_type_for
+from doc_parsing.application.logging import get_logger
+from doc_parsing.application.use_cases import (
+    ParsePdfToMarkdown,
+    ParsePdfToMarkdownInput,
+    ParsePdfToMarkdownResult,
+)
+from doc_parsing.domain import (
+    DocumentSource,
+    ParsingRequest,
+    ParsingTask,
+    ParsingTaskStore,
+    PdfParserConfig,
+    PdfParserFactory,
+    WarmablePdfParserFactory,
+)
+
+
+class WorkerPoolConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    workers: int = 2
+    timeout_seconds: float | None = None
+    timeout_seconds_per_page: float = 0.0
+    start_method: Literal["spawn", "forkserver", "fork", "zygote"] = "spawn"
+    max_rss_mb: float | None = None
+    max_tasks_per_worker: int | None = None
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> WorkerPoolConfig:
+        if self.workers < 1:
+            raise ValueError("workers must be >= 1")
+        if self.timeout_seconds is not None and self.timeout_seconds <= 0:
+            raise ValueError("timeout_seconds must be > 0")
+        if self.timeout_seconds_per_page < 0:
+            raise ValueError("timeout_seconds_per_page must be >= 0")
+        if self.max_rss_mb is not None and self.max_rss_mb <= 0:
+            raise ValueError("max_rss_mb must be > 0")
+        if self.max_tasks_per_worker is not None and self.max_tasks_per_worker < 1:
+            raise ValueError("max_tasks_per_worker must be >= 1")
+        if self.start_method == "zygote" and not hasattr(socket, "send_fds"):
+            raise ValueError("start_method zygote is not supported on this platform")
+        return self
+
+    def budget_seconds(self, page_count: int | None) -> float | None:
+        """Wall-clock budget for one document, or None for no limit."""
+        per_page = self.timeout_seconds_per_page * (page_count or 0)
+        if self.timeout_seconds is None and not per_page:
+            return None
+        return (self.timeout_seconds or 0.0) + per_page
+
+
+@dataclass(frozen=True, slots=True)
+class ParseWorkerSpec:
+    """Everything a worker process needs to build its own use case.
+
+    Under every start method but ``fork`` the spec is pickled, so
+    ``parser_factory`` and ``task_store`` must be picklable (a registry
+    instance, a module-level function, a ``functools.partial``). Workers warm
+    the factory for each ``preload`` config before taking documents.
+    """
+
+    parser_factory: PdfParserFactory
+    task_store: Callable[[], ParsingTaskStore] | None = None
+    preload: tuple[PdfParserConfig, ...] = ()
+
+
+class ParseTimeoutError(TimeoutError):
+    def __init__(self, task: ParsingTask, budget_seconds: float) -> None:
+        elapsed = task.run_seconds or 0.0
+        super().__init__(f"timeout after {elapsed:.1f}s (budget {budget_seconds:.1f}s)")
+        self.task = task
+        self.budget_seconds = budget_seconds
+
+
+class WorkerCrashedError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True)
+class _Job:
+    data: ParsePdfToMarkdownInput
+    budget_seconds: float | None
+    future: Future[ParsePdfToMarkdownResult]
+    dispatched_at: datetime | None = None
+    deadline: float | None = None
+
+
+@dataclass(slots=True)
+class _Worker:
+    process: Any
+    connection: Connection
+    ready: bool = False
+    job: _Job | None = None
+    tasks: int = 0
+    rss_bytes: int | None = None
+    started: float = field(default_factory=time.monotonic)
+    # Set while a recycled worker keeps serving until its successor is warm.
+    replacement: _Worker | None = None
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+
+class ParseWorkerPool:
+    """Runs ``ParsePdfToMarkdown`` in supervised child processes.
+
+    A supervisor thread hands queued documents to idle workers and watches
+    each one against its wall-clock budget. A worker that overruns is
+    killed and replaced, and the document's future fails with
+    ``ParseTimeoutError`` carrying a ``CANCELLED`` task. A worker that dies
+    mid-document fails it with ``WorkerCrashedError``.
+
+    Workers report their resident memory after every document. One that
+    passes ``max_rss_mb`` or ``max_tasks_per_worker`` is recycled: its
+    replacement is started first, the old worker keeps taking documents
+    until the replacement has finished warming up, and it is then stopped
+    once idle.
+
+    With ``start_method="zygote"`` a single spawned process warms the parser
+    once and forks every worker from that state, so the model weights are
+    shared copy-on-write rather than loaded by each worker.
+    """
+
+    def __init__(self, spec: ParseWorkerSpec, config: WorkerPoolConfig) -> None:
+        self._spec = spec
+        self._config = config
+        zygote = config.start_method == "zygote"
+        self._context = multiprocessing.get_context(
+            "spawn" if zygote else config.start_method
+        )
+        self._logger = get_logger(__name__)
+        self._pending: deque[_Job] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._failed: WorkerCrashedError | None = None
+        self._wake_reader, self._wake_writer = self._context.Pipe(duplex=False)
+        self._zygote = _Zygote(spec, self._context) if zygote else None
+        try:
+            self._workers = [self._spawn() for _ in range(config.workers)]
+        except BaseException:
+            if self._zygote is not None:
+                self._zygote.close()
+            raise
+        self._supervisor = threading.Thread(
+            target=self._supervise, name="parse-pool-supervisor", daemon=True
+        )
+        self._supervisor.start()
+
+    def submit(
+        self, data: ParsePdfToMarkdownInput, *, page_count: int | None = None
+    ) -> Future[ParsePdfToMarkdownResult]:
+        if data.content is not None:
+            raise ValueError("worker pools take file_path or uri inputs, not content")
+        job = _Job(
+            data=data,
+            budget_seconds=self._config.budget_seconds(page_count),
+            future=Future(),
+        )
+        with self._lock:
+            if self._closed:
+                raise ValueError("worker pool is closed")
+            if self._failed is not None:
+                raise WorkerCrashedError(str(self._failed))
+            self._pending.append(job)
+            self._wake_writer.send_bytes(b"j")
+        return job.future
+
+    def worker_pids(self) -> list[int]:
+        return [worker.pid for worker in self._workers]
+
+    def ready_workers(self) -> int:
+        """Workers that have finished warming up and can take documents."""
+        return sum(worker.ready for worker in self._workers)
+
+    def close(self) -> None:
+        """Finish queued documents, then stop every worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake_writer.send_bytes(b"c")
+        self._supervisor.join()
+        if self._zygote is not None:
+            self._zygote.close()
+        self._wake_reader.close()
+        self._wake_writer.close()
+
+    def __enter__(self) -> ParseWorkerPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _spawn(self) -> _Worker:
+        if self._zygote is not None:
+            process, connection = self._zygote.fork()
+            return _Worker(process=process, connection=connection)
+        parent, child = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self._spec, child),
+            name="doc-parse-worker",
+        )
+        process.start()
+        child.close()
+        return _Worker(process=process, connection=parent)
+
+    def _supervise(self) -> None:
+        while True:
+            try:
+                with self._lock:
+                    self._dispatch()
+                    closing = self._closed and not self._pending
+                if closing and all(worker.job is None for worker in self._workers):
+                    break
+                ready = wait(
+                    [
+                        self._wake_reader,
+                        *(worker.connection for worker in self._workers),
+                    ],
+                    timeout=self._next_deadline_in(),
+                )
+                for connection in ready:
+                    if connection is self._wake_reader:
+                        self._wake_reader.recv_bytes()
+                    else:
+                        self._receive(self._worker_for(connection))
+                self._expire_overdue()
+                self._retire_drained()
+            except WorkerCrashedError as exc:
+                # Only spawning raises here (the zygote died), and every later
+                # spawn would fail the same way.
+                self._logger.error("worker.spawn_failed", extra={"error": str(exc)})
+                self._fail(WorkerCrashedError(f"no parse worker could start: {exc}"))
+                break
+        for worker in self._workers:
+            self._stop(worker)
+
+    def _dispatch(self) -> None:
+        for worker in list(self._workers):
+            if not worker.ready or worker.job is not None or _retired(worker):
+                continue
+            while self._pending and worker.job is None:
+                if not self._hand_out(worker, self._pending.popleft()):
+                    break
+
+    def _hand_out(self, worker: _Worker, job: _Job) -> bool:
+        """Send ``job`` to ``worker``; False if the worker turned out dead."""
+        # A job put back after a failed send is already running.
+        if not job.future.running() and not job.future.set_running_or_notify_cancel():
+            return True
+        try:
+            payload = ForkingPickler.dumps(job.data)
+        except Exception as exc:
+            job.future.set_exception(exc)
+            return True
+        try:
+            worker.connection.send_bytes(payload)
+        except OSError:
+            # The worker died while idle; the document never reached it.
+            self._pending.appendleft(job)
+            self._replace(worker, reason="crashed")
+            return False
+        job.dispatched_at = datetime.now(tz=UTC)
+        if job.budget_seconds is not None:
+            job.deadline = time.monotonic() + job.budget_seconds
+        worker.job = job
+        return True
+
+    def _next_deadline_in(self) -> float | None:
+        deadlines = [
+            worker.job.deadline
+            for worker in self._workers
+            if worker.job is not None and worker.job.deadline is not None
+        ]
+        if not deadlines:
+            return None
+        return max(min(deadlines) - time.monotonic(), 0.0)
+
+    def _worker_for(self, connection: Any) -> _Worker:
+        return next(w for w in self._workers if w.connection is connection)
+
+    def _receive(self, worker: _Worker) -> None:
+        try:
+            kind, payload, worker.rss_bytes = worker.connection.recv()
+        except (EOFError, OSError):
+            self._replace(worker, reason="crashed")
+            return
+        if kind == "ready":
+            worker.ready = True
+            return
+        job, worker.job = worker.job, None
+        worker.tasks += 1
+        if job is not None:
+            if kind == "done":
+                job.future.set_result(payload)
+            else:
+                job.future.set_exception(payload)
+        self._maybe_recycle(worker)
+
+    def _maybe_recycle(self, worker: _Worker) -> None:
+        if worker.replacement is not None:
+            return
+        rss_mb = (worker.rss_bytes or 0) / (1024 * 1024)
+        if self._config.max_rss_mb is not None and rss_mb >= self._config.max_rss_mb:
+            reason = "max_rss"
+        elif (
+            self._config.max_tasks_per_worker is not None
+            and worker.tasks >= self._config.max_tasks_per_worker
+        ):
+            reason = "max_tasks"
+        else:
+            return
+        worker.replacement = self._spawn()
+        self._workers.append(worker.replacement)
+        self._logger.info(
+            "worker.recycle.start",
+            extra={
+                "reason": reason,
+                "pid": worker.pid,
+                "replacement_pid": worker.replacement.pid,
+                "rss_mb": round(rss_mb, 1),
+                "tasks": worker.tasks,
+            },
+        )
+
+    def _retire_drained(self) -> None:
+        for worker in list(self._workers):
+            if not _retired(worker) or worker.job is not None:
+                continue
+            self._workers.remove(worker)
+            self._stop(worker)
+            self._logger.info(
+                "worker.recycled",
+                extra={
+                    "pid": worker.pid,
+                    "replacement_pid": worker.replacement.pid
+                    if worker.replacement
+                    else None,
+                    "rss_mb": round((worker.rss_bytes or 0) / (1024 * 1024), 1),
+                    "tasks": worker.tasks,
+                    "age_seconds": round(time.monotonic() - worker.started, 1),
+                },
+            )
+
+    def _expire_overdue(self) -> None:
+        now = time.monotonic()
+        for worker in list(self._workers):
+            job = worker.job
+            if job is None or job.deadline is None or job.deadline > now:
+                continue
+            worker.job = None
+            self._replace(worker, reason="timeout")
+            job.future.set_exception(
+                ParseTimeoutError(
+                    _cancelled_task(job, reason="timeout"), job.budget_seconds or 0.0
+                )
+            )
+
+    def _replace(self, worker: _Worker, *, reason: str) -> None:
+        worker.process.kill()
+        worker.process.join()
+        worker.connection.close()
+        job, worker.job = worker.job, None
+        if job is not None:
+            job.future.set_exception(
+                WorkerCrashedError(
+                    f"worker {worker.pid} exited with code {worker.process.exitcode}"
+                )
+            )
+        if not worker.ready:
+            self._abandon(worker)
+            return
+        if worker.replacement is not None:
+            # Already being recycled; its successor takes over the slot.
+            self._workers.remove(worker)
+            replacement = worker.replacement
+        else:
+            replacement = self._spawn()
+            self._workers[self._workers.index(worker)] = replacement
+            for other in self._workers:
+                if other.replacement is worker:
+                    other.replacement = replacement
+        self._logger.warning(
+            "worker.replaced",
+            extra={
+                "reason": reason,
+                "pid": worker.pid,
+                "replacement_pid": replacement.pid,
+                "tasks": worker.tasks,
+            },
+        )
+
+    def _abandon(self, worker: _Worker) -> None:
+        # A worker that dies while warming up (missing models, a bad parser
+        # config) would fail the same way again, so it is not respawned.
+        self._workers.remove(worker)
+        for other in self._workers:
+            if other.replacement is worker:
+                other.replacement = None
+        self._logger.error(
+            "worker.start_failed",
+            extra={"pid": worker.pid, "exitcode": worker.process.exitcode},
+        )
+        if not self._workers:
+            self._fail(
+                WorkerCrashedError("no parse worker could start; see worker logs")
+            )
+
+    def _fail(self, error: WorkerCrashedError) -> None:
+        """Fail every queued and running document, and every later submit."""
+        with self._lock:
+            self._failed = error
+            pending, self._pending = self._pending, deque()
+        for job in pending:
+            if job.future.set_running_or_notify_cancel():
+                job.future.set_exception(error)
+        for worker in self._workers:
+            job, worker.job = worker.job, None
+            if job is not None:
+                job.future.set_exception(error)
+
+    def _stop(self, worker: _Worker) -> None:
+        try:
+            worker.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        worker.process.join(timeout=10)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.connection.close()
+
+
+class _Zygote:
+    """A warmed-up process that forks pool workers on request."""
+
+    def __init__(self, spec: ParseWorkerSpec, context: Any) -> None:
+        self._control, child = socket.socketpair()
+        self._process = context.Process(
+            target=_zygote_main, args=(spec, child), name="doc-parse-zygote"
+        )
+        self._process.start()
+        child.close()
+        self._lock = threading.Lock()
+
+    def fork(self) -> tuple[_ForkedProcess, Connection]:
+        with self._lock:
+            try:
+                self._control.sendall(b"f")
+                message, fds, _, _ = socket.recv_fds(self._control, 16, 1)
+            except OSError:
+                message, fds = b"", []
+        if not message or not fds:
+            raise WorkerCrashedError(
+                f"zygote {self._process.pid} exited with code {self._process.exitcode}"
+            )
+        return _ForkedProcess(int(message)), Connection(fds[0])
+
+    def close(self) -> None:
+        self._control.close()
+        self._process.join(timeout=10)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+
+
+@dataclass(slots=True)
+class _ForkedProcess:
+    """The parts of ``Process`` the pool uses, for a worker the zygote forked.
+
+    The zygote is the worker's parent and reaps it, so liveness is probed
+    with signal 0 rather than ``waitpid``.
+    """
+
+    pid: int
+    exitcode: int | None = None
+
+    def is_alive(self) -> bool:
+        try:
+            os.kill(self.pid, 0)
+        except (ProcessLookupError, PermissionError):
+            return False
+        return True
+
+    def kill(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            return
+        self.exitcode = -signal.SIGKILL
+
+    def join(self, timeout: float | None = None) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(0.01)
+
+
+def _zygote_main(spec: ParseWorkerSpec, control: socket.socket) -> None:
+    _warm(spec)
+    # Forked workers are reaped by the kernel as soon as they exit.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    while control.recv(1):
+        parent, child = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:
+            control.close()
+            parent.close()
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            try:
+                _worker_main(spec, Connection(child.detach()))
+            except BaseException:
+                traceback.print_exc()
+                os._exit(1)
+            os._exit(0)
+        child.close()
+        socket.send_fds(control, [str(pid).encode()], [parent.fileno()])
+        parent.close()
+
+
+def _worker_main(spec: ParseWorkerSpec, connection: Connection) -> None:
+    # Not a daemon process, so parsers may start processes of their own; a
+    # closed pipe (parent gone) ends the loop instead.
+    _warm(spec)
+    store = spec.task_store() if spec.task_store is not None else None
+    use_case = ParsePdfToMarkdown(spec.parser_factory, task_store=store)
+    connection.send(("ready", os.getpid(), _rss_bytes()))
+    while True:
+        try:
+            data = connection.recv()
+        except EOFError:
+            break
+        if data is None:
+            break
+        try:
+            connection.send(("done", use_case.execute(data), _rss_bytes()))
+        except Exception as exc:
+            try:
+                connection.send(("error", exc, _rss_bytes()))
+            except Exception:
+                # The exception itself may not pickle; keep its message.
+                connection.send(("error", RuntimeError(str(exc)), _rss_bytes()))
+    if store is not None:
+        store.flush()
+
+
+def _warm(spec: ParseWorkerSpec) -> None:
+    if isinstance(spec.parser_factory, WarmablePdfParserFactory):
+        for config in spec.preload:
+            spec.parser_factory.warm(config)
+
+
+def _retired(worker: _Worker) -> bool:
+    return worker.replacement is not None and worker.replacement.ready
+
+
+def _rss_bytes() -> int | None:
+    """Current resident set size; peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _cancelled_task(job: _Job, *, reason: str) -> ParsingTask:
+    data = job.data
+    uri = data.source_uri or data.uri or str(data.file_path)
+    task = ParsingTask(
+        request=ParsingRequest(
+            task_id=data.task_id,
+            source=DocumentSource(uri=uri, source_type=source_type_for(uri)),
+            options=data.options,
+        ),
+        queued_at=data.queued_at,
+    )
+    task.start()
+    # The child never reported back, so the run started when it was handed out.
+    task.started_at = job.dispatched_at or task.started_at
+    task.cancel(reason)
+    return task
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
 import pdb
+import signal
 import sys
+import threading
+import time
 import traceback
-from pathlib import Path
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from pathlib import Path, PurePosixPath
 from typing import Any, cast
 
 import typer
@@ -12,28 +22,75 @@ import yaml
 from rich.console import Console
 from rich.panel import Panel
 
-from doc_parsing.application import ParsePdfToMarkdown, ParsePdfToMarkdownInput
+from doc_parsing.application import (
+    BatchConfig,
+    BatchItem,
+    BatchReport,
+    ParsePdfToMarkdown,
+    ParsePdfToMarkdownInput,
+    ParsePdfToMarkdownResult,
+    ParseScheduler,
+    ParseTimeoutError,
+    ParseWorkerPool,
+    ParseWorkerSpec,
+    SpooledInput,
+    WorkerPoolConfig,
+    replay_dlq,
+    run_batch,
+)
 from doc_parsing.application.config_resolver import ConfigResolver
+from doc_parsing.application.inputs import MappedPdfInput, is_remote_uri
 from doc_parsing.application.logging import LoggingConfig, configure_logging
+from doc_parsing.application.routing import ProfileRouter, TriagedParse
 from doc_parsing.application.triage_config_resolver import TriageConfigResolver
 from doc_parsing.application.use_cases import (
     TriagePdf,
     TriagePdfInput,
     TriagePolicyChain,
 )
+from doc_parsing.daemon import (
+    SOCKET_ENV,
+    DaemonClient,
+    DaemonHandler,
+    DaemonServer,
+    DaemonUnavailableError,
+    default_socket_path,
+)
 from doc_parsing.domain import (
     DocumentId,
+    ParseStatus,
     PdfParserConfig,
+    PdfPreflightReader,
     TaskId,
+    TriageMetadata,
+)
+from doc_parsing.http_service import HttpParseService, HttpServiceConfig
+from doc_parsing.infrastructure import (
+    DlqSpoolReader,
+    DlqSpoolSink,
+    ParserRegistry,
+    SqliteParsingTaskStore,
+    encode_triage_metadata,
+)
+from doc_parsing.infrastructure.triage import (
+    TriagePolicyRegistry,
+    XrefPreflightReader,
+    create_inspector,
 )
-from doc_parsing.infrastructure import ParserRegistry
-from doc_parsing.infrastructure.triage import PypdfInspector, TriagePolicyRegistry
 
 app = typer.Typer(add_completion=False)
 console = Console()
+err_console = Console(stderr=True)
 
 CONFIG_OPT = typer.Option(None, "--config", "-c")
-INPUT_OPT = typer.Option(None, "--input", "-i")
+INPUT_OPT = typer.Option(
+    None, "--input", "-i", help="PDF path or URI (s3://, https://), or - for stdin"
+)
+INPUTS_FILE_OPT = typer.Option(
+    None,
+    "--inputs-file",
+    help="File listing one PDF path or URI per line; runs them as a batch",
+)
 OUTPUT_OPT = typer.Option(None, "--output", "-o")
 PARSER_OPT = typer.Option(None, "--parser", "-p")
 SET_OPT = typer.Option(None, "--set")
@@ -43,6 +100,30 @@ PDB_OPT = typer.Option(False, "--pdb", help="Drop into pdb on error")
 LOG_LEVEL_OPT = typer.Option(None, "--log-level")
 LOG_FORMAT_OPT = typer.Option(None, "--log-format")
 LOG_FILE_OPT = typer.Option(None, "--log-file")
+RUN_ID_OPT = typer.Option(
+    None,
+    "--run-id",
+    help="Checkpoint a batch under this id; rerunning it skips finished tasks",
+)
+SOCKET_OPT = typer.Option(
+    None,
+    "--socket",
+    help=f"Daemon socket; defaults to ${SOCKET_ENV} or a per-user runtime path",
+)
+NO_DAEMON_OPT = typer.Option(
+    False, "--no-daemon", help="Run in this process even if a daemon is listening"
+)
+CONCURRENCY_OPT = typer.Option(
+    1, "--concurrency", help="Daemon requests handled at the same time"
+)
+HOST_OPT = typer.Option("127.0.0.1", "--host")
+PORT_OPT = typer.Option(8080, "--port")
+MAX_PENDING_OPT = typer.Option(
+    64, "--max-pending", help="Queued uploads before new ones get HTTP 429"
+)
+STDIN_INPUT = "-"
+JOB_STORE_NAME = ".doc-parse-jobs.sqlite3"
+DAEMON_CONFIG_CACHE_SIZE = 128
 
 
 def _load_yaml_config(config: str | None) -> dict[str, Any] | None:
@@ -65,7 +146,8 @@ def _load_yaml_config(config: str | None) -> dict[str, Any] | None:
 @app.command("parse")
 def parse_pdf(
     config_path: str | None = CONFIG_OPT,
-    input_path: Path | None = INPUT_OPT,
+    input_path: str | None = INPUT_OPT,
+    inputs_file: Path | None = INPUTS_FILE_OPT,
     parser: str | None = PARSER_OPT,
     output_path: Path | None = OUTPUT_OPT,
     task_id: str | None = TASK_ID_OPT,
@@ -75,67 +157,97 @@ def parse_pdf(
     log_format: str | None = LOG_FORMAT_OPT,
     log_file: Path | None = LOG_FILE_OPT,
     pdb_on_error: bool = PDB_OPT,
+    run_id: str | None = RUN_ID_OPT,
+    socket_path: Path | None = SOCKET_OPT,
+    no_daemon: bool = NO_DAEMON_OPT,
 ) -> None:
     """Parse a PDF into markdown using a configured parser."""
-    registry = ParserRegistry()
-    registry.load_from_entrypoints()
-
-    use_case = ParsePdfToMarkdown(registry)
-    resolver = ConfigResolver(registry)
     raw_config = _load_yaml_config(config_path)
 
     if raw_config is None:
         raw_config = {}
     if "parser" not in raw_config:
-        raise ValueError("parser must be specified in raw config")
-    if "input_path" not in raw_config:
-        if input_path is None:
-            raise ValueError("input_path is required (use --input or config)")
-        raw_config["input_path"] = input_path
-
-    config_model = resolver.parse(raw_config)
-    logging_overrides: dict[str, Any] = {}
-    if log_level is not None:
-        logging_overrides["level"] = log_level
-    if log_format is not None:
-        logging_overrides["format"] = log_format
-    if log_file is not None:
-        logging_overrides["file"] = log_file
-    updated_config = resolver.apply_base_overrides(
-        config_model,
+        if parser is None:
+            raise ValueError("parser must be specified in raw config or --parser")
+        raw_config["parser"] = {"kind": parser}
+
+    stdin_bytes = None
+    if not (no_daemon or pdb_on_error or inputs_file or run_id):
+        response, stdin_bytes = _request_daemon(
+            socket_path,
+            "parse",
+            {
+                "config": raw_config,
+                "input_path": input_path,
+                "output_path": str(output_path) if output_path else None,
+                "parser": parser,
+                "task_id": task_id,
+                "document_id": document_id,
+                "set_values": set_values or [],
+            },
+            input_path=input_path,
+            config_path=config_path,
+        )
+        if response is not None:
+            if response["status"] != "ok":
+                console.print(
+                    Panel(response["error"], title="Parse Failed", style="red")
+                )
+                raise typer.Exit(code=1)
+            output = response["output_path"]
+            _emit_markdown(
+                response["markdown"],
+                Path(output) if output else None,
+                from_stdin=stdin_bytes is not None,
+            )
+            return
+
+    registry = ParserRegistry()
+    registry.load_from_entrypoints()
+
+    use_case = ParsePdfToMarkdown(registry)
+    resolver = ConfigResolver(registry)
+    updated_config = _resolve_parse_config(
+        resolver,
+        raw_config,
         input_path=input_path,
         output_path=output_path,
         task_id=task_id,
         document_id=document_id,
-        parser_kind=parser,
-        logging_overrides=logging_overrides or None,
+        parser=parser,
+        set_values=set_values,
+        logging_overrides=_logging_overrides(log_level, log_format, log_file),
+        inputs=_read_inputs_file(inputs_file),
     )
-    if set_values:
-        updated_config = resolver.apply_overrides(
-            updated_config,
-            overrides=set_values,
-        )
 
     config_logging = cast(Any, updated_config).logging
     configure_logging(LoggingConfig.model_validate(config_logging))
 
-    parser_model = cast(Any, updated_config).parser
-    parser_name = getattr(parser_model, "kind", None)
-    if parser_name is None:
-        raise ValueError("parser kind is required")
+    parser_config = _parser_config(updated_config)
+    router = _profile_router(registry, updated_config, parser_config)
 
-    parser_options = parser_model.model_dump(exclude={"kind"})
-    parser_config = PdfParserConfig(name=parser_name, options=parser_options)
+    if cast(Any, updated_config).inputs:
+        _run_parse_batch(
+            registry, parser_config, updated_config, run_id=run_id, router=router
+        )
+        return
+    if run_id is not None:
+        raise ValueError("--run-id requires --inputs-file or inputs in config")
 
+    resolved_input = _require_input(cast(Any, updated_config).input_path)
+    from_stdin = _is_stdin(resolved_input, config_path)
     try:
-        result = use_case.execute(
-            ParsePdfToMarkdownInput(
-                file_path=cast(Any, updated_config).input_path,
-                parser_config=parser_config,
-                task_id=TaskId(cast(Any, updated_config).task_id),
-                document_id=DocumentId(cast(Any, updated_config).document_id),
+        with _routed_execute(updated_config, router, use_case.execute) as execute:
+            result = execute(
+                ParsePdfToMarkdownInput(
+                    parser_config=parser_config,
+                    task_id=TaskId(cast(Any, updated_config).task_id),
+                    document_id=DocumentId(cast(Any, updated_config).document_id),
+                    **_source_arguments(
+                        resolved_input, from_stdin=from_stdin, stdin_bytes=stdin_bytes
+                    ),
+                )
             )
-        )
     except Exception as exc:
         console.print(Panel(str(exc), title="Parse Failed", style="red"))
         if pdb_on_error:
@@ -144,30 +256,16 @@ def parse_pdf(
         raise typer.Exit(code=1) from exc
 
     markdown = result.task.document.markdown if result.task.document else None
-    if markdown is None:
-        console.print(
-            Panel("No markdown produced", title="Parse Result", style="yellow")
-        )
-        raise typer.Exit(code=1)
-
-    output_path = cast(Any, updated_config).output_path
-    if output_path is not None:
-        output_path.write_text(markdown)
-        console.print(
-            Panel(
-                f"Markdown written to {output_path}",
-                title="Parse Result",
-                style="green",
-            )
-        )
-    else:
-        console.print(markdown)
+    _emit_markdown(
+        markdown, cast(Any, updated_config).output_path, from_stdin=from_stdin
+    )
 
 
 @app.command("triage")
 def triage_pdf(
     config_path: str | None = CONFIG_OPT,
-    input_path: Path | None = INPUT_OPT,
+    input_path: str | None = INPUT_OPT,
+    inputs_file: Path | None = INPUTS_FILE_OPT,
     output_path: Path | None = OUTPUT_OPT,
     task_id: str | None = TASK_ID_OPT,
     document_id: str | None = DOCUMENT_ID_OPT,
@@ -176,63 +274,87 @@ def triage_pdf(
     log_format: str | None = LOG_FORMAT_OPT,
     log_file: Path | None = LOG_FILE_OPT,
     pdb_on_error: bool = PDB_OPT,
+    socket_path: Path | None = SOCKET_OPT,
+    no_daemon: bool = NO_DAEMON_OPT,
 ) -> None:
     """Inspect a PDF and return triage metadata + decision as JSON."""
-    registry = TriagePolicyRegistry()
-    registry.load_from_entrypoints()
-
-    resolver = TriageConfigResolver(registry)
     raw_config = _load_yaml_config(config_path)
 
     if raw_config is None:
         raw_config = {}
     if "triage" not in raw_config:
         raise ValueError("triage must be specified in raw config")
-    if "input_path" not in raw_config:
-        if input_path is None:
-            raise ValueError("input_path is required (use --input or config)")
-        raw_config["input_path"] = input_path
-
-    config_model = resolver.parse(raw_config)
-    logging_overrides: dict[str, Any] = {}
-    if log_level is not None:
-        logging_overrides["level"] = log_level
-    if log_format is not None:
-        logging_overrides["format"] = log_format
-    if log_file is not None:
-        logging_overrides["file"] = log_file
-    updated_config = resolver.apply_base_overrides(
-        config_model,
+
+    stdin_bytes = None
+    if not (no_daemon or pdb_on_error or inputs_file):
+        response, stdin_bytes = _request_daemon(
+            socket_path,
+            "triage",
+            {
+                "config": raw_config,
+                "input_path": input_path,
+                "output_path": str(output_path) if output_path else None,
+                "task_id": task_id,
+                "document_id": document_id,
+                "set_values": set_values or [],
+            },
+            input_path=input_path,
+            config_path=config_path,
+        )
+        if response is not None:
+            if response["status"] != "ok":
+                console.print(
+                    Panel(response["error"], title="Triage Failed", style="red")
+                )
+                raise typer.Exit(code=1)
+            output = response["output_path"]
+            _emit_triage(response["payload"], Path(output) if output else None)
+            return
+
+    registry = TriagePolicyRegistry()
+    registry.load_from_entrypoints()
+
+    resolver = TriageConfigResolver(registry)
+    updated_config = _resolve_triage_config(
+        resolver,
+        raw_config,
         input_path=input_path,
         output_path=output_path,
         task_id=task_id,
         document_id=document_id,
-        logging_overrides=logging_overrides or None,
+        set_values=set_values,
+        logging_overrides=_logging_overrides(log_level, log_format, log_file),
+        inputs=_read_inputs_file(inputs_file),
     )
-    if set_values:
-        updated_config = resolver.apply_overrides(
-            updated_config,
-            overrides=set_values,
-        )
 
     config_logging = cast(Any, updated_config).logging
     configure_logging(LoggingConfig.model_validate(config_logging))
 
-    inspection_config = cast(Any, updated_config).inspection
-    inspector = PypdfInspector(inspection_config)
-    policy_configs = cast(Any, updated_config).triage.policies
-    policies = [registry.create(policy) for policy in policy_configs]
-    policy_chain = TriagePolicyChain(policies)
-    use_case = TriagePdf(inspector, policy_chain)
+    batch_inputs = cast(Any, updated_config).inputs
+    if batch_inputs:
+        with _triage_use_case(registry, updated_config) as use_case:
+            report = run_batch(
+                _batch_items(batch_inputs, cast(Any, updated_config).task_id),
+                _triage_worker(use_case),
+                cast(Any, updated_config).batch,
+            )
+        _write_triage_lines(report, cast(Any, updated_config).output_path)
+        _finish_batch(report, title="Triage Batch")
+        return
 
+    resolved_input = _require_input(cast(Any, updated_config).input_path)
+    from_stdin = _is_stdin(resolved_input, config_path)
     try:
-        result = use_case.execute(
-            TriagePdfInput(
-                file_path=cast(Any, updated_config).input_path,
-                task_id=TaskId(cast(Any, updated_config).task_id),
-                document_id=DocumentId(cast(Any, updated_config).document_id),
+        with _triage_use_case(registry, updated_config) as use_case:
+            result = use_case.execute(
+                TriagePdfInput(
+                    task_id=TaskId(cast(Any, updated_config).task_id),
+                    document_id=DocumentId(cast(Any, updated_config).document_id),
+                    **_source_arguments(
+                        resolved_input, from_stdin=from_stdin, stdin_bytes=stdin_bytes
+                    ),
+                )
             )
-        )
     except Exception as exc:
         console.print(Panel(str(exc), title="Triage Failed", style="red"))
         if pdb_on_error:
@@ -240,24 +362,821 @@ def triage_pdf(
             pdb.post_mortem(exc.__traceback__)
         raise typer.Exit(code=1) from exc
 
-    payload = _triage_payload(result.result)
-    json_payload = json.dumps(payload, indent=2)
+    _emit_triage(_triage_payload(result.result), cast(Any, updated_config).output_path)
+
+
+@app.command("warmup")
+def warmup_parser(
+    config_path: str | None = CONFIG_OPT,
+    parser: str | None = PARSER_OPT,
+    set_values: list[str] | None = SET_OPT,
+    log_level: str | None = LOG_LEVEL_OPT,
+    log_format: str | None = LOG_FORMAT_OPT,
+    log_file: Path | None = LOG_FILE_OPT,
+) -> None:
+    """Download and load the configured parser's models ahead of a run."""
+    registry = ParserRegistry()
+    registry.load_from_entrypoints()
+
+    resolver = ConfigResolver(registry)
+    raw_config = _load_yaml_config(config_path) or {}
+    if "parser" not in raw_config:
+        if parser is None:
+            raise ValueError("parser must be specified in raw config or --parser")
+        raw_config["parser"] = {"kind": parser}
+    updated_config = _resolve_parse_config(
+        resolver,
+        raw_config,
+        parser=parser,
+        set_values=set_values,
+        logging_overrides=_logging_overrides(log_level, log_format, log_file),
+    )
+    configure_logging(LoggingConfig.model_validate(cast(Any, updated_config).logging))
+
+    parser_config = _parser_config(updated_config)
+    profiles = ProfileRouter(parser_config, cast(Any, updated_config).profiles)
+    started = time.perf_counter()
+    try:
+        for warm_config in (parser_config, *profiles.parser_configs()):
+            registry.warm(warm_config)
+    except Exception as exc:
+        console.print(Panel(str(exc), title="Warmup Failed", style="red"))
+        raise typer.Exit(code=1) from exc
+    console.print(
+        Panel(
+            f"Parser {parser_config.name} ready in "
+            f"{time.perf_counter() - started:.1f}s",
+            title="Warmup",
+            style="green",
+        )
+    )
+
+
+@app.command("serve")
+def serve_daemon(
+    socket_path: Path | None = SOCKET_OPT,
+    config_path: str | None = CONFIG_OPT,
+    parser: str | None = PARSER_OPT,
+    concurrency: int = CONCURRENCY_OPT,
+    log_level: str | None = LOG_LEVEL_OPT,
+    log_format: str | None = LOG_FORMAT_OPT,
+    log_file: Path | None = LOG_FILE_OPT,
+) -> None:
+    """Keep parsers warm and serve parse/triage requests on a Unix socket.
+
+    The parser named by --config/--parser is loaded before the socket opens.
+    """
+    configure_logging(
+        LoggingConfig.model_validate(
+            _logging_overrides(log_level, log_format, log_file) or {}
+        )
+    )
+    parsers = ParserRegistry()
+    parsers.load_from_entrypoints()
+    policies = TriagePolicyRegistry()
+    policies.load_from_entrypoints()
+
+    raw_config = _load_yaml_config(config_path) or {}
+    warm = None
+    if parser is not None or "parser" in raw_config:
+        raw_config.setdefault("parser", {"kind": parser})
+        # Warmed on each handler thread, since Docling keeps converters per
+        # thread.
+        warm = partial(
+            parsers.warm,
+            _parser_config(
+                _resolve_parse_config(
+                    ConfigResolver(parsers), raw_config, parser=parser
+                )
+            ),
+        )
+
+    path = socket_path or default_socket_path()
+    with ExitStack() as stack:
+        server = DaemonServer(
+            path,
+            _daemon_handlers(parsers, policies, stack),
+            max_concurrency=concurrency,
+            warm=warm,
+        )
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(
+                signal.SIGTERM,
+                lambda *_: threading.Thread(target=server.shutdown).start(),
+            )
+        err_console.print(f"Serving on {path}", markup=False)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+@app.command("serve-http")
+def serve_http(
+    config_path: str | None = CONFIG_OPT,
+    parser: str | None = PARSER_OPT,
+    set_values: list[str] | None = SET_OPT,
+    host: str = HOST_OPT,
+    port: int = PORT_OPT,
+    max_pending: int = MAX_PENDING_OPT,
+    log_level: str | None = LOG_LEVEL_OPT,
+    log_format: str | None = LOG_FORMAT_OPT,
+    log_file: Path | None = LOG_FILE_OPT,
+) -> None:
+    """Accept PDF uploads over HTTP and parse them in worker processes.
+
+    Workers come from batch.pool in the parse config (defaults otherwise).
+    """
+    registry = ParserRegistry()
+    registry.load_from_entrypoints()
+
+    raw_config = _load_yaml_config(config_path) or {}
+    if "parser" not in raw_config:
+        if parser is None:
+            raise ValueError("parser must be specified in raw config or --parser")
+        raw_config["parser"] = {"kind": parser}
+    updated_config = _resolve_parse_config(
+        ConfigResolver(registry),
+        raw_config,
+        parser=parser,
+        set_values=set_values,
+        logging_overrides=_logging_overrides(log_level, log_format, log_file),
+    )
+    configure_logging(LoggingConfig.model_validate(cast(Any, updated_config).logging))
+    parser_config = _parser_config(updated_config)
+    pool_config = cast(Any, updated_config).batch.pool or WorkerPoolConfig()
+    service_config = HttpServiceConfig(host=host, port=port, max_pending=max_pending)
+
+    spec = ParseWorkerSpec(parser_factory=registry, preload=(parser_config,))
+    with ParseWorkerPool(spec, pool_config) as pool:
+        service = HttpParseService(
+            pool, parser_config, service_config, dispatchers=pool_config.workers
+        )
+        err_console.print(f"Listening on http://{host}:{port}", markup=False)
+        try:
+            asyncio.run(service.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+
+@app.command("replay-dlq")
+def replay_dlq_segments(
+    config_path: str | None = CONFIG_OPT,
+    set_values: list[str] | None = SET_OPT,
+    log_level: str | None = LOG_LEVEL_OPT,
+    log_format: str | None = LOG_FORMAT_OPT,
+    log_file: Path | None = LOG_FILE_OPT,
+) -> None:
+    """Re-triage sealed DLQ segments with the current policies."""
+    registry = TriagePolicyRegistry()
+    registry.load_from_entrypoints()
+
+    resolver = TriageConfigResolver(registry)
+    raw_config = _load_yaml_config(config_path) or {}
+    if "triage" not in raw_config:
+        raise ValueError("triage must be specified in raw config")
+    updated_config = _resolve_triage_config(
+        resolver,
+        raw_config,
+        set_values=set_values,
+        logging_overrides=_logging_overrides(log_level, log_format, log_file),
+    )
+    configure_logging(LoggingConfig.model_validate(cast(Any, updated_config).logging))
+
+    dlq_config = cast(Any, updated_config).dlq
+    if dlq_config is None:
+        raise ValueError("dlq must be configured to replay segments")
+    reader = DlqSpoolReader(dlq_config.directory)
+    # Taken before replaying: rejections written during the replay land in
+    # new segments and are left for the next run.
+    segments = reader.segments()
+    failed = 0
+    with _triage_use_case(registry, updated_config) as use_case:
+        for segment in segments:
+            entries = _replay_segment(reader, segment, use_case)
+            for entry in entries:
+                sys.stdout.write(json.dumps(entry) + "\n")
+            segment_failed = sum("error" in entry for entry in entries)
+            # A segment with failures stays sealed so the next run retries it.
+            if not segment_failed:
+                reader.mark_replayed(segment)
+            failed += segment_failed
+    sys.stdout.flush()
+    err_console.print(
+        f"Replayed {len(segments)} segment(s), {failed} record(s) failed",
+        markup=False,
+    )
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _replay_segment(
+    reader: DlqSpoolReader, segment: Path, use_case: TriagePdf
+) -> list[dict[str, Any]]:
+    entries: list[dict[str, Any]] = []
+
+    def _malformed(path: Path, line: int, exc: Exception) -> None:
+        entries.append({"segment": str(path), "line": line, "error": str(exc)})
+
+    outcomes = replay_dlq(
+        reader.iter_records(segment, on_malformed=_malformed), use_case
+    )
+    for outcome in outcomes:
+        entry: dict[str, Any] = {
+            "source_uri": outcome.record.source.uri,
+            "task_id": outcome.record.task_id.value,
+            "document_id": outcome.record.document_id.value,
+        }
+        if outcome.triage is not None:
+            entry.update(_triage_payload(outcome.triage))
+        else:
+            entry["error"] = outcome.error
+        entries.append(entry)
+    return entries
+
+
+@contextmanager
+def _triage_use_case(
+    registry: TriagePolicyRegistry, config: Any
+) -> Iterator[TriagePdf]:
+    inspector = create_inspector(config.inspection)
+    policies = [registry.create(policy) for policy in config.triage.policies]
+    policy = TriagePolicyChain(policies)
+    preflight = XrefPreflightReader()
+    if config.dlq is None:
+        yield TriagePdf(inspector, policy, preflight=preflight)
+        return
+    with DlqSpoolSink(config.dlq) as sink:
+        yield TriagePdf(inspector, policy, preflight=preflight, dlq_sink=sink)
+
+
+def _profile_router(
+    registry: ParserRegistry, config: Any, parser_config: PdfParserConfig
+) -> ProfileRouter | None:
+    if config.triage_config is None:
+        if config.profiles:
+            raise ValueError("profiles require triage_config to select them")
+        return None
+    router = ProfileRouter(parser_config, config.profiles)
+    for profile_config in router.parser_configs():
+        # Fail on a bad profile before any document is processed.
+        registry.create(profile_config)
+    return router
+
+
+@contextmanager
+def _routed_execute(
+    config: Any,
+    router: ProfileRouter | None,
+    execute: Callable[[ParsePdfToMarkdownInput], ParsePdfToMarkdownResult],
+) -> Iterator[Callable[[ParsePdfToMarkdownInput], ParsePdfToMarkdownResult]]:
+    if router is None:
+        yield execute
+        return
+    policies = TriagePolicyRegistry()
+    policies.load_from_entrypoints()
+    triage_config = TriageConfigResolver(policies).parse(
+        _load_yaml_config(str(config.triage_config)) or {}
+    )
+    with _triage_use_case(policies, triage_config) as triage:
+        try:
+            yield TriagedParse(triage, execute, router).execute
+        finally:
+            router.log_throughput()
+
+
+def _logging_overrides(
+    level: str | None, log_format: str | None, file: Path | None
+) -> dict[str, Any] | None:
+    overrides: dict[str, Any] = {}
+    if level is not None:
+        overrides["level"] = level
+    if log_format is not None:
+        overrides["format"] = log_format
+    if file is not None:
+        overrides["file"] = file
+    return overrides or None
+
+
+def _resolve_parse_config(
+    resolver: ConfigResolver,
+    raw_config: dict[str, Any],
+    *,
+    input_path: str | None = None,
+    output_path: Path | None = None,
+    task_id: str | None = None,
+    document_id: str | None = None,
+    parser: str | None = None,
+    set_values: list[str] | None = None,
+    logging_overrides: dict[str, Any] | None = None,
+    inputs: list[str] | None = None,
+) -> Any:
+    updated_config = resolver.apply_base_overrides(
+        resolver.parse(raw_config),
+        input_path=input_path,
+        output_path=output_path,
+        task_id=task_id,
+        document_id=document_id,
+        parser_kind=parser,
+        logging_overrides=logging_overrides,
+        inputs=inputs,
+    )
+    if set_values:
+        updated_config = resolver.apply_overrides(updated_config, overrides=set_values)
+    return updated_config
+
+
+def _resolve_triage_config(
+    resolver: TriageConfigResolver,
+    raw_config: dict[str, Any],
+    *,
+    input_path: str | None = None,
+    output_path: Path | None = None,
+    task_id: str | None = None,
+    document_id: str | None = None,
+    set_values: list[str] | None = None,
+    logging_overrides: dict[str, Any] | None = None,
+    inputs: list[str] | None = None,
+) -> Any:
+    updated_config = resolver.apply_base_overrides(
+        resolver.parse(raw_config),
+        input_path=input_path,
+        output_path=output_path,
+        task_id=task_id,
+        document_id=document_id,
+        logging_overrides=logging_overrides,
+        inputs=inputs,
+    )
+    if set_values:
+        updated_config = resolver.apply_overrides(updated_config, overrides=set_values)
+    return updated_config
 
-    output_path = cast(Any, updated_config).output_path
+
+def _parser_config(config: Any) -> PdfParserConfig:
+    parser_name = getattr(config.parser, "kind", None)
+    if parser_name is None:
+        raise ValueError("parser kind is required")
+    return PdfParserConfig(
+        name=parser_name, options=config.parser.model_dump(exclude={"kind"})
+    )
+
+
+def _emit_markdown(
+    markdown: str | None, output_path: Path | None, *, from_stdin: bool
+) -> None:
+    if markdown is None:
+        console.print(
+            Panel("No markdown produced", title="Parse Result", style="yellow")
+        )
+        raise typer.Exit(code=1)
+    if output_path is not None:
+        output_path.write_text(markdown)
+        console.print(
+            Panel(
+                f"Markdown written to {output_path}",
+                title="Parse Result",
+                style="green",
+            )
+        )
+    elif from_stdin:
+        # Pipeline mode: emit the markdown verbatim, without Rich formatting.
+        sys.stdout.write(markdown)
+        sys.stdout.flush()
+    else:
+        console.print(markdown)
+
+
+def _emit_triage(payload: dict[str, Any], output_path: Path | None) -> None:
+    json_payload = json.dumps(payload, indent=2)
     if output_path is not None:
         output_path.write_text(json_payload)
     console.print(json_payload, markup=False, soft_wrap=True)
 
 
+def _request_daemon(
+    socket_path: Path | None,
+    command: str,
+    payload: dict[str, Any],
+    *,
+    input_path: str | None,
+    config_path: str | None,
+) -> tuple[dict[str, Any] | None, bytes | None]:
+    """Run ``command`` on a listening daemon; a None response means run locally.
+
+    Also returns stdin's bytes if they were read to send along, so a local
+    fallback can still parse them.
+    """
+    client = DaemonClient(socket_path or default_socket_path())
+    if not client.available():
+        return None, None
+    body = None
+    if input_path is not None and _is_stdin(input_path, config_path):
+        body = sys.stdin.buffer.read()
+    try:
+        response = client.request(command, {**payload, "cwd": os.getcwd()}, body=body)
+    except DaemonUnavailableError:
+        return None, body
+    if response.get("status") == "unsupported":
+        return None, body
+    return response, body
+
+
+def _daemon_handlers(
+    parsers: ParserRegistry, policies: TriagePolicyRegistry, stack: ExitStack
+) -> dict[str, DaemonHandler]:
+    parse_resolver = ConfigResolver(parsers)
+    triage_resolver = TriageConfigResolver(policies)
+    parse_use_case = ParsePdfToMarkdown(parsers)
+    triage_use_cases: dict[str, TriagePdf] = {}
+    resolved: OrderedDict[str, Any] = OrderedDict()
+    lock = threading.Lock()
+
+    def resolve(command: str, payload: dict[str, Any]) -> Any:
+        # Callers usually repeat the same config; keep the validated models.
+        options = {key: value for key, value in payload.items() if key != "cwd"}
+        key = json.dumps([command, options], sort_keys=True, default=str)
+        with lock:
+            if key in resolved:
+                resolved.move_to_end(key)
+                return resolved[key]
+        if command == "parse":
+            config = _resolve_parse_config(
+                parse_resolver,
+                payload["config"],
+                input_path=payload.get("input_path"),
+                output_path=payload.get("output_path"),
+                task_id=payload.get("task_id"),
+                document_id=payload.get("document_id"),
+                parser=payload.get("parser"),
+                set_values=payload.get("set_values"),
+            )
+        else:
+            config = _resolve_triage_config(
+                triage_resolver,
+                payload["config"],
+                input_path=payload.get("input_path"),
+                output_path=payload.get("output_path"),
+                task_id=payload.get("task_id"),
+                document_id=payload.get("document_id"),
+                set_values=payload.get("set_values"),
+            )
+        with lock:
+            resolved[key] = config
+            while len(resolved) > DAEMON_CONFIG_CACHE_SIZE:
+                resolved.popitem(last=False)
+        return config
+
+    def source(config: Any, payload: dict[str, Any], body: bytes | None) -> Any:
+        if config.inputs or config.input_path is None:
+            return None
+        if config.input_path == STDIN_INPUT:
+            if body is None:
+                return None
+            return {"file_path": None, "content": body, "source_name": "stdin.pdf"}
+        if is_remote_uri(config.input_path):
+            return {"file_path": None, "uri": config.input_path}
+        # Relative paths are relative to the client, not to the daemon.
+        return {"file_path": Path(payload["cwd"]) / config.input_path}
+
+    def triage_use_case(config: Any) -> TriagePdf:
+        key = json.dumps(
+            [
+                config.inspection.model_dump(mode="json"),
+                config.triage.model_dump(mode="json"),
+                config.dlq.model_dump(mode="json") if config.dlq else None,
+            ],
+            sort_keys=True,
+        )
+        with lock:
+            if key not in triage_use_cases:
+                triage_use_cases[key] = stack.enter_context(
+                    _triage_use_case(policies, config)
+                )
+            return triage_use_cases[key]
+
+    def parse(payload: dict[str, Any], body: bytes | None) -> dict[str, Any]:
+        config = resolve("parse", payload)
+        arguments = source(config, payload, body)
+        if arguments is None or config.triage_config is not None:
+            return {"status": "unsupported"}
+        result = parse_use_case.execute(
+            ParsePdfToMarkdownInput(
+                parser_config=_parser_config(config),
+                task_id=TaskId(config.task_id),
+                document_id=DocumentId(config.document_id),
+                **arguments,
+            )
+        )
+        document = result.task.document
+        return {
+            "status": "ok",
+            "markdown": document.markdown if document else None,
+            "output_path": str(config.output_path) if config.output_path else None,
+        }
+
+    def triage(payload: dict[str, Any], body: bytes | None) -> dict[str, Any]:
+        config = resolve("triage", payload)
+        arguments = source(config, payload, body)
+        if arguments is None:
+            return {"status": "unsupported"}
+        result = triage_use_case(config).execute(
+            TriagePdfInput(
+                task_id=TaskId(config.task_id),
+                document_id=DocumentId(config.document_id),
+                **arguments,
+            )
+        )
+        return {
+            "status": "ok",
+            "payload": _triage_payload(result.result),
+            "output_path": str(config.output_path) if config.output_path else None,
+        }
+
+    return {"parse": parse, "triage": triage}
+
+
+def _require_input(input_path: str | None) -> str:
+    if input_path is None:
+        raise ValueError(
+            "input_path is required (use --input, --inputs-file or config)"
+        )
+    return input_path
+
+
+def _read_inputs_file(inputs_file: Path | None) -> list[str] | None:
+    if inputs_file is None:
+        return None
+    lines = (line.strip() for line in inputs_file.read_text().splitlines())
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def _batch_items(locations: list[str], task_id: str) -> list[BatchItem]:
+    items: list[BatchItem] = []
+    seen: set[str] = set()
+    occurrences: Counter[str] = Counter()
+    for index, location in enumerate(locations, start=1):
+        stem = PurePosixPath(location.split("://", 1)[-1]).stem or f"doc-{index}"
+        document_id = stem if stem not in seen else f"{stem}-{index}"
+        seen.add(document_id)
+        occurrences[location] += 1
+        items.append(
+            BatchItem(
+                location=location,
+                task_id=_batch_task_id(task_id, location, occurrences[location]),
+                document_id=DocumentId(document_id),
+            )
+        )
+    return items
+
+
+def _batch_task_id(task_id: str, location: str, occurrence: int = 1) -> TaskId:
+    # Derived from the location rather than its line, so --run-id resumes the
+    # right documents after the inputs file is edited or reordered.
+    digest = hashlib.sha256(location.encode()).hexdigest()[:12]
+    suffix = f"-{occurrence}" if occurrence > 1 else ""
+    return TaskId(f"{task_id}-{digest}{suffix}")
+
+
+def _run_parse_batch(
+    registry: ParserRegistry,
+    parser_config: PdfParserConfig,
+    config: Any,
+    *,
+    run_id: str | None,
+    router: ProfileRouter | None = None,
+) -> None:
+    batch: BatchConfig = config.batch
+    if batch.output_dir is None:
+        raise ValueError("batch.output_dir is required when parsing --inputs-file")
+    batch.output_dir.mkdir(parents=True, exist_ok=True)
+    items = _batch_items(config.inputs, config.task_id)
+    store_path = batch.job_store or batch.output_dir / JOB_STORE_NAME
+
+    with ExitStack() as stack:
+        store: SqliteParsingTaskStore | None = None
+        if run_id is not None:
+            store = stack.enter_context(
+                SqliteParsingTaskStore.open(store_path, run_id=run_id)
+            )
+            items = _resumable_items(items, store, run_id)
+        feeders = batch.workers
+        if batch.pool is None:
+            execute = ParsePdfToMarkdown(registry, task_store=store).execute
+        else:
+            spec = ParseWorkerSpec(
+                parser_factory=registry,
+                task_store=(
+                    None
+                    if run_id is None
+                    else partial(SqliteParsingTaskStore.open, store_path, run_id=run_id)
+                ),
+                preload=(
+                    parser_config,
+                    *(router.parser_configs() if router is not None else ()),
+                ),
+            )
+            pool = stack.enter_context(ParseWorkerPool(spec, batch.pool))
+            execute = _pooled_execute(pool, batch.pool, store)
+            # One feeding thread per worker process keeps every process busy.
+            feeders = batch.pool.workers
+        if batch.scheduler is not None:
+            scheduler = stack.enter_context(ParseScheduler(execute, batch.scheduler))
+            execute = _scheduled_execute(scheduler, XrefPreflightReader())
+            # Feeding threads beyond the scheduler's own workers are the queue
+            # it reorders.
+            feeders = max(
+                batch.workers,
+                batch.scheduler.workers + batch.scheduler.fast_lane_workers,
+            )
+        batch = batch.model_copy(update={"workers": feeders})
+        execute = stack.enter_context(_routed_execute(config, router, execute))
+        worker = _parse_worker(execute, parser_config, batch.output_dir)
+        report = run_batch(items, worker, batch)
+    _finish_batch(report, title="Parse Batch")
+
+
+def _resumable_items(
+    items: list[BatchItem], store: SqliteParsingTaskStore, run_id: str
+) -> list[BatchItem]:
+    statuses = store.statuses()
+    remaining = [
+        item for item in items if statuses.get(item.task_id) != ParseStatus.SUCCEEDED
+    ]
+    interrupted = sum(
+        statuses.get(item.task_id) == ParseStatus.RUNNING for item in remaining
+    )
+    err_console.print(
+        f"Run {run_id}: {len(items) - len(remaining)} succeeded earlier, "
+        f"{interrupted} interrupted, {len(remaining)} to run",
+        markup=False,
+    )
+    return remaining
+
+
+def _pooled_execute(
+    pool: ParseWorkerPool,
+    pool_config: WorkerPoolConfig,
+    store: SqliteParsingTaskStore | None,
+) -> Callable[[ParsePdfToMarkdownInput], ParsePdfToMarkdownResult]:
+    def execute(data: ParsePdfToMarkdownInput) -> ParsePdfToMarkdownResult:
+        page_count = None
+        if pool_config.timeout_seconds_per_page and data.file_path is not None:
+            page_count = _page_count(data.file_path)
+        try:
+            return pool.submit(data, page_count=page_count).result()
+        except ParseTimeoutError as exc:
+            # The killed worker could not record the cancellation itself.
+            if store is not None:
+                store.record(exc.task)
+            raise
+
+    return execute
+
+
+def _scheduled_execute(
+    scheduler: ParseScheduler, preflight: PdfPreflightReader
+) -> Callable[[ParsePdfToMarkdownInput], ParsePdfToMarkdownResult]:
+    def execute(data: ParsePdfToMarkdownInput) -> ParsePdfToMarkdownResult:
+        return scheduler.submit(data, _schedule_metadata(data, preflight)).result()
+
+    return execute
+
+
+def _schedule_metadata(
+    data: ParsePdfToMarkdownInput, preflight: PdfPreflightReader
+) -> TriageMetadata:
+    # The scheduler only needs a cost: the declared page count, and the pages
+    # triage found image-only when the document was routed.
+    page_count = None
+    if data.file_path is not None:
+        try:
+            with MappedPdfInput.open(data.file_path) as source:
+                page_count = preflight.read(source).page_count
+        except Exception:
+            page_count = None
+        if page_count is None:
+            page_count = _page_count(data.file_path)
+    page_count = page_count or 0
+    image_only = min(len(data.options.ocr_pages or ()), page_count)
+    return TriageMetadata(
+        page_count=page_count,
+        language=None,
+        scanned=False,
+        image_only_pages=image_only,
+        image_only_page_ratio=image_only / page_count if page_count else 0.0,
+        inspected=False,
+    )
+
+
+def _page_count(path: Path) -> int | None:
+    from pypdf import PdfReader
+
+    try:
+        return len(PdfReader(path).pages)
+    except Exception:
+        return None
+
+
+def _parse_worker(
+    execute: Callable[[ParsePdfToMarkdownInput], ParsePdfToMarkdownResult],
+    parser_config: PdfParserConfig,
+    output_dir: Path,
+) -> Callable[[SpooledInput], Path]:
+    def parse_one(spooled: SpooledInput) -> Path:
+        item = spooled.item
+        result = execute(
+            ParsePdfToMarkdownInput(
+                file_path=spooled.path,
+                parser_config=parser_config,
+                task_id=item.task_id,
+                document_id=item.document_id,
+                source_uri=item.location if spooled.spooled else None,
+            )
+        )
+        document = result.task.document
+        markdown = document.markdown if document else None
+        if markdown is None:
+            raise ValueError("no markdown produced")
+        target = output_dir / f"{item.document_id.value}.md"
+        target.write_text(markdown)
+        return target
+
+    return parse_one
+
+
+def _triage_worker(use_case: TriagePdf) -> Callable[[SpooledInput], Any]:
+    def triage_one(spooled: SpooledInput) -> Any:
+        item = spooled.item
+        return use_case.execute(
+            TriagePdfInput(
+                file_path=spooled.path,
+                task_id=item.task_id,
+                document_id=item.document_id,
+                source_uri=item.location if spooled.spooled else None,
+            )
+        ).result
+
+    return triage_one
+
+
+def _write_triage_lines(report: BatchReport[Any], output_path: Path | None) -> None:
+    lines = []
+    for outcome in report.outcomes:
+        entry: dict[str, Any] = {
+            "input": outcome.item.location,
+            "document_id": outcome.item.document_id.value,
+        }
+        if outcome.ok:
+            entry.update(_triage_payload(outcome.result))
+        else:
+            entry["error"] = outcome.error
+        lines.append(json.dumps(entry))
+    payload = "\n".join(lines) + "\n"
+    if output_path is not None:
+        output_path.write_text(payload)
+    sys.stdout.write(payload)
+    sys.stdout.flush()
+
+
+def _finish_batch(report: BatchReport[Any], *, title: str) -> None:
+    failed = report.failed
+    summary = json.dumps(report.summary(), indent=2)
+    err_console.print(
+        Panel(summary, title=title, style="red" if failed else "green"),
+        markup=False,
+    )
+    for outcome in failed:
+        err_console.print(f"{outcome.item.location}: {outcome.error}", markup=False)
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _is_stdin(input_path: str, config_path: str | None) -> bool:
+    if input_path != STDIN_INPUT:
+        return False
+    if config_path == "-":
+        raise ValueError("--config - and --input - cannot both read from stdin")
+    return True
+
+
+def _source_arguments(
+    input_path: str, *, from_stdin: bool, stdin_bytes: bytes | None = None
+) -> dict[str, Any]:
+    if from_stdin:
+        # stdin may already have been read for a daemon that then went away.
+        return {
+            "file_path": None,
+            "content": sys.stdin.buffer if stdin_bytes is None else stdin_bytes,
+            "source_name": "stdin.pdf",
+        }
+    if is_remote_uri(input_path):
+        return {"file_path": None, "uri": input_path}
+    return {"file_path": Path(input_path)}
+
+
 def _triage_payload(result: Any) -> dict[str, Any]:
     return {
-        "metadata": {
-            "page_count": result.metadata.page_count,
-            "language": result.metadata.language,
-            "scanned": result.metadata.scanned,
-            "image_only_pages": result.metadata.image_only_pages,
-            "image_only_page_ratio": result.metadata.image_only_page_ratio,
-        },
+        "metadata": encode_triage_metadata(result.metadata),
         "decision": {
             "route": result.decision.route.value,
             "reason": result.decision.reason,
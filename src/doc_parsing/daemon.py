@@ -0,0 +1,239 @@
+"""Unix-socket transport between ``doc-parse`` commands and a resident daemon.
+
+Each connection carries one request and one response. A message is a
+length-prefixed JSON header, optionally followed by a length-prefixed binary
+body (the PDF bytes of a stdin input).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from doc_parsing.application.logging import get_logger
+
+SOCKET_ENV = "DOC_PARSE_SOCKET"
+_LENGTH = struct.Struct("!Q")
+
+type DaemonHandler = Callable[[dict[str, Any], bytes | None], dict[str, Any]]
+
+
+class DaemonUnavailableError(ConnectionError):
+    pass
+
+
+def default_socket_path() -> Path:
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"doc-parse-{os.getuid()}.sock"
+
+
+class DaemonClient:
+    def __init__(self, socket_path: Path, *, timeout: float | None = None) -> None:
+        self._socket_path = socket_path
+        self._timeout = timeout
+
+    def available(self) -> bool:
+        try:
+            return stat.S_ISSOCK(self._socket_path.stat().st_mode)
+        except OSError:
+            return False
+
+    def request(
+        self, command: str, payload: dict[str, Any], *, body: bytes | None = None
+    ) -> dict[str, Any]:
+        """Send one request; raises ``DaemonUnavailableError`` if nobody answers."""
+        header = {"command": command, "payload": payload, "body": body is not None}
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.settimeout(self._timeout)
+                connection.connect(str(self._socket_path))
+                _send(connection, header, body)
+                response, _ = _receive(connection)
+        except (FileNotFoundError, ConnectionRefusedError) as exc:
+            raise DaemonUnavailableError(str(exc)) from exc
+        except EOFError as exc:
+            raise DaemonUnavailableError("daemon closed the connection") from exc
+        return response
+
+
+class DaemonServer:
+    """Serves registered command handlers on a Unix domain socket.
+
+    Connections are read on threads of their own, but handlers run on
+    ``max_concurrency`` long-lived worker threads; other requests wait their
+    turn. ``warm`` runs once on each worker thread before the socket opens, so
+    per-thread state it loads (Docling converters, for instance) serves every
+    request. Handler exceptions are returned to the client as
+    ``{"status": "error"}`` responses.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        handlers: Mapping[str, DaemonHandler],
+        *,
+        max_concurrency: int = 1,
+        warm: Callable[[], None] | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._socket_path = socket_path
+        self._handlers = dict(handlers)
+        self._logger = get_logger(__name__)
+        self._workers = _start_workers(max_concurrency, warm)
+        try:
+            _remove_stale_socket(socket_path)
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
+            self._server = _ThreadingUnixServer(str(socket_path), self._handle)
+        except BaseException:
+            self._workers.shutdown(wait=False)
+            raise
+        # Requests can read any file the daemon can, so keep it to this user.
+        socket_path.chmod(0o600)
+
+    @property
+    def socket_path(self) -> Path:
+        return self._socket_path
+
+    def serve_forever(self) -> None:
+        self._logger.info("daemon.start", extra={"socket": str(self._socket_path)})
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        """Stop ``serve_forever``; safe to call from another thread."""
+        self._server.shutdown()
+
+    def close(self) -> None:
+        self._server.server_close()
+        self._workers.shutdown(wait=False, cancel_futures=True)
+        self._socket_path.unlink(missing_ok=True)
+        self._logger.info("daemon.stop", extra={"socket": str(self._socket_path)})
+
+    def _handle(self, connection: socket.socket) -> None:
+        try:
+            header, body = _receive(connection)
+        except (EOFError, OSError, ValueError):
+            return
+        command = header.get("command")
+        handler = self._handlers.get(command) if isinstance(command, str) else None
+        if handler is None:
+            response = {"status": "error", "error": f"unknown command: {command}"}
+        else:
+            try:
+                response = self._workers.submit(
+                    handler, header.get("payload") or {}, body
+                ).result()
+            except Exception as exc:
+                self._logger.exception(
+                    "daemon.request.failed", extra={"command": command}
+                )
+                response = {
+                    "status": "error",
+                    "error": str(exc) or type(exc).__name__,
+                }
+        try:
+            _send(connection, response, None)
+        except OSError:
+            pass
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, address: str, handle: Callable[[socket.socket], None]) -> None:
+        self.handle_connection = handle
+        super().__init__(address, _RequestHandler)
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    server: _ThreadingUnixServer
+
+    def handle(self) -> None:
+        self.server.handle_connection(self.request)
+
+
+def _start_workers(count: int, warm: Callable[[], None] | None) -> ThreadPoolExecutor:
+    workers = ThreadPoolExecutor(
+        max_workers=count, thread_name_prefix="doc-parse-daemon", initializer=warm
+    )
+    # Each task blocks until all have started, so every worker thread is
+    # created (and warmed) now rather than by the first requests.
+    barrier = threading.Barrier(count)
+    started = [workers.submit(barrier.wait) for _ in range(count)]
+    done, _ = wait(started, return_when=FIRST_EXCEPTION)
+    for future in done:
+        if future.exception() is not None:
+            # A failed warmup leaves the others waiting for a thread that
+            # never comes.
+            barrier.abort()
+            workers.shutdown(wait=False, cancel_futures=True)
+            future.result()
+    return workers
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not socket_path.exists() and not socket_path.is_symlink():
+        return
+    if not stat.S_ISSOCK(socket_path.lstat().st_mode):
+        raise ValueError(f"{socket_path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except ConnectionRefusedError:
+            # Left behind by a daemon that did not shut down cleanly.
+            socket_path.unlink()
+            return
+    raise ValueError(f"a daemon is already listening on {socket_path}")
+
+
+def _send(
+    connection: socket.socket, header: dict[str, Any], body: bytes | None
+) -> None:
+    encoded = json.dumps(header, default=str).encode("utf-8")
+    parts = [_LENGTH.pack(len(encoded)), encoded]
+    if body is not None:
+        parts += [_LENGTH.pack(len(body)), body]
+    connection.sendall(b"".join(parts))
+
+
+def _receive(connection: socket.socket) -> tuple[dict[str, Any], bytes | None]:
+    header = json.loads(_read_exactly(connection, _read_length(connection)))
+    if not isinstance(header, dict):
+        raise ValueError("daemon message must be a JSON object")
+    body = None
+    if header.get("body"):
+        body = _read_exactly(connection, _read_length(connection))
+    return header, body
+
+
+def _read_length(connection: socket.socket) -> int:
+    (length,) = _LENGTH.unpack(_read_exactly(connection, _LENGTH.size))
+    return length
+
+
+def _read_exactly(connection: socket.socket, length: int) -> bytes:
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    received = 0
+    while received < length:
+        count = connection.recv_into(view[received:])
+        if not count:
+            raise EOFError("connection closed mid-message")
+        received += count
+    return bytes(buffer)
@@ -1,6 +1,7 @@
 from .entities import (
     BlockType,
     ContentBlock,
+    DlqRecord,
     Document,
     DocumentContent,
     DocumentContentKind,
@@ -17,25 +18,41 @@ from .entities import (
     TriageRoute,
 )
 from .ports import (
+    AsyncPdfInspector,
+    AsyncPdfParser,
+    DlqSink,
+    LanguageDetector,
+    ParsingTaskStore,
+    PdfInput,
     PdfInspector,
     PdfParser,
     PdfParserConfig,
     PdfParserFactory,
+    PdfPreflightReader,
+    PreflightTriagePolicy,
     TriagePolicy,
+    WarmablePdfParserFactory,
 )
+from .validation import set_trusted_validation, trusted_validation_enabled
 from .value_objects import (
     BoundingBox,
     DocumentId,
     DocumentSource,
+    PageRanges,
     ParseOptions,
+    PdfPreflight,
     SourceType,
     TaskId,
 )
 
 __all__ = [
+    "AsyncPdfInspector",
+    "AsyncPdfParser",
     "BlockType",
     "BoundingBox",
     "ContentBlock",
+    "DlqRecord",
+    "DlqSink",
     "DocumentContent",
     "DocumentContentKind",
     "Document",
@@ -43,15 +60,23 @@ __all__ = [
     "DocumentSource",
     "ImageBlock",
     "Page",
+    "PageRanges",
+    "PdfInput",
+    "LanguageDetector",
     "PdfInspector",
     "PdfParser",
     "PdfParserConfig",
     "PdfParserFactory",
+    "PdfPreflight",
+    "PdfPreflightReader",
+    "PreflightTriagePolicy",
     "ParsingRequest",
     "ParsingTask",
+    "ParsingTaskStore",
     "ParseOptions",
     "ParseStatus",
     "SourceType",
+    "set_trusted_validation",
     "TableBlock",
     "TaskId",
     "TextBlock",
@@ -60,4 +85,6 @@ __all__ = [
     "TriagePolicy",
     "TriageResult",
     "TriageRoute",
+    "trusted_validation_enabled",
+    "WarmablePdfParserFactory",
 ]
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import operator
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
 
+from .validation import trusted_validation_enabled
 from .value_objects import (
     BoundingBox,
     DocumentId,
     DocumentSource,
+    PageRanges,
     ParseOptions,
     TaskId,
 )
@@ -73,6 +76,47 @@ def _ensure_pages_valid(pages: list[Page]) -> None:
         )
 
 
+def _validate_text_columns(
+    page_numbers: Sequence[int],
+    block_ids: Sequence[str],
+    bboxes: Sequence[tuple[float, float, float, float]],
+    texts: Sequence[str],
+    confidences: Sequence[float | None],
+    normalized: bool,
+) -> None:
+    size = len(block_ids)
+    if any(
+        len(column) != size for column in (page_numbers, bboxes, texts, confidences)
+    ):
+        raise ValueError("column lengths must match")
+    if not size:
+        return
+    if min(page_numbers) < 1:
+        raise ValueError("page number must be >= 1")
+    if not all(map(str.strip, block_ids)):
+        raise ValueError("block_id cannot be empty")
+    if not all(map(str.strip, texts)):
+        raise ValueError("text block content cannot be empty")
+    if len(set(zip(page_numbers, block_ids, strict=True))) != size:
+        _ensure_unique(
+            list(zip(page_numbers, block_ids, strict=True)),
+            key=lambda row: row,
+            field_name="block_id",
+        )
+    x0s, y0s, x1s, y1s = zip(*bboxes, strict=True)
+    if not all(map(operator.lt, x0s, x1s)):
+        raise ValueError("x0 must be less than x1")
+    if not all(map(operator.lt, y0s, y1s)):
+        raise ValueError("y0 must be less than y1")
+    if normalized and (min(*x0s, *y0s) < 0.0 or max(*x1s, *y1s) > 1.0):
+        raise ValueError(
+            "Normalized bounding boxes must have coordinates in [0.0, 1.0]"
+        )
+    scored = [value for value in confidences if value is not None]
+    if scored and (min(scored) < 0.0 or max(scored) > 1.0):
+        raise ValueError("confidence must be between 0.0 and 1.0")
+
+
 @dataclass(slots=True)
 class ContentBlock:
     block_id: str
@@ -95,6 +139,24 @@ class TextBlock(ContentBlock):
         if self.confidence is not None and not (0.0 <= self.confidence <= 1.0):
             raise ValueError("confidence must be between 0.0 and 1.0")
 
+    @classmethod
+    def trusted(
+        cls,
+        block_id: str,
+        bbox: BoundingBox,
+        text: str,
+        confidence: float | None = None,
+    ) -> TextBlock:
+        if trusted_validation_enabled():
+            return cls(block_id=block_id, bbox=bbox, text=text, confidence=confidence)
+        block = object.__new__(cls)
+        block.block_id = block_id
+        block.bbox = bbox
+        block.kind = BlockType.TEXT
+        block.text = text
+        block.confidence = confidence
+        return block
+
 
 @dataclass(slots=True)
 class TableBlock(ContentBlock):
@@ -108,6 +170,22 @@ class TableBlock(ContentBlock):
         if any(not row for row in self.cells):
             raise ValueError("table rows cannot be empty")
 
+    @classmethod
+    def trusted(
+        cls,
+        block_id: str,
+        bbox: BoundingBox,
+        cells: tuple[tuple[str, ...], ...],
+    ) -> TableBlock:
+        if trusted_validation_enabled():
+            return cls(block_id=block_id, bbox=bbox, cells=cells)
+        block = object.__new__(cls)
+        block.block_id = block_id
+        block.bbox = bbox
+        block.kind = BlockType.TABLE
+        block.cells = cells
+        return block
+
 
 @dataclass(slots=True)
 class ImageBlock(ContentBlock):
@@ -119,6 +197,22 @@ class ImageBlock(ContentBlock):
         if self.description is not None and not self.description.strip():
             raise ValueError("description cannot be blank")
 
+    @classmethod
+    def trusted(
+        cls,
+        block_id: str,
+        bbox: BoundingBox,
+        description: str | None = None,
+    ) -> ImageBlock:
+        if trusted_validation_enabled():
+            return cls(block_id=block_id, bbox=bbox, description=description)
+        block = object.__new__(cls)
+        block.block_id = block_id
+        block.bbox = bbox
+        block.kind = BlockType.IMAGE
+        block.description = description
+        return block
+
 
 @dataclass(slots=True)
 class Page:
@@ -129,6 +223,15 @@ class Page:
         if self.number < 1:
             raise ValueError("page number must be >= 1")
 
+    @classmethod
+    def trusted(cls, number: int, blocks: list[ContentBlock]) -> Page:
+        if trusted_validation_enabled():
+            return cls(number=number, blocks=blocks)
+        page = object.__new__(cls)
+        page.number = number
+        page.blocks = blocks
+        return page
+
     def add_block(self, block: ContentBlock) -> None:
         if any(existing.block_id == block.block_id for existing in self.blocks):
             raise ValueError(
@@ -145,11 +248,92 @@ class DocumentContent:
 
     @classmethod
     def from_pages(cls, pages: list[Page]) -> DocumentContent:
-        pages_copy = list(pages)
-        _ensure_pages_valid(pages_copy)
-        pages_copy.sort(key=lambda page: page.number)
+        pages_copy = sorted(pages, key=lambda page: page.number)
         return cls(kind=DocumentContentKind.BLOCKS, pages=pages_copy, markdown=None)
 
+    @classmethod
+    def from_trusted_pages(cls, pages: list[Page]) -> DocumentContent:
+        """Build block content from pages an adapter has already validated."""
+        if trusted_validation_enabled():
+            return cls.from_pages(pages)
+        content = object.__new__(cls)
+        content.kind = DocumentContentKind.BLOCKS
+        content.pages = sorted(pages, key=lambda page: page.number)
+        content.markdown = None
+        return content
+
+    @classmethod
+    def from_trusted_columns(
+        cls,
+        *,
+        page_numbers: Sequence[int],
+        block_ids: Sequence[str],
+        bboxes: Sequence[tuple[float, float, float, float]],
+        texts: Sequence[str],
+        confidences: Sequence[float | None] | None = None,
+        normalized: bool = True,
+    ) -> DocumentContent:
+        """Build text-block content from column-oriented adapter output.
+
+        Row ``i`` of every column describes one text block. The whole batch is
+        validated in a single pass per column instead of once per object, then
+        blocks, boxes and pages are built without re-running ``__post_init__``.
+        """
+        if confidences is None:
+            confidences = [None] * len(block_ids)
+        _validate_text_columns(
+            page_numbers, block_ids, bboxes, texts, confidences, normalized
+        )
+        if trusted_validation_enabled():
+            blocks_by_page: dict[int, list[ContentBlock]] = {}
+            for number, block_id, box, text, confidence in zip(
+                page_numbers, block_ids, bboxes, texts, confidences, strict=True
+            ):
+                blocks_by_page.setdefault(number, []).append(
+                    TextBlock(
+                        block_id=block_id,
+                        bbox=BoundingBox(*box, normalized=normalized),
+                        text=text,
+                        confidence=confidence,
+                    )
+                )
+            return cls.from_pages(
+                [
+                    Page(number=number, blocks=blocks)
+                    for number, blocks in blocks_by_page.items()
+                ]
+            )
+
+        # Inlined rather than calling the ``trusted`` constructors: at hundreds of
+        # thousands of rows the per-row call overhead dominates.
+        new = object.__new__
+        set_frozen = object.__setattr__
+        text_kind = BlockType.TEXT
+        blocks_by_page = {}
+        for number, block_id, box, text, confidence in zip(
+            page_numbers, block_ids, bboxes, texts, confidences, strict=True
+        ):
+            bbox = new(BoundingBox)
+            set_frozen(bbox, "x0", box[0])
+            set_frozen(bbox, "y0", box[1])
+            set_frozen(bbox, "x1", box[2])
+            set_frozen(bbox, "y1", box[3])
+            set_frozen(bbox, "normalized", normalized)
+            block = new(TextBlock)
+            block.block_id = block_id
+            block.bbox = bbox
+            block.kind = text_kind
+            block.text = text
+            block.confidence = confidence
+            page_blocks = blocks_by_page.get(number)
+            if page_blocks is None:
+                page_blocks = blocks_by_page[number] = []
+            page_blocks.append(block)
+        pages = [
+            Page.trusted(number, blocks) for number, blocks in blocks_by_page.items()
+        ]
+        return cls.from_trusted_pages(pages)
+
     @classmethod
     def from_markdown(cls, markdown: str) -> DocumentContent:
         return cls(kind=DocumentContentKind.MARKDOWN, pages=[], markdown=markdown)
@@ -219,6 +403,21 @@ class ParsingTask:
     started_at: datetime | None = None
     completed_at: datetime | None = None
     error_message: str | None = None
+    queued_at: datetime | None = None
+
+    @property
+    def queue_wait_seconds(self) -> float | None:
+        """Time between queueing (or the request, if never queued) and start."""
+        if self.started_at is None:
+            return None
+        queued_at = self.queued_at or self.request.requested_at
+        return max((self.started_at - queued_at).total_seconds(), 0.0)
+
+    @property
+    def run_seconds(self) -> float | None:
+        if self.started_at is None or self.completed_at is None:
+            return None
+        return (self.completed_at - self.started_at).total_seconds()
 
     def start(self) -> None:
         self._ensure_transition_allowed(ParseStatus.RUNNING)
@@ -238,9 +437,12 @@ class ParsingTask:
         self.error_message = error_message
         self._mark_completed()
 
-    def cancel(self) -> None:
+    def cancel(self, reason: str | None = None) -> None:
         self._ensure_transition_allowed(ParseStatus.CANCELLED)
+        if reason is not None:
+            _require_non_blank(reason, field_name="reason")
         self.status = ParseStatus.CANCELLED
+        self.error_message = reason
         self._mark_completed()
 
     def _ensure_transition_allowed(self, target: ParseStatus) -> None:
@@ -260,14 +462,38 @@ class TriageMetadata:
     scanned: bool
     image_only_pages: int
     image_only_page_ratio: float
+    # Empty when the inspector only counted image-only pages.
+    image_only_page_ranges: PageRanges = PageRanges()
+    # Pages whose content was over the inspector's decode budget; their text
+    # was not read.
+    limited_page_ranges: PageRanges = PageRanges()
+    file_size: int = 0
+    encrypted: bool = False
+    linearized: bool = False
+    truncated: bool = False
+    # False when triage decided from the preflight alone; the page content
+    # fields are then defaults.
+    inspected: bool = True
 
     def __post_init__(self) -> None:
         if self.page_count < 0:
             raise ValueError("page_count must be >= 0")
+        if self.file_size < 0:
+            raise ValueError("file_size must be >= 0")
         if self.image_only_pages < 0:
             raise ValueError("image_only_pages must be >= 0")
         if self.image_only_pages > self.page_count:
             raise ValueError("image_only_pages cannot exceed page_count")
+        if self.image_only_page_ranges.ranges:
+            if len(self.image_only_page_ranges) != self.image_only_pages:
+                raise ValueError("image_only_page_ranges must match image_only_pages")
+            if self.image_only_page_ranges.last > self.page_count:
+                raise ValueError("image_only_page_ranges cannot exceed page_count")
+        if (
+            self.limited_page_ranges.ranges
+            and self.limited_page_ranges.last > self.page_count
+        ):
+            raise ValueError("limited_page_ranges cannot exceed page_count")
         if not (0.0 <= self.image_only_page_ratio <= 1.0):
             raise ValueError("image_only_page_ratio must be between 0.0 and 1.0")
         if self.language is not None and not self.language.strip():
@@ -294,3 +520,19 @@ class TriageDecision:
 class TriageResult:
     metadata: TriageMetadata
     decision: TriageDecision
+
+
+@dataclass(slots=True)
+class DlqRecord:
+    """A triage rejection, kept with enough context to replay it later."""
+
+    task_id: TaskId
+    document_id: DocumentId
+    source: DocumentSource
+    decision: TriageDecision
+    metadata: TriageMetadata
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
+
+    def __post_init__(self) -> None:
+        if self.decision.route != TriageRoute.DLQ:
+            raise ValueError("DLQ records require a dlq decision")
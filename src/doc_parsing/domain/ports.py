@@ -3,9 +3,16 @@ from __future__ import annotations
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol, runtime_checkable
+from typing import BinaryIO, Protocol, runtime_checkable
 
-from .entities import TriageDecision, TriageMetadata
+from .entities import (
+    DlqRecord,
+    ParseStatus,
+    ParsingTask,
+    TriageDecision,
+    TriageMetadata,
+)
+from .value_objects import ParseOptions, PdfPreflight, SourceType, TaskId
 
 
 @dataclass(frozen=True, slots=True)
@@ -18,9 +25,56 @@ class PdfParserConfig:
             raise ValueError("parser name cannot be empty")
 
 
+@runtime_checkable
+class PdfInput(Protocol):
+    """An opened PDF shared by every stage that needs its bytes.
+
+    ``stage`` labels each read so implementations can account for the bytes
+    consumed by header sniffing, inspection and parsing separately.
+    """
+
+    @property
+    def uri(self) -> str: ...
+
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def source_type(self) -> SourceType: ...
+
+    @property
+    def path(self) -> Path | None: ...
+
+    @property
+    def size(self) -> int: ...
+
+    def read_range(self, offset: int, length: int, *, stage: str) -> bytes: ...
+
+    def open_stream(self, *, stage: str) -> BinaryIO: ...
+
+    def bytes_read(self) -> Mapping[str, int]: ...
+
+
 @runtime_checkable
 class PdfParser(Protocol):
-    def parse(self, file_path: Path) -> str: ...
+    """Converts a PDF to markdown.
+
+    ``options`` says which content the caller needs; parsers should skip the
+    work for anything switched off rather than discard it afterwards.
+    """
+
+    def parse(self, source: PdfInput, options: ParseOptions) -> str: ...
+
+
+@runtime_checkable
+class AsyncPdfParser(Protocol):
+    """A parser that can await I/O (e.g. a remote service) instead of blocking.
+
+    Async use cases prefer ``parse_async`` and run plain ``PdfParser.parse``
+    on their executor otherwise.
+    """
+
+    async def parse_async(self, source: PdfInput, options: ParseOptions) -> str: ...
 
 
 @runtime_checkable
@@ -28,11 +82,73 @@ class PdfParserFactory(Protocol):
     def create(self, config: PdfParserConfig) -> PdfParser: ...
 
 
+@runtime_checkable
+class WarmablePdfParserFactory(PdfParserFactory, Protocol):
+    """A factory that can load models for a config before the first ``create``.
+
+    Warming downloads any missing artifacts and keeps the loaded models in the
+    process, so later parsers (and workers forked from it) reuse them.
+    """
+
+    def warm(self, config: PdfParserConfig) -> None: ...
+
+
+@runtime_checkable
+class LanguageDetector(Protocol):
+    def detect(self, text: str) -> str | None: ...
+
+
 @runtime_checkable
 class PdfInspector(Protocol):
-    def inspect(self, file_path: Path) -> TriageMetadata: ...
+    def inspect(self, source: PdfInput) -> TriageMetadata: ...
+
+
+@runtime_checkable
+class AsyncPdfInspector(Protocol):
+    async def inspect_async(self, source: PdfInput) -> TriageMetadata: ...
+
+
+@runtime_checkable
+class PdfPreflightReader(Protocol):
+    """Reads file-level facts without touching page content."""
+
+    def read(self, source: PdfInput) -> PdfPreflight: ...
 
 
 @runtime_checkable
 class TriagePolicy(Protocol):
     def decide(self, metadata: TriageMetadata) -> TriageDecision | None: ...
+
+
+@runtime_checkable
+class PreflightTriagePolicy(TriagePolicy, Protocol):
+    """A policy that can settle some documents before they are inspected.
+
+    ``decide_preflight`` returns a decision only when inspecting the document
+    could not change it, and ``None`` otherwise.
+    """
+
+    def decide_preflight(self, preflight: PdfPreflight) -> TriageDecision | None: ...
+
+
+@runtime_checkable
+class ParsingTaskStore(Protocol):
+    """Durable record of task status for one run.
+
+    ``record`` may buffer; ``flush`` makes everything recorded so far durable.
+    """
+
+    def record(self, task: ParsingTask) -> None: ...
+
+    def statuses(self) -> Mapping[TaskId, ParseStatus]: ...
+
+    def flush(self) -> None: ...
+
+
+@runtime_checkable
+class DlqSink(Protocol):
+    """Destination for triage rejections; ``write`` may buffer until ``flush``."""
+
+    def write(self, record: DlqRecord) -> None: ...
+
+    def flush(self) -> None: ...
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import os
+
+_TRUSTED_VALIDATION = os.environ.get("DOC_PARSING_VALIDATE_TRUSTED") == "1"
+
+
+def set_trusted_validation(enabled: bool) -> bool:
+    """Toggle full validation on the trusted construction paths.
+
+    Adapters use the ``trusted`` constructors to skip per-object checks; tests
+    flip this on (or set ``DOC_PARSING_VALIDATE_TRUSTED=1``) so the same code
+    paths run through ``__post_init__``. Returns the previous setting.
+    """
+    global _TRUSTED_VALIDATION
+    previous = _TRUSTED_VALIDATION
+    _TRUSTED_VALIDATION = enabled
+    return previous
+
+
+def trusted_validation_enabled() -> bool:
+    return _TRUSTED_VALIDATION
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import StrEnum
 
+from .validation import trusted_validation_enabled
+
 
 @dataclass(frozen=True, slots=True)
 class DocumentId:
@@ -63,13 +66,118 @@ class BoundingBox:
                     "Normalized bounding boxes must have coordinates in [0.0, 1.0]"
                 )
 
+    @classmethod
+    def trusted(
+        cls, x0: float, y0: float, x1: float, y1: float, normalized: bool = True
+    ) -> BoundingBox:
+        if trusted_validation_enabled():
+            return cls(x0, y0, x1, y1, normalized)
+        bbox = object.__new__(cls)
+        object.__setattr__(bbox, "x0", x0)
+        object.__setattr__(bbox, "y0", y0)
+        object.__setattr__(bbox, "x1", x1)
+        object.__setattr__(bbox, "y1", y1)
+        object.__setattr__(bbox, "normalized", normalized)
+        return bbox
+
+
+@dataclass(frozen=True, slots=True)
+class PageRanges:
+    """A set of 1-based page numbers kept as sorted, disjoint inclusive ranges.
+
+    Stays small for long documents, and renders as ``"1-3,7"``.
+    """
+
+    ranges: tuple[tuple[int, int], ...] = ()
+
+    def __post_init__(self) -> None:
+        previous_end = -1
+        for start, end in self.ranges:
+            if start < 1 or end < start:
+                raise ValueError(f"invalid page range {start}-{end}")
+            if start <= previous_end + 1:
+                raise ValueError("page ranges must be sorted and not touch")
+            previous_end = end
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[int]) -> PageRanges:
+        return cls._merged((page, page) for page in pages)
+
+    @classmethod
+    def parse(cls, text: str) -> PageRanges:
+        spans = []
+        for part in filter(None, (chunk.strip() for chunk in text.split(","))):
+            start, _, end = part.partition("-")
+            spans.append((int(start), int(end or start)))
+        return cls._merged(spans)
+
+    @classmethod
+    def _merged(cls, spans: Iterable[tuple[int, int]]) -> PageRanges:
+        ranges: list[tuple[int, int]] = []
+        for start, end in sorted(spans):
+            if ranges and start <= ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], max(end, ranges[-1][1]))
+            else:
+                ranges.append((start, end))
+        return cls(tuple(ranges))
+
+    @property
+    def last(self) -> int:
+        return self.ranges[-1][1] if self.ranges else 0
+
+    def __len__(self) -> int:
+        return sum(end - start + 1 for start, end in self.ranges)
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in self.ranges:
+            yield from range(start, end + 1)
+
+    def __contains__(self, page: object) -> bool:
+        return isinstance(page, int) and any(
+            start <= page <= end for start, end in self.ranges
+        )
+
+    def __str__(self) -> str:
+        return ",".join(
+            str(start) if start == end else f"{start}-{end}"
+            for start, end in self.ranges
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PdfPreflight:
+    """What a PDF's header, trailer and cross-reference say about it.
+
+    ``page_count`` is the page tree's declared ``/Count``, or ``None`` when it
+    could not be reached without reading further into the file.
+    """
+
+    file_size: int
+    encrypted: bool = False
+    linearized: bool = False
+    truncated: bool = False
+    page_count: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.file_size < 0:
+            raise ValueError("file_size must be >= 0")
+        if self.page_count is not None and self.page_count < 0:
+            raise ValueError("page_count must be >= 0")
+
 
 @dataclass(frozen=True, slots=True)
 class ParseOptions:
+    """What the caller needs from a parse.
+
+    ``ocr_pages`` restricts OCR to those pages (an empty set means none);
+    ``None`` leaves OCR to the parser's configuration.
+    """
+
     extract_tables: bool = True
     extract_images: bool = True
     extract_text: bool = True
     language_hint: str | None = None
+    ocr_pages: PageRanges | None = None
 
     def __post_init__(self) -> None:
         if self.language_hint is not None and not self.language_hint.strip():
@@ -0,0 +1,546 @@
+"""Asyncio HTTP front end that parses uploaded PDFs in a worker pool.
+
+``POST /v1/tasks``
+    Upload a PDF as the request body. Returns ``202`` with the task, ``429``
+    when ``max_pending`` uploads are already queued, ``413`` when the body is
+    larger than ``max_upload_mb``.
+``GET /v1/tasks/{task_id}?wait=SECONDS``
+    The task's status. With ``wait`` the request is held until the status
+    changes from the one the client last saw (``status=...``, by default the
+    current one) or the task finishes.
+``GET /v1/tasks/{task_id}/markdown?wait=SECONDS``
+    The markdown of a succeeded task, streamed in chunks; ``409`` while the
+    task is unfinished or if it failed.
+``GET /healthz``
+    Queue and task counters.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from doc_parsing.application import (
+    ParsePdfToMarkdownInput,
+    ParseTimeoutError,
+    ParseWorkerPool,
+)
+from doc_parsing.application.logging import get_logger
+from doc_parsing.domain import (
+    DocumentId,
+    DocumentSource,
+    ParseStatus,
+    ParsingRequest,
+    ParsingTask,
+    PdfParserConfig,
+    SourceType,
+    TaskId,
+)
+
+_CHUNK_SIZE = 64 * 1024
+_MAX_HEADER_BYTES = 64 * 1024
+_FINISHED = frozenset(
+    {ParseStatus.SUCCEEDED, ParseStatus.FAILED, ParseStatus.CANCELLED}
+)
+
+
+class HttpServiceConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    host: str = "127.0.0.1"
+    port: int = 8080
+    max_pending: int = 64
+    max_upload_mb: float = 100.0
+    max_wait_seconds: float = 30.0
+    max_retained_tasks: int = 1000
+    spool_dir: Path | None = None
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> HttpServiceConfig:
+        if not 0 <= self.port <= 65535:
+            raise ValueError("port must be between 0 and 65535")
+        if self.max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        if self.max_upload_mb <= 0:
+            raise ValueError("max_upload_mb must be > 0")
+        if self.max_wait_seconds < 0:
+            raise ValueError("max_wait_seconds must be >= 0")
+        if self.max_retained_tasks < 1:
+            raise ValueError("max_retained_tasks must be >= 1")
+        return self
+
+
+class _HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(slots=True)
+class _Request:
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+
+
+@dataclass(slots=True)
+class _TaskRecord:
+    task: ParsingTask
+    document_id: DocumentId
+    path: Path
+    markdown: str | None = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def notify(self) -> None:
+        # Waiters hold the old event; a fresh one catches the next change.
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+class HttpParseService:
+    """Accepts uploads over HTTP and runs them through a ``ParseWorkerPool``.
+
+    Uploads are spooled to disk and queued; ``dispatchers`` coroutines (one
+    per pool worker) feed the pool, so a task turns ``running`` when a worker
+    actually picks it up. Finished tasks are kept for status queries until
+    ``max_retained_tasks`` newer ones have finished.
+    """
+
+    def __init__(
+        self,
+        pool: ParseWorkerPool,
+        parser_config: PdfParserConfig,
+        config: HttpServiceConfig,
+        *,
+        dispatchers: int,
+    ) -> None:
+        self._pool = pool
+        self._parser_config = parser_config
+        self._config = config
+        self._dispatchers = dispatchers
+        self._max_upload_bytes = int(config.max_upload_mb * 1024 * 1024)
+        self._records: OrderedDict[str, _TaskRecord] = OrderedDict()
+        self._queue: asyncio.Queue[_TaskRecord] | None = None
+        self._server: asyncio.Server | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._spool: Path | None = None
+        self._logger = get_logger(__name__)
+
+    async def start(self) -> int:
+        """Start listening; returns the bound port."""
+        self._queue = asyncio.Queue(maxsize=self._config.max_pending)
+        if self._config.spool_dir is not None:
+            self._config.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._spool = Path(
+            tempfile.mkdtemp(prefix="doc-parse-http-", dir=self._config.spool_dir)
+        )
+        self._tasks = [
+            asyncio.create_task(self._dispatch()) for _ in range(self._dispatchers)
+        ]
+        self._server = await asyncio.start_server(
+            self._handle, self._config.host, self._config.port
+        )
+        port = self._server.sockets[0].getsockname()[1]
+        self._logger.info("http.start", extra={"host": self._config.host, "port": port})
+        return port
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._spool is not None:
+            shutil.rmtree(self._spool, ignore_errors=True)
+            self._spool = None
+
+    async def _dispatch(self) -> None:
+        assert self._queue is not None
+        while True:
+            record = await self._queue.get()
+            try:
+                await self._run(record)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, record: _TaskRecord) -> None:
+        task = record.task
+        task.start()
+        record.notify()
+        try:
+            result = await asyncio.wrap_future(
+                self._pool.submit(
+                    ParsePdfToMarkdownInput(
+                        file_path=record.path,
+                        parser_config=self._parser_config,
+                        task_id=task.request.task_id,
+                        document_id=record.document_id,
+                        source_uri=task.request.source.uri,
+                        queued_at=task.queued_at,
+                    )
+                )
+            )
+        except ParseTimeoutError:
+            task.cancel("timeout")
+        except Exception as exc:
+            task.fail(str(exc) or type(exc).__name__)
+        else:
+            document = result.task.document
+            record.markdown = document.markdown if document else None
+            if document is None:
+                task.fail("no markdown produced")
+            else:
+                task.complete(document)
+        finally:
+            _remove_upload(record.path)
+        record.notify()
+        self._logger.info(
+            "http.task.finished",
+            extra={
+                "task_id": task.request.task_id.value,
+                "status": task.status.value,
+                "queue_wait_seconds": round(task.queue_wait_seconds or 0.0, 3),
+                "run_seconds": round(task.run_seconds or 0.0, 3),
+            },
+        )
+        self._evict_finished()
+
+    def _evict_finished(self) -> None:
+        finished = [
+            key
+            for key, record in self._records.items()
+            if record.task.status in _FINISHED
+        ]
+        for key in finished[: max(len(finished) - self._config.max_retained_tasks, 0)]:
+            del self._records[key]
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        started = time.perf_counter()
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+        request: _Request | None = None
+        try:
+            request = await _read_request(reader)
+            status = await self._route(request, reader, writer)
+        except _HttpError as exc:
+            status = exc.status
+            await _send_json(writer, status, {"error": str(exc)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception:
+            self._logger.exception("http.request.failed")
+            await _send_json(writer, status, {"error": "internal error"})
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+        self._logger.debug(
+            "http.request",
+            extra={
+                "method": request.method if request else None,
+                "path": request.path if request else None,
+                "status": int(status),
+                "seconds": round(time.perf_counter() - started, 4),
+            },
+        )
+
+    async def _route(
+        self,
+        request: _Request,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> HTTPStatus:
+        parts = [part for part in request.path.split("/") if part]
+        if request.method == "POST" and parts == ["v1", "tasks"]:
+            return await self._create(request, reader, writer)
+        if request.method == "GET" and parts == ["healthz"]:
+            return await self._health(writer)
+        if request.method == "GET" and len(parts) == 3 and parts[:2] == ["v1", "tasks"]:
+            return await self._status(request, parts[2], writer)
+        if (
+            request.method == "GET"
+            and len(parts) == 4
+            and parts[:2] == ["v1", "tasks"]
+            and parts[3] == "markdown"
+        ):
+            return await self._markdown(request, parts[2], writer)
+        raise _HttpError(HTTPStatus.NOT_FOUND, f"no route for {request.path}")
+
+    async def _create(
+        self,
+        request: _Request,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> HTTPStatus:
+        assert self._queue is not None and self._spool is not None
+        length = _content_length(request.headers)
+        if length > self._max_upload_bytes:
+            raise _HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "upload too large")
+        if self._queue.full():
+            # Refuse before spooling; the body is only drained so the client
+            # reads the response instead of a connection reset.
+            await _discard_body(reader, length)
+            return await _reject_full(writer)
+
+        task_id = request.query.get("task_id") or uuid.uuid4().hex
+        if task_id in self._records:
+            raise _HttpError(HTTPStatus.CONFLICT, f"task {task_id} already exists")
+        name = Path(request.query.get("name") or f"{task_id}.pdf").name
+        if name in {"", ".", ".."}:
+            name = "document.pdf"
+        # One directory per upload keeps the client's file name for the parser.
+        path = self._spool / uuid.uuid4().hex / name
+        path.parent.mkdir()
+        await _spool_body(reader, path, length)
+        record = _TaskRecord(
+            task=ParsingTask(
+                request=ParsingRequest(
+                    task_id=TaskId(task_id),
+                    source=DocumentSource(uri=name, source_type=SourceType.RAW_BYTES),
+                ),
+                queued_at=datetime.now(tz=UTC),
+            ),
+            document_id=DocumentId(request.query.get("document_id") or task_id),
+            path=path,
+        )
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            _remove_upload(path)
+            return await _reject_full(writer)
+        self._records[task_id] = record
+        await _send_json(
+            writer,
+            HTTPStatus.ACCEPTED,
+            _task_payload(record),
+            headers={"Location": f"/v1/tasks/{task_id}"},
+        )
+        return HTTPStatus.ACCEPTED
+
+    async def _status(
+        self, request: _Request, task_id: str, writer: asyncio.StreamWriter
+    ) -> HTTPStatus:
+        record = self._record(task_id)
+        seen = request.query.get("status", record.task.status.value)
+        deadline = time.monotonic() + self._wait_seconds(request)
+        while record.task.status.value == seen and record.task.status not in _FINISHED:
+            if not await _wait_for(record.changed, deadline):
+                break
+        await _send_json(writer, HTTPStatus.OK, _task_payload(record))
+        return HTTPStatus.OK
+
+    async def _markdown(
+        self, request: _Request, task_id: str, writer: asyncio.StreamWriter
+    ) -> HTTPStatus:
+        record = self._record(task_id)
+        deadline = time.monotonic() + self._wait_seconds(request)
+        while record.task.status not in _FINISHED:
+            if not await _wait_for(record.changed, deadline):
+                break
+        if record.task.status != ParseStatus.SUCCEEDED or record.markdown is None:
+            await _send_json(writer, HTTPStatus.CONFLICT, _task_payload(record))
+            return HTTPStatus.CONFLICT
+        writer.write(
+            _head(
+                HTTPStatus.OK,
+                {
+                    "Content-Type": "text/markdown; charset=utf-8",
+                    "Transfer-Encoding": "chunked",
+                },
+            )
+        )
+        encoded = record.markdown.encode("utf-8")
+        for offset in range(0, len(encoded), _CHUNK_SIZE):
+            chunk = encoded[offset : offset + _CHUNK_SIZE]
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        return HTTPStatus.OK
+
+    async def _health(self, writer: asyncio.StreamWriter) -> HTTPStatus:
+        assert self._queue is not None
+        counts: dict[str, int] = {}
+        for record in self._records.values():
+            status = record.task.status.value
+            counts[status] = counts.get(status, 0) + 1
+        await _send_json(
+            writer,
+            HTTPStatus.OK,
+            {
+                "queued": self._queue.qsize(),
+                "max_pending": self._config.max_pending,
+                "ready_workers": self._pool.ready_workers(),
+                "tasks": counts,
+            },
+        )
+        return HTTPStatus.OK
+
+    def _record(self, task_id: str) -> _TaskRecord:
+        record = self._records.get(task_id)
+        if record is None:
+            raise _HttpError(HTTPStatus.NOT_FOUND, f"unknown task {task_id}")
+        return record
+
+    def _wait_seconds(self, request: _Request) -> float:
+        try:
+            wait = float(request.query.get("wait", "0"))
+        except ValueError as exc:
+            raise _HttpError(HTTPStatus.BAD_REQUEST, "wait must be a number") from exc
+        return min(max(wait, 0.0), self._config.max_wait_seconds)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> _Request:
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError as exc:
+        raise _HttpError(
+            HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "headers too large"
+        ) from exc
+    if len(head) > _MAX_HEADER_BYTES:
+        raise _HttpError(
+            HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "headers too large"
+        )
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = request_line.split(" ", 2)
+    except ValueError as exc:
+        raise _HttpError(HTTPStatus.BAD_REQUEST, "malformed request line") from exc
+    headers: dict[str, str] = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    url = urlsplit(target)
+    query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+    return _Request(method=method.upper(), path=url.path, query=query, headers=headers)
+
+
+def _content_length(headers: dict[str, str]) -> int:
+    if "transfer-encoding" in headers:
+        raise _HttpError(HTTPStatus.LENGTH_REQUIRED, "send uploads with Content-Length")
+    try:
+        length = int(headers["content-length"])
+    except (KeyError, ValueError) as exc:
+        raise _HttpError(HTTPStatus.LENGTH_REQUIRED, "Content-Length required") from exc
+    if length <= 0:
+        raise _HttpError(HTTPStatus.BAD_REQUEST, "empty upload")
+    return length
+
+
+async def _spool_body(reader: asyncio.StreamReader, path: Path, length: int) -> None:
+    # Disk writes of a few chunks are cheap next to parsing; the upload never
+    # sits in memory whole.
+    with path.open("wb") as handle:
+        remaining = length
+        while remaining:
+            chunk = await reader.read(min(remaining, _CHUNK_SIZE))
+            if not chunk:
+                handle.close()
+                _remove_upload(path)
+                raise asyncio.IncompleteReadError(b"", remaining)
+            handle.write(chunk)
+            remaining -= len(chunk)
+
+
+def _remove_upload(path: Path) -> None:
+    shutil.rmtree(path.parent, ignore_errors=True)
+
+
+async def _discard_body(reader: asyncio.StreamReader, length: int) -> None:
+    remaining = length
+    while remaining:
+        chunk = await reader.read(min(remaining, _CHUNK_SIZE))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+
+
+async def _reject_full(writer: asyncio.StreamWriter) -> HTTPStatus:
+    await _send_json(
+        writer,
+        HTTPStatus.TOO_MANY_REQUESTS,
+        {"error": "parse queue is full"},
+        headers={"Retry-After": "1"},
+    )
+    return HTTPStatus.TOO_MANY_REQUESTS
+
+
+async def _wait_for(event: asyncio.Event, deadline: float) -> bool:
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return False
+    try:
+        await asyncio.wait_for(event.wait(), remaining)
+    except TimeoutError:
+        return False
+    return True
+
+
+def _task_payload(record: _TaskRecord) -> dict[str, Any]:
+    task = record.task
+    return {
+        "task_id": task.request.task_id.value,
+        "document_id": record.document_id.value,
+        "status": task.status.value,
+        "error": task.error_message,
+        "queue_wait_seconds": task.queue_wait_seconds,
+        "run_seconds": task.run_seconds,
+    }
+
+
+def _head(status: HTTPStatus, headers: dict[str, str]) -> bytes:
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}", "Connection: close"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _send_json(
+    writer: asyncio.StreamWriter,
+    status: HTTPStatus,
+    payload: dict[str, Any],
+    *,
+    headers: dict[str, str] | None = None,
+) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(
+        _head(
+            status,
+            {
+                "Content-Type": "application/json",
+                "Content-Length": str(len(body)),
+                **(headers or {}),
+            },
+        )
+        + body
+    )
+    await writer.drain()
@@ -1,30 +1,75 @@
-from .parsers.docling import DoclingPdfParserFactory
+from .dlq import DlqSpoolConfig, DlqSpoolReader, DlqSpoolSink
 from .parsers.docling_config import DoclingConfig
 from .parsers.docling_lazy import LazyDoclingPdfParserFactory
 from .parsers.entrypoints import load_entrypoints
+from .parsers.hybrid import HybridParserConfig, HybridPdfParserFactory
 from .parsers.mock import MockConfig, MockPdfParserFactory
+from .parsers.pypdf_parser import PypdfParserConfig, PypdfPdfParserFactory
 from .parsers.registration import AdapterRegistration
 from .parsers.registry import ParserRegistry
+from .persistence import SqliteParsingTaskStore
+from .serialization import (
+    BinaryDocumentReader,
+    DocumentFormatError,
+    decode_triage_metadata,
+    encode_document,
+    encode_triage_metadata,
+    write_document,
+)
 from .triage import (
+    LangdetectLanguageDetector,
+    NgramLanguageDetector,
+    PdfiumInspector,
+    PdfiumInspectorConfig,
     PypdfInspector,
     PypdfInspectorConfig,
     TriagePolicyRegistration,
     TriagePolicyRegistry,
+    XrefPreflightReader,
     load_triage_entrypoints,
 )
 
 __all__ = [
     "AdapterRegistration",
+    "BinaryDocumentReader",
+    "DlqSpoolConfig",
+    "DlqSpoolReader",
+    "DlqSpoolSink",
+    "DocumentFormatError",
     "DoclingConfig",
     "DoclingPdfParserFactory",
+    "decode_triage_metadata",
+    "encode_document",
+    "encode_triage_metadata",
+    "LangdetectLanguageDetector",
+    "HybridParserConfig",
+    "HybridPdfParserFactory",
     "LazyDoclingPdfParserFactory",
     "load_entrypoints",
     "MockConfig",
     "MockPdfParserFactory",
+    "NgramLanguageDetector",
     "ParserRegistry",
+    "PdfiumInspector",
+    "PdfiumInspectorConfig",
     "PypdfInspector",
     "PypdfInspectorConfig",
+    "PypdfParserConfig",
+    "PypdfPdfParserFactory",
+    "SqliteParsingTaskStore",
     "TriagePolicyRegistration",
     "TriagePolicyRegistry",
     "load_triage_entrypoints",
+    "write_document",
+    "XrefPreflightReader",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # The eager docling adapter imports docling and torch, which takes seconds;
+    # only pay for that when it is actually asked for.
+    if name == "DoclingPdfParserFactory":
+        from .parsers.docling import DoclingPdfParserFactory
+
+        return DoclingPdfParserFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
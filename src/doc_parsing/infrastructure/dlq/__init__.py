@@ -0,0 +1,15 @@
+from .spool import (
+    DlqSpoolConfig,
+    DlqSpoolReader,
+    DlqSpoolSink,
+    decode_record,
+    encode_record,
+)
+
+__all__ = [
+    "DlqSpoolConfig",
+    "DlqSpoolReader",
+    "DlqSpoolSink",
+    "decode_record",
+    "encode_record",
+]
@@ -0,0 +1,250 @@
+"""Local segment spool for triage rejections.
+
+Records are appended as JSON lines to ``*.jsonl.open`` segments. A segment is
+sealed (renamed to ``*.jsonl``) once it reaches ``max_segment_mb`` or
+``max_segment_seconds``, or when the sink closes; readers only see sealed
+segments by default. Writes are fsynced in batches of ``fsync_every`` records
+or every ``fsync_interval_seconds``, whichever comes first.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from itertools import count
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from doc_parsing.domain import (
+    DlqRecord,
+    DlqSink,
+    DocumentId,
+    DocumentSource,
+    SourceType,
+    TaskId,
+    TriageDecision,
+    TriageRoute,
+)
+from doc_parsing.infrastructure.serialization.triage import (
+    decode_triage_metadata,
+    encode_triage_metadata,
+)
+
+RECORD_VERSION = 1
+_OPEN_SUFFIX = ".jsonl.open"
+_SEALED_SUFFIX = ".jsonl"
+_REPLAYED_SUFFIX = ".jsonl.replayed"
+
+
+class DlqSpoolConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    directory: Path
+    max_segment_mb: float = 64.0
+    max_segment_seconds: float = 300.0
+    fsync_every: int = 100
+    fsync_interval_seconds: float = 1.0
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> DlqSpoolConfig:
+        if self.max_segment_mb <= 0:
+            raise ValueError("max_segment_mb must be > 0")
+        if self.max_segment_seconds <= 0:
+            raise ValueError("max_segment_seconds must be > 0")
+        if self.fsync_every < 1:
+            raise ValueError("fsync_every must be >= 1")
+        if self.fsync_interval_seconds < 0:
+            raise ValueError("fsync_interval_seconds must be >= 0")
+        return self
+
+
+class DlqSpoolSink(DlqSink):
+    def __init__(self, config: DlqSpoolConfig) -> None:
+        self._config = config
+        self._max_bytes = int(config.max_segment_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._sequence = count()
+        self._handle: IO[bytes] | None = None
+        self._segment: Path | None = None
+        self._segment_bytes = 0
+        self._segment_opened = 0.0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        config.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, record: DlqRecord) -> None:
+        line = json.dumps(encode_record(record)).encode("utf-8") + b"\n"
+        with self._lock:
+            handle = self._current_segment(len(line))
+            handle.write(line)
+            self._segment_bytes += len(line)
+            self._unsynced += 1
+            elapsed = time.monotonic() - self._last_sync
+            if (
+                self._unsynced >= self._config.fsync_every
+                or elapsed >= self._config.fsync_interval_seconds
+            ):
+                self._sync()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            self._seal()
+
+    def __enter__(self) -> DlqSpoolSink:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _current_segment(self, incoming: int) -> IO[bytes]:
+        if self._handle is not None:
+            # A record larger than a whole segment still gets written.
+            full = self._segment_bytes > 0 and (
+                self._segment_bytes + incoming > self._max_bytes
+            )
+            age = time.monotonic() - self._segment_opened
+            if full or age >= self._config.max_segment_seconds:
+                self._seal()
+        if self._handle is None:
+            stamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%S%f")
+            name = f"dlq-{stamp}-{os.getpid()}-{next(self._sequence):04d}"
+            self._segment = self._config.directory / f"{name}{_OPEN_SUFFIX}"
+            self._handle = self._segment.open("ab")
+            self._segment_bytes = 0
+            self._segment_opened = time.monotonic()
+        return self._handle
+
+    def _sync(self) -> None:
+        if self._handle is not None and self._unsynced:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _seal(self) -> None:
+        if self._handle is None or self._segment is None:
+            return
+        self._sync()
+        self._handle.close()
+        sealed = self._segment.with_name(
+            self._segment.name.removesuffix(_OPEN_SUFFIX) + _SEALED_SUFFIX
+        )
+        os.replace(self._segment, sealed)
+        _fsync_directory(self._config.directory)
+        self._handle = None
+        self._segment = None
+
+
+class DlqSpoolReader:
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    def segments(self, *, include_open: bool = False) -> list[Path]:
+        if not self._directory.exists():
+            return []
+        suffixes = (_SEALED_SUFFIX, _OPEN_SUFFIX) if include_open else _SEALED_SUFFIX
+        return sorted(
+            path for path in self._directory.iterdir() if path.name.endswith(suffixes)
+        )
+
+    def iter_records(
+        self,
+        segment: Path | None = None,
+        *,
+        on_malformed: Callable[[Path, int, Exception], None] | None = None,
+    ) -> Iterator[DlqRecord]:
+        """Yield the records of ``segment``, or of every sealed segment.
+
+        A line that does not decode raises, unless ``on_malformed`` is given:
+        it is then called with the segment, the 1-based line number and the
+        error, and the line is skipped.
+        """
+        for path in [segment] if segment is not None else self.segments():
+            yield from _read_segment(path, on_malformed)
+
+    def mark_replayed(self, segment: Path) -> Path:
+        if not segment.name.endswith(_SEALED_SUFFIX):
+            raise ValueError("only sealed segments can be marked replayed")
+        target = segment.with_name(
+            segment.name.removesuffix(_SEALED_SUFFIX) + _REPLAYED_SUFFIX
+        )
+        os.replace(segment, target)
+        return target
+
+
+def encode_record(record: DlqRecord) -> dict[str, Any]:
+    metadata = record.metadata
+    decision = record.decision
+    return {
+        "version": RECORD_VERSION,
+        "task_id": record.task_id.value,
+        "document_id": record.document_id.value,
+        "source_uri": record.source.uri,
+        "source_type": record.source.source_type.value,
+        "recorded_at": record.recorded_at.isoformat(),
+        "decision": {
+            "reason": decision.reason,
+            "policy": decision.policy,
+            "rule": decision.rule,
+            "hint": decision.hint,
+        },
+        "metadata": encode_triage_metadata(metadata),
+    }
+
+
+def decode_record(payload: dict[str, Any]) -> DlqRecord:
+    version = payload.get("version")
+    if version != RECORD_VERSION:
+        raise ValueError(f"unsupported DLQ record version: {version}")
+    return DlqRecord(
+        task_id=TaskId(payload["task_id"]),
+        document_id=DocumentId(payload["document_id"]),
+        source=DocumentSource(
+            uri=payload["source_uri"],
+            source_type=SourceType(payload["source_type"]),
+        ),
+        decision=TriageDecision(route=TriageRoute.DLQ, **payload["decision"]),
+        metadata=decode_triage_metadata(payload["metadata"]),
+        recorded_at=datetime.fromisoformat(payload["recorded_at"]),
+    )
+
+
+def _read_segment(
+    path: Path, on_malformed: Callable[[Path, int, Exception], None] | None
+) -> Iterator[DlqRecord]:
+    with path.open("rb") as handle:
+        for number, line in enumerate(handle, start=1):
+            if not line.endswith(b"\n"):
+                # A crash mid-write leaves a partial last line in open segments.
+                return
+            try:
+                record = decode_record(json.loads(line))
+            except (ValueError, KeyError, TypeError) as exc:
+                if on_malformed is None:
+                    raise
+                on_malformed(path, number, exc)
+                continue
+            yield record
+
+
+def _fsync_directory(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
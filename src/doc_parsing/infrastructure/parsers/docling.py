@@ -1,64 +1,287 @@
 from __future__ import annotations
 
+import dataclasses
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from pathlib import Path
+from io import BytesIO
 from typing import Any
 
-from docling.datamodel.base_models import InputFormat
+import pypdfium2
+from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.pipeline_options import (
+    EasyOcrOptions,
+    OcrMacOptions,
+    OcrOptions,
     PdfPipelineOptions,
+    RapidOcrOptions,
+    TesseractCliOcrOptions,
+    TesseractOcrOptions,
     smolvlm_picture_description,
 )
 from docling.document_converter import DocumentConverter, PdfFormatOption
 
 from doc_parsing.application.logging import get_logger
-from doc_parsing.domain import PdfParser, PdfParserConfig, PdfParserFactory
+from doc_parsing.domain import (
+    PageRanges,
+    ParseOptions,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    WarmablePdfParserFactory,
+)
 
 from .docling_config import DoclingConfig
+from .ocr_languages import ocr_languages
+from .page_runs import merge_short_gaps
+
+_ConverterKey = tuple[str, ParseOptions, bool, tuple[str, ...] | None]
+
+# Converters own the loaded layout/table/VLM models and are not safe to share
+# between threads, so each thread keeps its own: one per distinct config and
+# set of requested content. Pool workers warm and parse on the same thread, and
+# forked workers keep the converters of the thread that forked them.
+_local = threading.local()
+# Each language set the hints narrow OCR to is its own converter, so only the
+# most recently used ones keep their models loaded.
+_MAX_CONVERTERS = 4
+
+_OCR_OPTIONS: dict[str, type[OcrOptions]] = {
+    "easyocr": EasyOcrOptions,
+    "tesserocr": TesseractOcrOptions,
+    "tesseract": TesseractCliOcrOptions,
+    "ocrmac": OcrMacOptions,
+    "rapidocr": RapidOcrOptions,
+}
 
 
 @dataclass(slots=True)
 class DoclingPdfParser(PdfParser):
     config: DoclingConfig
 
-    def parse(self, file_path: Path) -> str:
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        return self.parse_pages(source, options)
+
+    def parse_pages(
+        self,
+        source: PdfInput,
+        options: ParseOptions,
+        first: int = 1,
+        last: int | None = None,
+    ) -> str:
+        """Parse pages ``first`` to ``last`` (1-based, inclusive; ``None`` is
+        the last page)."""
         logger = get_logger(__name__, parser="docling")
-        logger.info("docling.parse.start", extra={"path": str(file_path)})
-        pipeline_options = PdfPipelineOptions()
-
-        if self.config.picture_description:
-            pipeline_options.do_picture_description = True
-            pipeline_options.picture_description_options = smolvlm_picture_description
-            if self.config.picture_prompt is not None:
-                pipeline_options.picture_description_options.prompt = (
-                    self.config.picture_prompt
-                )
+        logger.info(
+            "docling.parse.start",
+            extra={
+                "path": source.uri,
+                "pages": f"{first}-{'' if last is None else last}",
+                "ocr_languages": _ocr_languages(self.config, options),
+            },
+        )
+        if options.ocr_pages and self.config.do_ocr and options.extract_text:
+            markdown, stage_seconds = self._parse_segments(
+                source, options, options.ocr_pages, first, last, logger
+            )
+        else:
+            # An empty page selection means no page needs OCR.
+            converter = _converter(self.config, options, ocr=options.ocr_pages is None)
+            result = converter.convert(
+                _converter_source(source),
+                page_range=(first, sys.maxsize if last is None else last),
+            )
+            markdown = _document_to_markdown(result.document)
+            stage_seconds = _stage_seconds(result)
+        logger.info(
+            "docling.parse.complete",
+            extra={"chars": len(markdown), "stage_seconds": stage_seconds},
+        )
+        return markdown
+
+    def _parse_segments(
+        self,
+        source: PdfInput,
+        options: ParseOptions,
+        ocr_pages: PageRanges,
+        first: int,
+        last: int | None,
+        logger: Any,
+    ) -> tuple[str, dict[str, float]]:
+        # Docling switches OCR per converter, not per page, so runs of pages
+        # that need it and runs that do not are converted separately.
+        content = None
+        if source.path is None:
+            with source.open_stream(stage="parse") as stream:
+                content = stream.read()
+        if last is None:
+            last = _page_count(source.path if content is None else content)
+        segments = merge_short_gaps(
+            _ocr_segments(ocr_pages, first, last), self.config.ocr_merge_gap_pages
+        )
+        if len(segments) > self.config.max_ocr_segments:
+            segments = [(first, last, True)]
+        parts: list[str] = []
+        stage_seconds: dict[str, float] = {}
+        for start, end, ocr in segments:
+            result = _converter(self.config, options, ocr=ocr).convert(
+                source.path
+                if content is None
+                else DocumentStream(name=source.name, stream=BytesIO(content)),
+                page_range=(start, end),
+            )
+            parts.append(_document_to_markdown(result.document))
+            for stage, seconds in _stage_seconds(result).items():
+                stage_seconds[stage] = round(stage_seconds.get(stage, 0.0) + seconds, 3)
+        logger.info(
+            "docling.parse.ocr_pages",
+            extra={"segments": len(segments), "ocr_pages": str(ocr_pages)},
+        )
+        return "\n\n".join(part for part in parts if part), stage_seconds
+
+
+class DoclingPdfParserFactory(WarmablePdfParserFactory):
+    config_model = DoclingConfig
+
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        return DoclingPdfParser(config=_docling_config(config))
+
+    def warm(self, config: PdfParserConfig) -> None:
+        # Initialising the PDF pipeline downloads and loads every model it uses.
+        # Page-selective OCR converts text pages without OCR, so that converter
+        # is loaded too.
+        docling_config = _docling_config(config)
+        for ocr in (True, False) if docling_config.do_ocr else (True,):
+            converter = _converter(docling_config, ParseOptions(), ocr=ocr)
+            converter.initialize_pipeline(InputFormat.PDF)
 
-        if self.config.images_scale is not None:
-            pipeline_options.images_scale = self.config.images_scale
 
-        if self.config.generate_picture_images:
-            pipeline_options.generate_picture_images = True
+def _docling_config(config: PdfParserConfig) -> DoclingConfig:
+    options = _coerce_options(config.options)
+    options.setdefault("kind", "docling")
+    return DoclingConfig.model_validate(options)
 
-        converter = DocumentConverter(
+
+def _converter(
+    config: DoclingConfig, options: ParseOptions, *, ocr: bool = True
+) -> DocumentConverter:
+    # The page selection does not change the pipeline, and the language hint
+    # only does through the OCR languages it resolves to.
+    languages = _ocr_languages(config, options)
+    key = (
+        config.model_dump_json(),
+        dataclasses.replace(options, language_hint=None, ocr_pages=None),
+        ocr,
+        None if languages is None else tuple(languages),
+    )
+    converters = _thread_converters()
+    converter = converters.get(key)
+    if converter is None:
+        converter = converters[key] = DocumentConverter(
             format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_options=_pipeline_options(config, options, ocr=ocr)
+                )
             }
         )
-        document = converter.convert(file_path).document
-        markdown = _document_to_markdown(document)
-        logger.info("docling.parse.complete", extra={"chars": len(markdown)})
-        return markdown
+        if len(converters) > _MAX_CONVERTERS:
+            converters.popitem(last=False)
+    else:
+        converters.move_to_end(key)
+    return converter
 
 
-class DoclingPdfParserFactory(PdfParserFactory):
-    config_model = DoclingConfig
+def _thread_converters() -> OrderedDict[_ConverterKey, DocumentConverter]:
+    converters = getattr(_local, "converters", None)
+    if converters is None:
+        converters = _local.converters = OrderedDict()
+    return converters
 
-    def create(self, config: PdfParserConfig) -> PdfParser:
-        options = _coerce_options(config.options)
-        options.setdefault("kind", "docling")
-        model = DoclingConfig.model_validate(options)
-        return DoclingPdfParser(config=model)
+
+def _pipeline_options(
+    config: DoclingConfig, options: ParseOptions, *, ocr: bool = True
+) -> PdfPipelineOptions:
+    pipeline_options = PdfPipelineOptions()
+    # TableFormer and OCR run on every page, so skip them unless requested.
+    pipeline_options.do_table_structure = (
+        config.do_table_structure and options.extract_tables
+    )
+    pipeline_options.do_ocr = ocr and config.do_ocr and options.extract_text
+    if pipeline_options.do_ocr and config.ocr_engine != "auto":
+        # Every enabled language adds recognition work, so only the ones the
+        # document needs are passed on.
+        languages = _ocr_languages(config, options)
+        pipeline_options.ocr_options = _OCR_OPTIONS[config.ocr_engine](
+            **({} if languages is None else {"lang": languages})
+        )
+    if not options.extract_images:
+        return pipeline_options
+
+    if config.picture_description:
+        pipeline_options.do_picture_description = True
+        pipeline_options.picture_description_options = smolvlm_picture_description
+        if config.picture_prompt is not None:
+            pipeline_options.picture_description_options.prompt = config.picture_prompt
+
+    if config.images_scale is not None:
+        pipeline_options.images_scale = config.images_scale
+
+    if config.generate_picture_images:
+        pipeline_options.generate_picture_images = True
+
+    return pipeline_options
+
+
+def _ocr_languages(config: DoclingConfig, options: ParseOptions) -> list[str] | None:
+    language = options.language_hint if config.narrow_ocr_languages else None
+    return ocr_languages(config.ocr_engine, config.ocr_languages, language)
+
+
+def _ocr_segments(
+    ocr_pages: PageRanges, first: int, last: int
+) -> list[tuple[int, int, bool]]:
+    """Split ``first..last`` into ordered runs of OCR and non-OCR pages."""
+    segments: list[tuple[int, int, bool]] = []
+    next_page = first
+    for start, end in ocr_pages.ranges:
+        if end < first:
+            continue
+        if start > last:
+            break
+        start, end = max(start, first), min(end, last)
+        if start > next_page:
+            segments.append((next_page, start - 1, False))
+        segments.append((start, end, True))
+        next_page = end + 1
+    if next_page <= last:
+        segments.append((next_page, last, False))
+    return segments
+
+
+def _page_count(source: Any) -> int:
+    document = pypdfium2.PdfDocument(source)
+    try:
+        return len(document)
+    finally:
+        document.close()
+
+
+def _stage_seconds(result: Any) -> dict[str, float]:
+    # Populated when docling's settings.debug.profile_pipeline_timings is on.
+    return {
+        stage: round(float(timing.total()), 3)
+        for stage, timing in (getattr(result, "timings", None) or {}).items()
+    }
+
+
+def _converter_source(source: PdfInput) -> Any:
+    # Docling's PDF backends open local paths themselves; anything else is
+    # handed over as a DocumentStream read from the already-open input.
+    if source.path is not None:
+        return source.path
+    with source.open_stream(stage="parse") as stream:
+        return DocumentStream(name=source.name, stream=BytesIO(stream.read()))
 
 
 def _coerce_options(options: Any) -> dict[str, Any]:
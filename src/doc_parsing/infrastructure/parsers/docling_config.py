@@ -4,6 +4,8 @@ from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from .ocr_languages import OcrEngine
+
 
 class DoclingConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -13,9 +15,28 @@ class DoclingConfig(BaseModel):
     picture_prompt: str | None = None
     images_scale: float | None = None
     generate_picture_images: bool = False
+    do_ocr: bool = True
+    do_table_structure: bool = True
+    ocr_engine: OcrEngine = "auto"
+    # Engine language codes; None keeps the engine's default set.
+    ocr_languages: list[str] | None = None
+    narrow_ocr_languages: bool = True
+    # Text-page gaps this short between OCR runs are OCR'd with them. Past
+    # max_ocr_segments conversions, the whole range is converted with OCR.
+    ocr_merge_gap_pages: int = 2
+    max_ocr_segments: int = 8
 
     @model_validator(mode="after")
-    def _validate_picture_prompt(self) -> DoclingConfig:
+    def _validate_values(self) -> DoclingConfig:
         if self.picture_prompt is not None and not self.picture_description:
             raise ValueError("picture_prompt requires picture_description=true")
+        if self.ocr_languages is not None:
+            if self.ocr_engine == "auto":
+                raise ValueError("ocr_languages requires an explicit ocr_engine")
+            if not self.ocr_languages:
+                raise ValueError("ocr_languages cannot be empty")
+        if self.ocr_merge_gap_pages < 0:
+            raise ValueError("ocr_merge_gap_pages must be >= 0")
+        if self.max_ocr_segments < 1:
+            raise ValueError("max_ocr_segments must be >= 1")
         return self
@@ -12,3 +12,8 @@ class LazyDoclingPdfParserFactory(PdfParserFactory):
         from .docling import DoclingPdfParserFactory
 
         return DoclingPdfParserFactory().create(config)
+
+    def warm(self, config: PdfParserConfig) -> None:
+        from .docling import DoclingPdfParserFactory
+
+        DoclingPdfParserFactory().warm(config)
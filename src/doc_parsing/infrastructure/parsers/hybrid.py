@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pypdf import PdfReader
+from pypdf.generic import ContentStream
+
+from doc_parsing.application.logging import get_logger
+from doc_parsing.domain import (
+    ParseOptions,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+)
+
+from .docling_config import DoclingConfig
+from .page_runs import merge_short_gaps
+from .pypdf_parser import PypdfParserConfig
+from .text_layout import TextLine, heading_levels, page_lines, render_markdown
+
+if TYPE_CHECKING:
+    from .docling import DoclingPdfParser
+
+_PATH_OPERATORS = frozenset({b"m", b"l", b"c", b"v", b"y", b"re", b"h"})
+_TEXT_OPERATORS = frozenset({b"Tj", b"TJ", b"'", b'"'})
+# Strokes at least this long and at most this thick read as table rules.
+_RULE_MIN_LENGTH = 10.0
+_RULE_MAX_THICKNESS = 2.0
+
+
+class HybridParserConfig(BaseModel):
+    """Per-page routing between the pypdf text path and Docling.
+
+    A page goes to Docling when it has more images, path operators or ruling
+    lines than allowed, or too little text to skip OCR. Other pages take the
+    ``fast`` pypdf path. Runs of fast pages up to ``merge_gap_pages`` long
+    between Docling runs go to Docling with them, and a document that would
+    still need more than ``max_full_runs`` Docling calls is parsed by Docling
+    whole.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    kind: Literal["hybrid"] = Field(default="hybrid")
+    fast: PypdfParserConfig = Field(default_factory=PypdfParserConfig)
+    full: DoclingConfig = Field(default_factory=DoclingConfig)
+    max_images: int = 0
+    max_path_ops: int = 200
+    max_ruling_lines: int = 3
+    min_text_chars: int = 20
+    merge_gap_pages: int = 2
+    max_full_runs: int = 8
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> HybridParserConfig:
+        for name in (
+            "max_images",
+            "max_path_ops",
+            "max_ruling_lines",
+            "merge_gap_pages",
+        ):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be >= 0")
+        if self.min_text_chars < 0:
+            raise ValueError("min_text_chars must be >= 0")
+        if self.max_full_runs < 1:
+            raise ValueError("max_full_runs must be >= 1")
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class PageFeatures:
+    images: int = 0
+    path_ops: int = 0
+    ruling_lines: int = 0
+    text_chars: int = 0
+
+    def is_complex(self, config: HybridParserConfig) -> bool:
+        return (
+            self.images > config.max_images
+            or self.path_ops > config.max_path_ops
+            or self.ruling_lines > config.max_ruling_lines
+            or self.text_chars < config.min_text_chars
+        )
+
+
+class HybridPdfParser(PdfParser):
+    def __init__(self, config: HybridParserConfig) -> None:
+        self._config = config
+        self._full: DoclingPdfParser | None = None
+
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        logger = get_logger(__name__, parser="hybrid")
+        logger.info("hybrid.parse.start", extra={"path": source.uri})
+        with source.open_stream(stage="parse") as stream:
+            reader = PdfReader(stream)
+            complex_pages: list[bool] = []
+            lines: dict[int, list[TextLine]] = {}
+            for number, page in enumerate(reader.pages, start=1):
+                try:
+                    is_complex = page_features(page, reader).is_complex(self._config)
+                    if not is_complex:
+                        lines[number] = page_lines(page, number)
+                except Exception:
+                    # Docling gets whatever pypdf cannot read.
+                    is_complex = True
+                complex_pages.append(is_complex)
+
+        runs = merge_short_gaps(_runs(complex_pages), self._config.merge_gap_pages)
+        if sum(is_complex for *_, is_complex in runs) > self._config.max_full_runs:
+            runs = [(1, len(complex_pages), True)]
+        levels = heading_levels(
+            [
+                line
+                for first, last, is_complex in runs
+                if not is_complex
+                for number in range(first, last + 1)
+                for line in lines[number]
+            ],
+            self._config.fast,
+        )
+        parts: list[str] = []
+        for first, last, is_complex in runs:
+            if is_complex:
+                parts.append(
+                    self._full_parser().parse_pages(source, options, first, last)
+                )
+            else:
+                run_lines = [
+                    line for number in range(first, last + 1) for line in lines[number]
+                ]
+                parts.append(render_markdown(run_lines, self._config.fast, levels))
+        markdown = "\n\n".join(part for part in parts if part)
+
+        full_pages = sum(
+            last - first + 1 for first, last, is_complex in runs if is_complex
+        )
+        page_count = len(complex_pages)
+        logger.info(
+            "hybrid.parse.complete",
+            extra={
+                "chars": len(markdown),
+                "pages": page_count,
+                "fast_pages": page_count - full_pages,
+                "full_pages": full_pages,
+                "full_share": round(full_pages / page_count, 3) if page_count else 0.0,
+                "runs": len(runs),
+            },
+        )
+        return markdown
+
+    def _full_parser(self) -> DoclingPdfParser:
+        # Docling (and torch) load on the first complex page, not at import.
+        if self._full is None:
+            from .docling import DoclingPdfParser
+
+            self._full = DoclingPdfParser(config=self._config.full)
+        return self._full
+
+
+class HybridPdfParserFactory(PdfParserFactory):
+    config_model = HybridParserConfig
+
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        return HybridPdfParser(_hybrid_config(config))
+
+    def warm(self, config: PdfParserConfig) -> None:
+        from .docling import DoclingPdfParserFactory
+
+        full = _hybrid_config(config).full
+        DoclingPdfParserFactory().warm(
+            PdfParserConfig(name="docling", options=full.model_dump(exclude={"kind"}))
+        )
+
+
+def page_features(page: Any, reader: PdfReader) -> PageFeatures:
+    """Count what a page draws, including inside the forms it draws."""
+    contents = page.get_contents()
+    if contents is None:
+        return PageFeatures()
+    tally = _Tally()
+    resources = _resolve(page.get("/Resources")) or {}
+    _scan(contents, resources, reader, tally, set())
+    return PageFeatures(
+        tally.images, tally.path_ops, tally.ruling_lines, tally.text_chars
+    )
+
+
+@dataclass(slots=True)
+class _Tally:
+    images: int = 0
+    path_ops: int = 0
+    ruling_lines: int = 0
+    text_chars: int = 0
+
+
+def _scan(
+    contents: Any, resources: Any, reader: PdfReader, tally: _Tally, seen: set[int]
+) -> None:
+    xobjects = _resolve(resources.get("/XObject")) or {}
+    current: tuple[float, float] | None = None
+    for operands, operator in ContentStream(contents, reader).operations:
+        if operator in _TEXT_OPERATORS:
+            text = operands[-1]
+            tally.text_chars += (
+                sum(len(item) for item in text if isinstance(item, str | bytes))
+                if isinstance(text, list)
+                else len(text)
+            )
+        elif operator in _PATH_OPERATORS:
+            tally.path_ops += 1
+            if operator == b"re":
+                width, height = abs(float(operands[2])), abs(float(operands[3]))
+                if _is_rule(max(width, height), min(width, height)):
+                    tally.ruling_lines += 1
+            elif operator == b"m":
+                current = (float(operands[0]), float(operands[1]))
+            elif operator == b"l":
+                x, y = float(operands[0]), float(operands[1])
+                if current is not None and (
+                    _is_rule(abs(x - current[0]), abs(y - current[1]))
+                    or _is_rule(abs(y - current[1]), abs(x - current[0]))
+                ):
+                    tally.ruling_lines += 1
+                current = (x, y)
+        elif operator == b"Do":
+            xobject = _resolve(xobjects.get(operands[0]))
+            if xobject is None:
+                continue
+            subtype = xobject.get("/Subtype")
+            if subtype == "/Image":
+                tally.images += 1
+            elif subtype == "/Form" and id(xobject) not in seen:
+                # Each form is counted once, which also stops forms that draw
+                # themselves.
+                seen.add(id(xobject))
+                form_resources = _resolve(xobject.get("/Resources")) or resources
+                _scan(xobject, form_resources, reader, tally, seen)
+        elif operator == b"INLINE IMAGE":
+            tally.images += 1
+
+
+def _resolve(obj: Any) -> Any:
+    return obj.get_object() if obj is not None else None
+
+
+def _is_rule(length: float, thickness: float) -> bool:
+    return length >= _RULE_MIN_LENGTH and thickness <= _RULE_MAX_THICKNESS
+
+
+def _runs(complex_pages: list[bool]) -> list[tuple[int, int, bool]]:
+    runs: list[tuple[int, int, bool]] = []
+    for number, is_complex in enumerate(complex_pages, start=1):
+        if runs and runs[-1][2] == is_complex:
+            runs[-1] = (runs[-1][0], number, is_complex)
+        else:
+            runs.append((number, number, is_complex))
+    return runs
+
+
+def _hybrid_config(config: PdfParserConfig) -> HybridParserConfig:
+    return HybridParserConfig.model_validate(
+        {"kind": "hybrid", **(config.options or {})}
+    )
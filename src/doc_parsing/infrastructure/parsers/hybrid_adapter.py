@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from .hybrid import HybridParserConfig, HybridPdfParserFactory
+from .registration import AdapterRegistration
+
+adapter = AdapterRegistration(
+    name="hybrid",
+    config_model=HybridParserConfig,
+    factory=HybridPdfParserFactory(),
+)
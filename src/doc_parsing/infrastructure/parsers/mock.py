@@ -1,27 +1,39 @@
 from __future__ import annotations
 
-from pathlib import Path
+import time
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from doc_parsing.application.logging import get_logger
-from doc_parsing.domain import PdfParser, PdfParserConfig, PdfParserFactory
+from doc_parsing.domain import (
+    ParseOptions,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+)
 
 
 class MockConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     kind: Literal["mock"] = Field(default="mock")
+    delay_seconds: float = Field(default=0.0, ge=0.0)
 
 
 class MockPdfParser(PdfParser):
-    def parse(self, file_path: Path) -> str:
+    def __init__(self, delay_seconds: float = 0.0) -> None:
+        self._delay_seconds = delay_seconds
+
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
         logger = get_logger(__name__, parser="mock")
-        logger.info("mock.parse.start", extra={"path": str(file_path)})
+        logger.info("mock.parse.start", extra={"path": source.uri})
+        if self._delay_seconds:
+            # Stands in for a slow conversion when exercising timeouts.
+            time.sleep(self._delay_seconds)
         return (
-            f"# Parsed {file_path.name}\n\n"
-            "This output was generated by the mock parser."
+            f"# Parsed {source.name}\n\nThis output was generated by the mock parser."
         )
 
 
@@ -29,4 +41,5 @@ class MockPdfParserFactory(PdfParserFactory):
     config_model = MockConfig
 
     def create(self, config: PdfParserConfig) -> PdfParser:
-        return MockPdfParser()
+        model = MockConfig.model_validate({"kind": "mock", **(config.options or {})})
+        return MockPdfParser(delay_seconds=model.delay_seconds)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Literal
+
+OcrEngine = Literal["auto", "easyocr", "tesserocr", "tesseract", "ocrmac", "rapidocr"]
+
+# Detected languages arrive as langdetect codes: ISO 639-1, plus zh-cn / zh-tw.
+_TESSERACT_CODES = {
+    "af": "afr",
+    "ar": "ara",
+    "bg": "bul",
+    "bn": "ben",
+    "ca": "cat",
+    "cs": "ces",
+    "cy": "cym",
+    "da": "dan",
+    "de": "deu",
+    "el": "ell",
+    "en": "eng",
+    "es": "spa",
+    "et": "est",
+    "fa": "fas",
+    "fi": "fin",
+    "fr": "fra",
+    "gu": "guj",
+    "he": "heb",
+    "hi": "hin",
+    "hr": "hrv",
+    "hu": "hun",
+    "id": "ind",
+    "it": "ita",
+    "ja": "jpn",
+    "kn": "kan",
+    "ko": "kor",
+    "lt": "lit",
+    "lv": "lav",
+    "mk": "mkd",
+    "ml": "mal",
+    "mr": "mar",
+    "ne": "nep",
+    "nl": "nld",
+    "no": "nor",
+    "pa": "pan",
+    "pl": "pol",
+    "pt": "por",
+    "ro": "ron",
+    "ru": "rus",
+    "sk": "slk",
+    "sl": "slv",
+    "so": "som",
+    "sq": "sqi",
+    "sv": "swe",
+    "sw": "swa",
+    "ta": "tam",
+    "te": "tel",
+    "th": "tha",
+    "tl": "tgl",
+    "tr": "tur",
+    "uk": "ukr",
+    "ur": "urd",
+    "vi": "vie",
+    "zh-cn": "chi_sim",
+    "zh-tw": "chi_tra",
+}
+
+_EASYOCR_CODES = {
+    **{
+        code: code
+        for code in (
+            "af ar bg bn cs cy da de en es et fa fr hi hr hu id it ja kn ko lt lv "
+            "mr ne nl no pl pt ro ru sk sl sq sv sw ta te th tl tr uk ur vi"
+        ).split()
+    },
+    "zh-cn": "ch_sim",
+    "zh-tw": "ch_tra",
+}
+
+_OCRMAC_CODES = {
+    "de": "de-DE",
+    "en": "en-US",
+    "es": "es-ES",
+    "fr": "fr-FR",
+    "it": "it-IT",
+    "ja": "ja-JP",
+    "ko": "ko-KR",
+    "pt": "pt-BR",
+    "ru": "ru-RU",
+    "th": "th-TH",
+    "uk": "uk-UA",
+    "vi": "vi-VT",
+    "zh-cn": "zh-Hans",
+    "zh-tw": "zh-Hant",
+}
+
+# RapidOCR picks recognisers by script rather than language, and "auto" only
+# chooses its engine at run time, so neither is narrowed.
+OCR_LANGUAGE_CODES: dict[str, dict[str, str]] = {
+    "easyocr": _EASYOCR_CODES,
+    "tesserocr": _TESSERACT_CODES,
+    "tesseract": _TESSERACT_CODES,
+    "ocrmac": _OCRMAC_CODES,
+}
+
+
+def ocr_languages(
+    engine: OcrEngine, configured: list[str] | None, language: str | None
+) -> list[str] | None:
+    """Resolve the OCR languages for one document.
+
+    A detected or hinted language narrows the set to that language's engine
+    code, as long as the engine has one and it is among ``configured``.
+    Otherwise ``configured`` is used as is; ``None`` keeps the engine default.
+    """
+    if language is not None:
+        code = OCR_LANGUAGE_CODES.get(engine, {}).get(language.strip().lower())
+        if code is not None and (configured is None or code in configured):
+            return [code]
+    return configured
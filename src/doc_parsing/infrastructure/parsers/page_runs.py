@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+PageRun = tuple[int, int, bool]
+
+
+def merge_short_gaps(runs: list[PageRun], max_gap_pages: int) -> list[PageRun]:
+    """Fold gaps of at most ``max_gap_pages`` between flagged runs into them.
+
+    ``runs`` are ordered ``(first, last, flagged)`` page runs. A short
+    unflagged run between two flagged ones costs a conversion of its own, so
+    it is cheaper to treat it as flagged.
+    """
+    merged: list[PageRun] = []
+    for index, (first, last, flagged) in enumerate(runs):
+        if (
+            not flagged
+            and 0 < index < len(runs) - 1
+            and last - first + 1 <= max_gap_pages
+        ):
+            flagged = True
+        if merged and merged[-1][2] == flagged:
+            merged[-1] = (merged[-1][0], last, flagged)
+        else:
+            merged.append((first, last, flagged))
+    return merged
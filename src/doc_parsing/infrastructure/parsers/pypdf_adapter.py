@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from .pypdf_parser import PypdfParserConfig, PypdfPdfParserFactory
+from .registration import AdapterRegistration
+
+adapter = AdapterRegistration(
+    name="pypdf",
+    config_model=PypdfParserConfig,
+    factory=PypdfPdfParserFactory(),
+)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pypdf import PdfReader
+
+from doc_parsing.application.logging import get_logger
+from doc_parsing.domain import (
+    ParseOptions,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+)
+
+from .text_layout import TextLine, heading_levels, page_lines, render_markdown
+
+
+class PypdfParserConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    kind: Literal["pypdf"] = Field(default="pypdf")
+    # Lines this much larger than the body text become headings.
+    heading_size_ratio: float = 1.15
+    max_heading_level: int = 3
+    max_heading_chars: int = 120
+    # A vertical gap of more than this many line heights starts a paragraph.
+    paragraph_gap_ratio: float = 1.5
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> PypdfParserConfig:
+        if self.heading_size_ratio <= 1.0:
+            raise ValueError("heading_size_ratio must be > 1.0")
+        if not (1 <= self.max_heading_level <= 6):
+            raise ValueError("max_heading_level must be between 1 and 6")
+        if self.max_heading_chars < 1:
+            raise ValueError("max_heading_chars must be >= 1")
+        if self.paragraph_gap_ratio <= 0.0:
+            raise ValueError("paragraph_gap_ratio must be > 0.0")
+        return self
+
+
+class PypdfPdfParser(PdfParser):
+    """Text-only markdown from the PDF's text layer, without any models.
+
+    Suited to born-digital, single-column documents. Headings are inferred
+    from font size relative to the body text; tables, images and scanned pages
+    are not handled.
+    """
+
+    def __init__(self, config: PypdfParserConfig) -> None:
+        self._config = config
+
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        logger = get_logger(__name__, parser="pypdf")
+        logger.info("pypdf.parse.start", extra={"path": source.uri})
+        with source.open_stream(stage="parse") as stream:
+            reader = PdfReader(stream)
+            page_count = len(reader.pages)
+            lines: list[TextLine] = []
+            for number, page in enumerate(reader.pages, start=1):
+                try:
+                    lines.extend(page_lines(page, number))
+                except Exception:
+                    logger.warning("pypdf.parse.page_failed", extra={"page": number})
+        markdown = render_markdown(
+            lines, self._config, heading_levels(lines, self._config)
+        )
+        logger.info(
+            "pypdf.parse.complete",
+            extra={"chars": len(markdown), "pages": page_count},
+        )
+        return markdown
+
+
+class PypdfPdfParserFactory(PdfParserFactory):
+    config_model = PypdfParserConfig
+
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        model = PypdfParserConfig.model_validate(
+            {"kind": "pypdf", **(config.options or {})}
+        )
+        return PypdfPdfParser(model)
@@ -4,7 +4,12 @@ from collections.abc import Callable, Mapping
 
 from pydantic import BaseModel
 
-from doc_parsing.domain import PdfParser, PdfParserConfig, PdfParserFactory
+from doc_parsing.domain import (
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+    WarmablePdfParserFactory,
+)
 
 from .entrypoints import load_entrypoints
 from .registration import AdapterRegistration
@@ -31,6 +36,16 @@ class ParserRegistry(PdfParserFactory):
             raise ValueError(f"unknown parser: {config.name}") from exc
         return factory(config)
 
+    def warm(self, config: PdfParserConfig) -> None:
+        adapter = self._adapters.get(config.name)
+        if adapter is not None and isinstance(
+            adapter.factory, WarmablePdfParserFactory
+        ):
+            adapter.factory.warm(config)
+        else:
+            # Nothing to preload; building a parser still validates the config.
+            self.create(config)
+
     def available(self) -> Mapping[str, Callable[[PdfParserConfig], PdfParser]]:
         return dict(self._factories)
 
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pypdf_parser import PypdfParserConfig
+
+_HYPHENATED = re.compile(r"\w-$")
+
+
+@dataclass(slots=True)
+class TextLine:
+    text: str
+    size: float
+    y: float | None
+    page: int
+
+
+def page_lines(page: Any, number: int) -> list[TextLine]:
+    lines: list[TextLine] = []
+    current: TextLine | None = None
+
+    def visit(
+        text: str, cm: list[float], tm: list[float], font: Any, font_size: float
+    ) -> None:
+        nonlocal current
+        if not text.strip():
+            # Whitespace chunks carry a reset text matrix, so only their line
+            # breaks are meaningful.
+            if "\n" in text:
+                current = None
+            return
+        matrix = _multiply(tm, cm)
+        size = round(font_size * math.hypot(matrix[2], matrix[3]) * 2) / 2
+        y = matrix[5]
+        for index, piece in enumerate(text.split("\n")):
+            if index or (
+                current is not None
+                and current.y is not None
+                and abs(current.y - y) > 0.5 * max(size, current.size)
+            ):
+                current = None
+            if not piece.strip():
+                continue
+            if current is None:
+                current = TextLine(piece, size, y if index == 0 else None, number)
+                lines.append(current)
+            else:
+                current.text += piece
+                current.size = max(current.size, size)
+
+    page.extract_text(visitor_text=visit)
+    return [line for line in lines if line.text.strip()]
+
+
+def _multiply(a: list[float], b: list[float]) -> tuple[float, ...]:
+    return (
+        a[0] * b[0] + a[1] * b[2],
+        a[0] * b[1] + a[1] * b[3],
+        a[2] * b[0] + a[3] * b[2],
+        a[2] * b[1] + a[3] * b[3],
+        a[4] * b[0] + a[5] * b[2] + b[4],
+        a[4] * b[1] + a[5] * b[3] + b[5],
+    )
+
+
+def heading_levels(
+    lines: list[TextLine], config: PypdfParserConfig
+) -> dict[float, int]:
+    weights: Counter[float] = Counter()
+    for line in lines:
+        weights[line.size] += len(line.text)
+    if not weights:
+        return {}
+    body_size = weights.most_common(1)[0][0]
+    sizes = sorted(
+        (size for size in weights if size >= body_size * config.heading_size_ratio),
+        reverse=True,
+    )
+    return {
+        size: min(level, config.max_heading_level)
+        for level, size in enumerate(sizes, start=1)
+    }
+
+
+def render_markdown(
+    lines: list[TextLine], config: PypdfParserConfig, levels: dict[float, int]
+) -> str:
+    blocks: list[str] = []
+    paragraph: list[str] = []
+    previous: TextLine | None = None
+
+    def flush() -> None:
+        if paragraph:
+            blocks.append(" ".join(paragraph))
+            paragraph.clear()
+
+    for line in lines:
+        text = " ".join(line.text.split())
+        level = levels.get(line.size)
+        if level is not None and len(text) <= config.max_heading_chars:
+            flush()
+            blocks.append(f"{'#' * level} {text}")
+            previous = None
+            continue
+        if previous is None or _starts_paragraph(previous, line, config):
+            flush()
+        if paragraph and _HYPHENATED.search(paragraph[-1]) and text[:1].islower():
+            paragraph[-1] = paragraph[-1][:-1] + text
+        else:
+            paragraph.append(text)
+        previous = line
+    flush()
+    return "\n\n".join(blocks)
+
+
+def _starts_paragraph(
+    previous: TextLine, line: TextLine, config: PypdfParserConfig
+) -> bool:
+    if line.page != previous.page or line.size != previous.size:
+        return True
+    if line.y is None or previous.y is None:
+        return False
+    gap = previous.y - line.y
+    # Moving up the page means a new column or text box.
+    return gap <= 0 or gap > config.paragraph_gap_ratio * line.size
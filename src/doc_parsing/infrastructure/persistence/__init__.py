@@ -0,0 +1,3 @@
+from .sqlite_task_store import SqliteParsingTaskStore
+
+__all__ = ["SqliteParsingTaskStore"]
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+
+from doc_parsing.domain import ParseStatus, ParsingTask, ParsingTaskStore, TaskId
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parsing_tasks (
+    run_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    source_uri TEXT NOT NULL,
+    status TEXT NOT NULL,
+    requested_at TEXT NOT NULL,
+    queued_at TEXT,
+    started_at TEXT,
+    completed_at TEXT,
+    error_message TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, task_id)
+);
+CREATE INDEX IF NOT EXISTS parsing_tasks_status
+    ON parsing_tasks (run_id, status);
+"""
+
+_UPSERT = """
+INSERT INTO parsing_tasks (
+    run_id, task_id, source_uri, status, requested_at, queued_at,
+    started_at, completed_at, error_message, attempts, updated_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (run_id, task_id) DO UPDATE SET
+    source_uri = excluded.source_uri,
+    status = excluded.status,
+    requested_at = excluded.requested_at,
+    queued_at = excluded.queued_at,
+    started_at = excluded.started_at,
+    completed_at = excluded.completed_at,
+    error_message = excluded.error_message,
+    attempts = parsing_tasks.attempts + excluded.attempts,
+    updated_at = excluded.updated_at
+"""
+
+type _Row = tuple[
+    str, str, str, str, str, str | None, str | None, str | None, str | None, int, str
+]
+
+
+class SqliteParsingTaskStore(ParsingTaskStore):
+    """SQLite-backed task statuses for one run, written in batches.
+
+    The database runs in WAL mode so status reads do not block the writer.
+    Transitions are buffered and written ``batch_size`` at a time, or after
+    ``flush_interval`` seconds, in one transaction. Repeated transitions of
+    the same task within a batch collapse into a single row write. A crash
+    loses at most the unflushed tail, which a resumed run simply re-does.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        run_id: str,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+    ) -> None:
+        if not run_id.strip():
+            raise ValueError("run_id cannot be empty")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self._connection = connection
+        self._run_id = run_id
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending: dict[str, _Row] = {}
+        self._pending_attempts: dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(
+        cls,
+        path: Path,
+        *,
+        run_id: str,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+    ) -> SqliteParsingTaskStore:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        return cls(
+            connection,
+            run_id=run_id,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    def record(self, task: ParsingTask) -> None:
+        task_id = task.request.task_id.value
+        with self._lock:
+            attempts = self._pending_attempts.get(task_id, 0)
+            if task.status == ParseStatus.RUNNING:
+                attempts += 1
+            self._pending_attempts[task_id] = attempts
+            self._pending[task_id] = (
+                self._run_id,
+                task_id,
+                task.request.source.uri,
+                task.status.value,
+                task.request.requested_at.isoformat(),
+                _isoformat(task.queued_at),
+                _isoformat(task.started_at),
+                _isoformat(task.completed_at),
+                task.error_message,
+                attempts,
+                datetime.now(tz=UTC).isoformat(),
+            )
+            due = time.monotonic() - self._last_flush >= self._flush_interval
+            if len(self._pending) >= self._batch_size or due:
+                self._write_pending()
+
+    def statuses(self) -> Mapping[TaskId, ParseStatus]:
+        self.flush()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT task_id, status FROM parsing_tasks WHERE run_id = ?",
+                (self._run_id,),
+            ).fetchall()
+        return {TaskId(task_id): ParseStatus(status) for task_id, status in rows}
+
+    def count_by_status(self) -> dict[ParseStatus, int]:
+        self.flush()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM parsing_tasks WHERE run_id = ? "
+                "GROUP BY status",
+                (self._run_id,),
+            ).fetchall()
+        return {ParseStatus(status): count for status, count in rows}
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self) -> SqliteParsingTaskStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _write_pending(self) -> None:
+        if self._pending:
+            with self._connection:
+                self._connection.executemany(_UPSERT, list(self._pending.values()))
+            self._pending.clear()
+            self._pending_attempts.clear()
+        self._last_flush = time.monotonic()
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
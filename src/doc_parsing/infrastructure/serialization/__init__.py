@@ -0,0 +1,18 @@
+from .binary import (
+    FORMAT_VERSION,
+    BinaryDocumentReader,
+    DocumentFormatError,
+    encode_document,
+    write_document,
+)
+from .triage import decode_triage_metadata, encode_triage_metadata
+
+__all__ = [
+    "BinaryDocumentReader",
+    "DocumentFormatError",
+    "FORMAT_VERSION",
+    "decode_triage_metadata",
+    "encode_document",
+    "encode_triage_metadata",
+    "write_document",
+]
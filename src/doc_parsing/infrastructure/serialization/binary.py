@@ -0,0 +1,345 @@
+"""Versioned binary encoding for ``Document``.
+
+Layout (all integers little-endian)::
+
+    header      magic, version, content kind, counts, section offsets and
+                string refs for the document-level fields
+    pages       one ``_PAGE`` record per page: number, first block, block count
+    blocks      one ``_BLOCK`` record per block: kind, flags, string refs
+    bboxes      four packed float64 values per block
+    arena       UTF-8 text referenced by (offset, length) pairs
+
+Readers map the file and decode records on demand; text comes back as
+``memoryview`` slices of the arena until a caller asks for ``str``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from doc_parsing.domain import (
+    BlockType,
+    BoundingBox,
+    ContentBlock,
+    Document,
+    DocumentContent,
+    DocumentContentKind,
+    DocumentId,
+    DocumentSource,
+    ImageBlock,
+    Page,
+    SourceType,
+    TableBlock,
+    TextBlock,
+)
+
+MAGIC = b"DPDOC\x00\x00\x00"
+FORMAT_VERSION = 1
+
+_NONE = 0xFFFFFFFF
+_HEADER = struct.Struct("<8sHB5xIIQQQQ" + "QI" * 7)
+_PAGE = struct.Struct("<III")
+_BLOCK = struct.Struct("<BB2xQIQId")
+_BBOX = struct.Struct("<4d")
+
+_KIND_CODES = {DocumentContentKind.BLOCKS: 0, DocumentContentKind.MARKDOWN: 1}
+_KINDS = {code: kind for kind, code in _KIND_CODES.items()}
+_BLOCK_CODES = {BlockType.TEXT: 0, BlockType.TABLE: 1, BlockType.IMAGE: 2}
+_BLOCK_TYPES = {code: kind for kind, code in _BLOCK_CODES.items()}
+_FLAG_NORMALIZED = 0x01
+
+
+class DocumentFormatError(ValueError):
+    pass
+
+
+class _Arena:
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def add(self, value: str | None) -> tuple[int, int]:
+        if value is None:
+            return 0, _NONE
+        encoded = value.encode("utf-8")
+        offset = self._size
+        self._chunks.append(encoded)
+        self._size += len(encoded)
+        return offset, len(encoded)
+
+    def getvalue(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+def encode_document(document: Document) -> bytes:
+    arena = _Arena()
+    content = document.content
+    pages = bytearray()
+    blocks = bytearray()
+    bboxes = bytearray()
+    block_index = 0
+
+    for page in content.pages:
+        pages += _PAGE.pack(page.number, block_index, len(page.blocks))
+        for block in page.blocks:
+            payload, confidence = _block_payload(block)
+            flags = _FLAG_NORMALIZED if block.bbox.normalized else 0
+            blocks += _BLOCK.pack(
+                _BLOCK_CODES[block.kind],
+                flags,
+                *arena.add(block.block_id),
+                *arena.add(payload),
+                math.nan if confidence is None else confidence,
+            )
+            bbox = block.bbox
+            bboxes += _BBOX.pack(bbox.x0, bbox.y0, bbox.x1, bbox.y1)
+            block_index += 1
+
+    refs = (
+        arena.add(document.document_id.value),
+        arena.add(document.source.uri),
+        arena.add(document.source.source_type.value),
+        arena.add(document.source.mime_type),
+        arena.add(document.created_at.isoformat()),
+        arena.add(json.dumps(document.metadata) if document.metadata else None),
+        arena.add(content.markdown),
+    )
+    pages_offset = _HEADER.size
+    blocks_offset = pages_offset + len(pages)
+    bboxes_offset = blocks_offset + len(blocks)
+    arena_offset = bboxes_offset + len(bboxes)
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        _KIND_CODES[content.kind],
+        len(content.pages),
+        block_index,
+        pages_offset,
+        blocks_offset,
+        bboxes_offset,
+        arena_offset,
+        *(value for ref in refs for value in ref),
+    )
+    return b"".join((header, pages, blocks, bboxes, arena.getvalue()))
+
+
+def write_document(document: Document, target: Path | BinaryIO) -> int:
+    payload = encode_document(document)
+    if isinstance(target, Path):
+        target.write_bytes(payload)
+    else:
+        target.write(payload)
+    return len(payload)
+
+
+def _block_payload(block: ContentBlock) -> tuple[str | None, float | None]:
+    if isinstance(block, TextBlock):
+        return block.text, block.confidence
+    if isinstance(block, TableBlock):
+        return json.dumps(block.cells), None
+    if isinstance(block, ImageBlock):
+        return block.description, None
+    raise TypeError(f"unsupported block type: {type(block).__name__}")
+
+
+class BinaryDocumentReader:
+    """Lazy view over an encoded document.
+
+    Slices returned by ``*_bytes`` methods borrow the underlying buffer and
+    must be released before ``close()`` when the reader owns a memory map.
+    """
+
+    def __init__(self, buffer: bytes | bytearray | memoryview | mmap.mmap) -> None:
+        self._mmap = buffer if isinstance(buffer, mmap.mmap) else None
+        self._view = memoryview(buffer)
+        if len(self._view) < _HEADER.size:
+            raise DocumentFormatError("buffer too small for document header")
+        fields = _HEADER.unpack_from(self._view, 0)
+        magic, version, kind_code, page_count, block_count = fields[:5]
+        if magic != MAGIC:
+            raise DocumentFormatError("not an encoded document")
+        if version != FORMAT_VERSION:
+            raise DocumentFormatError(f"unsupported format version: {version}")
+        if kind_code not in _KINDS:
+            raise DocumentFormatError(f"unknown content kind: {kind_code}")
+        self.kind = _KINDS[kind_code]
+        self.page_count: int = page_count
+        self.block_count: int = block_count
+        (
+            self._pages_offset,
+            self._blocks_offset,
+            self._bboxes_offset,
+            self._arena_offset,
+        ) = fields[5:9]
+        refs = fields[9:]
+        self._refs = [(refs[i], refs[i + 1]) for i in range(0, len(refs), 2)]
+        # Every record read later is then inside the buffer.
+        self._check_section("page", self._pages_offset, page_count, _PAGE.size)
+        self._check_section("block", self._blocks_offset, block_count, _BLOCK.size)
+        self._check_section("bbox", self._bboxes_offset, block_count, _BBOX.size)
+        if self._arena_offset > len(self._view):
+            raise DocumentFormatError("truncated document")
+
+    @classmethod
+    def open(cls, path: Path) -> BinaryDocumentReader:
+        with path.open("rb") as handle:
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return cls(handle.read())
+        return cls(mapped)
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> BinaryDocumentReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def document_id(self) -> str:
+        return self._ref_str(self._refs[0]) or ""
+
+    def markdown_bytes(self) -> memoryview | None:
+        return self._slice(self._refs[6])
+
+    def markdown(self) -> str | None:
+        return self._ref_str(self._refs[6])
+
+    def page_numbers(self) -> list[int]:
+        return [self._page_record(index)[0] for index in range(self.page_count)]
+
+    def page(self, number: int) -> Page | None:
+        for index in range(self.page_count):
+            page_number, first, count = self._page_record(index)
+            if page_number == number:
+                blocks = [self.block(first + offset) for offset in range(count)]
+                return Page.trusted(page_number, blocks)
+        return None
+
+    def iter_pages(self) -> Iterator[Page]:
+        for index in range(self.page_count):
+            number, first, count = self._page_record(index)
+            yield Page.trusted(
+                number, [self.block(first + offset) for offset in range(count)]
+            )
+
+    def text_bytes(self, index: int) -> memoryview | None:
+        """Return the raw UTF-8 payload of block ``index`` without decoding."""
+        _, _, _, _, offset, length, _ = self._block_record(index)
+        return self._slice((offset, length))
+
+    def bbox(self, index: int) -> tuple[float, float, float, float]:
+        self._check_block_index(index)
+        return _BBOX.unpack_from(self._view, self._bboxes_offset + index * _BBOX.size)
+
+    def bbox_array(self) -> memoryview:
+        """Return every bbox as a flat float64 view (x0, y0, x1, y1 per block)."""
+        start = self._bboxes_offset
+        raw = self._view[start : start + self.block_count * _BBOX.size]
+        if sys.byteorder == "little":
+            return raw.cast("d")
+        values = array("d", raw.tobytes())
+        values.byteswap()
+        return memoryview(values)
+
+    def block(self, index: int) -> ContentBlock:
+        code, flags, id_offset, id_length, offset, length, confidence = (
+            self._block_record(index)
+        )
+        bbox = BoundingBox.trusted(
+            *self.bbox(index), normalized=bool(flags & _FLAG_NORMALIZED)
+        )
+        block_id = self._ref_str((id_offset, id_length)) or ""
+        payload = self._ref_str((offset, length))
+        kind = _BLOCK_TYPES.get(code)
+        if kind == BlockType.TEXT:
+            return TextBlock.trusted(
+                block_id,
+                bbox,
+                payload or "",
+                None if math.isnan(confidence) else confidence,
+            )
+        if kind == BlockType.TABLE:
+            try:
+                rows = json.loads(payload or "[]")
+            except json.JSONDecodeError as exc:
+                raise DocumentFormatError(f"invalid table cells: {exc}") from None
+            cells = tuple(tuple(row) for row in rows)
+            return TableBlock.trusted(block_id, bbox, cells)
+        if kind == BlockType.IMAGE:
+            return ImageBlock.trusted(block_id, bbox, payload)
+        raise DocumentFormatError(f"unknown block kind: {code}")
+
+    def to_document(self) -> Document:
+        if self.kind == DocumentContentKind.MARKDOWN:
+            content = DocumentContent.from_markdown(self.markdown() or "")
+        else:
+            content = DocumentContent.from_trusted_pages(list(self.iter_pages()))
+        mime_type = self._ref_str(self._refs[3])
+        metadata = self._ref_str(self._refs[5])
+        return Document(
+            document_id=DocumentId(self.document_id),
+            source=DocumentSource(
+                uri=self._ref_str(self._refs[1]) or "",
+                source_type=SourceType(self._ref_str(self._refs[2])),
+                mime_type=mime_type,
+            ),
+            content=content,
+            metadata=json.loads(metadata) if metadata else {},
+            created_at=datetime.fromisoformat(self._ref_str(self._refs[4]) or ""),
+        )
+
+    def _check_section(self, name: str, offset: int, count: int, size: int) -> None:
+        if offset < _HEADER.size or offset + count * size > len(self._view):
+            raise DocumentFormatError(f"{name} table past end of buffer")
+
+    def _page_record(self, index: int) -> tuple[int, int, int]:
+        if not (0 <= index < self.page_count):
+            raise IndexError(f"page index out of range: {index}")
+        number, first, count = _PAGE.unpack_from(
+            self._view, self._pages_offset + index * _PAGE.size
+        )
+        if first + count > self.block_count:
+            raise DocumentFormatError(f"page {number} blocks past end of block table")
+        return number, first, count
+
+    def _block_record(self, index: int) -> tuple[int, int, int, int, int, int, float]:
+        self._check_block_index(index)
+        return _BLOCK.unpack_from(self._view, self._blocks_offset + index * _BLOCK.size)
+
+    def _check_block_index(self, index: int) -> None:
+        if not (0 <= index < self.block_count):
+            raise IndexError(f"block index out of range: {index}")
+
+    def _slice(self, ref: tuple[int, int]) -> memoryview | None:
+        offset, length = ref
+        if length == _NONE:
+            return None
+        start = self._arena_offset + offset
+        if start + length > len(self._view):
+            raise DocumentFormatError("string reference past end of buffer")
+        return self._view[start : start + length]
+
+    def _ref_str(self, ref: tuple[int, int]) -> str | None:
+        view = self._slice(ref)
+        if view is None:
+            return None
+        with view:
+            try:
+                return str(view, "utf-8")
+            except UnicodeDecodeError as exc:
+                raise DocumentFormatError(f"invalid UTF-8 string: {exc}") from None
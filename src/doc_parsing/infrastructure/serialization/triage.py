@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+from doc_parsing.domain import PageRanges, TriageMetadata
+
+
+def encode_triage_metadata(metadata: TriageMetadata) -> dict[str, Any]:
+    """JSON-ready ``TriageMetadata``, as the CLI prints it and the DLQ spools it."""
+    return {
+        "page_count": metadata.page_count,
+        "language": metadata.language,
+        "scanned": metadata.scanned,
+        "image_only_pages": metadata.image_only_pages,
+        "image_only_page_ratio": metadata.image_only_page_ratio,
+        "image_only_page_ranges": str(metadata.image_only_page_ranges),
+        "limited_page_ranges": str(metadata.limited_page_ranges),
+        "file_size": metadata.file_size,
+        "encrypted": metadata.encrypted,
+        "linearized": metadata.linearized,
+        "truncated": metadata.truncated,
+        "inspected": metadata.inspected,
+    }
+
+
+def decode_triage_metadata(payload: dict[str, Any]) -> TriageMetadata:
+    fields = dict(payload)
+    # Payloads written before page ranges, the preflight fields or decode
+    # limits were tracked do not carry them.
+    ranges = PageRanges.parse(fields.pop("image_only_page_ranges", ""))
+    limited = PageRanges.parse(fields.pop("limited_page_ranges", ""))
+    return TriageMetadata(
+        **fields, image_only_page_ranges=ranges, limited_page_ranges=limited
+    )
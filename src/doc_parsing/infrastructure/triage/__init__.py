@@ -1,12 +1,28 @@
 from .entrypoints import load_entrypoints as load_triage_entrypoints
+from .inspectors import InspectorConfig, create_inspector
+from .language import (
+    LangdetectLanguageDetector,
+    NgramLanguageDetector,
+    language_detector,
+)
+from .pdfium_inspector import PdfiumInspector, PdfiumInspectorConfig
+from .preflight import XrefPreflightReader
 from .pypdf_inspector import PypdfInspector, PypdfInspectorConfig
 from .registration import TriagePolicyRegistration
 from .registry import TriagePolicyRegistry
 
 __all__ = [
+    "create_inspector",
+    "InspectorConfig",
+    "LangdetectLanguageDetector",
+    "language_detector",
     "load_triage_entrypoints",
+    "NgramLanguageDetector",
+    "PdfiumInspector",
+    "PdfiumInspectorConfig",
     "PypdfInspector",
     "PypdfInspectorConfig",
     "TriagePolicyRegistration",
     "TriagePolicyRegistry",
+    "XrefPreflightReader",
 ]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from doc_parsing.domain import LanguageDetector, PageRanges, TriageMetadata
+
+from .language import LanguageDetectorKind
+
+
+class InspectorConfigBase(BaseModel):
+    """Settings shared by every inspector backend."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    scanned_page_ratio_threshold: float = 0.7
+    min_text_chars: int = 20
+    language_detector: LanguageDetectorKind = "ngram"
+    # The language sample is the first pages' text, cut at this many characters.
+    language_sample_chars: int = 2000
+    language_sample_pages: int | None = None
+    language_min_chars: int = 200
+
+    @model_validator(mode="after")
+    def _validate_values(self) -> InspectorConfigBase:
+        if not (0.0 <= self.scanned_page_ratio_threshold <= 1.0):
+            raise ValueError("scanned_page_ratio_threshold must be between 0.0 and 1.0")
+        if self.min_text_chars < 0:
+            raise ValueError("min_text_chars must be >= 0")
+        if self.language_sample_chars < 1:
+            raise ValueError("language_sample_chars must be >= 1")
+        if self.language_sample_pages is not None and self.language_sample_pages < 1:
+            raise ValueError("language_sample_pages must be >= 1")
+        if self.language_min_chars < 0:
+            raise ValueError("language_min_chars must be >= 0")
+        return self
+
+
+class PageScan:
+    """Collects per-page findings, in page order, into ``TriageMetadata``."""
+
+    def __init__(
+        self,
+        config: InspectorConfigBase,
+        detector: LanguageDetector,
+        page_count: int,
+    ) -> None:
+        self._config = config
+        self._detector = detector
+        self._page_count = page_count
+        self._sample_pages = config.language_sample_pages or page_count
+        self._image_only_pages: list[int] = []
+        self._limited_pages: list[int] = []
+        self._language_parts: list[str] = []
+        self._sample_chars = 0
+
+    def wanted_chars(self, number: int) -> int:
+        """How many characters of page ``number``'s text the scan can use."""
+        wanted = self._config.min_text_chars
+        if number <= self._sample_pages:
+            wanted = max(
+                wanted, self._config.language_sample_chars - self._sample_chars
+            )
+        return wanted
+
+    def add_page(
+        self, number: int, text: str, has_image: bool, *, limited: bool = False
+    ) -> None:
+        if limited:
+            self._limited_pages.append(number)
+        sample = text.strip()
+        if len(sample) < self._config.min_text_chars and has_image:
+            self._image_only_pages.append(number)
+        if (
+            not limited
+            and number <= self._sample_pages
+            and self._sample_chars < self._config.language_sample_chars
+        ):
+            self._language_parts.append(sample)
+            self._sample_chars += len(sample) + 1
+
+    def metadata(self) -> TriageMetadata:
+        page_count = self._page_count
+        ratio = len(self._image_only_pages) / page_count if page_count else 0.0
+        sample = " ".join(self._language_parts)[: self._config.language_sample_chars]
+        return TriageMetadata(
+            page_count=page_count,
+            language=_detect_language(
+                self._detector, sample, self._config.language_min_chars
+            ),
+            scanned=ratio >= self._config.scanned_page_ratio_threshold,
+            image_only_pages=len(self._image_only_pages),
+            image_only_page_ratio=ratio,
+            image_only_page_ranges=PageRanges.from_pages(self._image_only_pages),
+            limited_page_ranges=PageRanges.from_pages(self._limited_pages),
+        )
+
+
+def _detect_language(
+    detector: LanguageDetector, text: str, min_chars: int
+) -> str | None:
+    sample = text.strip()
+    if len(sample) < min_chars:
+        return None
+    return detector.detect(sample)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from pydantic import Discriminator, Tag
+
+from doc_parsing.domain import PdfInspector
+
+from .pdfium_inspector import PdfiumInspector, PdfiumInspectorConfig
+from .pypdf_inspector import PypdfInspector, PypdfInspectorConfig
+
+
+def _inspector_kind(value: Any) -> str:
+    # Configs written before inspection.kind had a choice leave it out.
+    if isinstance(value, dict):
+        return value.get("kind", "pypdf")
+    return getattr(value, "kind", "pypdf")
+
+
+InspectorConfig = Annotated[
+    Annotated[PypdfInspectorConfig, Tag("pypdf")]
+    | Annotated[PdfiumInspectorConfig, Tag("pdfium")],
+    Discriminator(_inspector_kind),
+]
+
+
+def create_inspector(
+    config: PypdfInspectorConfig | PdfiumInspectorConfig,
+) -> PdfInspector:
+    """The inspector selected by ``inspection.kind``."""
+    if isinstance(config, PdfiumInspectorConfig):
+        return PdfiumInspector(config)
+    return PypdfInspector(config)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import re
+import unicodedata
+from collections import Counter
+from functools import cache
+from pathlib import Path
+from typing import Any, Literal
+
+from doc_parsing.domain import LanguageDetector
+
+LanguageDetectorKind = Literal["langdetect", "ngram"]
+
+_PROFILES = Path(__file__).with_name("language_profiles.json")
+_NON_LETTERS = re.compile(r"[\W\d_]+")
+
+
+class LangdetectLanguageDetector(LanguageDetector):
+    """langdetect's probabilistic detector, with its profiles loaded up front."""
+
+    kind: LanguageDetectorKind = "langdetect"
+
+    def __init__(self) -> None:
+        from langdetect import DetectorFactory, detector_factory
+
+        DetectorFactory.seed = 0
+        # detect() would otherwise read all profiles on its first call.
+        detector_factory.init_factory()
+
+    def detect(self, text: str) -> str | None:
+        from langdetect import LangDetectException, detect
+
+        try:
+            return detect(text)
+        except LangDetectException:
+            return None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (language_detector, (self.kind,))
+
+
+class NgramLanguageDetector(LanguageDetector):
+    """Naive Bayes over character 1- to 3-grams.
+
+    Profiles are the most frequent n-grams of langdetect's profiles (see
+    ``scripts/build_language_profiles.py``), normalised the same way. Every
+    n-gram of the sample is looked up once, against all languages together.
+    """
+
+    kind: LanguageDetectorKind = "ngram"
+
+    def __init__(self, profiles: Path = _PROFILES) -> None:
+        payload = json.loads(profiles.read_text(encoding="utf-8"))
+        self._languages: list[str] = sorted(payload["languages"])
+        self._floors = [
+            payload["languages"][language]["floors"] for language in self._languages
+        ]
+        # n-gram -> (language index, log-probability above that language's floor)
+        index: dict[str, list[tuple[int, float]]] = {}
+        for position, language in enumerate(self._languages):
+            floors = self._floors[position]
+            for gram, logp in payload["languages"][language]["ngrams"].items():
+                index.setdefault(gram, []).append(
+                    (position, logp - floors[len(gram) - 1])
+                )
+        self._index = {gram: tuple(entries) for gram, entries in index.items()}
+        self._table = _normalisation_table(payload["cjk_classes"])
+
+    def detect(self, text: str) -> str | None:
+        counts = _ngrams(self._normalise(text))
+        if not counts:
+            return None
+        totals = [0, 0, 0]
+        for gram, count in counts.items():
+            totals[len(gram) - 1] += count
+        scores = [
+            sum(floor * total for floor, total in zip(floors, totals, strict=True))
+            for floors in self._floors
+        ]
+        for gram, count in counts.items():
+            for position, delta in self._index.get(gram, ()):
+                scores[position] += count * delta
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return self._languages[best]
+
+    def _normalise(self, text: str) -> str:
+        text = unicodedata.normalize("NFC", text).lower().translate(self._table)
+        return _NON_LETTERS.sub(" ", text)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (language_detector, (self.kind,))
+
+
+@cache
+def language_detector(kind: LanguageDetectorKind) -> LanguageDetector:
+    """The process-wide detector of ``kind``, loaded on first use."""
+    if kind == "langdetect":
+        return LangdetectLanguageDetector()
+    if kind == "ngram":
+        return NgramLanguageDetector()
+    raise ValueError(f"unknown language detector: {kind}")
+
+
+def _normalisation_table(cjk_classes: list[str]) -> dict[int, str]:
+    # Mirrors langdetect's NGram.normalize for the blocks its profiles fold.
+    table: dict[int, str] = {}
+    for start, end, replacement in (
+        (0x3040, 0x309F, "あ"),  # Hiragana
+        (0x30A0, 0x30FF, "ア"),  # Katakana
+        (0x3100, 0x312F, "ㄅ"),  # Bopomofo
+        (0x31A0, 0x31BF, "ㄅ"),  # Bopomofo extended
+        (0xAC00, 0xD7AF, "가"),  # Hangul syllables
+        (0x1EA0, 0x1EFF, "ể"),  # Vietnamese letters with diacritics
+        (0x2000, 0x206F, " "),  # General punctuation
+    ):
+        table.update(dict.fromkeys(range(start, end + 1), replacement))
+    for members in cjk_classes:
+        table.update(dict.fromkeys(map(ord, members), members[0]))
+    table.update({0x06CC: "ي", 0x0219: "ş", 0x021B: "ţ"})
+    table.update(dict.fromkeys(map(ord, "\xa0«°»"), " "))
+    return table
+
+
+def _ngrams(text: str) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    for word in text.split():
+        padded = f" {word} "
+        counts.update(word)
+        counts.update(padded[i : i + 2] for i in range(len(padded) - 1))
+        counts.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return counts
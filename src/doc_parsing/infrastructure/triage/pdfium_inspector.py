@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import functools
+import threading
+from typing import Any, Literal
+
+import pypdfium2
+from pydantic import Field
+
+from doc_parsing.domain import PdfInput, PdfInspector, TriageMetadata
+
+from .inspection import InspectorConfigBase, PageScan
+from .language import language_detector
+
+_IMAGE_OBJECTS = (pypdfium2.raw.FPDF_PAGEOBJ_IMAGE,)
+_LOCK = threading.Lock()
+
+
+class PdfiumInspectorConfig(InspectorConfigBase):
+    kind: Literal["pdfium"] = Field(default="pdfium")
+
+
+class PdfiumInspector(PdfInspector):
+    """Inspection through pdfium's text pages and page-object enumeration.
+
+    Unlike the pypdf inspector, a page counts as having an image only when its
+    content (or a form it draws) places one, not when its resources merely
+    list one.
+    """
+
+    def __init__(self, config: PdfiumInspectorConfig) -> None:
+        self._config = config
+        self._detector = language_detector(config.language_detector)
+
+    def inspect(self, source: PdfInput) -> TriageMetadata:
+        # pdfium is not thread-safe, so every call into it holds the lock, but
+        # only for one page at a time: other documents (and Docling parses)
+        # interleave, and language detection runs outside it.
+        lock = _pdfium_lock()
+        with source.open_stream(stage="inspect") as stream:
+            with lock:
+                document = pypdfium2.PdfDocument(stream)
+                page_count = len(document)
+            try:
+                scan = PageScan(self._config, self._detector, page_count)
+                for index in range(page_count):
+                    with lock:
+                        page = document[index]
+                        try:
+                            text, has_image = _read_page(page)
+                        finally:
+                            page.close()
+                    scan.add_page(index + 1, text, has_image)
+            finally:
+                with lock:
+                    document.close()
+        return scan.metadata()
+
+
+def _read_page(page: Any) -> tuple[str, bool]:
+    try:
+        textpage = page.get_textpage()
+        try:
+            text = textpage.get_text_range()
+        finally:
+            textpage.close()
+    except pypdfium2.PdfiumError:
+        text = ""
+    has_image = next(page.get_objects(filter=_IMAGE_OBJECTS), None) is not None
+    return text, has_image
+
+
+@functools.cache
+def _pdfium_lock() -> Any:
+    # Docling calls pdfium under its own lock, so that one is shared when
+    # Docling is installed. Imported here: docling.utils costs tens of
+    # milliseconds to import.
+    try:
+        from docling.utils.locks import pypdfium2_lock
+    except ImportError:
+        return _LOCK
+    return pypdfium2_lock
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import re
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from doc_parsing.domain import PdfInput, PdfPreflight, PdfPreflightReader
+
+# The header and the linearization dictionary sit in the first kilobyte, and
+# %%EOF in the last one; everything else is read in small pieces at offsets
+# the xref gives.
+_HEAD_BYTES = 1024
+_TAIL_BYTES = 1024
+_CHUNK_BYTES = 1024
+_ENTRY_BYTES = 20
+# Xref and object streams larger than this are not decoded; the page count is
+# then left unknown rather than read at a cost proportional to the file.
+_MAX_STREAM_BYTES = 1 << 20
+_MAX_SECTIONS = 8
+_MAX_SUBSECTIONS = 64
+
+_REF = rb"\s+(\d+)\s+(\d+)\s+R"
+_OBJECT = rb"\s*(\d+)\s+\d+\s+obj"
+_FIRST_OBJECT = re.compile(rb"%PDF-[^\r\n]*[\r\n]+(?:%[^\r\n]*[\r\n]+)*" + _OBJECT)
+_LINEARIZED = re.compile(rb"/Linearized\s")
+_FILE_LENGTH = re.compile(rb"/L\s+(\d+)")
+_DECLARED_PAGES = re.compile(rb"/N\s+(\d+)")
+_STARTXREF = re.compile(rb"startxref\s+(\d+)\s+%%EOF")
+_SUBSECTION = re.compile(rb"\s*(\d+)\s+(\d+)[ \t]*\r?\n?")
+_ENTRY = re.compile(rb"(\d{10}) (\d{5}) ([nf])")
+_ROOT = re.compile(rb"/Root" + _REF)
+_PAGES = re.compile(rb"/Pages" + _REF)
+_COUNT = re.compile(rb"/Count\s+(\d+)")
+_PREV = re.compile(rb"/Prev\s+(\d+)")
+_LENGTH = re.compile(rb"/Length\s+(\d+)(?:\s+(\d+)\s+R)?")
+_WIDTHS = re.compile(rb"/W\s*\[\s*(\d+)\s+(\d+)\s+(\d+)\s*\]")
+_INDEX = re.compile(rb"/Index\s*\[([\d\s]*)\]")
+_SIZE = re.compile(rb"/Size\s+(\d+)")
+_FIRST = re.compile(rb"/First\s+(\d+)")
+_COLUMNS = re.compile(rb"/Columns\s+(\d+)")
+_PREDICTOR = re.compile(rb"/Predictor\s+(\d+)")
+
+
+@dataclass(slots=True)
+class _Section:
+    trailer: bytes
+    # Classic tables: (first object, count, offset of the first entry).
+    subsections: list[tuple[int, int, int]] = field(default_factory=list)
+    # Xref streams: object -> (type, offset or object stream, index).
+    entries: dict[int, tuple[int, int, int]] | None = None
+
+
+class XrefPreflightReader(PdfPreflightReader):
+    """Reads what the header, trailer and xref say, in a few small reads.
+
+    Page content is never touched. The page count is the linearization
+    dictionary's ``/N`` or the page tree's ``/Count``, reached through
+    ``/Root`` and ``/Pages``.
+    """
+
+    def read(self, source: PdfInput) -> PdfPreflight:
+        size = source.size
+        head = source.read_range(0, min(size, _HEAD_BYTES), stage="preflight")
+        if not head.startswith(b"%PDF"):
+            raise ValueError("file_path does not appear to be a PDF")
+        tail_start = max(size - _TAIL_BYTES, 0)
+        tail = source.read_range(tail_start, size - tail_start, stage="preflight")
+
+        linearized, page_count = _linearization(head, size)
+        # Incremental updates append sections; the last startxref is current.
+        startxref = next(reversed(list(_STARTXREF.finditer(tail))), None)
+        if startxref is None or int(startxref.group(1)) >= size:
+            return PdfPreflight(
+                file_size=size,
+                encrypted=b"/Encrypt" in tail,
+                linearized=linearized,
+                truncated=True,
+                page_count=page_count,
+            )
+        section = _section(source, int(startxref.group(1)))
+        if section is None:
+            # pypdf recovers from offsets that are slightly off, or rebuilds
+            # the xref, so the file is not truncated; only the page count is
+            # unknown here.
+            return PdfPreflight(
+                file_size=size,
+                encrypted=b"/Encrypt" in tail,
+                linearized=linearized,
+                page_count=page_count,
+            )
+        if page_count is None:
+            page_count = _page_count(source, section)
+        return PdfPreflight(
+            file_size=size,
+            encrypted=b"/Encrypt" in section.trailer,
+            linearized=linearized,
+            page_count=page_count,
+        )
+
+
+def _linearization(head: bytes, size: int) -> tuple[bool, int | None]:
+    first = _FIRST_OBJECT.match(head)
+    if first is None:
+        return False, None
+    body = head[first.end() : head.find(b">>", first.end())]
+    if not _LINEARIZED.search(body):
+        return False, None
+    length = _FILE_LENGTH.search(body)
+    # An incremental update after linearization invalidates the hints.
+    if length is None or int(length.group(1)) != size:
+        return False, None
+    pages = _DECLARED_PAGES.search(body)
+    return True, int(pages.group(1)) if pages else None
+
+
+def _section(source: PdfInput, offset: int) -> _Section | None:
+    chunk = source.read_range(offset, _CHUNK_BYTES, stage="preflight")
+    if not chunk.startswith(b"xref"):
+        return _stream_section(source, offset, chunk)
+    subsections: list[tuple[int, int, int]] = []
+    position = offset + 4
+    for _ in range(_MAX_SUBSECTIONS):
+        chunk = source.read_range(position, _CHUNK_BYTES, stage="preflight")
+        header = _SUBSECTION.match(chunk)
+        if header is None:
+            trailer = chunk.lstrip()
+            if not trailer.startswith(b"trailer"):
+                return None
+            return _Section(trailer.partition(b"startxref")[0], subsections)
+        first, count = int(header.group(1)), int(header.group(2))
+        entries = position + header.end()
+        subsections.append((first, count, entries))
+        position = entries + count * _ENTRY_BYTES
+    return None
+
+
+def _stream_section(source: PdfInput, offset: int, chunk: bytes) -> _Section | None:
+    # An xref stream: its dictionary doubles as the trailer, and its length
+    # is always direct.
+    stream = _stream(source, offset, chunk, lambda number: None)
+    if stream is None or b"/XRef" not in stream[0]:
+        return None
+    dictionary, data = stream
+    widths = _WIDTHS.search(dictionary)
+    if data is None or widths is None:
+        return _Section(dictionary)
+    w1, w2, w3 = (int(width) for width in widths.groups())
+    index = _INDEX.search(dictionary)
+    size = _SIZE.search(dictionary)
+    bounds = [int(value) for value in index.group(1).split()] if index else []
+    if not bounds and size:
+        bounds = [0, int(size.group(1))]
+    entries: dict[int, tuple[int, int, int]] = {}
+    row = w1 + w2 + w3
+    position = 0
+    for first, count in zip(bounds[::2], bounds[1::2], strict=False):
+        for number in range(first, first + count):
+            record = data[position : position + row]
+            if len(record) < row:
+                return _Section(dictionary, entries=entries)
+            kind = int.from_bytes(record[:w1]) if w1 else 1
+            entries[number] = (
+                kind,
+                int.from_bytes(record[w1 : w1 + w2]),
+                int.from_bytes(record[w1 + w2 :]),
+            )
+            position += row
+    return _Section(dictionary, entries=entries)
+
+
+def _page_count(source: PdfInput, section: _Section) -> int | None:
+    root = _ROOT.search(section.trailer)
+    catalog = _object(source, section, int(root.group(1))) if root else None
+    pages = _PAGES.search(catalog) if catalog else None
+    tree = _object(source, section, int(pages.group(1))) if pages else None
+    count = _COUNT.search(tree) if tree else None
+    return int(count.group(1)) if count else None
+
+
+def _object(
+    source: PdfInput, section: _Section, number: int, depth: int = 0
+) -> bytes | None:
+    entry = _locate(source, section, number)
+    if entry is None:
+        return None
+    kind, offset, index = entry
+    if kind == 1:
+        return _object_at(source, offset, number)
+    # Object streams cannot nest, so a /Length inside one is never compressed.
+    if kind == 2 and depth == 0:
+        return _compressed_object(source, section, offset, index)
+    return None
+
+
+def _locate(
+    source: PdfInput, section: _Section, number: int
+) -> tuple[int, int, int] | None:
+    current: _Section | None = section
+    for _ in range(_MAX_SECTIONS):
+        if current is None:
+            return None
+        entry = _entry(source, current, number)
+        if entry is not None:
+            return entry
+        # Incremental updates list only the objects they change; the rest are
+        # in the sections /Prev chains back to.
+        prev = _PREV.search(current.trailer)
+        current = _section(source, int(prev.group(1))) if prev else None
+    return None
+
+
+def _entry(
+    source: PdfInput, section: _Section, number: int
+) -> tuple[int, int, int] | None:
+    if section.entries is not None:
+        return section.entries.get(number)
+    for first, count, entries in section.subsections:
+        if first <= number < first + count:
+            entry = _ENTRY.match(
+                source.read_range(
+                    entries + (number - first) * _ENTRY_BYTES,
+                    _ENTRY_BYTES,
+                    stage="preflight",
+                )
+            )
+            if entry is None or entry.group(3) != b"n":
+                return (0, 0, 0)
+            return (1, int(entry.group(1)), 0)
+    return None
+
+
+def _object_at(source: PdfInput, offset: int, number: int) -> bytes | None:
+    chunk = source.read_range(offset, _CHUNK_BYTES, stage="preflight")
+    header = re.match(_OBJECT, chunk)
+    if header is None or int(header.group(1)) != number:
+        return None
+    return chunk[header.end() :].partition(b"endobj")[0]
+
+
+def _compressed_object(
+    source: PdfInput, section: _Section, container: int, index: int
+) -> bytes | None:
+    entry = _locate(source, section, container)
+    if entry is None or entry[0] != 1:
+        return None
+    chunk = source.read_range(entry[1], _CHUNK_BYTES, stage="preflight")
+
+    def resolve(number: int) -> bytes | None:
+        return _object(source, section, number, depth=1)
+
+    stream = _stream(source, entry[1], chunk, resolve)
+    if stream is None or stream[1] is None:
+        return None
+    dictionary, data = stream
+    first = _FIRST.search(dictionary)
+    if first is None:
+        return None
+    start = int(first.group(1))
+    # The header lists (object number, offset from /First) pairs.
+    offsets = [int(value) for value in data[:start].split()[1::2]]
+    if index >= len(offsets):
+        return None
+    end = offsets[index + 1] if index + 1 < len(offsets) else len(data) - start
+    return data[start + offsets[index] : start + end]
+
+
+def _stream(
+    source: PdfInput,
+    offset: int,
+    chunk: bytes,
+    resolve: Callable[[int], bytes | None],
+) -> tuple[bytes, bytes | None] | None:
+    header = re.match(_OBJECT, chunk)
+    keyword = chunk.find(b"stream", header.end()) if header else -1
+    if header is None or keyword < 0:
+        return None
+    dictionary = chunk[header.end() : keyword]
+    length = _LENGTH.search(dictionary)
+    if length is None:
+        return dictionary, None
+    size = int(length.group(1))
+    if length.group(2) is not None:
+        target = resolve(size)
+        size = int(target.strip() or b"-1") if target is not None else -1
+    if not 0 <= size <= _MAX_STREAM_BYTES:
+        return dictionary, None
+    start = keyword + len(b"stream")
+    start += 2 if chunk[start : start + 2] == b"\r\n" else 1
+    raw = source.read_range(offset + start, size, stage="preflight")
+    return dictionary, _decode(dictionary, raw)
+
+
+def _decode(dictionary: bytes, raw: bytes) -> bytes | None:
+    if b"/Filter" in dictionary:
+        if not re.search(rb"/Filter\s*\[?\s*/FlateDecode\s*\]?", dictionary):
+            return None
+        try:
+            decompressor = zlib.decompressobj()
+            data = decompressor.decompress(raw, _MAX_STREAM_BYTES)
+        except zlib.error:
+            return None
+    else:
+        data = raw
+    predictor = _PREDICTOR.search(dictionary)
+    if predictor is None or int(predictor.group(1)) < 10:
+        return data
+    columns = _COLUMNS.search(dictionary)
+    return _unpredict(data, int(columns.group(1)) if columns else 1)
+
+
+def _unpredict(data: bytes, columns: int) -> bytes | None:
+    # PNG predictors, one byte per sample, as xref streams use them.
+    rows = bytearray()
+    previous = bytearray(columns)
+    for start in range(0, len(data) - columns, columns + 1):
+        kind = data[start]
+        row = bytearray(data[start + 1 : start + 1 + columns])
+        if kind == 1:
+            for i in range(1, columns):
+                row[i] = (row[i] + row[i - 1]) & 0xFF
+        elif kind == 2:
+            for i in range(columns):
+                row[i] = (row[i] + previous[i]) & 0xFF
+        elif kind != 0:
+            return None
+        rows += row
+        previous = row
+    return bytes(rows)
@@ -1,89 +1,237 @@
 from __future__ import annotations
 
-from pathlib import Path
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
-from langdetect import DetectorFactory, LangDetectException, detect
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import Field, model_validator
 from pypdf import PdfReader
+from pypdf.errors import LimitReachedError
+from pypdf.filters import ASCII85Decode, ASCIIHexDecode, decode_stream_data
+from pypdf.generic import DecodedStreamObject, EncodedStreamObject
 
-from doc_parsing.domain import PdfInspector, TriageMetadata
+from doc_parsing.application.logging import get_logger
+from doc_parsing.domain import PdfInput, PdfInspector, TriageMetadata
 
-DetectorFactory.seed = 0
+from .inspection import InspectorConfigBase, PageScan
+from .language import language_detector
 
+_BYTES_PER_MB = 1024 * 1024
+# Flate streams are inflated this much at a time, so a bomb stops at the
+# limit.
+_INFLATE_CHUNK = 64 * 1024
+_FLATE = frozenset({"/FlateDecode", "/Fl"})
+_ASCII_FILTERS: dict[str, Callable[[bytes], bytes]] = {
+    "/ASCIIHexDecode": ASCIIHexDecode.decode,
+    "/AHx": ASCIIHexDecode.decode,
+    "/ASCII85Decode": ASCII85Decode.decode,
+    "/A85": ASCII85Decode.decode,
+}
 
-class PypdfInspectorConfig(BaseModel):
-    model_config = ConfigDict(extra="forbid")
 
+class PypdfInspectorConfig(InspectorConfigBase):
     kind: Literal["pypdf"] = Field(default="pypdf")
-    scanned_page_ratio_threshold: float = 0.7
-    min_text_chars: int = 20
-    language_sample_pages: int = 5
-    language_min_chars: int = 200
+    # Decoded content allowed per stream and per document. Pages over either
+    # are not read and are listed in limited_page_ranges.
+    max_stream_mb: float = 32.0
+    max_document_mb: float = 256.0
 
     @model_validator(mode="after")
-    def _validate_values(self) -> PypdfInspectorConfig:
-        if not (0.0 <= self.scanned_page_ratio_threshold <= 1.0):
-            raise ValueError("scanned_page_ratio_threshold must be between 0.0 and 1.0")
-        if self.min_text_chars < 0:
-            raise ValueError("min_text_chars must be >= 0")
-        if self.language_sample_pages < 1:
-            raise ValueError("language_sample_pages must be >= 1")
-        if self.language_min_chars < 0:
-            raise ValueError("language_min_chars must be >= 0")
+    def _validate_budgets(self) -> PypdfInspectorConfig:
+        if self.max_stream_mb <= 0.0:
+            raise ValueError("max_stream_mb must be > 0.0")
+        if self.max_document_mb <= 0.0:
+            raise ValueError("max_document_mb must be > 0.0")
         return self
 
 
 class PypdfInspector(PdfInspector):
     def __init__(self, config: PypdfInspectorConfig) -> None:
         self._config = config
+        # Loads the detector's profiles now rather than on the first document.
+        self._detector = language_detector(config.language_detector)
 
-    def inspect(self, file_path: Path) -> TriageMetadata:
-        reader = PdfReader(str(file_path))
-        page_count = len(reader.pages)
-        image_only_pages = 0
-        language_parts: list[str] = []
-
-        for index, page in enumerate(reader.pages):
-            try:
-                text = page.extract_text() or ""
-            except Exception:
-                text = ""
-            has_text = len(text.strip()) >= self._config.min_text_chars
-            try:
-                has_image = _page_has_image(page)
-            except Exception:
+    def inspect(self, source: PdfInput) -> TriageMetadata:
+        with source.open_stream(stage="inspect") as stream:
+            reader = PdfReader(stream)
+            scan = PageScan(self._config, self._detector, len(reader.pages))
+            budget = _DecodeBudget(
+                stream_bytes=int(self._config.max_stream_mb * _BYTES_PER_MB),
+                document_bytes=int(self._config.max_document_mb * _BYTES_PER_MB),
+            )
+            for number, page in enumerate(reader.pages, start=1):
+                streams = _budgeted_streams(page, budget)
+                limited = False
+                try:
+                    text = _page_text(page, scan.wanted_chars(number))
+                except LimitReachedError:
+                    limited = True
+                    text = ""
+                except Exception:
+                    text = ""
                 has_image = False
+                # Image-only is only asked of pages without enough text.
+                if len(text.strip()) < self._config.min_text_chars:
+                    try:
+                        has_image = _page_has_image(page)
+                    except Exception:
+                        has_image = False
+                scan.add_page(number, text, has_image, limited=limited)
+                # Shared forms are decoded again, uncharged, on the next page
+                # that draws them.
+                for budgeted in streams:
+                    budgeted.release()
+        metadata = scan.metadata()
+        if metadata.limited_page_ranges.ranges:
+            get_logger(__name__, inspector="pypdf").warning(
+                "triage.inspect.limited",
+                extra={
+                    "path": source.uri,
+                    "pages": str(metadata.limited_page_ranges),
+                },
+            )
+        return metadata
 
-            if not has_text and has_image:
-                image_only_pages += 1
 
-            if index < self._config.language_sample_pages:
-                language_parts.append(text)
+@dataclass(slots=True)
+class _DecodeBudget:
+    stream_bytes: int
+    document_bytes: int
+    # Streams already counted against document_bytes.
+    charged: set[int] = field(default_factory=set)
 
-        ratio = image_only_pages / page_count if page_count else 0.0
-        scanned = ratio >= self._config.scanned_page_ratio_threshold
-        language = _detect_language(
-            " ".join(language_parts), self._config.language_min_chars
-        )
+    def decode(self, stream: EncodedStreamObject) -> bytes:
+        charged = id(stream) in self.charged
+        limit = self.stream_bytes
+        if not charged:
+            limit = min(limit, self.document_bytes)
+        data = _decoded(stream, limit)
+        if data is None:
+            raise LimitReachedError(f"decoded stream is over {limit} bytes")
+        if not charged:
+            self.charged.add(id(stream))
+            self.document_bytes -= len(data)
+        return data
 
-        return TriageMetadata(
-            page_count=page_count,
-            language=language,
-            scanned=scanned,
-            image_only_pages=image_only_pages,
-            image_only_page_ratio=ratio,
-        )
 
+class _BudgetedData(DecodedStreamObject):
+    """Stands in for pypdf's decoded-stream cache, decoding on first use.
 
-def _detect_language(text: str, min_chars: int) -> str | None:
-    sample = text.strip()
-    if len(sample) < min_chars:
-        return None
+    pypdf reads a stream's data only when its text pass reaches it, so
+    forms that are never drawn, or drawn after the page has enough text,
+    are never decoded.
+    """
+
+    def __init__(self, stream: EncodedStreamObject, budget: _DecodeBudget) -> None:
+        super().__init__()
+        self._stream = stream
+        self._budget = budget
+        self._decoded: bytes | None = None
+
+    def get_data(self) -> bytes:
+        if self._decoded is None:
+            self._decoded = self._budget.decode(self._stream)
+        return self._decoded
+
+    def release(self) -> None:
+        self._decoded = None
+
+
+class _EnoughText(Exception):
+    pass
+
+
+def _page_text(page: Any, wanted: int) -> str:
+    if wanted <= 0:
+        return ""
+    pieces: list[str] = []
+    found = 0
+
+    def visit(text: str, *_: Any) -> None:
+        nonlocal found
+        pieces.append(text)
+        found += len("".join(text.split()))
+        if found >= wanted:
+            raise _EnoughText
+
+    try:
+        page.extract_text(visitor_text=visit)
+    except _EnoughText:
+        pass
+    return "".join(pieces)
+
+
+def _budgeted_streams(page: Any, budget: _DecodeBudget) -> list[_BudgetedData]:
+    """Route the decoding of the page's content and forms through ``budget``."""
+    streams: list[Any] = []
+    contents = _deref(_get_attr(page, "/Contents"))
+    if isinstance(contents, list):
+        streams.extend(_deref(item) for item in contents)
+    elif contents is not None:
+        streams.append(contents)
+    seen: set[int] = set()
+    pending = [_get_attr(page, "/Resources")]
+    while pending:
+        xobject = _deref(_get_attr(_deref(pending.pop()), "/XObject"))
+        for obj in getattr(xobject, "values", lambda: [])():
+            candidate = _deref(obj)
+            if id(candidate) in seen or _get_attr(candidate, "/Subtype") != "/Form":
+                continue
+            seen.add(id(candidate))
+            streams.append(candidate)
+            pending.append(_get_attr(candidate, "/Resources"))
+    budgeted: list[_BudgetedData] = []
+    for stream in streams:
+        # Unfiltered streams are already in memory as read from the file.
+        if not isinstance(stream, EncodedStreamObject):
+            continue
+        if not isinstance(stream.decoded_self, _BudgetedData):
+            stream.decoded_self = _BudgetedData(stream, budget)
+        budgeted.append(stream.decoded_self)
+    return budgeted
+
+
+def _decoded(stream: EncodedStreamObject, limit: int) -> bytes | None:
+    """The stream's decoded data, or ``None`` once it passes ``limit``."""
+    filters = _deref(_get_attr(stream, "/Filter"))
+    if isinstance(filters, list):
+        names = [str(_deref(name)) for name in filters]
+    else:
+        names = [str(filters)] if filters is not None else []
+    if (
+        names
+        and names[-1] in _FLATE
+        and all(name in _ASCII_FILTERS for name in names[:-1])
+        and _get_attr(stream, "/DecodeParms") is None
+    ):
+        data = stream._data
+        for name in names[:-1]:
+            data = _ASCII_FILTERS[name](data)
+        return _inflated(data, limit)
+    # pypdf bounds its own decoders for the other filters.
+    data = decode_stream_data(stream)
+    return data if len(data) <= limit else None
+
+
+def _inflated(data: bytes, limit: int) -> bytes | None:
+    decompressor = zlib.decompressobj()
+    chunks: list[bytes] = []
+    size = 0
     try:
-        return detect(sample)
-    except LangDetectException:
-        return None
+        while data and not decompressor.eof:
+            chunk = decompressor.decompress(data, _INFLATE_CHUNK)
+            size += len(chunk)
+            if size > limit:
+                return None
+            chunks.append(chunk)
+            data = decompressor.unconsumed_tail
+        chunks.append(decompressor.flush())
+    except zlib.error:
+        # Keep what inflated before the corruption, as pypdf would.
+        pass
+    inflated = b"".join(chunks)
+    return inflated if len(inflated) <= limit else None
 
 
 def _page_has_image(page: Any) -> bool:
@@ -4,10 +4,19 @@ from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from doc_parsing.domain import TriageDecision, TriageMetadata, TriagePolicy, TriageRoute
+from doc_parsing.domain import (
+    PdfPreflight,
+    PreflightTriagePolicy,
+    TriageDecision,
+    TriageMetadata,
+    TriagePolicy,
+    TriageRoute,
+)
 
 from .registration import TriagePolicyRegistration
 
+_BYTES_PER_MB = 1024 * 1024
+
 
 class RuleWhen(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -16,6 +25,13 @@ class RuleWhen(BaseModel):
     max_pages: int | None = None
     languages: list[str] | None = None
     scanned: bool | None = None
+    min_file_mb: float | None = None
+    max_file_mb: float | None = None
+    encrypted: bool | None = None
+    linearized: bool | None = None
+    truncated: bool | None = None
+    # Whether the inspector skipped any page over its decode budget.
+    limited: bool | None = None
 
     @model_validator(mode="after")
     def _validate_bounds(self) -> RuleWhen:
@@ -29,6 +45,16 @@ class RuleWhen(BaseModel):
             and self.min_pages > self.max_pages
         ):
             raise ValueError("min_pages cannot be greater than max_pages")
+        if self.min_file_mb is not None and self.min_file_mb < 0:
+            raise ValueError("min_file_mb must be >= 0")
+        if self.max_file_mb is not None and self.max_file_mb < 0:
+            raise ValueError("max_file_mb must be >= 0")
+        if (
+            self.min_file_mb is not None
+            and self.max_file_mb is not None
+            and self.min_file_mb > self.max_file_mb
+        ):
+            raise ValueError("min_file_mb cannot be greater than max_file_mb")
         if self.languages is not None and not self.languages:
             raise ValueError("languages cannot be empty")
         if self.languages is not None:
@@ -85,10 +111,32 @@ class RulesPolicyConfig(BaseModel):
         return self
 
 
-class RulesPolicy(TriagePolicy):
+class RulesPolicy(PreflightTriagePolicy):
     def __init__(self, config: RulesPolicyConfig) -> None:
         self._config = config
 
+    def decide_preflight(self, preflight: PdfPreflight) -> TriageDecision | None:
+        # Rules are tried in order, so the first one that needs the
+        # inspection to settle ends the preflight.
+        for rule in self._config.rules:
+            matched = _matches_preflight(rule.when, preflight)
+            if matched is None:
+                return None
+            if matched:
+                return _decision_from_action(
+                    rule.action,
+                    policy=self._config.name,
+                    rule=rule.name,
+                )
+
+        if self._config.default is not None:
+            return _decision_from_action(
+                self._config.default,
+                policy=self._config.name,
+                rule=None,
+            )
+        return None
+
     def decide(self, metadata: TriageMetadata) -> TriageDecision | None:
         for rule in self._config.rules:
             if _matches(rule.when, metadata):
@@ -108,12 +156,17 @@ class RulesPolicy(TriagePolicy):
 
 
 def _matches(when: RuleWhen, metadata: TriageMetadata) -> bool:
-    if when.min_pages is not None and metadata.page_count < when.min_pages:
+    if not _file_matches(when, metadata):
         return False
-    if when.max_pages is not None and metadata.page_count > when.max_pages:
+    if not _pages_match(when, metadata.page_count):
         return False
     if when.scanned is not None and metadata.scanned is not when.scanned:
         return False
+    if (
+        when.limited is not None
+        and bool(metadata.limited_page_ranges.ranges) is not when.limited
+    ):
+        return False
     if when.languages is not None:
         if metadata.language is None:
             return False
@@ -123,6 +176,45 @@ def _matches(when: RuleWhen, metadata: TriageMetadata) -> bool:
     return True
 
 
+def _matches_preflight(when: RuleWhen, preflight: PdfPreflight) -> bool | None:
+    """Whether ``when`` matches, or ``None`` if only the inspection can tell."""
+    if not _file_matches(when, preflight):
+        return False
+    if when.min_pages is not None or when.max_pages is not None:
+        if preflight.page_count is None:
+            return None
+        if not _pages_match(when, preflight.page_count):
+            return False
+    if (
+        when.scanned is not None
+        or when.languages is not None
+        or when.limited is not None
+    ):
+        return None
+    return True
+
+
+def _file_matches(when: RuleWhen, facts: TriageMetadata | PdfPreflight) -> bool:
+    size_mb = facts.file_size / _BYTES_PER_MB
+    if when.min_file_mb is not None and size_mb < when.min_file_mb:
+        return False
+    if when.max_file_mb is not None and size_mb > when.max_file_mb:
+        return False
+    for name in ("encrypted", "linearized", "truncated"):
+        expected = getattr(when, name)
+        if expected is not None and getattr(facts, name) is not expected:
+            return False
+    return True
+
+
+def _pages_match(when: RuleWhen, page_count: int) -> bool:
+    if when.min_pages is not None and page_count < when.min_pages:
+        return False
+    if when.max_pages is not None and page_count > when.max_pages:
+        return False
+    return True
+
+
 def _decision_from_action(
     action: RuleAction, *, policy: str, rule: str | None
 ) -> TriageDecision:
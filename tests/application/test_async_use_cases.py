@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+from doc_parsing.application import (
+    AsyncExecutionConfig,
+    AsyncExecutor,
+    ParsePdfToMarkdown,
+    ParsePdfToMarkdownInput,
+    TriagePdf,
+    TriagePdfInput,
+)
+from doc_parsing.domain import (
+    DocumentId,
+    ParseOptions,
+    ParseStatus,
+    ParsingTask,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    TaskId,
+    TriageDecision,
+    TriageMetadata,
+    TriageRoute,
+)
+
+
+class CountingParser:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return f"# {source.name}"
+
+
+class BlockingAsyncParser:
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        raise AssertionError("async parsers should not be called synchronously")
+
+    async def parse_async(self, source: PdfInput, options: ParseOptions) -> str:
+        self.started.set()
+        await asyncio.Event().wait()
+        return ""
+
+
+class GatedParser:
+    """Blocks in ``parse`` until released, then reads its source."""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.read: bytes | None = None
+
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        self.started.set()
+        self.release.wait(5)
+        with source.open_stream(stage="parse") as stream:
+            self.read = stream.read(5)
+        return ""
+
+
+class StaticFactory:
+    def __init__(self, parser: PdfParser) -> None:
+        self._parser = parser
+
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        return self._parser
+
+
+class RecordingStore:
+    def __init__(self) -> None:
+        self.statuses_seen: list[ParseStatus] = []
+
+    def record(self, task: ParsingTask) -> None:
+        self.statuses_seen.append(task.status)
+
+    def statuses(self) -> Mapping[TaskId, ParseStatus]:
+        return {}
+
+    def flush(self) -> None:
+        pass
+
+
+class PageCountInspector:
+    def inspect(self, source: PdfInput) -> TriageMetadata:
+        return TriageMetadata(
+            page_count=source.size,
+            language=None,
+            scanned=False,
+            image_only_pages=0,
+            image_only_page_ratio=0.0,
+        )
+
+
+class AcceptPolicy:
+    def decide(self, metadata: TriageMetadata) -> TriageDecision | None:
+        return TriageDecision(
+            route=TriageRoute.PARSE,
+            reason="ok",
+            policy="test",
+            rule=None,
+            hint=None,
+        )
+
+
+def _parse_input(path: Path) -> ParsePdfToMarkdownInput:
+    return ParsePdfToMarkdownInput(
+        file_path=path,
+        parser_config=PdfParserConfig(name="fake"),
+        task_id=TaskId(path.stem),
+        document_id=DocumentId(path.stem),
+    )
+
+
+def _write_pdfs(tmp_path: Path, count: int) -> list[Path]:
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"doc-{index}.pdf"
+        path.write_bytes(b"%PDF-1.4\n" + b"x" * index)
+        paths.append(path)
+    return paths
+
+
+def test_execute_many_async_bounds_in_flight_parses(tmp_path: Path) -> None:
+    parser = CountingParser()
+    executor = AsyncExecutor(AsyncExecutionConfig(max_in_flight=2, max_workers=4))
+    use_case = ParsePdfToMarkdown(StaticFactory(parser), executor=executor)
+    items = [_parse_input(path) for path in _write_pdfs(tmp_path, 6)]
+
+    async def collect() -> list[str]:
+        return [
+            result.task.request.task_id.value
+            async for result in use_case.execute_many_async(items)
+        ]
+
+    with executor:
+        completed = asyncio.run(collect())
+
+    assert sorted(completed) == sorted(item.task_id.value for item in items)
+    assert parser.peak == 2
+
+
+def test_cancelling_execute_async_cancels_the_task(tmp_path: Path) -> None:
+    (path,) = _write_pdfs(tmp_path, 1)
+    parser = BlockingAsyncParser()
+    store = RecordingStore()
+    use_case = ParsePdfToMarkdown(StaticFactory(parser), task_store=store)
+
+    async def cancel_mid_parse() -> None:
+        running = asyncio.ensure_future(use_case.execute_async(_parse_input(path)))
+        await parser.started.wait()
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+
+    asyncio.run(cancel_mid_parse())
+
+    assert store.statuses_seen == [
+        ParseStatus.RECEIVED,
+        ParseStatus.RUNNING,
+        ParseStatus.CANCELLED,
+    ]
+
+
+def test_cancelling_execute_async_waits_for_the_running_parse(
+    tmp_path: Path,
+) -> None:
+    (path,) = _write_pdfs(tmp_path, 1)
+    parser = GatedParser()
+    use_case = ParsePdfToMarkdown(StaticFactory(parser))
+
+    async def cancel_mid_parse() -> None:
+        running = asyncio.ensure_future(use_case.execute_async(_parse_input(path)))
+        while not parser.started.is_set():
+            await asyncio.sleep(0.01)
+        running.cancel()
+        await asyncio.sleep(0.05)
+        # The source stays open until the parse that is using it returns.
+        assert not running.done()
+        parser.release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+
+    asyncio.run(cancel_mid_parse())
+
+    assert parser.read == b"%PDF-"
+
+
+def test_executor_is_reusable_across_event_loops(tmp_path: Path) -> None:
+    parser = CountingParser()
+    executor = AsyncExecutor(AsyncExecutionConfig(max_in_flight=1))
+    use_case = ParsePdfToMarkdown(StaticFactory(parser), executor=executor)
+    items = [_parse_input(path) for path in _write_pdfs(tmp_path, 3)]
+
+    async def collect() -> int:
+        # Contended, so the semaphore binds to the running loop.
+        return len(await asyncio.gather(*map(use_case.execute_async, items)))
+
+    with executor:
+        counts = [asyncio.run(collect()), asyncio.run(collect())]
+
+    assert counts == [3, 3]
+    assert parser.peak == 1
+
+
+def test_triage_execute_many_async_on_process_executor(tmp_path: Path) -> None:
+    executor = AsyncExecutor(
+        AsyncExecutionConfig(
+            executor="process", max_in_flight=2, start_method="forkserver"
+        )
+    )
+    use_case = TriagePdf(PageCountInspector(), AcceptPolicy(), executor=executor)
+    paths = _write_pdfs(tmp_path, 3)
+    items = [
+        TriagePdfInput(
+            file_path=None,
+            task_id=TaskId(path.stem),
+            document_id=DocumentId(path.stem),
+            content=path.read_bytes(),
+            source_name=path.name,
+        )
+        for path in paths
+    ] + [
+        TriagePdfInput(
+            file_path=None,
+            task_id=TaskId("bad"),
+            document_id=DocumentId("bad"),
+            content=b"not a pdf",
+        )
+    ]
+
+    async def collect() -> list[TriageMetadata | Exception]:
+        return [
+            outcome if isinstance(outcome, Exception) else outcome.result.metadata
+            async for outcome in use_case.execute_many_async(
+                items, return_exceptions=True
+            )
+        ]
+
+    with executor:
+        outcomes = asyncio.run(collect())
+
+    errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    page_counts = sorted(
+        outcome.page_count
+        for outcome in outcomes
+        if isinstance(outcome, TriageMetadata)
+    )
+    assert [str(error) for error in errors] == ["file_path does not appear to be a PDF"]
+    assert page_counts == [path.stat().st_size for path in paths]
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import io
+import threading
+import time
+from pathlib import Path
+
+import fsspec
+from pypdf import PdfWriter
+
+from doc_parsing.application import (
+    BatchConfig,
+    BatchItem,
+    ParsePdfToMarkdown,
+    ParsePdfToMarkdownInput,
+    SpooledInput,
+    run_batch,
+)
+from doc_parsing.domain import (
+    DocumentId,
+    ParseOptions,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+    SourceType,
+    TaskId,
+)
+
+
+def _pdf_bytes() -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _memory_inputs(prefix: str, count: int) -> list[str]:
+    fs = fsspec.filesystem("memory")
+    data = _pdf_bytes()
+    locations = []
+    for index in range(count):
+        path = f"/{prefix}/doc-{index}.pdf"
+        fs.pipe(path, data)
+        locations.append(f"memory://{path}")
+    return locations
+
+
+def _items(locations: list[str]) -> list[BatchItem]:
+    return [
+        BatchItem(
+            location=location,
+            task_id=TaskId(f"task-{index}"),
+            document_id=DocumentId(f"doc-{index}"),
+        )
+        for index, location in enumerate(locations)
+    ]
+
+
+def test_run_batch_spools_remote_inputs_and_cleans_up(tmp_path: Path) -> None:
+    locations = _memory_inputs("batch-spool", 3)
+    local = tmp_path / "local.pdf"
+    local.write_bytes(_pdf_bytes())
+    spool_dir = tmp_path / "spool"
+
+    def read_header(spooled: SpooledInput) -> bytes:
+        return spooled.path.read_bytes()[:4]
+
+    report = run_batch(
+        _items([*locations, str(local)]),
+        read_header,
+        BatchConfig(spool_dir=spool_dir, workers=2, prefetch_concurrency=2),
+    )
+
+    assert [outcome.item.location for outcome in report.outcomes] == [
+        *locations,
+        str(local),
+    ]
+    assert all(outcome.result == b"%PDF" for outcome in report.outcomes)
+    assert not report.failed
+    assert list(spool_dir.iterdir()) == []
+    assert local.exists()
+
+
+def test_spool_cap_holds_back_prefetch(tmp_path: Path) -> None:
+    locations = _memory_inputs("batch-cap", 4)
+    size = len(_pdf_bytes())
+    spool_dir = tmp_path / "spool"
+    lock = threading.Lock()
+    peak = 0
+
+    def count_spooled(spooled: SpooledInput) -> None:
+        nonlocal peak
+        with lock:
+            peak = max(peak, len(list(spool_dir.iterdir())))
+        time.sleep(0.01)
+
+    report = run_batch(
+        _items(locations),
+        count_spooled,
+        BatchConfig(
+            spool_dir=spool_dir,
+            spool_max_mb=size * 1.5 / (1024 * 1024),
+            prefetch_concurrency=4,
+            workers=2,
+        ),
+    )
+
+    assert not report.failed
+    assert peak == 1
+
+
+def test_run_batch_records_fetch_and_worker_failures(tmp_path: Path) -> None:
+    locations = _memory_inputs("batch-errors", 1)
+
+    def fail(spooled: SpooledInput) -> None:
+        raise RuntimeError("worker exploded")
+
+    report = run_batch(
+        _items([*locations, "memory:///batch-errors/missing.pdf"]),
+        fail,
+        BatchConfig(spool_dir=tmp_path / "spool"),
+    )
+
+    worker_failure, fetch_failure = report.outcomes
+    assert worker_failure.error == "worker exploded"
+    assert fetch_failure.error is not None
+    assert fetch_failure.error.startswith("fetch failed")
+    assert len(report.failed) == 2
+
+
+def test_run_batch_reports_overlap(tmp_path: Path) -> None:
+    locations = _memory_inputs("batch-overlap", 4)
+
+    def slow(spooled: SpooledInput) -> None:
+        time.sleep(0.02)
+
+    report = run_batch(
+        _items(locations),
+        slow,
+        BatchConfig(spool_dir=tmp_path / "spool", workers=1),
+    )
+
+    summary = report.summary()
+    assert summary["documents"] == 4
+    assert report.cpu_busy_seconds >= 0.08
+    assert report.overlap_seconds <= min(
+        report.io_busy_seconds, report.cpu_busy_seconds
+    )
+    assert 0.0 <= report.overlap_ratio <= 1.0
+
+
+class _NameParser(PdfParser):
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        return f"{source.name} {source.uri} {source.source_type.value}"
+
+
+class _Factory(PdfParserFactory):
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        return _NameParser()
+
+
+def test_spooled_parse_keeps_original_source(tmp_path: Path) -> None:
+    location = "memory:///batch-source/object-key"
+    fsspec.filesystem("memory").pipe("/batch-source/object-key", _pdf_bytes())
+    use_case = ParsePdfToMarkdown(_Factory())
+
+    def parse(spooled: SpooledInput):
+        return use_case.execute(
+            ParsePdfToMarkdownInput(
+                file_path=spooled.path,
+                parser_config=PdfParserConfig(name="fake"),
+                task_id=spooled.item.task_id,
+                document_id=spooled.item.document_id,
+                source_uri=spooled.item.location,
+            )
+        )
+
+    report = run_batch(_items([location]), parse, BatchConfig(spool_dir=tmp_path))
+
+    (outcome,) = report.outcomes
+    assert outcome.result is not None
+    source = outcome.result.task.request.source
+    assert source.uri == location
+    assert source.source_type == SourceType.OBJECT_STORAGE
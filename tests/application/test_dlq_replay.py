@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from doc_parsing.application import (
+    ParsePdfToMarkdown,
+    TriagePdf,
+    TriagePdfInput,
+    replay_dlq,
+)
+from doc_parsing.domain import (
+    DlqRecord,
+    DocumentId,
+    DocumentSource,
+    ParseOptions,
+    PdfInput,
+    PdfInspector,
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+    SourceType,
+    TaskId,
+    TriageDecision,
+    TriageMetadata,
+    TriagePolicy,
+    TriageRoute,
+)
+
+METADATA = TriageMetadata(
+    page_count=2,
+    language="en",
+    scanned=True,
+    image_only_pages=2,
+    image_only_page_ratio=1.0,
+)
+
+
+class _Inspector(PdfInspector):
+    def inspect(self, source: PdfInput) -> TriageMetadata:
+        return METADATA
+
+
+class _Policy(TriagePolicy):
+    def __init__(self, route: TriageRoute) -> None:
+        self.route = route
+
+    def decide(self, metadata: TriageMetadata) -> TriageDecision | None:
+        reason = "scanned" if self.route == TriageRoute.DLQ else None
+        return TriageDecision(route=self.route, reason=reason, policy="fake", rule=None)
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.records: list[DlqRecord] = []
+
+    def write(self, record: DlqRecord) -> None:
+        self.records.append(record)
+
+    def flush(self) -> None:
+        pass
+
+
+class _Parser(PdfParser):
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        return f"# {source.name}"
+
+
+class _Factory(PdfParserFactory):
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        return _Parser()
+
+
+def test_triage_writes_rejections_to_sink_and_replay_recovers(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "scan.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n")
+    sink = _Sink()
+    policy = _Policy(TriageRoute.DLQ)
+    triage = TriagePdf(_Inspector(), policy, dlq_sink=sink)
+
+    triage.execute(
+        TriagePdfInput(
+            file_path=pdf_path, task_id=TaskId("task-1"), document_id=DocumentId("scan")
+        )
+    )
+    triage.execute(
+        TriagePdfInput(
+            file_path=None,
+            task_id=TaskId("task-2"),
+            document_id=DocumentId("upload"),
+            content=b"%PDF-1.4\n",
+            source_name="upload.pdf",
+        )
+    )
+
+    assert [record.source.uri for record in sink.records] == [
+        str(pdf_path),
+        "upload.pdf",
+    ]
+    assert sink.records[0].decision.reason == "scanned"
+    assert sink.records[0].metadata == METADATA
+
+    policy.route = TriageRoute.PARSE
+    rejected = list(sink.records)
+    outcomes = replay_dlq(
+        rejected,
+        triage,
+        parse=ParsePdfToMarkdown(_Factory()),
+        parser_config=PdfParserConfig(name="fake"),
+    )
+
+    recovered, upload = outcomes
+    assert recovered.recovered
+    assert recovered.parse is not None
+    assert recovered.parse.task.document is not None
+    assert recovered.parse.task.document.markdown == "# scan.pdf"
+    assert upload.error == "raw byte sources cannot be replayed"
+    assert len(sink.records) == 2
+
+
+def test_replay_rewrites_documents_that_are_still_rejected(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "scan.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n")
+    sink = _Sink()
+    record = DlqRecord(
+        task_id=TaskId("task-1"),
+        document_id=DocumentId("scan"),
+        source=DocumentSource(uri=str(pdf_path), source_type=SourceType.LOCAL_FILE),
+        decision=TriageDecision(
+            route=TriageRoute.DLQ, reason="scanned", policy="fake", rule=None
+        ),
+        metadata=METADATA,
+    )
+
+    (outcome,) = replay_dlq(
+        [record], TriagePdf(_Inspector(), _Policy(TriageRoute.DLQ), dlq_sink=sink)
+    )
+
+    assert not outcome.recovered
+    assert outcome.error is None
+    assert [rewritten.source.uri for rewritten in sink.records] == [str(pdf_path)]
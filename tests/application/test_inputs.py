@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import ctypes
+import io
+import logging
+from pathlib import Path
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+
+from doc_parsing.application import MappedPdfInput, TriagePdf, TriagePdfInput
+from doc_parsing.domain import (
+    DocumentId,
+    PdfInput,
+    PdfInspector,
+    TaskId,
+    TriageMetadata,
+    TriagePolicy,
+)
+from doc_parsing.infrastructure.triage import XrefPreflightReader
+
+
+def _write_pdf(path: Path, pages: int = 2) -> None:
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=72, height=72)
+    with path.open("wb") as handle:
+        writer.write(handle)
+
+
+def test_mapped_input_streams_pdf_to_pypdf(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "sample.pdf"
+    _write_pdf(pdf_path, pages=3)
+
+    with MappedPdfInput.open(pdf_path) as source:
+        assert source.mapped is True
+        assert source.size == pdf_path.stat().st_size
+        assert source.read_range(0, 4, stage="header") == b"%PDF"
+
+        reader = PdfReader(source.open_stream(stage="inspect"))
+
+        assert len(reader.pages) == 3
+        bytes_read = source.bytes_read()
+        assert bytes_read["header"] == 4
+        assert bytes_read["inspect"] > 0
+
+
+def test_mapped_input_falls_back_to_buffered_read(tmp_path: Path) -> None:
+    empty_path = tmp_path / "empty.pdf"
+    empty_path.write_bytes(b"")
+
+    with MappedPdfInput.open(empty_path) as source:
+        assert source.mapped is False
+        assert source.size == 0
+        assert source.read_range(0, 4, stage="header") == b""
+
+
+def test_mapped_input_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        MappedPdfInput.open(tmp_path / "missing.pdf")
+
+
+def test_memory_stream_seek_and_readinto() -> None:
+    source = MappedPdfInput(b"0123456789", uri="mem", name="mem.pdf")
+    stream = source.open_stream(stage="parse")
+
+    stream.seek(-3, io.SEEK_END)
+    assert stream.read() == b"789"
+    stream.seek(2)
+    buffer = bytearray(4)
+    assert stream.readinto(buffer) == 4
+    assert bytes(buffer) == b"2345"
+    assert stream.tell() == 6
+    assert source.bytes_read() == {"parse": 7}
+
+
+def test_memory_stream_reads_into_ctypes_buffers() -> None:
+    source = MappedPdfInput(b"0123456789", uri="mem", name="mem.pdf")
+    stream = source.open_stream(stage="inspect")
+    buffer = (ctypes.c_ubyte * 4)()
+
+    assert stream.readinto(buffer) == 4  # type: ignore[arg-type]
+    assert bytes(buffer) == b"0123"
+
+
+class _StreamingInspector(PdfInspector):
+    def inspect(self, source: PdfInput) -> TriageMetadata:
+        page_count = len(PdfReader(source.open_stream(stage="inspect")).pages)
+        return TriageMetadata(
+            page_count=page_count,
+            language=None,
+            scanned=False,
+            image_only_pages=0,
+            image_only_page_ratio=0.0,
+        )
+
+
+class _NoPolicy(TriagePolicy):
+    def decide(self, metadata: TriageMetadata) -> None:
+        return None
+
+
+def test_triage_logs_bytes_read_per_stage(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    pdf_path = tmp_path / "sample.pdf"
+    _write_pdf(pdf_path)
+
+    doc_logger = logging.getLogger("doc_parsing")
+    doc_logger.addHandler(caplog.handler)
+    caplog.set_level(logging.INFO, logger="doc_parsing")
+    try:
+        result = TriagePdf(
+            _StreamingInspector(), _NoPolicy(), preflight=XrefPreflightReader()
+        ).execute(
+            TriagePdfInput(
+                file_path=pdf_path,
+                task_id=TaskId("task-1"),
+                document_id=DocumentId("doc-1"),
+            )
+        )
+    finally:
+        doc_logger.removeHandler(caplog.handler)
+
+    assert result.result.metadata.page_count == 2
+    io_records = [r for r in caplog.records if r.getMessage() == "triage.io"]
+    assert io_records
+    bytes_read = io_records[0].bytes_read
+    assert 0 < bytes_read["preflight"] <= 8192
+    assert bytes_read["inspect"] > 0
@@ -13,6 +13,7 @@ from doc_parsing.application.use_cases import (
 from doc_parsing.domain import (
     DocumentId,
     ParseOptions,
+    PdfInput,
     PdfParser,
     PdfParserConfig,
     PdfParserFactory,
@@ -21,7 +22,7 @@ from doc_parsing.domain import (
 
 
 class FakeParser(PdfParser):
-    def parse(self, file_path: Path) -> str:
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
         return "# ok"
 
 
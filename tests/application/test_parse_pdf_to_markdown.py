@@ -7,9 +7,14 @@ import pytest
 from doc_parsing.application import ParsePdfToMarkdown, ParsePdfToMarkdownInput
 from doc_parsing.domain import (
     DocumentId,
+    ParseOptions,
+    ParseStatus,
+    ParsingTask,
+    PdfInput,
     PdfParser,
     PdfParserConfig,
     PdfParserFactory,
+    SourceType,
     TaskId,
 )
 
@@ -17,8 +22,10 @@ from doc_parsing.domain import (
 class FakePdfParser(PdfParser):
     def __init__(self, markdown: str) -> None:
         self._markdown = markdown
+        self.seen_bytes: bytes | None = None
 
-    def parse(self, file_path: Path) -> str:
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        self.seen_bytes = source.read_range(0, source.size, stage="parse")
         return self._markdown
 
 
@@ -80,3 +87,83 @@ def test_parse_pdf_to_markdown_requires_file(tmp_path: Path) -> None:
                 document_id=DocumentId("doc-1"),
             )
         )
+
+
+def test_parse_pdf_to_markdown_from_bytes() -> None:
+    parser = FakePdfParser("# Upload")
+    use_case = ParsePdfToMarkdown(FakePdfParserFactory(parser))
+    result = use_case.execute(
+        ParsePdfToMarkdownInput(
+            file_path=None,
+            parser_config=PdfParserConfig(name="fake"),
+            task_id=TaskId("task-1"),
+            document_id=DocumentId("doc-1"),
+            content=b"%PDF-1.4 upload",
+            source_name="upload.pdf",
+        )
+    )
+
+    assert parser.seen_bytes == b"%PDF-1.4 upload"
+    assert result.task.document is not None
+    assert result.task.document.markdown == "# Upload"
+    assert result.task.request.source.uri == "upload.pdf"
+    assert result.task.request.source.source_type == SourceType.RAW_BYTES
+
+
+def test_parse_pdf_to_markdown_rejects_path_and_content(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        ParsePdfToMarkdownInput(
+            file_path=tmp_path / "sample.pdf",
+            parser_config=PdfParserConfig(name="fake"),
+            task_id=TaskId("task-1"),
+            document_id=DocumentId("doc-1"),
+            content=b"%PDF-1.4",
+        )
+
+
+class _RecordingStore:
+    def __init__(self) -> None:
+        self.statuses_seen: list[ParseStatus] = []
+
+    def record(self, task: ParsingTask) -> None:
+        self.statuses_seen.append(task.status)
+
+    def statuses(self) -> dict[TaskId, ParseStatus]:
+        return {}
+
+    def flush(self) -> None:
+        pass
+
+
+class _FailingParser(PdfParser):
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        raise RuntimeError("parser crashed")
+
+
+def test_parse_pdf_to_markdown_checkpoints_transitions(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    store = _RecordingStore()
+    data = ParsePdfToMarkdownInput(
+        file_path=pdf_path,
+        parser_config=PdfParserConfig(name="fake"),
+        task_id=TaskId("task-1"),
+        document_id=DocumentId("doc-1"),
+    )
+
+    ParsePdfToMarkdown(
+        FakePdfParserFactory(FakePdfParser("# Title")), task_store=store
+    ).execute(data)
+    with pytest.raises(RuntimeError):
+        ParsePdfToMarkdown(
+            FakePdfParserFactory(_FailingParser()), task_store=store
+        ).execute(data)
+
+    assert store.statuses_seen == [
+        ParseStatus.RECEIVED,
+        ParseStatus.RUNNING,
+        ParseStatus.SUCCEEDED,
+        ParseStatus.RECEIVED,
+        ParseStatus.RUNNING,
+        ParseStatus.FAILED,
+    ]
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import io
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, NameObject
+from upath import UPath
+
+from doc_parsing.application import (
+    ParsePdfToMarkdown,
+    ParsePdfToMarkdownInput,
+    RemotePdfInput,
+    TriagePdf,
+    TriagePdfInput,
+)
+from doc_parsing.domain import (
+    DocumentId,
+    ParseOptions,
+    PdfInput,
+    PdfInspector,
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+    SourceType,
+    TaskId,
+    TriageMetadata,
+    TriagePolicy,
+)
+
+PADDING = 2_000_000
+
+
+def _padded_pdf() -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    page = writer.add_blank_page(width=72, height=72)
+    contents = DecodedStreamObject()
+    contents.set_data(b"%" + b"x" * PADDING + b"\n")
+    page[NameObject("/Contents")] = writer._add_object(contents)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class _PageCountInspector(PdfInspector):
+    def inspect(self, source: PdfInput) -> TriageMetadata:
+        reader = PdfReader(source.open_stream(stage="inspect"))
+        return TriageMetadata(
+            page_count=len(reader.pages),
+            language=None,
+            scanned=False,
+            image_only_pages=0,
+            image_only_page_ratio=0.0,
+        )
+
+
+class _NoPolicy(TriagePolicy):
+    def decide(self, metadata: TriageMetadata) -> None:
+        return None
+
+
+class _SizeParser(PdfParser):
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        with source.open_stream(stage="parse") as stream:
+            return f"{source.name}: {len(stream.read())} bytes"
+
+
+class _SizeParserFactory(PdfParserFactory):
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        return _SizeParser()
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    payload = b""
+    range_requests: list[str] = []
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        header = self.headers.get("Range")
+        if header is None:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(self.payload)))
+            self.end_headers()
+            self.wfile.write(self.payload)
+            return
+        self.range_requests.append(header)
+        start_text, end_text = header.removeprefix("bytes=").split("-")
+        start = int(start_text)
+        end = min(int(end_text), len(self.payload) - 1)
+        body = self.payload[start : end + 1]
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.payload)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def http_pdf() -> Iterator[tuple[str, bytes, list[str]]]:
+    payload = _padded_pdf()
+    handler = type(
+        "Handler", (_RangeHandler,), {"payload": payload, "range_requests": []}
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/sample.pdf"
+        yield url, payload, handler.range_requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_triage_reads_object_storage_through_upath() -> None:
+    payload = _padded_pdf()
+    UPath("memory://bucket/sample.pdf").write_bytes(payload)
+
+    result = TriagePdf(_PageCountInspector(), _NoPolicy()).execute(
+        TriagePdfInput(
+            file_path=None,
+            uri="memory://bucket/sample.pdf",
+            task_id=TaskId("task-1"),
+            document_id=DocumentId("doc-1"),
+        )
+    )
+
+    assert result.result.metadata.page_count == 2
+
+
+def test_remote_input_missing_object() -> None:
+    with pytest.raises(FileNotFoundError):
+        RemotePdfInput.open(
+            "memory://bucket/missing.pdf", block_size=1024, cache_type="blockcache"
+        )
+
+
+def test_http_triage_fetches_ranges_not_whole_file(
+    http_pdf: tuple[str, bytes, list[str]],
+) -> None:
+    url, payload, range_requests = http_pdf
+
+    with RemotePdfInput.open(
+        url, block_size=64 * 1024, cache_type="blockcache"
+    ) as source:
+        assert isinstance(source, RemotePdfInput)
+        assert source.source_type == SourceType.URL
+        assert source.size == len(payload)
+        assert source.read_range(0, 4, stage="header") == b"%PDF"
+        reader = PdfReader(source.open_stream(stage="inspect"))
+        assert len(reader.pages) == 2
+        fetched = source.fetched_bytes
+
+    assert range_requests
+    assert fetched is not None
+    assert fetched < PADDING
+
+
+def test_http_parse_streams_whole_document(
+    http_pdf: tuple[str, bytes, list[str]],
+) -> None:
+    url, payload, _ = http_pdf
+
+    result = ParsePdfToMarkdown(_SizeParserFactory()).execute(
+        ParsePdfToMarkdownInput(
+            file_path=None,
+            uri=url,
+            parser_config=PdfParserConfig(name="size"),
+            task_id=TaskId("task-1"),
+            document_id=DocumentId("doc-1"),
+        )
+    )
+
+    assert result.task.document is not None
+    assert result.task.document.markdown == f"sample.pdf: {len(payload)} bytes"
+    assert result.task.request.source.source_type == SourceType.URL
+    assert result.task.request.source.uri == url
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from doc_parsing.application import (
+    ParsePdfToMarkdown,
+    ParsePdfToMarkdownInput,
+    ParseProfile,
+    ProfileRouter,
+    TriagedParse,
+    TriagePdf,
+    TriageRejectedError,
+)
+from doc_parsing.domain import (
+    DocumentId,
+    PageRanges,
+    ParseOptions,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    TaskId,
+    TriageDecision,
+    TriageMetadata,
+    TriageResult,
+    TriageRoute,
+)
+
+
+class StaticInspector:
+    def __init__(self, metadata: TriageMetadata) -> None:
+        self._metadata = metadata
+
+    def inspect(self, source: PdfInput) -> TriageMetadata:
+        return self._metadata
+
+
+class StaticPolicy:
+    def __init__(self, decision: TriageDecision) -> None:
+        self._decision = decision
+
+    def decide(self, metadata: TriageMetadata) -> TriageDecision | None:
+        return self._decision
+
+
+class RecordingFactory:
+    def __init__(self) -> None:
+        self.calls: list[tuple[PdfParserConfig, ParseOptions]] = []
+
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        factory = self
+
+        class _Parser:
+            def parse(self, source: PdfInput, options: ParseOptions) -> str:
+                factory.calls.append((config, options))
+                return "# ok"
+
+        return _Parser()
+
+
+def _metadata(*, scanned: bool) -> TriageMetadata:
+    return TriageMetadata(
+        page_count=3,
+        language="de",
+        scanned=scanned,
+        image_only_pages=3 if scanned else 0,
+        image_only_page_ratio=1.0 if scanned else 0.0,
+        image_only_page_ranges=PageRanges.from_pages([1, 2, 3] if scanned else []),
+    )
+
+
+def _decision(route: TriageRoute, hint: str | None) -> TriageDecision:
+    return TriageDecision(
+        route=route,
+        reason="rejected" if route == TriageRoute.DLQ else None,
+        policy="rules",
+        rule=None,
+        hint=hint,
+    )
+
+
+PROFILES = {
+    "fast-text": ParseProfile(
+        parser={"do_ocr": False, "do_table_structure": False},
+        extract_tables=False,
+        language_from_triage=False,
+    ),
+    "scanned": ParseProfile(parser={"do_ocr": True}),
+    "plain": ParseProfile(parser={"kind": "pypdf"}),
+}
+BASE = PdfParserConfig(name="docling", options={"images_scale": 2.0})
+
+
+def test_router_selects_profile_from_hint() -> None:
+    router = ProfileRouter(BASE, PROFILES)
+
+    fast = router.select(
+        TriageResult(
+            _metadata(scanned=False), _decision(TriageRoute.PARSE, "fast-text")
+        )
+    )
+    scanned = router.select(
+        TriageResult(_metadata(scanned=True), _decision(TriageRoute.PARSE, "scanned"))
+    )
+    plain = router.select(
+        TriageResult(_metadata(scanned=False), _decision(TriageRoute.PARSE, "plain"))
+    )
+    unknown = router.select(
+        TriageResult(_metadata(scanned=False), _decision(TriageRoute.PARSE, "other"))
+    )
+
+    assert fast.parser_config.options == {
+        "images_scale": 2.0,
+        "do_ocr": False,
+        "do_table_structure": False,
+    }
+    assert fast.options == ParseOptions(extract_tables=False, ocr_pages=PageRanges())
+    assert scanned.options.language_hint == "de"
+    assert str(scanned.options.ocr_pages) == "1-3"
+    assert plain.parser_config == PdfParserConfig(name="pypdf", options={})
+    assert (unknown.profile, unknown.parser_config) == ("default", BASE)
+    assert unknown.options.language_hint == "de"
+
+
+def test_triaged_parse_uses_profile_and_tracks_throughput(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n")
+    factory = RecordingFactory()
+    router = ProfileRouter(BASE, PROFILES)
+    data = ParsePdfToMarkdownInput(
+        file_path=pdf_path,
+        parser_config=BASE,
+        task_id=TaskId("task-1"),
+        document_id=DocumentId("doc-1"),
+    )
+
+    def triaged(decision: TriageDecision) -> TriagedParse:
+        triage = TriagePdf(
+            StaticInspector(_metadata(scanned=False)), StaticPolicy(decision)
+        )
+        return TriagedParse(triage, ParsePdfToMarkdown(factory).execute, router)
+
+    triaged(_decision(TriageRoute.PARSE, "fast-text")).execute(data)
+    with pytest.raises(TriageRejectedError, match="rejected"):
+        triaged(_decision(TriageRoute.DLQ, None)).execute(data)
+
+    ((config, options),) = factory.calls
+    assert config.options is not None and config.options["do_ocr"] is False
+    assert options.extract_tables is False
+    throughput = router.throughput()
+    assert list(throughput) == ["fast-text"]
+    assert throughput["fast-text"]["documents"] == 1
+    assert throughput["fast-text"]["pages"] == 3
+
+
+def test_router_leaves_ocr_to_parser_without_page_ranges() -> None:
+    metadata = TriageMetadata(
+        page_count=3,
+        language=None,
+        scanned=False,
+        image_only_pages=1,
+        image_only_page_ratio=1 / 3,
+    )
+    router = ProfileRouter(
+        BASE, {"scanned": ParseProfile(), "all": ParseProfile(page_selective_ocr=False)}
+    )
+
+    counted = router.select(
+        TriageResult(metadata, _decision(TriageRoute.PARSE, "scanned"))
+    )
+    disabled = router.select(
+        TriageResult(_metadata(scanned=True), _decision(TriageRoute.PARSE, "all"))
+    )
+
+    assert counted.options.ocr_pages is None
+    assert disabled.options.ocr_pages is None
+
+
+def test_router_leaves_ocr_to_parser_when_preflight_decided() -> None:
+    metadata = TriageMetadata(
+        page_count=3,
+        language=None,
+        scanned=False,
+        image_only_pages=0,
+        image_only_page_ratio=0.0,
+        inspected=False,
+    )
+    router = ProfileRouter(BASE, {"scanned": ParseProfile()})
+
+    selection = router.select(
+        TriageResult(metadata, _decision(TriageRoute.PARSE, "scanned"))
+    )
+
+    assert selection.options.ocr_pages is None
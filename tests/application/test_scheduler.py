@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+
+from doc_parsing.application import (
+    ParsePdfToMarkdown,
+    ParsePdfToMarkdownInput,
+    ParseScheduler,
+    SchedulerConfig,
+)
+from doc_parsing.domain import (
+    DocumentId,
+    ParseOptions,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+    TaskId,
+    TriageMetadata,
+)
+
+
+class _RecordingParser(PdfParser):
+    def __init__(self, gates: dict[str, threading.Event], order: list[str]) -> None:
+        self._gates = gates
+        self._order = order
+        self.started = threading.Event()
+
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
+        self._order.append(source.name)
+        self.started.set()
+        gate = self._gates.get(source.name)
+        if gate is not None:
+            assert gate.wait(timeout=5)
+        return f"# {source.name}"
+
+
+class _Factory(PdfParserFactory):
+    def __init__(self, parser: PdfParser) -> None:
+        self._parser = parser
+
+    def create(self, config: PdfParserConfig) -> PdfParser:
+        return self._parser
+
+
+def _input(name: str) -> ParsePdfToMarkdownInput:
+    return ParsePdfToMarkdownInput(
+        file_path=None,
+        parser_config=PdfParserConfig(name="fake"),
+        task_id=TaskId(name),
+        document_id=DocumentId(name),
+        content=b"%PDF-1.7",
+        source_name=name,
+    )
+
+
+def _metadata(pages: int, *, scanned: bool = False) -> TriageMetadata:
+    return TriageMetadata(
+        page_count=pages,
+        language=None,
+        scanned=scanned,
+        image_only_pages=pages if scanned else 0,
+        image_only_page_ratio=1.0 if scanned else 0.0,
+    )
+
+
+def _scheduler(
+    gates: dict[str, threading.Event], order: list[str], **config: object
+) -> tuple[ParseScheduler, threading.Event]:
+    parser = _RecordingParser(gates, order)
+    use_case = ParsePdfToMarkdown(_Factory(parser))
+    scheduler = ParseScheduler(use_case.execute, SchedulerConfig.model_validate(config))
+    return scheduler, parser.started
+
+
+def test_scheduler_runs_shortest_expected_job_first() -> None:
+    gate = threading.Event()
+    order: list[str] = []
+    scheduler, started = _scheduler(
+        {"blocker": gate},
+        order,
+        workers=1,
+        fast_lane_workers=0,
+        aging_pages_per_second=0.0,
+    )
+    with scheduler:
+        blocker = scheduler.submit(_input("blocker"), _metadata(1))
+        assert started.wait(timeout=5)
+        futures = [
+            scheduler.submit(_input("big"), _metadata(500)),
+            scheduler.submit(_input("scanned"), _metadata(20, scanned=True)),
+            scheduler.submit(_input("small"), _metadata(2)),
+        ]
+        gate.set()
+        blocker.result(timeout=5)
+        results = [future.result(timeout=5) for future in futures]
+
+    assert order == ["blocker", "small", "scanned", "big"]
+    task = results[0].task
+    assert task.queued_at is not None
+    assert task.queue_wait_seconds is not None
+    assert task.queue_wait_seconds > 0.0
+    assert task.run_seconds is not None
+
+
+def test_scheduler_ages_waiting_jobs_ahead_of_newer_small_ones() -> None:
+    gate = threading.Event()
+    order: list[str] = []
+    scheduler, started = _scheduler(
+        {"blocker": gate},
+        order,
+        workers=1,
+        fast_lane_workers=0,
+        aging_pages_per_second=1e9,
+    )
+    with scheduler:
+        scheduler.submit(_input("blocker"), _metadata(1))
+        assert started.wait(timeout=5)
+        big = scheduler.submit(_input("big"), _metadata(500))
+        small = scheduler.submit(_input("small"), _metadata(2))
+        gate.set()
+        big.result(timeout=5)
+        small.result(timeout=5)
+
+    assert order == ["blocker", "big", "small"]
+
+
+def test_fast_lane_keeps_small_documents_moving() -> None:
+    gate = threading.Event()
+    order: list[str] = []
+    scheduler, started = _scheduler(
+        {"big": gate},
+        order,
+        workers=1,
+        fast_lane_workers=1,
+        fast_lane_max_pages=5,
+    )
+    with scheduler:
+        big = scheduler.submit(_input("big"), _metadata(2000))
+        assert started.wait(timeout=5)
+        small = scheduler.submit(_input("small"), _metadata(2))
+        result = small.result(timeout=5)
+        assert not big.done()
+        gate.set()
+        big.result(timeout=5)
+
+    assert result.task.document is not None
+    assert order == ["big", "small"]
+
+
+def test_scheduler_surfaces_use_case_errors() -> None:
+    class _Broken(PdfParser):
+        def parse(self, source: PdfInput, options: ParseOptions) -> str:
+            raise RuntimeError("boom")
+
+    scheduler = ParseScheduler(
+        ParsePdfToMarkdown(_Factory(_Broken())).execute, SchedulerConfig(workers=1)
+    )
+    with scheduler:
+        future = scheduler.submit(_input("broken"), _metadata(1))
+        error = future.exception(timeout=5)
+
+    assert isinstance(error, RuntimeError)
@@ -7,6 +7,8 @@ from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 from doc_parsing.application.triage_config_resolver import TriageConfigResolver
 from doc_parsing.infrastructure.triage import (
+    PdfiumInspectorConfig,
+    PypdfInspectorConfig,
     TriagePolicyRegistration,
     TriagePolicyRegistry,
 )
@@ -80,3 +82,21 @@ def test_set_overrides_inspection_and_triage() -> None:
 
     assert inspection.scanned_page_ratio_threshold == 0.9
     assert policy.flag is True
+
+
+def test_inspection_kind_selects_the_inspector_config() -> None:
+    resolver = TriageConfigResolver(_registry())
+    config = resolver.parse(
+        {
+            "triage": {"policies": [{"kind": "fake"}]},
+            "inspection": {"min_text_chars": 5},
+            "input_path": "/tmp/a.pdf",
+        }
+    )
+
+    updated = resolver.apply_overrides(config, overrides=["inspection.kind=pdfium"])
+
+    assert isinstance(cast(Any, config).inspection, PypdfInspectorConfig)
+    inspection = cast(Any, updated).inspection
+    assert isinstance(inspection, PdfiumInspectorConfig)
+    assert inspection.min_text_chars == 5
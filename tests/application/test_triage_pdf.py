@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import dataclasses
+import io
 from pathlib import Path
 
-from doc_parsing.application.use_cases import TriagePdf, TriagePdfInput
+import pytest
+
+from doc_parsing.application.use_cases import (
+    TriagePdf,
+    TriagePdfInput,
+    TriagePolicyChain,
+)
 from doc_parsing.domain import (
     DocumentId,
+    PdfInput,
     PdfInspector,
+    PdfPreflight,
+    PdfPreflightReader,
     TaskId,
     TriageDecision,
     TriageMetadata,
@@ -18,7 +29,7 @@ class FakeInspector(PdfInspector):
     def __init__(self, metadata: TriageMetadata) -> None:
         self._metadata = metadata
 
-    def inspect(self, file_path: Path) -> TriageMetadata:
+    def inspect(self, source: PdfInput) -> TriageMetadata:
         return self._metadata
 
 
@@ -91,3 +102,132 @@ def test_triage_pdf_defaults_to_dlq(tmp_path: Path) -> None:
     assert decision.route == TriageRoute.DLQ
     assert decision.reason == "no_policy_match"
     assert decision.policy == "default"
+
+
+def test_triage_pdf_from_stream() -> None:
+    metadata = TriageMetadata(
+        page_count=1,
+        language=None,
+        scanned=False,
+        image_only_pages=0,
+        image_only_page_ratio=0.0,
+    )
+
+    use_case = TriagePdf(FakeInspector(metadata), FakePolicy(None))
+    result = use_case.execute(
+        TriagePdfInput(
+            file_path=None,
+            task_id=TaskId("task-3"),
+            document_id=DocumentId("doc-3"),
+            content=io.BytesIO(b"%PDF-1.4\n"),
+        )
+    )
+
+    assert result.result.metadata == metadata
+
+
+def test_triage_pdf_rejects_non_pdf_bytes() -> None:
+    use_case = TriagePdf(FakeInspector(None), FakePolicy(None))  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        use_case.execute(
+            TriagePdfInput(
+                file_path=None,
+                task_id=TaskId("task-4"),
+                document_id=DocumentId("doc-4"),
+                content=b"not a pdf",
+            )
+        )
+
+
+class FakePreflightReader(PdfPreflightReader):
+    def __init__(self, preflight: PdfPreflight) -> None:
+        self._preflight = preflight
+
+    def read(self, source: PdfInput) -> PdfPreflight:
+        return self._preflight
+
+
+def test_triage_pdf_adds_preflight_facts_to_the_inspection() -> None:
+    metadata = TriageMetadata(
+        page_count=1,
+        language=None,
+        scanned=False,
+        image_only_pages=0,
+        image_only_page_ratio=0.0,
+    )
+    preflight = FakePreflightReader(PdfPreflight(file_size=9, linearized=True))
+
+    result = TriagePdf(
+        FakeInspector(metadata), FakePolicy(None), preflight=preflight
+    ).execute(
+        TriagePdfInput(
+            file_path=None,
+            task_id=TaskId("task-6"),
+            document_id=DocumentId("doc-6"),
+            content=b"%PDF-1.4\n",
+        )
+    )
+
+    assert result.result.metadata == dataclasses.replace(
+        metadata, file_size=9, linearized=True
+    )
+
+
+class FailingInspector(PdfInspector):
+    def inspect(self, source: PdfInput) -> TriageMetadata:
+        raise AssertionError("preflight decisions must not inspect pages")
+
+
+class PreflightPolicy(FakePolicy):
+    def __init__(self, decision: TriageDecision | None) -> None:
+        super().__init__(decision)
+        self.preflights: list[PdfPreflight] = []
+
+    def decide_preflight(self, preflight: PdfPreflight) -> TriageDecision | None:
+        self.preflights.append(preflight)
+        return self._decision
+
+
+def test_triage_pdf_rejects_at_preflight_without_inspecting(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "sample.pdf"
+    _write_pdf(pdf_path)
+    decision = TriageDecision(
+        route=TriageRoute.DLQ, reason="truncated", policy="fake", rule="truncated"
+    )
+    policy = PreflightPolicy(decision)
+
+    preflight = FakePreflightReader(PdfPreflight(file_size=9, truncated=True))
+
+    result = TriagePdf(FailingInspector(), policy, preflight=preflight).execute(
+        TriagePdfInput(
+            file_path=pdf_path,
+            task_id=TaskId("task-5"),
+            document_id=DocumentId("doc-5"),
+        )
+    )
+
+    assert policy.preflights == [PdfPreflight(file_size=9, truncated=True)]
+    assert result.result.decision == decision
+    assert result.result.metadata.inspected is False
+    assert result.result.metadata.truncated is True
+
+
+def test_triage_pdf_chain_defers_to_first_policy_at_preflight() -> None:
+    decision = TriageDecision(
+        route=TriageRoute.DLQ, reason="encrypted", policy="fake", rule=None
+    )
+    preflight = PdfPreflight(file_size=9, encrypted=True)
+
+    assert (
+        TriagePolicyChain([PreflightPolicy(decision)]).decide_preflight(preflight)
+        == decision
+    )
+    # A policy that cannot decide at preflight may match once inspected, so
+    # later policies are not consulted.
+    assert (
+        TriagePolicyChain(
+            [FakePolicy(None), PreflightPolicy(decision)]
+        ).decide_preflight(preflight)
+        is None
+    )
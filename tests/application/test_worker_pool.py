@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import io
+import logging
+import os
+import signal
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pypdf import PdfWriter
+
+from doc_parsing.application import (
+    ParsePdfToMarkdownInput,
+    ParseTimeoutError,
+    ParseWorkerPool,
+    ParseWorkerSpec,
+    WorkerCrashedError,
+    WorkerPoolConfig,
+    worker_pool,
+)
+from doc_parsing.domain import DocumentId, ParseStatus, PdfParserConfig, TaskId
+from doc_parsing.infrastructure.parsers.mock_adapter import adapter as mock_adapter
+from doc_parsing.infrastructure.parsers.registry import ParserRegistry
+
+
+def _write_pdf(path: Path) -> Path:
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    path.write_bytes(buffer.getvalue())
+    return path
+
+
+def _spec() -> ParseWorkerSpec:
+    registry = ParserRegistry()
+    registry.register_adapter(mock_adapter)
+    return ParseWorkerSpec(parser_factory=registry)
+
+
+def _input(path: Path, *, delay_seconds: float = 0.0) -> ParsePdfToMarkdownInput:
+    return ParsePdfToMarkdownInput(
+        file_path=path,
+        parser_config=PdfParserConfig(
+            name="mock", options={"delay_seconds": delay_seconds}
+        ),
+        task_id=TaskId(path.stem),
+        document_id=DocumentId(path.stem),
+    )
+
+
+def _wait_until_ready(pool: ParseWorkerPool, workers: int) -> None:
+    deadline = time.monotonic() + 60
+    while pool.ready_workers() < workers:
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+
+def test_pool_parses_in_child_processes(tmp_path: Path) -> None:
+    paths = [_write_pdf(tmp_path / f"doc-{index}.pdf") for index in range(3)]
+
+    with ParseWorkerPool(_spec(), WorkerPoolConfig(workers=2)) as pool:
+        pids = pool.worker_pids()
+        futures = [pool.submit(_input(path)) for path in paths]
+        results = [future.result(timeout=60) for future in futures]
+
+    assert os.getpid() not in pids
+    assert [result.task.status for result in results] == [ParseStatus.SUCCEEDED] * 3
+    assert results[0].task.document is not None
+    assert results[0].task.document.markdown is not None
+    assert results[0].task.document.markdown.startswith("# Parsed doc-0.pdf")
+
+
+def test_pool_kills_and_replaces_a_worker_past_its_budget(tmp_path: Path) -> None:
+    slow = _write_pdf(tmp_path / "slow.pdf")
+    fast = _write_pdf(tmp_path / "fast.pdf")
+    config = WorkerPoolConfig(workers=1, timeout_seconds=1.0)
+
+    with ParseWorkerPool(_spec(), config) as pool:
+        (original_pid,) = pool.worker_pids()
+        timed_out = pool.submit(_input(slow, delay_seconds=60.0))
+        with pytest.raises(ParseTimeoutError) as caught:
+            timed_out.result(timeout=60)
+        (replacement_pid,) = pool.worker_pids()
+        recovered = pool.submit(_input(fast)).result(timeout=60)
+
+    task = caught.value.task
+    assert task.status == ParseStatus.CANCELLED
+    assert task.error_message == "timeout"
+    assert task.run_seconds is not None
+    assert task.run_seconds >= 1.0
+    assert task.request.source.uri == str(slow)
+    assert replacement_pid != original_pid
+    assert recovered.task.status == ParseStatus.SUCCEEDED
+
+
+def test_budget_scales_with_page_count() -> None:
+    config = WorkerPoolConfig(timeout_seconds=10.0, timeout_seconds_per_page=0.5)
+
+    assert config.budget_seconds(None) == 10.0
+    assert config.budget_seconds(100) == 60.0
+    assert WorkerPoolConfig().budget_seconds(100) is None
+    assert WorkerPoolConfig(timeout_seconds_per_page=1.0).budget_seconds(3) == 3.0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="zygote workers need fork")
+def test_zygote_pool_forks_workers_from_a_warm_process(tmp_path: Path) -> None:
+    slow = _write_pdf(tmp_path / "slow.pdf")
+    fast = _write_pdf(tmp_path / "fast.pdf")
+    config = WorkerPoolConfig(workers=1, timeout_seconds=1.0, start_method="zygote")
+
+    with ParseWorkerPool(_spec(), config) as pool:
+        (original_pid,) = pool.worker_pids()
+        original_parent = _parent_pid(original_pid)
+        with pytest.raises(ParseTimeoutError):
+            pool.submit(_input(slow, delay_seconds=60.0)).result(timeout=60)
+        recovered = pool.submit(_input(fast)).result(timeout=60)
+        (replacement_pid,) = pool.worker_pids()
+        parents = {original_parent, _parent_pid(replacement_pid)}
+
+    assert recovered.task.status == ParseStatus.SUCCEEDED
+    assert replacement_pid != original_pid
+    # Both workers were forked by the same zygote, not by this process.
+    assert len(parents) == 1
+    assert os.getpid() not in parents
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="zygote workers need fork")
+def test_zygote_pool_fails_jobs_once_the_zygote_is_gone(tmp_path: Path) -> None:
+    first = _write_pdf(tmp_path / "first.pdf")
+    second = _write_pdf(tmp_path / "second.pdf")
+    config = WorkerPoolConfig(workers=1, max_tasks_per_worker=1, start_method="zygote")
+
+    with ParseWorkerPool(_spec(), config) as pool:
+        _wait_until_ready(pool, 1)
+        zygote = pool._zygote._process  # type: ignore[union-attr]
+        os.kill(zygote.pid, signal.SIGKILL)
+        zygote.join()
+        done = pool.submit(_input(first, delay_seconds=0.5))
+        queued = pool.submit(_input(second))
+        result = done.result(timeout=60)
+        # Recycling the worker after its one task needs a fork.
+        with pytest.raises(WorkerCrashedError):
+            queued.result(timeout=60)
+        with pytest.raises(WorkerCrashedError):
+            pool.submit(_input(second))
+
+    assert result.task.status == ParseStatus.SUCCEEDED
+
+
+def _parent_pid(pid: int) -> int | None:
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+    return int(stat.rsplit(")", 1)[1].split()[1])
+
+
+def test_pool_fails_jobs_when_no_worker_can_start(tmp_path: Path) -> None:
+    path = _write_pdf(tmp_path / "doc.pdf")
+    registry = ParserRegistry()
+    registry.register_adapter(mock_adapter)
+    spec = ParseWorkerSpec(
+        parser_factory=registry,
+        preload=(PdfParserConfig(name="mock", options={"delay_seconds": -1}),),
+    )
+
+    with ParseWorkerPool(spec, WorkerPoolConfig(workers=1)) as pool:
+        future = pool.submit(_input(path))
+        with pytest.raises(WorkerCrashedError):
+            future.result(timeout=60)
+        with pytest.raises(WorkerCrashedError):
+            pool.submit(_input(path))
+
+
+def test_pool_recycles_workers_after_max_tasks(tmp_path: Path) -> None:
+    paths = [_write_pdf(tmp_path / f"doc-{index}.pdf") for index in range(3)]
+    config = WorkerPoolConfig(workers=1, max_tasks_per_worker=2)
+
+    with ParseWorkerPool(_spec(), config) as pool:
+        (original_pid,) = pool.worker_pids()
+        results = [pool.submit(_input(path)).result(timeout=60) for path in paths]
+        deadline = time.monotonic() + 60
+        while len(pool.worker_pids()) != 1 or original_pid in pool.worker_pids():
+            assert time.monotonic() < deadline
+            time.sleep(0.1)
+
+    assert [result.task.status for result in results] == [ParseStatus.SUCCEEDED] * 3
+
+
+def test_pool_recycles_workers_past_max_rss(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    paths = [_write_pdf(tmp_path / f"doc-{index}.pdf") for index in range(2)]
+    # Any Python process is past 1 MB, so every worker is recycled after a job.
+    config = WorkerPoolConfig(workers=1, max_rss_mb=1)
+    caplog.set_level(logging.INFO, logger="doc_parsing")
+
+    with ParseWorkerPool(_spec(), config) as pool:
+        (original_pid,) = pool.worker_pids()
+        first = pool.submit(_input(paths[0])).result(timeout=60)
+        deadline = time.monotonic() + 60
+        while original_pid in pool.worker_pids():
+            assert time.monotonic() < deadline
+            time.sleep(0.1)
+        second = pool.submit(_input(paths[1])).result(timeout=60)
+
+    (start, *_) = [
+        r for r in caplog.records if r.getMessage() == "worker.recycle.start"
+    ]
+    (recycled, *_) = [r for r in caplog.records if r.getMessage() == "worker.recycled"]
+    assert (start.reason, start.pid) == ("max_rss", original_pid)
+    assert start.rss_mb >= 1
+    # The old worker is stopped only once its replacement is warm.
+    assert recycled.replacement_pid == start.replacement_pid
+    assert [first.task.status, second.task.status] == [ParseStatus.SUCCEEDED] * 2
+
+
+def test_pool_config_rejects_invalid_recycle_limits() -> None:
+    with pytest.raises(ValueError, match="max_rss_mb"):
+        WorkerPoolConfig(max_rss_mb=0)
+    with pytest.raises(ValueError, match="max_tasks_per_worker"):
+        WorkerPoolConfig(max_tasks_per_worker=0)
+
+
+def test_pool_replaces_a_worker_that_died_while_idle(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths = [_write_pdf(tmp_path / f"doc-{index}.pdf") for index in range(2)]
+    hidden: list[Any] = []
+    hiding = threading.Event()
+    real_wait = worker_pool.wait
+
+    def wait(connections: list[Any], timeout: float | None = None) -> list[Any]:
+        # Keeps the supervisor from seeing the dead worker's EOF, so the job
+        # is sent to it before the crash is noticed.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if hidden:
+                hiding.set()
+            visible = [c for c in connections if c not in hidden]
+            ready = real_wait(visible, 0.05)
+            if ready or (deadline is not None and time.monotonic() >= deadline):
+                return ready
+
+    monkeypatch.setattr(worker_pool, "wait", wait)
+    with ParseWorkerPool(_spec(), WorkerPoolConfig(workers=1)) as pool:
+        pool.submit(_input(paths[0])).result(timeout=60)
+        (worker,) = pool._workers
+        hidden.append(worker.connection)
+        assert hiding.wait(timeout=10)
+        worker.process.kill()
+        worker.process.join()
+        result = pool.submit(_input(paths[1])).result(timeout=60)
+        (replacement_pid,) = pool.worker_pids()
+
+    assert result.task.status == ParseStatus.SUCCEEDED
+    assert replacement_pid != worker.pid
+
+
+def test_pool_fails_only_the_job_that_cannot_be_sent(tmp_path: Path) -> None:
+    path = _write_pdf(tmp_path / "doc.pdf")
+    unpicklable = ParsePdfToMarkdownInput(
+        file_path=path,
+        parser_config=PdfParserConfig(name="mock", options={"hook": lambda: None}),
+        task_id=TaskId("bad"),
+        document_id=DocumentId("bad"),
+    )
+
+    with ParseWorkerPool(_spec(), WorkerPoolConfig(workers=1)) as pool:
+        failed = pool.submit(unpicklable)
+        with pytest.raises(Exception, match="lambda"):
+            failed.result(timeout=60)
+        result = pool.submit(_input(path)).result(timeout=60)
+
+    assert result.task.status == ParseStatus.SUCCEEDED
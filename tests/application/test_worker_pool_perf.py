@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from doc_parsing.application import ParseWorkerPool, ParseWorkerSpec, WorkerPoolConfig
+from doc_parsing.domain import PdfParserConfig
+from doc_parsing.infrastructure.parsers.docling_adapter import (
+    adapter as docling_adapter,
+)
+from doc_parsing.infrastructure.parsers.registry import ParserRegistry
+
+WORKERS = 3
+
+
+def _private_mb(pid: int) -> float:
+    # Private pages are the memory a worker adds on top of what it shares.
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":", 1)
+        fields[name] = int(value.split()[0])
+    return (fields["Private_Clean"] + fields["Private_Dirty"]) / 1024
+
+
+def _per_worker_mb(start_method: str) -> float:
+    registry = ParserRegistry()
+    registry.register_adapter(docling_adapter)
+    spec = ParseWorkerSpec(
+        parser_factory=registry, preload=(PdfParserConfig(name="docling"),)
+    )
+    config = WorkerPoolConfig(workers=WORKERS, start_method=start_method)
+    with ParseWorkerPool(spec, config) as pool:
+        while pool.ready_workers() < WORKERS:
+            time.sleep(0.5)
+        return sum(_private_mb(pid) for pid in pool.worker_pids()) / WORKERS
+
+
+@pytest.mark.skipif(
+    os.getenv("PERF") != "1" or not Path("/proc/self/smaps_rollup").exists(),
+    reason="Set PERF=1 on Linux to run worker memory measurements",
+)
+def test_zygote_workers_share_model_memory() -> None:
+    spawn = _per_worker_mb("spawn")
+    zygote = _per_worker_mb("zygote")
+
+    print(
+        f"private memory per extra worker: spawn {spawn:.0f} MB, zygote {zygote:.0f} MB"
+    )
+    assert zygote < spawn
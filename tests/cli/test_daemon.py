@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import socket
+import threading
+from concurrent.futures.thread import BrokenThreadPool
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from doc_parsing.daemon import DaemonClient, DaemonServer, DaemonUnavailableError
+from doc_parsing.domain import ParseOptions
+from doc_parsing.infrastructure.parsers import docling
+from doc_parsing.infrastructure.parsers.docling_config import DoclingConfig
+
+
+def _echo(payload: dict[str, Any], body: bytes | None) -> dict[str, Any]:
+    return {"status": "ok", "payload": payload, "size": len(body or b"")}
+
+
+def _fail(payload: dict[str, Any], body: bytes | None) -> dict[str, Any]:
+    raise ValueError("boom")
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Path:
+    path = tmp_path / "d.sock"
+    # AF_UNIX paths are limited to about 100 bytes.
+    if len(str(path)) > 100:
+        pytest.skip("tmp_path is too long for a Unix socket")
+    return path
+
+
+def _serve(path: Path) -> tuple[DaemonServer, threading.Thread]:
+    server = DaemonServer(path, {"echo": _echo, "fail": _fail})
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    return server, thread
+
+
+def test_daemon_round_trips_requests_with_a_body(socket_path: Path) -> None:
+    server, thread = _serve(socket_path)
+    try:
+        client = DaemonClient(socket_path)
+        response = client.request("echo", {"input": "-"}, body=b"%PDF-1.4")
+        failed = client.request("fail", {})
+        unknown = client.request("nope", {})
+    finally:
+        server.shutdown()
+        thread.join()
+
+    assert client.available() is False
+    assert response == {"status": "ok", "payload": {"input": "-"}, "size": 8}
+    assert failed == {"status": "error", "error": "boom"}
+    assert unknown["status"] == "error"
+
+
+def test_daemon_replaces_a_stale_socket(socket_path: Path) -> None:
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(str(socket_path))
+    stale.close()
+    client = DaemonClient(socket_path)
+
+    assert client.available()
+    with pytest.raises(DaemonUnavailableError):
+        client.request("echo", {})
+
+    server, thread = _serve(socket_path)
+    try:
+        assert client.request("echo", {})["status"] == "ok"
+        with pytest.raises(ValueError, match="already listening"):
+            DaemonServer(socket_path, {})
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def test_daemon_handlers_reuse_the_converters_warmed_for_them(
+    socket_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    built: list[str] = []
+
+    def _build(**_: Any) -> object:
+        built.append(threading.current_thread().name)
+        return object()
+
+    monkeypatch.setattr(docling, "DocumentConverter", _build)
+    monkeypatch.setattr(docling, "_local", threading.local())
+    config = DoclingConfig(do_table_structure=False)
+
+    def _convert(payload: dict[str, Any], body: bytes | None) -> dict[str, Any]:
+        return {"status": "ok", "id": id(docling._converter(config, ParseOptions()))}
+
+    server = DaemonServer(
+        socket_path,
+        {"convert": _convert},
+        warm=lambda: docling._converter(config, ParseOptions()),
+    )
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        client = DaemonClient(socket_path)
+        ids = {client.request("convert", {})["id"] for _ in range(3)}
+    finally:
+        server.shutdown()
+        thread.join()
+
+    assert len(built) == 1
+    assert built[0] != threading.main_thread().name
+    assert len(ids) == 1
+
+
+def test_daemon_fails_to_start_when_warmup_fails(socket_path: Path) -> None:
+    def _warm() -> None:
+        raise RuntimeError("no models")
+
+    with pytest.raises(BrokenThreadPool):
+        DaemonServer(socket_path, {"echo": _echo}, max_concurrency=2, warm=_warm)
+
+    assert not socket_path.exists()
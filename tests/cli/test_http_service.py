@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+from typing import Any
+
+from pypdf import PdfWriter
+
+from doc_parsing.application import ParseWorkerPool, ParseWorkerSpec, WorkerPoolConfig
+from doc_parsing.domain import PdfParserConfig
+from doc_parsing.http_service import HttpParseService, HttpServiceConfig
+from doc_parsing.infrastructure.parsers.mock_adapter import adapter as mock_adapter
+from doc_parsing.infrastructure.parsers.registry import ParserRegistry
+
+
+def _pdf_bytes() -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+async def _request(
+    port: int, method: str, target: str, body: bytes = b""
+) -> tuple[int, bytes]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    head = f"{method} {target} HTTP/1.1\r\nHost: test\r\n"
+    if method == "POST":
+        head += f"Content-Length: {len(body)}\r\n"
+    writer.write(head.encode() + b"\r\n" + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status_line, _, rest = response.partition(b"\r\n")
+    headers, _, payload = rest.partition(b"\r\n\r\n")
+    if b"transfer-encoding: chunked" in headers.lower():
+        payload = _dechunk(payload)
+    return int(status_line.split()[1]), payload
+
+
+def _dechunk(payload: bytes) -> bytes:
+    chunks = []
+    while True:
+        size_line, _, payload = payload.partition(b"\r\n")
+        size = int(size_line, 16)
+        if not size:
+            return b"".join(chunks)
+        chunks.append(payload[:size])
+        payload = payload[size + 2 :]
+
+
+def _json(payload: bytes) -> dict[str, Any]:
+    return json.loads(payload)
+
+
+def test_http_service_parses_uploads_and_sheds_load() -> None:
+    registry = ParserRegistry()
+    registry.register_adapter(mock_adapter)
+    parser_config = PdfParserConfig(name="mock", options={"delay_seconds": 1.0})
+    spec = ParseWorkerSpec(parser_factory=registry, preload=(parser_config,))
+    pdf = _pdf_bytes()
+
+    async def scenario(pool: ParseWorkerPool) -> None:
+        service = HttpParseService(
+            pool,
+            parser_config,
+            HttpServiceConfig(port=0, max_pending=1),
+            dispatchers=1,
+        )
+        port = await service.start()
+        try:
+            status, created = await _request(port, "POST", "/v1/tasks?task_id=a", pdf)
+            assert status == 202
+            assert _json(created)["status"] == "received"
+
+            _, running = await _request(
+                port, "GET", "/v1/tasks/a?wait=30&status=received"
+            )
+            assert _json(running)["status"] == "running"
+            status, _ = await _request(port, "POST", "/v1/tasks?task_id=b", pdf)
+            assert status == 202
+            status, rejected = await _request(port, "POST", "/v1/tasks?task_id=c", pdf)
+            assert status == 429
+            assert "full" in _json(rejected)["error"]
+
+            status, markdown = await _request(
+                port, "GET", "/v1/tasks/a/markdown?wait=30"
+            )
+            assert status == 200
+            assert markdown.decode().startswith("# Parsed a.pdf")
+            _, finished = await _request(port, "GET", "/v1/tasks/a")
+            assert _json(finished)["status"] == "succeeded"
+            status, _ = await _request(port, "GET", "/v1/tasks/missing")
+            assert status == 404
+        finally:
+            await service.close()
+
+    with ParseWorkerPool(spec, WorkerPoolConfig(workers=1)) as pool:
+        asyncio.run(scenario(pool))
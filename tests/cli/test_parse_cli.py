@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+from pathlib import Path
+
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, StreamObject
+from typer.testing import CliRunner
+
+from doc_parsing import cli
+from doc_parsing.application import ParseScheduler
+from doc_parsing.cli import _batch_task_id, app
+from doc_parsing.daemon import DaemonServer
+from doc_parsing.domain import (
+    Document,
+    DocumentId,
+    DocumentSource,
+    ParseStatus,
+    ParsingRequest,
+    ParsingTask,
+    SourceType,
+)
+from doc_parsing.infrastructure import SqliteParsingTaskStore
+from doc_parsing.infrastructure.parsers.mock_adapter import adapter as mock_adapter
+from doc_parsing.infrastructure.parsers.pypdf_adapter import adapter as pypdf_adapter
+from doc_parsing.infrastructure.parsers.registry import ParserRegistry
+from doc_parsing.infrastructure.triage.registry import TriagePolicyRegistry
+from doc_parsing.infrastructure.triage.rules_policy import policy as rules_policy
+
+
+def _pdf_bytes() -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=72, height=72)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_parse_cli_reads_stdin_and_writes_stdout(tmp_path: Path, monkeypatch) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(mock_adapter)
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_entrypoints)
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("parser:\n  kind: mock\n")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["parse", "--config", str(config_path), "--input", "-"],
+        input=_pdf_bytes(),
+    )
+
+    assert result.exit_code == 0
+    assert result.stdout == (
+        "# Parsed stdin.pdf\n\nThis output was generated by the mock parser."
+    )
+
+
+def test_parse_cli_runs_pypdf_parser(tmp_path: Path, monkeypatch) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(mock_adapter)
+        self.register_adapter(pypdf_adapter)
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_entrypoints)
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=200, height=200)
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    page[NameObject("/Resources")] = DictionaryObject(
+        {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+    )
+    content = StreamObject()
+    content.set_data(
+        b"BT /F1 20 Tf 10 150 Td (Title) Tj ET "
+        b"BT /F1 10 Tf 10 130 Td (Body text.) Tj ET"
+    )
+    page[NameObject("/Contents")] = writer._add_object(content)
+    pdf_path = tmp_path / "text.pdf"
+    with pdf_path.open("wb") as handle:
+        writer.write(handle)
+    output_path = tmp_path / "text.md"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "parse",
+            "--parser",
+            "pypdf",
+            "--input",
+            str(pdf_path),
+            "--output",
+            str(output_path),
+            "--no-daemon",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert output_path.read_text() == "# Title\n\nBody text."
+
+
+def test_parse_cli_resumes_batch_run(tmp_path: Path, monkeypatch) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(mock_adapter)
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_entrypoints)
+
+    inputs = []
+    for name in ("first", "second", "third"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_bytes(_pdf_bytes())
+        inputs.append(str(path))
+    inputs_file = tmp_path / "inputs.txt"
+    inputs_file.write_text("\n".join(inputs))
+    output_dir = tmp_path / "out"
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"parser:\n  kind: mock\nbatch:\n  output_dir: {output_dir}\n"
+    )
+
+    # A previous run finished the first document and died mid-way through the
+    # second one.
+    with SqliteParsingTaskStore.open(
+        output_dir / ".doc-parse-jobs.sqlite3", run_id="nightly"
+    ) as store:
+        for location, finish in ((inputs[0], True), (inputs[1], False)):
+            source = DocumentSource(uri=location, source_type=SourceType.LOCAL_FILE)
+            task = ParsingTask(
+                request=ParsingRequest(
+                    task_id=_batch_task_id("task-1", location), source=source
+                )
+            )
+            task.start()
+            if finish:
+                task.complete(Document(document_id=DocumentId("x"), source=source))
+            store.record(task)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "parse",
+            "--config",
+            str(config_path),
+            "--inputs-file",
+            str(inputs_file),
+            "--run-id",
+            "nightly",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert sorted(path.name for path in output_dir.glob("*.md")) == [
+        "second.md",
+        "third.md",
+    ]
+    with SqliteParsingTaskStore.open(
+        output_dir / ".doc-parse-jobs.sqlite3", run_id="nightly"
+    ) as store:
+        assert set(store.statuses().values()) == {ParseStatus.SUCCEEDED}
+
+
+def test_parse_cli_batch_records_timeouts(tmp_path: Path, monkeypatch) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(mock_adapter)
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_entrypoints)
+
+    pdf_path = tmp_path / "slow.pdf"
+    pdf_path.write_bytes(_pdf_bytes())
+    inputs_file = tmp_path / "inputs.txt"
+    inputs_file.write_text(str(pdf_path))
+    output_dir = tmp_path / "out"
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"""
+parser:
+  kind: mock
+  delay_seconds: 60
+batch:
+  output_dir: {output_dir}
+  pool:
+    workers: 1
+    timeout_seconds: 1
+"""
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "parse",
+            "--config",
+            str(config_path),
+            "--inputs-file",
+            str(inputs_file),
+            "--run-id",
+            "slow-run",
+        ],
+    )
+
+    assert result.exit_code == 1
+    assert "slow.pdf: timeout after" in " ".join(result.stderr.split())
+    with SqliteParsingTaskStore.open(
+        output_dir / ".doc-parse-jobs.sqlite3", run_id="slow-run"
+    ) as store:
+        assert store.statuses() == {
+            _batch_task_id("task-1", str(pdf_path)): ParseStatus.CANCELLED
+        }
+
+
+def test_warmup_cli_loads_the_configured_parser(monkeypatch) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(mock_adapter)
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_entrypoints)
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["warmup", "--parser", "mock"])
+    invalid = runner.invoke(
+        app, ["warmup", "--parser", "mock", "--set", "parser.delay_seconds=-1"]
+    )
+
+    assert result.exit_code == 0
+    assert "Parser mock ready" in result.stdout
+    assert invalid.exit_code != 0
+
+
+def test_parse_cli_uses_a_running_daemon(tmp_path: Path, monkeypatch) -> None:
+    daemon_loaded = threading.Event()
+
+    def _load_entrypoints(self) -> None:
+        # Only the daemon's registry knows the parser, so a local run would fail.
+        if threading.current_thread() is not threading.main_thread():
+            self.register_adapter(mock_adapter)
+            daemon_loaded.set()
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_entrypoints)
+    servers: list[DaemonServer] = []
+
+    class RecordingServer(DaemonServer):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            servers.append(self)
+
+    monkeypatch.setattr(cli, "DaemonServer", RecordingServer)
+    socket_path = tmp_path / "d.sock"
+    (tmp_path / "config.yaml").write_text("parser:\n  kind: mock\n")
+    (tmp_path / "doc.pdf").write_bytes(_pdf_bytes())
+    serve = threading.Thread(
+        target=app,
+        kwargs={
+            "args": ["serve", "--socket", str(socket_path)],
+            "standalone_mode": False,
+        },
+    )
+    serve.start()
+    try:
+        while not socket_path.exists():
+            time.sleep(0.01)
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(
+            app,
+            [
+                "parse",
+                "--config",
+                "config.yaml",
+                "--input",
+                "doc.pdf",
+                "--output",
+                "doc.md",
+                "--socket",
+                str(socket_path),
+            ],
+        )
+    finally:
+        while not servers:
+            time.sleep(0.01)
+        servers[0].shutdown()
+        serve.join()
+
+    assert daemon_loaded.is_set()
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "doc.md").read_text().startswith("# Parsed doc.pdf")
+    assert not socket_path.exists()
+
+
+def test_parse_cli_selects_profile_from_triage_hint(
+    tmp_path: Path, monkeypatch
+) -> None:
+    def _load_parsers(self) -> None:
+        self.register_adapter(mock_adapter)
+
+    def _load_policies(self) -> None:
+        self.register_adapter(rules_policy)
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_parsers)
+    monkeypatch.setattr(TriagePolicyRegistry, "load_from_entrypoints", _load_policies)
+
+    pdf_path = tmp_path / "doc.pdf"
+    pdf_path.write_bytes(_pdf_bytes())
+    triage_path = tmp_path / "triage.yaml"
+    triage_path.write_text(
+        """
+triage:
+  policies:
+    - kind: rules
+      name: rules
+      rules:
+        - name: short
+          when: {max_pages: 1}
+          action: {route: parse, hint: fast-text}
+"""
+    )
+    config_path = tmp_path / "parse.yaml"
+    config_path.write_text(
+        f"""
+parser: {{kind: mock, delay_seconds: 5.0}}
+triage_config: {triage_path}
+profiles:
+  fast-text:
+    parser: {{delay_seconds: 0.0}}
+    extract_tables: false
+"""
+    )
+    log_path = tmp_path / "parse.log"
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "parse",
+            "--config",
+            str(config_path),
+            "--input",
+            str(pdf_path),
+            "--no-daemon",
+            "--log-format",
+            "json",
+            "--log-file",
+            str(log_path),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    events = [json.loads(line) for line in log_path.read_text().splitlines()]
+    (selected,) = [e for e in events if e["message"] == "parse.profile.selected"]
+    (throughput,) = [e for e in events if e["message"] == "parse.profile.throughput"]
+    assert selected["profile"] == "fast-text"
+    assert throughput["profile"] == "fast-text"
+    assert throughput["documents"] == 1
+    assert throughput["run_seconds"] < 5.0
+
+
+def test_parse_cli_resumes_a_reordered_inputs_file(tmp_path: Path, monkeypatch) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(mock_adapter)
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_entrypoints)
+
+    paths = {}
+    for name in ("first", "second", "third"):
+        paths[name] = tmp_path / f"{name}.pdf"
+        paths[name].write_bytes(_pdf_bytes())
+    inputs_file = tmp_path / "inputs.txt"
+    output_dir = tmp_path / "out"
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"parser:\n  kind: mock\nbatch:\n  output_dir: {output_dir}\n"
+    )
+    args = [
+        "parse",
+        "--config",
+        str(config_path),
+        "--inputs-file",
+        str(inputs_file),
+        "--run-id",
+        "nightly",
+    ]
+    runner = CliRunner()
+
+    inputs_file.write_text(f"{paths['first']}\n{paths['second']}\n")
+    assert runner.invoke(app, args).exit_code == 0
+    (output_dir / "first.md").unlink()
+    # A new document goes first and the rest swap places.
+    inputs_file.write_text(f"{paths['third']}\n{paths['second']}\n{paths['first']}\n")
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0
+    assert "2 succeeded earlier, 0 interrupted, 1 to run" in result.stderr
+    # Only the new document was parsed again.
+    assert sorted(path.name for path in output_dir.glob("*.md")) == [
+        "second.md",
+        "third.md",
+    ]
+
+
+def test_parse_cli_batch_orders_parses_through_the_scheduler(
+    tmp_path: Path, monkeypatch
+) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(mock_adapter)
+
+    monkeypatch.setattr(ParserRegistry, "load_from_entrypoints", _load_entrypoints)
+    page_counts: dict[str, int] = {}
+    submit = ParseScheduler.submit
+
+    def recording_submit(self, data, metadata):
+        page_counts[data.document_id.value] = metadata.page_count
+        return submit(self, data, metadata)
+
+    monkeypatch.setattr(ParseScheduler, "submit", recording_submit)
+
+    paths = []
+    for name, pages in (("short", 1), ("long", 5)):
+        writer = PdfWriter()
+        for _ in range(pages):
+            writer.add_blank_page(width=72, height=72)
+        paths.append(tmp_path / f"{name}.pdf")
+        writer.write(paths[-1])
+    inputs_file = tmp_path / "inputs.txt"
+    inputs_file.write_text("\n".join(str(path) for path in paths))
+    output_dir = tmp_path / "out"
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"""
+parser:
+  kind: mock
+batch:
+  output_dir: {output_dir}
+  scheduler:
+    workers: 1
+    fast_lane_workers: 1
+"""
+    )
+
+    result = CliRunner().invoke(
+        app,
+        ["parse", "--config", str(config_path), "--inputs-file", str(inputs_file)],
+    )
+
+    assert result.exit_code == 0, result.stderr
+    assert page_counts == {"short": 1, "long": 5}
+    assert sorted(path.name for path in output_dir.glob("*.md")) == [
+        "long.md",
+        "short.md",
+    ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import fsspec
 from pypdf import PdfWriter
 from typer.testing import CliRunner
 
@@ -68,3 +69,164 @@ triage:
     assert payload["decision"]["route"] == "parse"
     assert payload["decision"]["policy"] == "rules"
     assert payload["decision"]["hint"] == "default"
+
+
+def test_triage_cli_runs_inputs_file_as_batch(tmp_path: Path, monkeypatch) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(rules_policy)
+
+    monkeypatch.setattr(
+        TriagePolicyRegistry,
+        "load_from_entrypoints",
+        _load_entrypoints,
+    )
+
+    local_pdf = tmp_path / "local.pdf"
+    _write_pdf(local_pdf)
+    remote_pdf = tmp_path / "remote.pdf"
+    _write_pdf(remote_pdf)
+    fsspec.filesystem("memory").pipe("/cli-batch/remote.pdf", remote_pdf.read_bytes())
+
+    inputs_file = tmp_path / "inputs.txt"
+    inputs_file.write_text(
+        f"{local_pdf}\n\n# skipped\nmemory:///cli-batch/remote.pdf\n"
+    )
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"""
+batch:
+  spool_dir: {tmp_path / "spool"}
+triage:
+  policies:
+    - kind: rules
+      name: "rules"
+      rules:
+        - name: "any"
+          when:
+            min_pages: 1
+          action:
+            route: parse
+"""
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["triage", "--config", str(config_path), "--inputs-file", str(inputs_file)],
+    )
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["input"] for line in lines] == [
+        str(local_pdf),
+        "memory:///cli-batch/remote.pdf",
+    ]
+    assert [line["document_id"] for line in lines] == ["local", "remote"]
+    assert all(line["decision"]["route"] == "parse" for line in lines)
+
+
+def test_triage_cli_spools_rejections_and_replays_them(
+    tmp_path: Path, monkeypatch
+) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(rules_policy)
+
+    monkeypatch.setattr(
+        TriagePolicyRegistry,
+        "load_from_entrypoints",
+        _load_entrypoints,
+    )
+
+    pdf_path = tmp_path / "sample.pdf"
+    _write_pdf(pdf_path)
+    dlq_dir = tmp_path / "dlq"
+
+    def _config(min_pages: int) -> Path:
+        path = tmp_path / f"config-{min_pages}.yaml"
+        path.write_text(
+            f"""
+dlq:
+  directory: {dlq_dir}
+triage:
+  policies:
+    - kind: rules
+      name: "rules"
+      rules:
+        - name: "long"
+          when:
+            min_pages: {min_pages}
+          action:
+            route: parse
+"""
+        )
+        return path
+
+    runner = CliRunner()
+    rejected = runner.invoke(
+        app, ["triage", "--config", str(_config(2)), "--input", str(pdf_path)]
+    )
+    assert rejected.exit_code == 0
+    assert len(list(dlq_dir.glob("*.jsonl"))) == 1
+
+    replayed = runner.invoke(app, ["replay-dlq", "--config", str(_config(1))])
+
+    assert replayed.exit_code == 0
+    (line,) = replayed.stdout.splitlines()
+    payload = json.loads(line)
+    assert payload["source_uri"] == str(pdf_path)
+    assert payload["decision"]["route"] == "parse"
+    assert list(dlq_dir.glob("*.jsonl")) == []
+    assert len(list(dlq_dir.glob("*.jsonl.replayed"))) == 1
+
+
+def test_replay_dlq_keeps_segments_with_failed_lines(
+    tmp_path: Path, monkeypatch
+) -> None:
+    def _load_entrypoints(self) -> None:
+        self.register_adapter(rules_policy)
+
+    monkeypatch.setattr(
+        TriagePolicyRegistry,
+        "load_from_entrypoints",
+        _load_entrypoints,
+    )
+
+    pdf_path = tmp_path / "sample.pdf"
+    _write_pdf(pdf_path)
+    dlq_dir = tmp_path / "dlq"
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        f"""
+dlq:
+  directory: {dlq_dir}
+triage:
+  policies:
+    - kind: rules
+      name: "rules"
+      rules:
+        - name: "long"
+          when:
+            min_pages: 2
+          action:
+            route: parse
+"""
+    )
+    runner = CliRunner()
+    runner.invoke(
+        app, ["triage", "--config", str(config_path), "--input", str(pdf_path)]
+    )
+    (segment,) = dlq_dir.glob("*.jsonl")
+    with segment.open("ab") as handle:
+        handle.write(b"{not json\n")
+
+    replayed = runner.invoke(app, ["replay-dlq", "--config", str(config_path)])
+
+    assert replayed.exit_code == 1
+    malformed, record = (json.loads(line) for line in replayed.stdout.splitlines())
+    assert record["source_uri"] == str(pdf_path)
+    assert "error" not in record
+    assert malformed["segment"] == str(segment)
+    assert malformed["line"] == 2
+    assert malformed["error"]
+    # Left sealed so the next replay retries it.
+    assert segment.exists()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 import pytest
 
 from doc_parsing.domain import (
@@ -10,12 +12,15 @@ from doc_parsing.domain import (
     DocumentId,
     DocumentSource,
     Page,
+    PageRanges,
     ParsingRequest,
     ParsingTask,
     SourceType,
     TableBlock,
     TaskId,
     TextBlock,
+    TriageMetadata,
+    set_trusted_validation,
 )
 
 
@@ -27,6 +32,40 @@ def test_bounding_box_rejects_invalid_ranges() -> None:
         BoundingBox(x0=-0.1, y0=0.0, x1=0.5, y1=0.5)
 
 
+def test_page_ranges_merge_and_round_trip() -> None:
+    ranges = PageRanges.from_pages([7, 1, 3, 2, 9, 8])
+
+    assert ranges.ranges == ((1, 3), (7, 9))
+    assert str(ranges) == "1-3,7-9"
+    assert PageRanges.parse(str(ranges)) == ranges
+    assert PageRanges.parse("") == PageRanges()
+    assert (len(ranges), ranges.last, 8 in ranges, 5 in ranges) == (6, 9, True, False)
+
+    with pytest.raises(ValueError):
+        PageRanges(((1, 2), (3, 4)))
+
+
+def test_triage_metadata_checks_image_only_page_ranges() -> None:
+    with pytest.raises(ValueError):
+        TriageMetadata(
+            page_count=3,
+            language=None,
+            scanned=False,
+            image_only_pages=1,
+            image_only_page_ratio=1 / 3,
+            image_only_page_ranges=PageRanges.from_pages([4]),
+        )
+    with pytest.raises(ValueError, match="limited_page_ranges"):
+        TriageMetadata(
+            page_count=3,
+            language=None,
+            scanned=False,
+            image_only_pages=0,
+            image_only_page_ratio=0.0,
+            limited_page_ranges=PageRanges.from_pages([4]),
+        )
+
+
 def test_document_rejects_duplicate_page_numbers() -> None:
     source = DocumentSource(uri="/tmp/sample.pdf", source_type=SourceType.LOCAL_FILE)
     document = Document(document_id=DocumentId("doc-1"), source=source)
@@ -111,6 +150,23 @@ def test_valid_task_lifecycle() -> None:
     assert task.completed_at is not None
 
 
+def test_task_splits_queue_wait_from_run_time() -> None:
+    source = DocumentSource(uri="/tmp/sample.pdf", source_type=SourceType.LOCAL_FILE)
+    request = ParsingRequest(task_id=TaskId("task-1"), source=source)
+    task = ParsingTask(
+        request=request, queued_at=request.requested_at - timedelta(seconds=5)
+    )
+
+    assert task.queue_wait_seconds is None
+    task.start()
+    task.complete(Document(document_id=DocumentId("doc-1"), source=source))
+
+    assert task.queue_wait_seconds is not None
+    assert task.queue_wait_seconds >= 5.0
+    assert task.run_seconds is not None
+    assert task.run_seconds >= 0.0
+
+
 def test_invalid_task_transition_raises() -> None:
     source = DocumentSource(uri="/tmp/sample.pdf", source_type=SourceType.LOCAL_FILE)
     request = ParsingRequest(task_id=TaskId("task-2"), source=source)
@@ -118,3 +174,78 @@ def test_invalid_task_transition_raises() -> None:
 
     with pytest.raises(ValueError):
         task.complete(Document(document_id=DocumentId("doc-1"), source=source))
+
+
+def test_document_content_from_trusted_columns_groups_pages() -> None:
+    content = DocumentContent.from_trusted_columns(
+        page_numbers=[2, 1, 2],
+        block_ids=["b-1", "b-1", "b-2"],
+        bboxes=[(0.0, 0.0, 0.5, 0.5), (0.1, 0.1, 0.2, 0.2), (0.5, 0.5, 1.0, 1.0)],
+        texts=["second", "first", "third"],
+        confidences=[0.9, None, 1.0],
+    )
+
+    assert content.kind == DocumentContentKind.BLOCKS
+    assert [page.number for page in content.pages] == [1, 2]
+    assert [block.block_id for block in content.pages[1].blocks] == ["b-1", "b-2"]
+    block = content.pages[1].blocks[0]
+    assert isinstance(block, TextBlock)
+    assert block.text == "second"
+    assert block.confidence == 0.9
+    assert block.bbox == BoundingBox(0.0, 0.0, 0.5, 0.5)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"page_numbers": [0]},
+        {"block_ids": [" "]},
+        {"texts": [""]},
+        {"bboxes": [(0.5, 0.0, 0.4, 1.0)]},
+        {"bboxes": [(0.0, 0.0, 1.5, 1.0)]},
+        {"confidences": [1.5]},
+        {"texts": ["a", "b"]},
+    ],
+)
+def test_document_content_from_trusted_columns_rejects_invalid_rows(
+    overrides: dict[str, list[object]],
+) -> None:
+    columns: dict[str, list[object]] = {
+        "page_numbers": [1],
+        "block_ids": ["b-1"],
+        "bboxes": [(0.0, 0.0, 1.0, 1.0)],
+        "texts": ["hello"],
+        "confidences": [None],
+    }
+    columns.update(overrides)
+
+    with pytest.raises(ValueError):
+        DocumentContent.from_trusted_columns(**columns)  # type: ignore[arg-type]
+
+
+def test_document_content_from_trusted_columns_rejects_duplicate_block_ids() -> None:
+    with pytest.raises(ValueError):
+        DocumentContent.from_trusted_columns(
+            page_numbers=[1, 1],
+            block_ids=["b-1", "b-1"],
+            bboxes=[(0.0, 0.0, 1.0, 1.0), (0.0, 0.0, 1.0, 1.0)],
+            texts=["hello", "duplicate"],
+        )
+
+
+def test_trusted_constructors_skip_validation_unless_enabled() -> None:
+    previous = set_trusted_validation(False)
+    try:
+        bbox = BoundingBox.trusted(0.5, 0.0, 0.4, 1.0)
+        block = TextBlock.trusted("b-1", bbox, "")
+        assert block.text == ""
+
+        set_trusted_validation(True)
+        with pytest.raises(ValueError):
+            BoundingBox.trusted(0.5, 0.0, 0.4, 1.0)
+        with pytest.raises(ValueError):
+            TextBlock.trusted("b-1", BoundingBox(0.0, 0.0, 1.0, 1.0), "")
+        with pytest.raises(ValueError):
+            DocumentContent.from_trusted_pages([Page(number=1), Page(number=1)])
+    finally:
+        set_trusted_validation(previous)
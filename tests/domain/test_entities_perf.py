@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from doc_parsing.domain import (
+    BoundingBox,
+    DocumentContent,
+    Page,
+    TextBlock,
+    set_trusted_validation,
+)
+
+BLOCKS_PER_PAGE = 500
+PAGES = 400
+
+
+@pytest.mark.skipif(
+    os.getenv("PERF") != "1",
+    reason="Set PERF=1 to run domain construction benchmarks",
+)
+def test_trusted_columns_faster_than_per_object_construction() -> None:
+    previous = set_trusted_validation(False)
+    try:
+        page_numbers = [
+            number for number in range(1, PAGES + 1) for _ in range(BLOCKS_PER_PAGE)
+        ]
+        block_ids = [f"b-{index}" for index in range(len(page_numbers))]
+        bboxes = [(0.1, 0.1, 0.9, 0.2)] * len(page_numbers)
+        texts = ["lorem ipsum"] * len(page_numbers)
+
+        start = time.perf_counter()
+        pages: dict[int, Page] = {}
+        for number, block_id, box, text in zip(
+            page_numbers, block_ids, bboxes, texts, strict=True
+        ):
+            page = pages.setdefault(number, Page(number=number))
+            page.blocks.append(
+                TextBlock(block_id=block_id, bbox=BoundingBox(*box), text=text)
+            )
+        DocumentContent.from_pages(list(pages.values()))
+        per_object = time.perf_counter() - start
+
+        start = time.perf_counter()
+        DocumentContent.from_trusted_columns(
+            page_numbers=page_numbers,
+            block_ids=block_ids,
+            bboxes=bboxes,
+            texts=texts,
+        )
+        columns = time.perf_counter() - start
+    finally:
+        set_trusted_validation(previous)
+
+    print(
+        f"{len(page_numbers)} blocks: per-object {per_object:.3f}s, "
+        f"trusted columns {columns:.3f}s ({per_object / columns:.1f}x)"
+    )
+    assert columns < per_object
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from doc_parsing.domain import (
+    BoundingBox,
+    Document,
+    DocumentContent,
+    DocumentContentKind,
+    DocumentId,
+    DocumentSource,
+    ImageBlock,
+    Page,
+    SourceType,
+    TableBlock,
+    TextBlock,
+)
+from doc_parsing.infrastructure.serialization import (
+    BinaryDocumentReader,
+    DocumentFormatError,
+    binary,
+    encode_document,
+    write_document,
+)
+
+
+def _source() -> DocumentSource:
+    return DocumentSource(
+        uri="s3://bucket/sample.pdf",
+        source_type=SourceType.OBJECT_STORAGE,
+        mime_type="application/pdf",
+    )
+
+
+def _block_document() -> Document:
+    pages = [
+        Page(
+            number=1,
+            blocks=[
+                TextBlock(
+                    block_id="t-1",
+                    bbox=BoundingBox(0.1, 0.1, 0.9, 0.2),
+                    text="Grüße aus Köln",
+                    confidence=0.75,
+                ),
+                TableBlock(
+                    block_id="tab-1",
+                    bbox=BoundingBox(0.1, 0.3, 0.9, 0.6),
+                    cells=(("a", "b"), ("c", "d")),
+                ),
+            ],
+        ),
+        Page(
+            number=3,
+            blocks=[
+                ImageBlock(
+                    block_id="img-1",
+                    bbox=BoundingBox(10.0, 20.0, 110.0, 220.0, normalized=False),
+                ),
+            ],
+        ),
+    ]
+    return Document(
+        document_id=DocumentId("doc-1"),
+        source=_source(),
+        content=DocumentContent.from_pages(pages),
+        metadata={"parser": "docling"},
+        created_at=datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+    )
+
+
+def test_block_document_round_trip(tmp_path: Path) -> None:
+    document = _block_document()
+    path = tmp_path / "doc.bin"
+    write_document(document, path)
+
+    with BinaryDocumentReader.open(path) as reader:
+        assert reader.kind == DocumentContentKind.BLOCKS
+        assert reader.page_count == 2
+        assert reader.block_count == 3
+        assert reader.page_numbers() == [1, 3]
+        restored = reader.to_document()
+
+    assert restored == document
+
+
+def test_block_text_is_memoryview_slice(tmp_path: Path) -> None:
+    path = tmp_path / "doc.bin"
+    write_document(_block_document(), path)
+
+    with BinaryDocumentReader.open(path) as reader:
+        with reader.text_bytes(0) as text:
+            assert isinstance(text, memoryview)
+            assert bytes(text).decode("utf-8") == "Grüße aus Köln"
+        assert reader.text_bytes(2) is None
+        with reader.bbox_array() as boxes:
+            assert boxes.tolist()[8:] == [10.0, 20.0, 110.0, 220.0]
+        page = reader.page(3)
+
+    assert page is not None
+    assert isinstance(page.blocks[0], ImageBlock)
+    assert page.blocks[0].bbox.normalized is False
+
+
+def test_markdown_document_round_trip() -> None:
+    document = Document(
+        document_id=DocumentId("doc-md"),
+        source=_source(),
+        content=DocumentContent.from_markdown("# Title\n\nBody ✓"),
+    )
+
+    reader = BinaryDocumentReader(encode_document(document))
+    try:
+        with reader.markdown_bytes() as markdown:
+            assert bytes(markdown) == "# Title\n\nBody ✓".encode()
+        assert reader.page_count == 0
+        assert reader.to_document() == document
+    finally:
+        reader.close()
+
+
+def test_reader_rejects_foreign_bytes() -> None:
+    with pytest.raises(DocumentFormatError):
+        BinaryDocumentReader(b"%PDF-1.4" + b"\x00" * 256)
+
+
+def _with_header(data: bytes, **changes: int) -> bytes:
+    fields = list(binary._HEADER.unpack_from(data, 0))
+    names = ("page_count", "block_count", "pages_offset", "blocks_offset")
+    for name, value in changes.items():
+        fields[3 + names.index(name)] = value
+    return binary._HEADER.pack(*fields) + data[binary._HEADER.size :]
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"page_count": 1_000_000},
+        {"block_count": 1_000_000},
+        {"pages_offset": 0},
+        {"blocks_offset": 2**40},
+    ],
+)
+def test_reader_rejects_tables_outside_the_buffer(changes: dict[str, int]) -> None:
+    data = _with_header(encode_document(_block_document()), **changes)
+
+    with pytest.raises(DocumentFormatError):
+        BinaryDocumentReader(data)
+
+
+def test_reader_rejects_pages_pointing_past_the_block_table() -> None:
+    data = bytearray(encode_document(_block_document()))
+    number, first, count = binary._PAGE.unpack_from(data, binary._HEADER.size)
+    binary._PAGE.pack_into(data, binary._HEADER.size, number, first, count + 100)
+
+    with BinaryDocumentReader(bytes(data)) as reader:
+        with pytest.raises(DocumentFormatError, match="past end of block table"):
+            list(reader.iter_pages())
+        with pytest.raises(DocumentFormatError):
+            reader.page(number)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from doc_parsing.domain import (
+    DlqRecord,
+    DocumentId,
+    DocumentSource,
+    PageRanges,
+    SourceType,
+    TaskId,
+    TriageDecision,
+    TriageMetadata,
+    TriageRoute,
+)
+from doc_parsing.infrastructure import (
+    DlqSpoolConfig,
+    DlqSpoolReader,
+    DlqSpoolSink,
+    decode_triage_metadata,
+    encode_triage_metadata,
+)
+
+
+def _record(index: int) -> DlqRecord:
+    return DlqRecord(
+        task_id=TaskId(f"task-{index}"),
+        document_id=DocumentId(f"doc-{index}"),
+        source=DocumentSource(
+            uri=f"s3://bucket/{index}.pdf", source_type=SourceType.OBJECT_STORAGE
+        ),
+        decision=TriageDecision(
+            route=TriageRoute.DLQ,
+            reason="scanned",
+            policy="rules",
+            rule="no-ocr",
+            hint=None,
+        ),
+        metadata=TriageMetadata(
+            page_count=3,
+            language=None,
+            scanned=True,
+            image_only_pages=3,
+            image_only_page_ratio=1.0,
+            image_only_page_ranges=PageRanges.from_pages([1, 2, 3]),
+            limited_page_ranges=PageRanges.from_pages([2]),
+        ),
+    )
+
+
+def test_sink_seals_segments_and_reader_round_trips(tmp_path: Path) -> None:
+    reader = DlqSpoolReader(tmp_path)
+    sink = DlqSpoolSink(DlqSpoolConfig(directory=tmp_path, fsync_every=2))
+    records = [_record(index) for index in range(3)]
+    for record in records:
+        sink.write(record)
+    sink.flush()
+
+    assert reader.segments() == []
+    assert list(reader.iter_records(reader.segments(include_open=True)[0])) == records
+
+    sink.close()
+
+    (segment,) = reader.segments()
+    assert list(reader.iter_records()) == records
+    replayed = reader.mark_replayed(segment)
+    assert replayed.exists()
+    assert reader.segments() == []
+
+
+def test_reader_reports_and_skips_malformed_lines(tmp_path: Path) -> None:
+    with DlqSpoolSink(DlqSpoolConfig(directory=tmp_path)) as sink:
+        sink.write(_record(0))
+    reader = DlqSpoolReader(tmp_path)
+    (segment,) = reader.segments()
+    valid = segment.read_bytes()
+    segment.write_bytes(valid + b"not json\n" + b'{"version": 99}\n' + valid)
+    skipped: list[tuple[Path, int]] = []
+
+    records = list(
+        reader.iter_records(
+            segment, on_malformed=lambda path, line, _: skipped.append((path, line))
+        )
+    )
+
+    assert [record.task_id for record in records] == [TaskId("task-0")] * 2
+    assert skipped == [(segment, 2), (segment, 3)]
+    with pytest.raises(ValueError):
+        list(reader.iter_records(segment))
+
+
+def test_sink_rotates_segments_by_size(tmp_path: Path) -> None:
+    config = DlqSpoolConfig(directory=tmp_path, max_segment_mb=600 / (1024 * 1024))
+    with DlqSpoolSink(config) as sink:
+        for index in range(4):
+            sink.write(_record(index))
+
+    segments = DlqSpoolReader(tmp_path).segments()
+    assert len(segments) > 1
+    assert [
+        record.task_id.value for record in DlqSpoolReader(tmp_path).iter_records()
+    ] == [f"task-{index}" for index in range(4)]
+
+
+def test_sink_rotates_segments_by_age(tmp_path: Path) -> None:
+    config = DlqSpoolConfig(directory=tmp_path, max_segment_seconds=1e-9)
+    with DlqSpoolSink(config) as sink:
+        sink.write(_record(0))
+        sink.write(_record(1))
+
+    assert len(DlqSpoolReader(tmp_path).segments()) == 2
+
+
+def test_reader_skips_partial_trailing_line(tmp_path: Path) -> None:
+    with DlqSpoolSink(DlqSpoolConfig(directory=tmp_path)) as sink:
+        sink.write(_record(0))
+    (segment,) = DlqSpoolReader(tmp_path).segments()
+    with segment.open("ab") as handle:
+        handle.write(b'{"version": 1, "task_id"')
+
+    assert len(list(DlqSpoolReader(tmp_path).iter_records())) == 1
+
+
+def test_dlq_record_requires_dlq_route() -> None:
+    record = _record(0)
+    with pytest.raises(ValueError):
+        DlqRecord(
+            task_id=record.task_id,
+            document_id=record.document_id,
+            source=record.source,
+            decision=TriageDecision(
+                route=TriageRoute.PARSE, reason=None, policy="rules", rule=None
+            ),
+            metadata=record.metadata,
+        )
+
+
+def test_reader_decodes_records_without_page_ranges(tmp_path: Path) -> None:
+    sink = DlqSpoolSink(DlqSpoolConfig(directory=tmp_path))
+    sink.write(_record(0))
+    sink.close()
+    reader = DlqSpoolReader(tmp_path)
+    (segment,) = reader.segments()
+    segment.write_text(
+        segment.read_text()
+        .replace(', "image_only_page_ranges": "1-3"', "")
+        .replace(', "limited_page_ranges": "2"', "")
+    )
+
+    (record,) = reader.iter_records()
+
+    assert record.metadata.image_only_page_ranges == PageRanges()
+    assert record.metadata.limited_page_ranges == PageRanges()
+
+
+def test_triage_metadata_serializer_round_trips() -> None:
+    metadata = _record(0).metadata
+
+    payload = encode_triage_metadata(metadata)
+
+    assert payload["image_only_page_ranges"] == "1-3"
+    assert decode_triage_metadata(json.loads(json.dumps(payload))) == metadata
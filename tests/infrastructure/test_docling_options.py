@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from doc_parsing.application.inputs import MappedPdfInput
+from doc_parsing.domain import PageRanges, ParseOptions, PdfParserConfig
+from doc_parsing.infrastructure.parsers import docling
+from doc_parsing.infrastructure.parsers.docling import (
+    DoclingPdfParser,
+    DoclingPdfParserFactory,
+    _converter,
+    _ocr_segments,
+    _pipeline_options,
+)
+from doc_parsing.infrastructure.parsers.docling_config import DoclingConfig
+from doc_parsing.infrastructure.parsers.ocr_languages import ocr_languages
+
+
+def test_parse_options_switch_off_pipeline_stages() -> None:
+    config = DoclingConfig(picture_description=True, generate_picture_images=True)
+
+    full = _pipeline_options(config, ParseOptions())
+    text_only = _pipeline_options(
+        config,
+        ParseOptions(extract_tables=False, extract_images=False),
+    )
+    layout_only = _pipeline_options(config, ParseOptions(extract_text=False))
+
+    assert full.do_table_structure and full.do_ocr
+    assert full.do_picture_description and full.generate_picture_images
+    assert not text_only.do_table_structure
+    assert not text_only.do_picture_description
+    assert not text_only.generate_picture_images
+    assert text_only.do_ocr
+    assert not layout_only.do_ocr
+
+
+def test_ocr_pages_split_document_into_ordered_segments() -> None:
+    config = DoclingConfig()
+
+    segments = _ocr_segments(PageRanges.parse("2-3,6,12"), 1, 8)
+
+    assert segments == [
+        (1, 1, False),
+        (2, 3, True),
+        (4, 5, False),
+        (6, 6, True),
+        (7, 8, False),
+    ]
+    assert _ocr_segments(PageRanges.parse("1-4"), 1, 4) == [(1, 4, True)]
+    assert _ocr_segments(PageRanges.parse("1-3,6"), 3, 5) == [
+        (3, 3, True),
+        (4, 5, False),
+    ]
+    assert not _pipeline_options(config, ParseOptions(), ocr=False).do_ocr
+
+
+class FakeConverter:
+    def __init__(self, calls: list[tuple[int, int, bool]], ocr: bool) -> None:
+        self._calls = calls
+        self._ocr = ocr
+
+    def convert(self, source: Any, page_range: tuple[int, int]) -> Any:
+        self._calls.append((*page_range, self._ocr))
+        markdown = f"pages {page_range[0]}-{page_range[1]}"
+        return SimpleNamespace(
+            document=SimpleNamespace(export_to_markdown=lambda: markdown)
+        )
+
+
+@pytest.mark.parametrize(
+    ("ocr_pages", "expected"),
+    [
+        # The one-page text gap is OCR'd with its neighbours.
+        ("2-3,5-6", [(1, 1, False), (2, 6, True), (7, 12, False)]),
+        # Too many segments even after merging: one OCR pass for everything.
+        ("1,4,7,10", [(1, 12, True)]),
+    ],
+)
+def test_ocr_segments_are_merged_and_capped(
+    monkeypatch: pytest.MonkeyPatch,
+    ocr_pages: str,
+    expected: list[tuple[int, int, bool]],
+) -> None:
+    calls: list[tuple[int, int, bool]] = []
+    monkeypatch.setattr(
+        docling,
+        "_converter",
+        lambda config, options, *, ocr=True: FakeConverter(calls, ocr),
+    )
+    monkeypatch.setattr(docling, "_page_count", lambda source: 12)
+    parser = DoclingPdfParser(
+        config=DoclingConfig(ocr_merge_gap_pages=1, max_ocr_segments=4)
+    )
+
+    parser.parse(
+        MappedPdfInput.from_bytes(b"%PDF-1.4", name="scan.pdf"),
+        ParseOptions(ocr_pages=PageRanges.parse(ocr_pages)),
+    )
+
+    assert calls == expected
+
+
+def test_language_hint_narrows_ocr_languages() -> None:
+    config = DoclingConfig(
+        ocr_engine="tesseract", ocr_languages=["eng", "deu", "fra", "spa"]
+    )
+
+    broad = _pipeline_options(config, ParseOptions())
+    german = _pipeline_options(config, ParseOptions(language_hint="de"))
+    italian = _pipeline_options(config, ParseOptions(language_hint="it"))
+    pinned = _pipeline_options(
+        config.model_copy(update={"narrow_ocr_languages": False}),
+        ParseOptions(language_hint="de"),
+    )
+
+    assert broad.ocr_options.lang == ["eng", "deu", "fra", "spa"]
+    assert german.ocr_options.lang == ["deu"]
+    assert italian.ocr_options.lang == ["eng", "deu", "fra", "spa"]
+    assert pinned.ocr_options.lang == ["eng", "deu", "fra", "spa"]
+    assert ocr_languages("easyocr", None, "zh-CN") == ["ch_sim"]
+    assert ocr_languages("ocrmac", None, "fr") == ["fr-FR"]
+    assert ocr_languages("rapidocr", None, "fr") is None
+    assert ocr_languages("auto", None, "fr") is None
+
+
+def test_ocr_languages_require_explicit_engine() -> None:
+    with pytest.raises(ValueError, match="ocr_engine"):
+        DoclingConfig(ocr_languages=["eng"])
+
+
+def test_converters_are_not_shared_between_threads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(docling, "DocumentConverter", lambda **_: object())
+    monkeypatch.setattr(docling, "_local", threading.local())
+    config = DoclingConfig(do_table_structure=False)
+    own = _converter(config, ParseOptions())
+    other: list[object] = []
+    thread = threading.Thread(
+        target=lambda: other.append(_converter(config, ParseOptions()))
+    )
+    thread.start()
+    thread.join()
+
+    assert _converter(config, ParseOptions()) is own
+    assert other[0] is not own
+
+
+class FakeDocumentConverter:
+    def __init__(self, **_: Any) -> None:
+        self.initialized = False
+
+    def initialize_pipeline(self, _: Any) -> None:
+        self.initialized = True
+
+
+def test_converter_cache_keeps_the_most_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(docling, "DocumentConverter", FakeDocumentConverter)
+    monkeypatch.setattr(docling, "_local", threading.local())
+    monkeypatch.setattr(docling, "_MAX_CONVERTERS", 2)
+    config = DoclingConfig(ocr_engine="tesseract", ocr_languages=["eng", "deu"])
+    english, german = ParseOptions(language_hint="en"), ParseOptions(language_hint="de")
+
+    first = _converter(config, english)
+    _converter(config, german)
+    assert _converter(config, english) is first
+    _converter(config, ParseOptions())
+
+    assert _converter(config, english) is first
+    assert len(docling._thread_converters()) == 2
+
+
+def test_warm_loads_the_converters_page_selective_ocr_uses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(docling, "DocumentConverter", FakeDocumentConverter)
+    monkeypatch.setattr(docling, "_local", threading.local())
+
+    DoclingPdfParserFactory().warm(PdfParserConfig(name="docling"))
+
+    converters = docling._thread_converters()
+    assert {key[2] for key in converters} == {True, False}
+    assert all(converter.initialized for converter in converters.values())
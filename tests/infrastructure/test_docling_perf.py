@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from doc_parsing.application import MappedPdfInput
+from doc_parsing.domain import ParseOptions, PdfParserConfig
+
+BENCH_PDF = os.getenv("DOCLING_BENCH_PDF")
+BENCH_OCR_ENGINE = os.getenv("DOCLING_BENCH_OCR_ENGINE", "tesseract")
+BENCH_LANGUAGE = os.getenv("DOCLING_BENCH_LANGUAGE", "en")
+
+
+def _stage_seconds(
+    options: ParseOptions,
+    caplog: pytest.LogCaptureFixture,
+    parser_options: dict[str, object] | None = None,
+) -> dict[str, float]:
+    from docling.datamodel.settings import settings
+
+    from doc_parsing.infrastructure.parsers.docling import DoclingPdfParserFactory
+
+    settings.debug.profile_pipeline_timings = True
+    factory = DoclingPdfParserFactory()
+    config = PdfParserConfig(name="docling", options=parser_options)
+    parser = factory.create(config)
+    with MappedPdfInput.open(Path(BENCH_PDF or "")) as source:
+        # First conversion loads the models; time the second.
+        parser.parse(source, options)
+        caplog.clear()
+        parser.parse(source, options)
+    (record,) = [
+        r for r in caplog.records if r.getMessage() == "docling.parse.complete"
+    ]
+    return record.stage_seconds
+
+
+requires_bench_pdf = pytest.mark.skipif(
+    os.getenv("PERF") != "1" or not BENCH_PDF,
+    reason="Set PERF=1 and DOCLING_BENCH_PDF=<pdf> to run docling stage timings",
+)
+
+
+@pytest.fixture
+def docling_logs(
+    caplog: pytest.LogCaptureFixture,
+) -> Iterator[pytest.LogCaptureFixture]:
+    doc_logger = logging.getLogger("doc_parsing")
+    doc_logger.addHandler(caplog.handler)
+    caplog.set_level(logging.INFO, logger="doc_parsing")
+    yield caplog
+    doc_logger.removeHandler(caplog.handler)
+
+
+@requires_bench_pdf
+def test_text_only_options_skip_table_structure(
+    docling_logs: pytest.LogCaptureFixture,
+) -> None:
+    full = _stage_seconds(ParseOptions(), docling_logs)
+    text_only = _stage_seconds(
+        ParseOptions(extract_tables=False, extract_images=False), docling_logs
+    )
+
+    for stage in sorted(full.keys() | text_only.keys()):
+        print(
+            f"{stage:<24} full {full.get(stage, 0.0):8.3f}s"
+            f"  text-only {text_only.get(stage, 0.0):8.3f}s"
+        )
+    assert text_only.get("table_structure", 0.0) < full.get("table_structure", 0.0)
+    assert text_only["pipeline_total"] < full["pipeline_total"]
+
+
+@requires_bench_pdf
+def test_language_hint_narrows_ocr_work(
+    docling_logs: pytest.LogCaptureFixture,
+) -> None:
+    # Compares the engine's default language set with the one the hint picks.
+    parser_options = {"ocr_engine": BENCH_OCR_ENGINE}
+    broad = _stage_seconds(ParseOptions(), docling_logs, parser_options)
+    narrowed = _stage_seconds(
+        ParseOptions(language_hint=BENCH_LANGUAGE), docling_logs, parser_options
+    )
+
+    print(
+        f"{BENCH_OCR_ENGINE} ocr  broad {broad.get('ocr', 0.0):8.3f}s"
+        f"  narrowed ({BENCH_LANGUAGE}) {narrowed.get('ocr', 0.0):8.3f}s"
+    )
+    print(
+        f"pipeline_total  broad {broad['pipeline_total']:8.3f}s"
+        f"  narrowed {narrowed['pipeline_total']:8.3f}s"
+    )
+    assert narrowed.get("ocr", 0.0) < broad.get("ocr", 0.0)
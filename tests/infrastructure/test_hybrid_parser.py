@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+from io import BytesIO
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, StreamObject
+
+from doc_parsing.application.inputs import MappedPdfInput
+from doc_parsing.domain import ParseOptions, PdfInput, PdfParserConfig
+from doc_parsing.infrastructure.parsers.hybrid import (
+    HybridPdfParser,
+    HybridPdfParserFactory,
+)
+
+TABLE = (
+    "\n".join(f"72 {y} m 300 {y} l S" for y in range(400, 520, 20))
+    + "\nBT /F1 11 Tf 80 500 Td (Quarter Revenue Costs Margin) Tj ET"
+)
+
+
+class FakeDocling:
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int | None]] = []
+
+    def parse_pages(
+        self, source: PdfInput, options: ParseOptions, first: int, last: int | None
+    ) -> str:
+        self.calls.append((first, last))
+        return f"| table pages {first}-{last} |"
+
+
+def _pdf(*contents: str) -> bytes:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for operations in contents:
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = StreamObject()
+        content.set_data(operations.encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _text(text: str, size: int = 11, y: int = 700) -> str:
+    return f"BT /F1 {size} Tf 72 {y} Td ({text}) Tj ET"
+
+
+def test_hybrid_routes_complex_pages_to_docling_in_order(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = _pdf(
+        _text("Introduction to the report", 20)
+        + "\n"
+        + _text("Plain prose page.", y=660),
+        _text("Another page of prose."),
+        TABLE,
+        TABLE,
+        _text("Closing remarks in prose."),
+    )
+    parser = HybridPdfParserFactory().create(PdfParserConfig(name="hybrid"))
+    docling = FakeDocling()
+    monkeypatch.setattr(HybridPdfParser, "_full_parser", lambda self: docling)
+    caplog.set_level(logging.INFO, logger="doc_parsing")
+
+    markdown = parser.parse(
+        MappedPdfInput.from_bytes(data, name="report.pdf"), ParseOptions()
+    )
+
+    assert docling.calls == [(3, 4)]
+    assert markdown.split("\n\n") == [
+        "# Introduction to the report",
+        "Plain prose page.",
+        "Another page of prose.",
+        "| table pages 3-4 |",
+        "Closing remarks in prose.",
+    ]
+    (record,) = [r for r in caplog.records if r.getMessage() == "hybrid.parse.complete"]
+    assert (record.fast_pages, record.full_pages, record.full_share) == (3, 2, 0.4)
+
+
+def test_hybrid_sends_pages_without_text_to_docling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    parser = HybridPdfParserFactory().create(
+        PdfParserConfig(name="hybrid", options={"max_ruling_lines": 10})
+    )
+    docling = FakeDocling()
+    monkeypatch.setattr(HybridPdfParser, "_full_parser", lambda self: docling)
+
+    markdown = parser.parse(
+        MappedPdfInput.from_bytes(_pdf(TABLE, ""), name="scan.pdf"), ParseOptions()
+    )
+
+    assert docling.calls == [(2, 2)]
+    assert markdown.startswith("Quarter Revenue Costs Margin")
+
+
+def _form_pdf(page_operations: str, form_operations: str) -> bytes:
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=612, height=792)
+    form = StreamObject()
+    form.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Form"),
+        }
+    )
+    form.set_data(form_operations.encode())
+    form_ref = writer._add_object(form)
+    # The form draws itself too, which the scan must not follow forever.
+    form[NameObject("/Resources")] = DictionaryObject(
+        {NameObject("/XObject"): DictionaryObject({NameObject("/Fm0"): form_ref})}
+    )
+    page[NameObject("/Resources")] = DictionaryObject(
+        {NameObject("/XObject"): DictionaryObject({NameObject("/Fm0"): form_ref})}
+    )
+    content = StreamObject()
+    content.set_data(page_operations.encode())
+    page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_hybrid_counts_what_forms_draw(monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = HybridPdfParserFactory().create(PdfParserConfig(name="hybrid"))
+    docling = FakeDocling()
+    monkeypatch.setattr(HybridPdfParser, "_full_parser", lambda self: docling)
+    data = _form_pdf(
+        _text("A table follows in a form.") + "\n/Fm0 Do", TABLE + "\n/Fm0 Do"
+    )
+
+    parser.parse(MappedPdfInput.from_bytes(data, name="form.pdf"), ParseOptions())
+
+    assert docling.calls == [(1, 1)]
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        # The prose page between two tables goes to Docling with them.
+        ({}, [(2, 4)]),
+        # More Docling runs than allowed: Docling parses the whole document.
+        ({"merge_gap_pages": 0, "max_full_runs": 1}, [(1, 5)]),
+    ],
+)
+def test_hybrid_merges_short_fast_runs_and_caps_docling_calls(
+    monkeypatch: pytest.MonkeyPatch,
+    options: dict[str, int],
+    expected: list[tuple[int, int]],
+) -> None:
+    parser = HybridPdfParserFactory().create(
+        PdfParserConfig(name="hybrid", options=options)
+    )
+    docling = FakeDocling()
+    monkeypatch.setattr(HybridPdfParser, "_full_parser", lambda self: docling)
+    data = _pdf(
+        _text("Opening page of prose."),
+        TABLE,
+        _text("A short note between tables."),
+        TABLE,
+        _text("Closing remarks in prose."),
+    )
+
+    parser.parse(MappedPdfInput.from_bytes(data, name="report.pdf"), ParseOptions())
+
+    assert docling.calls == expected
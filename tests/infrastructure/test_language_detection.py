@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+import pickle
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from doc_parsing.infrastructure.triage.language import (
+    NgramLanguageDetector,
+    language_detector,
+)
+
+# Two sentences per language, the same text translated.
+SAMPLES = {
+    "en": (
+        "The committee reviewed the annual budget and agreed that spending on "
+        "public transport should increase next year. Several members asked for "
+        "a detailed report on maintenance costs before the final vote."
+    ),
+    "de": (
+        "Der Ausschuss hat den Jahreshaushalt geprüft und beschlossen, dass die"
+        " Ausgaben für den öffentlichen Verkehr im nächsten Jahr steigen "
+        "sollen. Mehrere Mitglieder baten vor der Abstimmung um einen "
+        "ausführlichen Bericht."
+    ),
+    "fr": (
+        "Le comité a examiné le budget annuel et a convenu que les dépenses "
+        "consacrées aux transports publics devraient augmenter l'année "
+        "prochaine. Plusieurs membres ont demandé un rapport détaillé avant le "
+        "vote final."
+    ),
+    "es": (
+        "El comité revisó el presupuesto anual y acordó que el gasto en "
+        "transporte público debería aumentar el próximo año. Varios miembros "
+        "pidieron un informe detallado sobre los costes de mantenimiento antes "
+        "de la votación."
+    ),
+    "it": (
+        "Il comitato ha esaminato il bilancio annuale e ha convenuto che la "
+        "spesa per il trasporto pubblico dovrebbe aumentare il prossimo anno. "
+        "Diversi membri hanno chiesto una relazione dettagliata prima del voto "
+        "finale."
+    ),
+    "pt": (
+        "O comitê analisou o orçamento anual e concordou que os gastos com "
+        "transporte público devem aumentar no próximo ano. Vários membros "
+        "pediram um relatório detalhado sobre os custos de manutenção antes da "
+        "votação."
+    ),
+    "nl": (
+        "De commissie heeft de jaarlijkse begroting besproken en besloten dat "
+        "de uitgaven voor het openbaar vervoer volgend jaar moeten stijgen. "
+        "Verschillende leden vroegen om een uitgebreid verslag voor de "
+        "stemming."
+    ),
+    "sv": (
+        "Kommittén granskade den årliga budgeten och kom överens om att "
+        "utgifterna för kollektivtrafiken ska öka nästa år. Flera ledamöter bad"
+        " om en utförlig rapport om underhållskostnaderna före omröstningen."
+    ),
+    "da": (
+        "Udvalget gennemgik det årlige budget og blev enige om, at udgifterne "
+        "til offentlig transport skal stige næste år. Flere medlemmer bad om en"
+        " detaljeret rapport om vedligeholdelsesomkostningerne før "
+        "afstemningen."
+    ),
+    "pl": (
+        "Komisja przeanalizowała roczny budżet i uzgodniła, że wydatki na "
+        "transport publiczny powinny wzrosnąć w przyszłym roku. Kilku członków "
+        "poprosiło o szczegółowy raport przed ostatecznym głosowaniem."
+    ),
+    "cs": (
+        "Výbor přezkoumal roční rozpočet a dohodl se, že výdaje na veřejnou "
+        "dopravu by se měly příští rok zvýšit. Několik členů požádalo před "
+        "konečným hlasováním o podrobnou zprávu o nákladech na údržbu."
+    ),
+    "fi": (
+        "Valiokunta kävi läpi vuosibudjetin ja sopi, että julkisen liikenteen "
+        "menoja pitäisi ensi vuonna lisätä. Useat jäsenet pyysivät "
+        "yksityiskohtaista raporttia ylläpitokustannuksista ennen lopullista "
+        "äänestystä."
+    ),
+    "tr": (
+        "Komite yıllık bütçeyi inceledi ve toplu taşımaya yapılan harcamaların "
+        "gelecek yıl artması gerektiği konusunda anlaştı. Birkaç üye son "
+        "oylamadan önce bakım maliyetleri hakkında ayrıntılı bir rapor istedi."
+    ),
+    "ru": (
+        "Комитет рассмотрел годовой бюджет и согласился, что расходы на "
+        "общественный транспорт в следующем году должны увеличиться. Несколько "
+        "членов попросили подробный отчёт о расходах на обслуживание перед "
+        "голосованием."
+    ),
+    "uk": (
+        "Комітет розглянув річний бюджет і погодився, що видатки на громадський"
+        " транспорт наступного року мають зрости. Кілька членів попросили "
+        "докладний звіт про витрати на утримання перед остаточним голосуванням."
+    ),
+    "el": (
+        "Η επιτροπή εξέτασε τον ετήσιο προϋπολογισμό και συμφώνησε ότι οι "
+        "δαπάνες για τις δημόσιες συγκοινωνίες πρέπει να αυξηθούν τον επόμενο "
+        "χρόνο. Αρκετά μέλη ζήτησαν λεπτομερή έκθεση πριν από την τελική "
+        "ψηφοφορία."
+    ),
+    "ja": (
+        "委員会は年間予算を検討し、来年は公共交通機関への支出を"
+        "増やすべきだということで合意しました。何人かの委員は、"
+        "最終的な投票の前に維持費についての詳しい報告を求めました。"
+    ),
+    "zh-cn": (
+        "委员会审查了年度预算，并同意明年应增加公共交通方面的支出。"
+        "几位委员要求在最终投票前提供一份关于维护费用的详细报告。"
+    ),
+    "ko": (
+        "위원회는 연간 예산을 검토하고 내년에 대중교통 지출을 "
+        "늘려야 한다는 데 합의했습니다. 몇몇 위원들은 최종 투표 "
+        "전에 유지 비용에 대한 자세한 보고서를 요청했습니다."
+    ),
+    "ar": (
+        "راجعت اللجنة الميزانية السنوية واتفقت على ضرورة زيادة الإنفاق على "
+        "النقل العام في العام المقبل. وطلب عدد من الأعضاء تقريرا مفصلا عن "
+        "تكاليف الصيانة قبل التصويت النهائي."
+    ),
+}
+
+
+def test_ngram_detector_identifies_samples() -> None:
+    detector = language_detector("ngram")
+
+    detected = {code: detector.detect(text) for code, text in SAMPLES.items()}
+
+    assert detected == {code: code for code in SAMPLES}
+    assert detector.detect("1234 -- 5678") is None
+
+
+def test_ngram_detector_agrees_with_langdetect() -> None:
+    ngram = language_detector("ngram")
+    langdetect = language_detector("langdetect")
+
+    agreed = sum(
+        ngram.detect(text) == langdetect.detect(text) for text in SAMPLES.values()
+    )
+
+    assert agreed == len(SAMPLES)
+
+
+def test_detectors_unpickle_to_the_process_instance() -> None:
+    detector = language_detector("ngram")
+
+    assert isinstance(detector, NgramLanguageDetector)
+    assert pickle.loads(pickle.dumps(detector)) is detector
+
+
+def _corpus() -> dict[str, str]:
+    directory = os.getenv("LANGUAGE_BENCH_CORPUS")
+    if not directory:
+        return SAMPLES
+    # One text file per document; the file name does not matter.
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(Path(directory).glob("*.txt"))
+    }
+
+
+def _cold_load_seconds(kind: str) -> float:
+    code = (
+        "import time\n"
+        "from doc_parsing.infrastructure.triage import language\n"
+        "start = time.perf_counter()\n"
+        f"language.language_detector({kind!r}).detect('warm up the detector')\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, env=env
+    )
+    return float(result.stdout)
+
+
+@pytest.mark.skipif(
+    os.getenv("PERF") != "1",
+    reason="Set PERF=1 (and optionally LANGUAGE_BENCH_CORPUS=<dir of .txt>)",
+)
+def test_ngram_detector_benchmark_against_langdetect() -> None:
+    corpus = [text[:2000] for text in _corpus().values()]
+    results: dict[str, list[str | None]] = {}
+    for kind in ("langdetect", "ngram"):
+        detector = language_detector(kind)
+        start = time.perf_counter()
+        results[kind] = [detector.detect(text) for text in corpus]
+        per_document = (time.perf_counter() - start) / len(corpus)
+        print(
+            f"{kind:<10} load {_cold_load_seconds(kind) * 1000:7.1f}ms"
+            f"  detect {per_document * 1000:7.2f}ms/doc"
+        )
+    agreement = sum(
+        a == b for a, b in zip(results["langdetect"], results["ngram"], strict=True)
+    ) / len(corpus)
+    print(f"agreement with langdetect: {agreement:.1%} over {len(corpus)} documents")
+
+    assert _cold_load_seconds("ngram") < _cold_load_seconds("langdetect")
+    assert agreement >= 0.9
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 from pydantic import BaseModel, ConfigDict, Field
 
-from doc_parsing.domain import PdfParser, PdfParserConfig, PdfParserFactory
+from doc_parsing.application import MappedPdfInput
+from doc_parsing.domain import (
+    ParseOptions,
+    PdfInput,
+    PdfParser,
+    PdfParserConfig,
+    PdfParserFactory,
+)
 from doc_parsing.infrastructure import AdapterRegistration, ParserRegistry
 
 
@@ -16,7 +21,7 @@ class FakeConfig(BaseModel):
 
 
 class FakeParser(PdfParser):
-    def parse(self, file_path: Path) -> str:
+    def parse(self, source: PdfInput, options: ParseOptions) -> str:
         return "# ok"
 
 
@@ -39,7 +44,9 @@ def test_registry_returns_parser() -> None:
 
     parser = registry.create(PdfParserConfig(name="fake"))
 
-    assert parser.parse(Path("/tmp/sample.pdf")) == "# ok"
+    source = MappedPdfInput(b"%PDF-1.4", uri="/tmp/sample.pdf", name="sample.pdf")
+
+    assert parser.parse(source, ParseOptions()) == "# ok"
 
 
 def test_registry_rejects_unknown_parser() -> None:
@@ -62,3 +69,25 @@ def test_registry_exposes_config_models() -> None:
     models = registry.config_models()
 
     assert models["fake"] is FakeConfig
+
+
+class WarmingFactory(FakeFactory):
+    def __init__(self) -> None:
+        self.warmed: list[PdfParserConfig] = []
+
+    def warm(self, config: PdfParserConfig) -> None:
+        self.warmed.append(config)
+
+
+def test_registry_warms_adapters_that_support_it() -> None:
+    factory = WarmingFactory()
+    registry = ParserRegistry()
+    registry.register_adapter(
+        AdapterRegistration(name="fake", config_model=FakeConfig, factory=factory)
+    )
+
+    registry.warm(PdfParserConfig(name="fake"))
+
+    assert factory.warmed == [PdfParserConfig(name="fake")]
+    with pytest.raises(ValueError):
+        registry.warm(PdfParserConfig(name="missing"))
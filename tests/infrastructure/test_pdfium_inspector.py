@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+import time
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, NumberObject, StreamObject
+
+from doc_parsing.application.inputs import MappedPdfInput
+from doc_parsing.domain import PageRanges, PdfInspector
+from doc_parsing.infrastructure.triage import (
+    PdfiumInspector,
+    PdfiumInspectorConfig,
+    PypdfInspectorConfig,
+    create_inspector,
+    pdfium_inspector,
+)
+from doc_parsing.infrastructure.triage.inspection import PageScan
+
+TEXT = (
+    "The quarterly report describes the results of the survey and the "
+    "measures that the committee proposed for the following year. "
+)
+
+
+def _pdf(pages: list[tuple[bool, int]]) -> bytes:
+    """One page per ``(draws_image, sentences_of_text)`` entry."""
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    image = StreamObject()
+    image.set_data(b"\x00")
+    image.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Image"),
+            NameObject("/Width"): NumberObject(1),
+            NameObject("/Height"): NumberObject(1),
+            NameObject("/ColorSpace"): NameObject("/DeviceGray"),
+            NameObject("/BitsPerComponent"): NumberObject(8),
+        }
+    )
+    image_ref = writer._add_object(image)
+    for draws_image, sentences in pages:
+        page = writer.add_blank_page(width=612, height=792)
+        resources = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        operations: list[str] = []
+        if draws_image:
+            resources[NameObject("/XObject")] = DictionaryObject(
+                {NameObject("/Im0"): image_ref}
+            )
+            operations.append("q 500 0 0 700 50 50 cm /Im0 Do Q")
+        for line in range(sentences):
+            operations.append(f"BT /F1 8 Tf 40 {740 - 12 * line} Td ({TEXT}) Tj ET")
+        page[NameObject("/Resources")] = resources
+        content = StreamObject()
+        content.set_data("\n".join(operations).encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_create_inspector_follows_kind() -> None:
+    inspector = create_inspector(PdfiumInspectorConfig())
+
+    assert isinstance(inspector, PdfiumInspector)
+    assert isinstance(inspector, PdfInspector)
+
+
+def test_pdfium_inspector_matches_pypdf() -> None:
+    data = _pdf([(False, 3), (True, 0), (True, 0), (True, 2), (False, 0), (True, 0)])
+    settings = {"language_min_chars": 50}
+    results = [
+        create_inspector(config).inspect(MappedPdfInput.from_bytes(data, name="a.pdf"))
+        for config in (
+            PypdfInspectorConfig(**settings),
+            PdfiumInspectorConfig(**settings),
+        )
+    ]
+
+    assert results[0] == results[1]
+    assert results[1].page_count == 6
+    assert results[1].language == "en"
+    assert results[1].image_only_page_ranges == PageRanges(((2, 3), (6, 6)))
+    assert results[1].scanned is False
+
+
+def test_pdfium_inspector_counts_reads_against_inspect(tmp_path: Path) -> None:
+    path = tmp_path / "scan.pdf"
+    path.write_bytes(_pdf([(True, 0), (True, 0)]))
+
+    with MappedPdfInput.open(path) as source:
+        metadata = PdfiumInspector(PdfiumInspectorConfig()).inspect(source)
+        bytes_read = source.bytes_read()
+
+    assert metadata.scanned is True
+    assert bytes_read["inspect"] > 0
+
+
+def test_pdfium_inspector_releases_the_lock_between_pages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lock = pdfium_inspector._pdfium_lock()
+    held: list[bool] = []
+
+    class RecordingScan(PageScan):
+        def add_page(
+            self, number: int, text: str, has_image: bool, *, limited: bool = False
+        ) -> None:
+            held.append(lock.locked())
+            super().add_page(number, text, has_image, limited=limited)
+
+    monkeypatch.setattr(pdfium_inspector, "PageScan", RecordingScan)
+    data = _pdf([(False, 3), (True, 0)])
+
+    PdfiumInspector(PdfiumInspectorConfig()).inspect(
+        MappedPdfInput.from_bytes(data, name="a.pdf")
+    )
+
+    assert held == [False, False]
+
+
+def _corpus() -> list[bytes]:
+    directory = os.getenv("INSPECTOR_BENCH_CORPUS")
+    if directory:
+        return [path.read_bytes() for path in sorted(Path(directory).rglob("*.pdf"))]
+    return [
+        _pdf([(page % 3 == 0, 0 if page % 3 == 0 else 20) for page in range(30)])
+        for _ in range(20)
+    ]
+
+
+@pytest.mark.skipif(
+    os.getenv("PERF") != "1",
+    reason="Set PERF=1 (and optionally INSPECTOR_BENCH_CORPUS=<dir of .pdf>)",
+)
+def test_pdfium_inspector_benchmark_against_pypdf() -> None:
+    corpus = _corpus()
+    results: dict[str, list[object]] = {}
+    for config in (PypdfInspectorConfig(), PdfiumInspectorConfig()):
+        inspector = create_inspector(config)
+        started = time.perf_counter()
+        results[config.kind] = [
+            inspector.inspect(MappedPdfInput.from_bytes(data, name="bench.pdf"))
+            for data in corpus
+        ]
+        elapsed = time.perf_counter() - started
+        print(f"{config.kind}: {len(corpus) / elapsed:.1f} docs/s")
+    agreed = sum(
+        pypdf == pdfium
+        for pypdf, pdfium in zip(results["pypdf"], results["pdfium"], strict=True)
+    )
+    print(f"metadata agreement: {agreed}/{len(corpus)}")
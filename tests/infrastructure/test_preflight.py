@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import zlib
+from io import BytesIO
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+
+from doc_parsing.application.inputs import MappedPdfInput
+from doc_parsing.domain import PdfPreflight
+from doc_parsing.infrastructure.triage import XrefPreflightReader
+
+PAGE = b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 72 72] >>"
+
+
+def _source(data: bytes) -> MappedPdfInput:
+    return MappedPdfInput.from_bytes(data, name="doc.pdf")
+
+
+def _written(pages: int, *, password: str | None = None) -> bytes:
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=72, height=72)
+    if password is not None:
+        writer.encrypt(password)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _objects(objects: dict[int, bytes]) -> tuple[bytes, dict[int, int]]:
+    body = b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n"
+    offsets: dict[int, int] = {}
+    for number, content in objects.items():
+        offsets[number] = len(body)
+        body += b"%d 0 obj\n%s\nendobj\n" % (number, content)
+    return body, offsets
+
+
+def _classic(objects: dict[int, bytes], trailer: bytes) -> bytes:
+    body, offsets = _objects(objects)
+    size = max(objects) + 1
+    xref = b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for number in range(1, size):
+        xref += b"%010d 00000 n \n" % offsets[number]
+    return body + xref + b"trailer\n%s\nstartxref\n%d\n%%%%EOF\n" % (trailer, len(body))
+
+
+def _xref_stream_pdf() -> bytes:
+    # Catalog and page tree live in an object stream whose /Length is an
+    # indirect object; the xref stream uses the PNG Up predictor.
+    catalog = b"<< /Type /Catalog /Pages 2 0 R >>"
+    pages = b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>"
+    header = b"1 0 2 %d " % (len(catalog) + 1)
+    packed = zlib.compress(header + catalog + b" " + pages)
+    body, offsets = _objects(
+        {
+            3: PAGE,
+            4: b"<< /Type /ObjStm /N 2 /First %d /Filter /FlateDecode /Length 5 0 R >>"
+            b"\nstream\n%s\nendstream" % (len(header), packed),
+            5: b"%d" % len(packed),
+        }
+    )
+    rows = [(0, 0, 255), (2, 4, 0), (2, 4, 1)]
+    rows += [(1, offsets[number], 0) for number in (3, 4, 5)]
+    rows.append((1, len(body), 0))
+    encoded = b""
+    previous = bytes(4)
+    for kind, field, index in rows:
+        row = bytes([kind]) + field.to_bytes(2) + bytes([index])
+        encoded += b"\x02" + bytes(
+            (a - b) & 0xFF for a, b in zip(row, previous, strict=True)
+        )
+        previous = row
+    data = zlib.compress(encoded)
+    xref = (
+        b"6 0 obj\n<< /Type /XRef /Size 7 /Root 1 0 R /W [1 2 1] /Filter /FlateDecode"
+        b" /DecodeParms << /Columns 4 /Predictor 12 >> /Length %d >>\nstream\n"
+        % len(data)
+    )
+    xref += data + b"\nendstream\nendobj\n"
+    return body + xref + b"startxref\n%d\n%%%%EOF\n" % len(body)
+
+
+def test_preflight_reads_classic_trailer_and_page_count() -> None:
+    source = _source(_written(3))
+
+    preflight = XrefPreflightReader().read(source)
+
+    assert preflight == PdfPreflight(file_size=source.size, page_count=3)
+    assert source.bytes_read()["preflight"] < 8192
+
+
+def test_preflight_detects_encryption() -> None:
+    preflight = XrefPreflightReader().read(_source(_written(2, password="secret")))
+
+    assert preflight.encrypted is True
+    assert preflight.page_count == 2
+
+
+def test_preflight_marks_truncated_files() -> None:
+    data = _written(2)
+
+    preflight = XrefPreflightReader().read(_source(data[: len(data) // 2]))
+
+    assert preflight.truncated is True
+    assert preflight.page_count is None
+
+
+@pytest.mark.parametrize("shift", [-1, 1])
+def test_preflight_leaves_page_count_unknown_for_a_misplaced_startxref(
+    shift: int,
+) -> None:
+    data = _written(4)
+    offset = data.rindex(b"startxref") + len(b"startxref\n")
+    end = data.index(b"\n", offset)
+    data = data[:offset] + b"%d" % (int(data[offset:end]) + shift) + data[end:]
+
+    preflight = XrefPreflightReader().read(_source(data))
+
+    # pypdf recovers from the offset, so rejecting the file would be wrong.
+    assert len(PdfReader(BytesIO(data)).pages) == 4
+    assert preflight.truncated is False
+    assert preflight.page_count is None
+
+
+def test_preflight_marks_a_startxref_past_the_end_as_truncated() -> None:
+    data = _written(2)
+    offset = data.rindex(b"startxref") + len(b"startxref\n")
+    end = data.index(b"\n", offset)
+    data = data[:offset] + b"%d" % (len(data) + 10) + data[end:]
+
+    assert XrefPreflightReader().read(_source(data)).truncated is True
+
+
+def test_preflight_follows_incremental_updates() -> None:
+    writer = PdfWriter(PdfReader(BytesIO(_written(3))), incremental=True)
+    writer.add_blank_page(width=72, height=72)
+    buffer = BytesIO()
+    writer.write(buffer)
+
+    preflight = XrefPreflightReader().read(_source(buffer.getvalue()))
+
+    assert preflight.page_count == 4
+    assert preflight.truncated is False
+
+
+def test_preflight_decodes_xref_and_object_streams() -> None:
+    data = _xref_stream_pdf()
+
+    preflight = XrefPreflightReader().read(_source(data))
+
+    assert preflight.page_count == len(PdfReader(BytesIO(data)).pages) == 1
+
+
+def test_preflight_reads_linearization_dictionary() -> None:
+    data = _classic(
+        {
+            1: b"<< /Linearized 1 /L 0000000000 /N 1 /H [0 0] /O 4 /E 0 /T 0 >>",
+            2: b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            3: PAGE,
+            4: b"<< /Type /Catalog /Pages 2 0 R >>",
+        },
+        b"<< /Size 5 /Root 4 0 R >>",
+    )
+    data = data.replace(b"/L 0000000000", b"/L %010d" % len(data))
+
+    preflight = XrefPreflightReader().read(_source(data))
+
+    assert preflight.linearized is True
+    assert preflight.page_count == 1
+    # Anything appended afterwards invalidates the linearization.
+    assert XrefPreflightReader().read(_source(data + b"\n")).linearized is False
+
+
+def test_preflight_rejects_non_pdf() -> None:
+    with pytest.raises(ValueError, match="does not appear to be a PDF"):
+        XrefPreflightReader().read(_source(b"not a pdf"))
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import tracemalloc
+import zlib
+from io import BytesIO
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    EncodedStreamObject,
+    NameObject,
+    NumberObject,
+    StreamObject,
+)
+
+from doc_parsing.application.inputs import MappedPdfInput
+from doc_parsing.domain import PageRanges
+from doc_parsing.infrastructure.triage.pypdf_inspector import (
+    PypdfInspector,
+    PypdfInspectorConfig,
+    _page_text,
+)
+
+
+def _pdf_with_image_pages(page_count: int, image_pages: set[int]) -> bytes:
+    writer = PdfWriter()
+    image = StreamObject()
+    image.set_data(b"\x00")
+    image.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Image"),
+            NameObject("/Width"): NumberObject(1),
+            NameObject("/Height"): NumberObject(1),
+            NameObject("/ColorSpace"): NameObject("/DeviceGray"),
+            NameObject("/BitsPerComponent"): NumberObject(8),
+        }
+    )
+    image_ref = writer._add_object(image)
+    for number in range(1, page_count + 1):
+        page = writer.add_blank_page(width=72, height=72)
+        if number in image_pages:
+            page[NameObject("/Resources")] = DictionaryObject(
+                {
+                    NameObject("/XObject"): DictionaryObject(
+                        {NameObject("/Im0"): image_ref}
+                    )
+                }
+            )
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_inspector_records_image_only_page_ranges() -> None:
+    data = _pdf_with_image_pages(6, {2, 3, 6})
+    inspector = PypdfInspector(PypdfInspectorConfig())
+
+    metadata = inspector.inspect(MappedPdfInput.from_bytes(data, name="scan.pdf"))
+
+    assert metadata.image_only_pages == 3
+    assert metadata.image_only_page_ranges == PageRanges(((2, 3), (6, 6)))
+
+
+class RecordingDetector:
+    def __init__(self) -> None:
+        self.samples: list[str] = []
+
+    def detect(self, text: str) -> str | None:
+        self.samples.append(text)
+        return "en"
+
+
+def test_inspector_caps_language_sample_by_characters() -> None:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for number in range(1, 4):
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = StreamObject()
+        content.set_data(f"BT /F1 11 Tf 72 700 Td (Page {number} text) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = BytesIO()
+    writer.write(buffer)
+    inspector = PypdfInspector(
+        PypdfInspectorConfig(
+            min_text_chars=1, language_sample_chars=20, language_min_chars=5
+        )
+    )
+    detector = inspector._detector = RecordingDetector()
+
+    metadata = inspector.inspect(
+        MappedPdfInput.from_bytes(buffer.getvalue(), name="text.pdf")
+    )
+
+    assert metadata.language == "en"
+    assert detector.samples == ["Page 1 text Page 2 t"]
+
+
+def _text_page(
+    number: int, padding_mb: int = 0, *, draws_form: bool = False
+) -> EncodedStreamObject:
+    text = f"BT /F1 11 Tf 72 700 Td (Page {number} text) Tj ET"
+    return _flate(f"/Fm0 Do {text}" if draws_form else text, padding_mb)
+
+
+def _flate(content: str, padding_mb: int = 0) -> EncodedStreamObject:
+    # Trailing whitespace inflates to padding_mb without adding any text, the
+    # way a decompression bomb would.
+    compressor = zlib.compressobj(9)
+    parts = [compressor.compress(content.encode())]
+    chunk = b" " * (1024 * 1024)
+    parts.extend(compressor.compress(chunk) for _ in range(padding_mb))
+    parts.append(compressor.flush())
+    stream = EncodedStreamObject()
+    stream[NameObject("/Filter")] = NameObject("/FlateDecode")
+    stream._data = b"".join(parts)
+    return stream
+
+
+def _text_pdf(
+    contents: list[EncodedStreamObject], form: EncodedStreamObject | None = None
+) -> bytes:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    resources = DictionaryObject(
+        {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+    )
+    if form is not None:
+        form.update(
+            {
+                NameObject("/Type"): NameObject("/XObject"),
+                NameObject("/Subtype"): NameObject("/Form"),
+                NameObject("/BBox"): ArrayObject(
+                    [NumberObject(0), NumberObject(0), NumberObject(1), NumberObject(1)]
+                ),
+            }
+        )
+        resources[NameObject("/XObject")] = DictionaryObject(
+            {NameObject("/Fm0"): writer._add_object(form)}
+        )
+    for content in contents:
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = resources
+        page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_inspector_skips_pages_over_the_stream_budget() -> None:
+    data = _text_pdf([_text_page(1), _text_page(2, padding_mb=512), _text_page(3)])
+    assert len(data) < 2 * 1024 * 1024
+    inspector = PypdfInspector(
+        PypdfInspectorConfig(min_text_chars=1, language_min_chars=5, max_stream_mb=4)
+    )
+    inspector._detector = RecordingDetector()
+
+    tracemalloc.start()
+    try:
+        metadata = inspector.inspect(MappedPdfInput.from_bytes(data, name="bomb.pdf"))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert metadata.limited_page_ranges == PageRanges(((2, 2),))
+    assert metadata.page_count == 3
+    assert metadata.language == "en"
+    assert inspector._detector.samples == ["Page 1 text Page 3 text"]
+    # Inflating stops at the 4 MB stream cap, far short of the bomb's 512 MB.
+    assert peak < 16 * 1024 * 1024
+
+
+def test_inspector_charges_a_shared_form_once() -> None:
+    pages = [_text_page(number, draws_form=True) for number in range(1, 31)]
+    data = _text_pdf(pages, form=_flate("", padding_mb=1))
+    inspector = PypdfInspector(
+        PypdfInspectorConfig(min_text_chars=1, max_document_mb=2)
+    )
+
+    metadata = inspector.inspect(MappedPdfInput.from_bytes(data, name="form.pdf"))
+
+    assert metadata.limited_page_ranges == PageRanges()
+    assert metadata.image_only_pages == 0
+
+
+def test_inspector_does_not_charge_forms_it_never_draws() -> None:
+    data = _text_pdf(
+        [_text_page(number) for number in range(1, 4)],
+        form=_flate("", padding_mb=3),
+    )
+    inspector = PypdfInspector(
+        PypdfInspectorConfig(min_text_chars=1, max_document_mb=1)
+    )
+
+    metadata = inspector.inspect(MappedPdfInput.from_bytes(data, name="unused.pdf"))
+
+    assert metadata.limited_page_ranges == PageRanges()
+
+
+def test_inspector_skips_pages_over_the_document_budget() -> None:
+    data = _text_pdf([_text_page(number, padding_mb=1) for number in range(1, 5)])
+    inspector = PypdfInspector(
+        PypdfInspectorConfig(min_text_chars=1, max_document_mb=2.5)
+    )
+
+    metadata = inspector.inspect(MappedPdfInput.from_bytes(data, name="big.pdf"))
+
+    assert metadata.limited_page_ranges == PageRanges(((3, 4),))
+
+
+def test_inspector_stops_reading_a_page_once_it_has_enough_text() -> None:
+    stream = _text_page(1)
+    stream._data = zlib.compress(
+        b"".join(
+            f"BT /F1 11 Tf 72 {700 - 12 * line} Td (Line {line}) Tj ET ".encode()
+            for line in range(200)
+        )
+    )
+    page = PdfReader(BytesIO(_text_pdf([stream]))).pages[0]
+
+    text = _page_text(page, 10)
+
+    assert text.split() == ["Line", "0", "Line", "1"]
+    assert _page_text(page, 0) == ""
+
+
+@pytest.mark.parametrize("name", ["max_stream_mb", "max_document_mb"])
+def test_inspector_config_rejects_empty_budgets(name: str) -> None:
+    with pytest.raises(ValueError, match=name):
+        PypdfInspectorConfig(**{name: 0})
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from io import BytesIO
+from typing import BinaryIO
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, StreamObject
+
+from doc_parsing.application.inputs import MappedPdfInput
+from doc_parsing.domain import ParseOptions, PdfParserConfig
+from doc_parsing.infrastructure.parsers.pypdf_parser import (
+    PypdfParserConfig,
+    PypdfPdfParserFactory,
+)
+
+
+def _text_pdf(*pages: list[tuple[float, str]]) -> bytes:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for lines in pages:
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        operations = []
+        y = 750.0
+        for size, text in lines:
+            # An empty line stands for paragraph spacing.
+            y -= size * 1.2
+            if text:
+                operations.append(f"BT /F1 {size} Tf 72 {y} Td ({text}) Tj ET")
+        content = StreamObject()
+        content.set_data("\n".join(operations).encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _parse(data: bytes, **options: object) -> str:
+    parser = PypdfPdfParserFactory().create(
+        PdfParserConfig(name="pypdf", options=options)
+    )
+    return parser.parse(MappedPdfInput.from_bytes(data, name="doc.pdf"), ParseOptions())
+
+
+def test_parser_renders_headings_and_paragraphs() -> None:
+    data = _text_pdf(
+        [
+            (24, "Annual Report"),
+            (16, "Summary"),
+            (11, "Revenue grew in every re-"),
+            (11, "gion this year."),
+            (11, ""),
+            (11, "Costs were flat."),
+        ],
+        [(16, "Outlook"), (11, "More of the same.")],
+    )
+
+    assert _parse(data) == (
+        "# Annual Report\n\n"
+        "## Summary\n\n"
+        "Revenue grew in every region this year.\n\n"
+        "Costs were flat.\n\n"
+        "## Outlook\n\n"
+        "More of the same."
+    )
+    assert _parse(data, max_heading_level=1).startswith("# Annual Report\n\n# Summary")
+
+
+def test_parser_closes_the_stream_it_opens(monkeypatch: pytest.MonkeyPatch) -> None:
+    source = MappedPdfInput.from_bytes(_text_pdf([(11, "Body text.")]), name="a.pdf")
+    opened: list[BinaryIO] = []
+    open_stream = source.open_stream
+
+    def recording_open_stream(*, stage: str) -> BinaryIO:
+        opened.append(open_stream(stage=stage))
+        return opened[-1]
+
+    monkeypatch.setattr(source, "open_stream", recording_open_stream)
+
+    PypdfPdfParserFactory().create(PdfParserConfig(name="pypdf")).parse(
+        source, ParseOptions()
+    )
+
+    assert opened and all(stream.closed for stream in opened)
+
+
+def test_parser_config_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError):
+        PypdfParserConfig(heading_size_ratio=1.0)
+    with pytest.raises(ValueError):
+        PypdfParserConfig(max_heading_level=7)
+
+
+def test_pypdf_adapter_does_not_import_torch() -> None:
+    code = (
+        "import sys\n"
+        "from doc_parsing.domain import PdfParserConfig\n"
+        "from doc_parsing.infrastructure.parsers.pypdf_adapter import adapter\n"
+        "adapter.factory.create(PdfParserConfig(name='pypdf'))\n"
+        "assert 'torch' not in sys.modules, 'torch imported'\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
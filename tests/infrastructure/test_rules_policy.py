@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from doc_parsing.domain import TriageMetadata, TriageRoute
+import dataclasses
+
+from doc_parsing.domain import PageRanges, PdfPreflight, TriageMetadata, TriageRoute
 from doc_parsing.infrastructure.triage.rules_policy import (
     RuleAction,
     RuleConfig,
@@ -100,3 +102,112 @@ def test_rules_policy_returns_none_without_default() -> None:
     )
 
     assert policy.decide(metadata) is None
+
+
+def _preflight_policy() -> RulesPolicy:
+    return RulesPolicy(
+        RulesPolicyConfig(
+            name="preflight",
+            rules=[
+                RuleConfig(
+                    name="encrypted",
+                    when=RuleWhen(encrypted=True),
+                    action=RuleAction(route="dlq", reason="encrypted"),
+                ),
+                RuleConfig(
+                    name="huge",
+                    when=RuleWhen(min_file_mb=100),
+                    action=RuleAction(route="dlq", reason="too_large"),
+                ),
+                RuleConfig(
+                    name="empty",
+                    when=RuleWhen(max_pages=0),
+                    action=RuleAction(route="dlq", reason="no_pages"),
+                ),
+                RuleConfig(
+                    name="scanned",
+                    when=RuleWhen(scanned=True),
+                    action=RuleAction(route="parse", hint="ocr"),
+                ),
+            ],
+            default=RuleAction(route="parse", hint="default"),
+        )
+    )
+
+
+def test_rules_policy_decides_file_rules_at_preflight() -> None:
+    policy = _preflight_policy()
+
+    encrypted = policy.decide_preflight(
+        PdfPreflight(file_size=1024, encrypted=True, page_count=3)
+    )
+    huge = policy.decide_preflight(PdfPreflight(file_size=200 * 1024 * 1024))
+    empty = policy.decide_preflight(PdfPreflight(file_size=1024, page_count=0))
+
+    assert encrypted is not None and encrypted.rule == "encrypted"
+    assert huge is not None and huge.reason == "too_large"
+    assert empty is not None and empty.rule == "empty"
+
+
+def test_rules_policy_defers_to_inspection_when_a_rule_needs_it() -> None:
+    policy = _preflight_policy()
+
+    # The page count is unknown, so "empty" could still match.
+    unknown_pages = policy.decide_preflight(PdfPreflight(file_size=1024))
+    # "scanned" needs page content; the default must not pre-empt it.
+    ordinary = policy.decide_preflight(PdfPreflight(file_size=1024, page_count=2))
+
+    assert unknown_pages is None
+    assert ordinary is None
+
+
+def test_rules_policy_matches_file_facts_after_inspection() -> None:
+    policy = _preflight_policy()
+    metadata = TriageMetadata(
+        page_count=2,
+        language="en",
+        scanned=False,
+        image_only_pages=0,
+        image_only_page_ratio=0.0,
+        file_size=1024,
+        encrypted=True,
+    )
+
+    decision = policy.decide(metadata)
+
+    assert decision is not None
+    assert decision.rule == "encrypted"
+
+
+def test_rules_policy_matches_limited_pages_after_inspection() -> None:
+    policy = RulesPolicy(
+        RulesPolicyConfig(
+            name="limits",
+            rules=[
+                RuleConfig(
+                    name="over-budget",
+                    when=RuleWhen(limited=True),
+                    action=RuleAction(route="dlq", reason="decode_budget"),
+                ),
+            ],
+            default=RuleAction(route="parse"),
+        )
+    )
+    metadata = TriageMetadata(
+        page_count=4,
+        language="en",
+        scanned=False,
+        image_only_pages=0,
+        image_only_page_ratio=0.0,
+        limited_page_ranges=PageRanges.from_pages([3]),
+    )
+
+    limited = policy.decide(metadata)
+    unlimited = policy.decide(
+        dataclasses.replace(metadata, limited_page_ranges=PageRanges())
+    )
+
+    # Only the inspection knows which pages were over budget.
+    assert policy.decide_preflight(PdfPreflight(file_size=1024, page_count=4)) is None
+    assert limited is not None and limited.reason == "decode_budget"
+    assert unlimited is not None and unlimited.route is TriageRoute.PARSE
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from doc_parsing.domain import (
+    Document,
+    DocumentId,
+    DocumentSource,
+    ParseStatus,
+    ParsingRequest,
+    ParsingTask,
+    SourceType,
+    TaskId,
+)
+from doc_parsing.infrastructure import SqliteParsingTaskStore
+
+
+def _task(task_id: str) -> ParsingTask:
+    source = DocumentSource(
+        uri=f"s3://bucket/{task_id}.pdf", source_type=SourceType.OBJECT_STORAGE
+    )
+    return ParsingTask(request=ParsingRequest(task_id=TaskId(task_id), source=source))
+
+
+def test_store_checkpoints_task_lifecycle(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    with SqliteParsingTaskStore.open(path, run_id="run-1") as store:
+        done = _task("a")
+        store.record(done)
+        done.start()
+        store.record(done)
+        done.complete(Document(document_id=DocumentId("a"), source=done.request.source))
+        store.record(done)
+
+        interrupted = _task("b")
+        interrupted.start()
+        store.record(interrupted)
+
+        assert store.statuses() == {
+            TaskId("a"): ParseStatus.SUCCEEDED,
+            TaskId("b"): ParseStatus.RUNNING,
+        }
+
+    with SqliteParsingTaskStore.open(path, run_id="run-1") as reopened:
+        assert reopened.count_by_status() == {
+            ParseStatus.SUCCEEDED: 1,
+            ParseStatus.RUNNING: 1,
+        }
+    with SqliteParsingTaskStore.open(path, run_id="run-2") as other_run:
+        assert other_run.statuses() == {}
+
+
+def test_store_batches_writes_until_flush(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    store = SqliteParsingTaskStore.open(
+        path, run_id="run-1", batch_size=10, flush_interval=3600.0
+    )
+    reader = sqlite3.connect(path)
+    try:
+        assert reader.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        indexes = {row[1] for row in reader.execute("PRAGMA index_list(parsing_tasks)")}
+        assert "parsing_tasks_status" in indexes
+
+        for index in range(3):
+            store.record(_task(f"t-{index}"))
+        assert reader.execute("SELECT COUNT(*) FROM parsing_tasks").fetchone() == (0,)
+
+        store.flush()
+        assert reader.execute("SELECT COUNT(*) FROM parsing_tasks").fetchone() == (3,)
+    finally:
+        reader.close()
+        store.close()
+
+
+def test_store_counts_attempts_across_restarts(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite3"
+    for _ in range(2):
+        with SqliteParsingTaskStore.open(path, run_id="run-1") as store:
+            task = _task("a")
+            store.record(task)
+            task.start()
+            store.record(task)
+            task.fail("boom")
+            store.record(task)
+
+    reader = sqlite3.connect(path)
+    try:
+        row = reader.execute(
+            "SELECT status, attempts, error_message FROM parsing_tasks"
+        ).fetchone()
+    finally:
+        reader.close()
+    assert row == ("failed", 2, "boom")